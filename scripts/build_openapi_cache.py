@@ -0,0 +1,39 @@
+"""
+Script para generar el esquema OpenAPI en disco durante el build.
+
+Con OPENAPI_CACHE_PATH apuntando al fichero generado, /openapi.json y
+/docs se sirven sin importar todos los controladores. El esquema se
+ignora si su versión no coincide con APP_VERSION, así que conviene
+regenerarlo en cada despliegue.
+
+Uso: python -m scripts.build_openapi_cache [ruta]  (por defecto openapi.json)
+"""
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from src.main import create_app
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def build_openapi_cache(ruta: str) -> None:
+    """
+    Genera el esquema OpenAPI con todas las rutas y lo guarda en ``ruta``.
+    """
+    app = create_app()
+    app.state.cargador_routers.cargar_todos()
+    # Se genera desde las rutas, sin leer la caché que se va a reemplazar
+    esquema = FastAPI.openapi(app)
+
+    Path(ruta).write_text(json.dumps(esquema, ensure_ascii=False), encoding="utf-8")
+    logger.info(f"Esquema OpenAPI {esquema['info']['version']} guardado en {ruta}")
+
+
+if __name__ == "__main__":
+    build_openapi_cache(sys.argv[1] if len(sys.argv) > 1 else "openapi.json")
@@ -0,0 +1,35 @@
+"""
+Script para aplicar las migraciones pendientes del esquema.
+
+La aplicación ya migra al arrancar; este script permite hacerlo antes
+del despliegue y consultar la versión del esquema.
+"""
+
+import asyncio
+import logging
+
+from src.core.database import DatabaseManager, migrate_database
+from src.core.migrations.runner import version_actual
+from src.core.migrations.versions import MIGRACIONES
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Aplica las migraciones pendientes e informa de la versión resultante."""
+    db_manager = DatabaseManager()
+
+    try:
+        aplicadas = await migrate_database()
+        version = await version_actual(db_manager.engine)
+        logger.info(
+            f"Migraciones aplicadas: {aplicadas}. "
+            f"Versión del esquema: {version} (última: {MIGRACIONES[-1].version})"
+        )
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
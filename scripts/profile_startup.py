@@ -0,0 +1,83 @@
+"""
+Script para medir el arranque en frío de la aplicación.
+
+Mide, en un intérprete nuevo, la importación de src.main (que crea la
+aplicación) y la fase de inicio del lifespan (migraciones, bus de eventos,
+colas de cocina, permisos y revocaciones). Imprime un JSON con los
+tiempos en segundos y los controladores importados durante el arranque.
+
+Con la opción --importtime se repite la importación bajo
+``python -X importtime`` y se añaden los módulos más lentos.
+
+Uso: python -m scripts.profile_startup [--importtime]
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Módulos con más tiempo acumulado que se muestran con --importtime
+TOP_MODULOS = 15
+
+
+def modulos_lentos(top: int = TOP_MODULOS) -> list:
+    """
+    Importa src.main en otro intérprete con ``-X importtime``.
+
+    Returns
+    -------
+    list
+        Los ``top`` módulos con más tiempo acumulado: {"modulo", "segundos"}.
+    """
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True, text=True, env=os.environ.copy(),
+    ).stderr
+
+    tiempos = []
+    for linea in salida.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, modulo = linea[len("import time:"):].split("|")
+        tiempos.append({"modulo": modulo.strip(), "segundos": int(acumulado) / 1e6})
+    return sorted(tiempos, key=lambda t: t["segundos"], reverse=True)[:top]
+
+
+async def medir_lifespan(app) -> float:
+    """Mide la fase de inicio del lifespan; la de cierre no cuenta."""
+    inicio = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        duracion = time.perf_counter() - inicio
+    return duracion
+
+
+def profile_startup(importtime: bool = False) -> dict:
+    """
+    Mide el arranque en este intérprete; src.main no debe estar importado.
+    """
+    inicio = time.perf_counter()
+    from src.main import app
+    importacion = time.perf_counter() - inicio
+
+    controladores = sorted(
+        m for m in sys.modules if m.startswith("src.api.controllers.")
+    )
+    lifespan = asyncio.run(medir_lifespan(app))
+
+    resultado = {
+        "importacion": round(importacion, 4),
+        "lifespan": round(lifespan, 4),
+        "total": round(importacion + lifespan, 4),
+        "controladores_importados": controladores,
+    }
+    if importtime:
+        resultado["modulos_lentos"] = modulos_lentos()
+    return resultado
+
+
+if __name__ == "__main__":
+    print(json.dumps(profile_startup("--importtime" in sys.argv[1:]), indent=2))
@@ -0,0 +1,103 @@
+"""
+Endpoints para cierre de sesión y revocación de tokens.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.core.dependencies import requiere_permiso
+from src.core.enums.user_enums import Permiso
+from src.business_logic.auth.revocacion_service import RevocacionService
+from src.api.schemas.auth_schema import LogoutRequest
+from src.business_logic.exceptions.token_exceptions import TokenValidationError
+
+router = APIRouter(prefix="/auth", tags=["Autenticación"])
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Cerrar sesión",
+    description=(
+        "Revoca el token de acceso de la petición y, si se envía, el refresh token de la sesión. "
+        "Dejan de aceptarse de inmediato en todos los workers."
+    ),
+)
+async def logout(
+    datos: Optional[LogoutRequest] = None,
+    payload: dict = Depends(requiere_permiso()),
+    session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    """
+    Cierra la sesión del usuario autenticado.
+
+    Args:
+        datos: Refresh token opcional de la sesión.
+        payload: Contenido del token de acceso.
+        session: Sesión de base de datos.
+
+    Returns:
+        Respuesta vacía.
+
+    Raises:
+        HTTPException:
+            - 400: Si el refresh token no es válido o no pertenece al usuario.
+            - 401: Si el token de acceso no es válido o ya fue revocado.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        revocacion_service = RevocacionService(session)
+        if datos is not None and datos.refresh_token:
+            await revocacion_service.revocar_token(datos.refresh_token, id_usuario=payload.get("sub"))
+        await revocacion_service.revocar_payload(payload)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except TokenValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.post(
+    "/usuarios/{id_usuario}/revocar",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revocar las sesiones de un usuario",
+    description=(
+        "Revoca todos los tokens emitidos hasta ahora para el usuario, por ejemplo al darlo de "
+        "baja. Requiere el permiso usuarios:gestionar."
+    ),
+    dependencies=[Depends(requiere_permiso(Permiso.USUARIOS_GESTIONAR))],
+)
+async def revocar_usuario(
+    id_usuario: str, session: AsyncSession = Depends(get_database_session)
+) -> Response:
+    """
+    Revoca todas las sesiones de un usuario.
+
+    Args:
+        id_usuario: ID del usuario.
+        session: Sesión de base de datos.
+
+    Returns:
+        Respuesta vacía.
+
+    Raises:
+        HTTPException:
+            - 401: Si el token de acceso no es válido.
+            - 403: Si el rol no puede gestionar usuarios.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        revocacion_service = RevocacionService(session)
+        await revocacion_service.revocar_usuario(id_usuario)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
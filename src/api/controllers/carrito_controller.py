@@ -0,0 +1,50 @@
+"""
+Endpoints para la cotización del carrito.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.business_logic.pedidos.carrito_service import CarritoService
+from src.api.schemas.carrito_schema import CarritoCotizar, CarritoCotizacion
+
+router = APIRouter(prefix="/carrito", tags=["Carrito"])
+
+
+@router.post(
+    "/cotizar",
+    response_model=CarritoCotizacion,
+    status_code=status.HTTP_200_OK,
+    summary="Cotizar el carrito",
+    description=(
+        "Calcula el precio de las líneas del carrito con el menú vigente y valida las opciones "
+        "elegidas, incluidos los mínimos y máximos de cada grupo. Las líneas no válidas se "
+        "devuelven con sus errores y no suman al total."
+    ),
+)
+async def cotizar_carrito(
+    carrito: CarritoCotizar, session: AsyncSession = Depends(get_database_session)
+) -> CarritoCotizacion:
+    """
+    Cotiza el carrito.
+
+    Args:
+        carrito: Líneas del carrito.
+        session: Sesión de base de datos.
+
+    Returns:
+        El precio de cada línea y el total del carrito.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        carrito_service = CarritoService(session)
+        return await carrito_service.cotizar(carrito)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
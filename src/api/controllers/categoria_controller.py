@@ -2,11 +2,13 @@
 Endpoints para gestión de categorías.
 """
 
+from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_database_session
+from src.core.utils.query_utils import split_csv_values
 from src.business_logic.menu.categoria_service import CategoriaService
 from src.api.schemas.categoria_schema import (
     CategoriaCreate,
@@ -228,6 +230,13 @@ async def delete_categoria(
 async def get_categorias_con_productos_cards(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=500, description="Número máximo de registros a retornar"),
+    excluir_alergenos: List[str] = Query(
+        default=[],
+        description="IDs de alérgenos a excluir (repetido o separado por comas)",
+    ),
+    tolerar_trazas: bool = Query(
+        True, description="Si es false, también excluye productos con trazas del alérgeno"
+    ),
     session: AsyncSession = Depends(get_database_session)
 ) -> CategoriaConProductosCardList:
     """
@@ -243,6 +252,8 @@ async def get_categorias_con_productos_cards(
     Args:
         skip: Número de registros a omitir (paginación).
         limit: Número máximo de registros a retornar.
+        excluir_alergenos: IDs de alérgenos cuyos productos se excluyen.
+        tolerar_trazas: Si es False, también excluye trazas y "puede contener".
         session: Sesión de base de datos.
 
     Returns:
@@ -254,7 +265,12 @@ async def get_categorias_con_productos_cards(
     """
     try:
         categoria_service = CategoriaService(session)
-        return await categoria_service.get_categorias_con_productos_cards(skip=skip, limit=limit)
+        return await categoria_service.get_categorias_con_productos_cards(
+            skip=skip,
+            limit=limit,
+            excluir_alergenos=split_csv_values(excluir_alergenos),
+            tolerar_trazas=tolerar_trazas,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
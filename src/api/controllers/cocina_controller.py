@@ -0,0 +1,124 @@
+"""
+Endpoints para las pantallas de cocina.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, WebSocket
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.core.utils.query_utils import split_csv_values
+from src.business_logic.pedidos.cocina_service import CocinaService
+from src.business_logic.pedidos.cola_cocina import get_cola_cocina
+from src.api.schemas.pedido_schema import ColaCocinaResponse, ItemCocina, ItemCocinaTransicion
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoNotFoundError,
+    PedidoConflictError,
+)
+
+router = APIRouter(prefix="/cocina", tags=["Cocina"])
+
+
+@router.websocket("/ws")
+async def cocina_websocket(
+    websocket: WebSocket,
+    estacion: List[str] = Query(default=["cocina"], description="Estaciones que muestra la pantalla"),
+) -> None:
+    """
+    Canal en tiempo real con la cola de preparación de una o varias estaciones.
+
+    Al conectar se envía ``{"evento": "cola_cocina", "payload": {"estacion", "items"}}``
+    por cada estación, con los ítems en orden de preparación. Después solo
+    se envían los ítems que cambian como ``item_cocina``; un ítem cuyo
+    estado ya no es ``pendiente`` ni ``en_preparacion`` sale de la cola.
+
+    Args:
+        websocket: Conexión WebSocket entrante.
+        estacion: Estaciones a mostrar (repetible o separadas por comas).
+    """
+    await websocket.accept()
+    await get_cola_cocina().atender(websocket, split_csv_values(estacion))
+
+
+@router.get(
+    "/{estacion}",
+    response_model=ColaCocinaResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener la cola de una estación",
+    description=(
+        "Obtiene los ítems pendientes y en preparación de una estación, ordenados por "
+        "prioridad del pedido y antigüedad. Se sirve desde memoria sin consultar la base de datos."
+    ),
+)
+async def get_cola_estacion(
+    estacion: str, session: AsyncSession = Depends(get_database_session)
+) -> ColaCocinaResponse:
+    """
+    Obtiene la cola de preparación de una estación.
+
+    Args:
+        estacion: Estación de cocina.
+        session: Sesión de base de datos.
+
+    Returns:
+        Los ítems de la estación en orden de preparación.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        cocina_service = CocinaService(session)
+        return cocina_service.get_cola(estacion)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.post(
+    "/items/{item_id}/transition",
+    response_model=ItemCocina,
+    status_code=status.HTTP_200_OK,
+    summary="Cambiar el estado de un ítem",
+    description=(
+        "Avanza un ítem por su estación (pendiente → en_preparacion → listo → entregado) "
+        "y actualiza el estado de su pedido. Responde 409 si la transición no está permitida."
+    ),
+)
+async def transicionar_item(
+    item_id: str,
+    transicion: ItemCocinaTransicion,
+    session: AsyncSession = Depends(get_database_session),
+) -> ItemCocina:
+    """
+    Cambia el estado de preparación de un ítem.
+
+    Args:
+        item_id: ID del ítem de pedido.
+        transicion: Estado solicitado.
+        session: Sesión de base de datos.
+
+    Returns:
+        El ítem con su nuevo estado.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra el ítem.
+            - 409: Si la transición no está permitida.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        cocina_service = CocinaService(session)
+        return await cocina_service.transicionar_item(item_id, transicion)
+    except PedidoNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except PedidoConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
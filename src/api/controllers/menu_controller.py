@@ -0,0 +1,172 @@
+"""
+Endpoints para obtener el menú público completo.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.core.compression import elegir_codificacion, etag_coincide
+from src.business_logic.menu.menu_service import MenuService
+from src.business_logic.notifications.menu_stream import get_menu_broadcaster
+from src.api.schemas.menu_schema import MenuCambiosResponse, MenuResponse
+
+router = APIRouter(prefix="/menu", tags=["Menú"])
+
+
+@router.get(
+    "",
+    response_model=MenuResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener el menú completo",
+    description=(
+        "Obtiene en un único documento el menú público: categorías activas, "
+        "productos disponibles, grupos de opciones y alérgenos. Soporta ETag/If-None-Match."
+    ),
+)
+async def get_menu(
+    request: Request,
+    session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    """
+    Obtiene el menú público completo.
+
+    La respuesta se sirve desde bytes ya serializados (y comprimidos si el
+    cliente acepta brotli o gzip) mientras no cambie la versión del menú.
+
+    Args:
+        request: Petición HTTP, usada para la negociación de contenido.
+        session: Sesión de base de datos.
+
+    Returns:
+        El documento del menú, o 304 si el cliente ya tiene la versión vigente.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        menu_service = MenuService(session)
+        menu = await menu_service.get_menu_serializado()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+    codificacion = elegir_codificacion(
+        request.headers.get("accept-encoding", ""), disponibles=menu.codificaciones
+    )
+    headers = {
+        "ETag": menu.etag(codificacion),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if etag_coincide(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if codificacion is not None:
+        headers["Content-Encoding"] = codificacion
+
+    return Response(
+        content=menu.cuerpo(codificacion), media_type="application/json", headers=headers
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=MenuCambiosResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener cambios del menú desde una versión",
+    description=(
+        "Devuelve solo las categorías y productos creados, modificados o retirados "
+        "después de la versión indicada, para aplicar parches en lugar de recargar el menú."
+    ),
+)
+async def get_menu_changes(
+    since: int = Query(..., ge=0, description="Última versión del menú aplicada por el cliente"),
+    session: AsyncSession = Depends(get_database_session),
+) -> MenuCambiosResponse:
+    """
+    Obtiene los cambios del menú posteriores a una versión.
+
+    Args:
+        since: Versión del menú que el cliente tiene aplicada.
+        session: Sesión de base de datos.
+
+    Returns:
+        Cambios a aplicar y la versión vigente. Si requiere_menu_completo es
+        true, el cliente debe volver a descargar GET /menu.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        menu_service = MenuService(session)
+        return await menu_service.get_cambios(since)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Flujo de cambios de disponibilidad del menú",
+    description=(
+        "Server-Sent Events con los cambios de disponibilidad y precio de los productos. "
+        "Cada evento lleva la versión del menú como id; al reconectar, el navegador "
+        "envía Last-Event-ID y se reenvían los cambios perdidos."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_menu(
+    since: Optional[int] = Query(
+        default=None, ge=0, description="Versión aplicada, si no se envía Last-Event-ID"
+    ),
+    last_event_id: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    """
+    Abre un flujo SSE con los cambios de disponibilidad del menú.
+
+    Eventos emitidos:
+        - version: versión vigente al conectar sin versión previa.
+        - disponibilidad: productos con su disponibilidad y precio actual.
+        - recargar: el cliente debe volver a descargar GET /menu.
+
+    Args:
+        since: Versión del menú aplicada por el cliente.
+        last_event_id: Cabecera Last-Event-ID enviada por EventSource al reconectar.
+
+    Returns:
+        Respuesta en streaming de tipo text/event-stream.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    desde = since
+    if last_event_id is not None and last_event_id.strip().isdigit():
+        desde = int(last_event_id)
+
+    try:
+        broadcaster = get_menu_broadcaster()
+        conexion = await broadcaster.conectar(desde)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+    return StreamingResponse(
+        broadcaster.eventos(conexion),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
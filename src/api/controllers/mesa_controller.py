@@ -1,22 +1,31 @@
 from typing import List
 
 
-from typing import List
+from typing import List, Literal, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, WebSocket
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_database_session
 from src.business_logic.mesas.mesa_service import MesaService
+from src.business_logic.mesas.mesa_qr_service import ArchivoQR, MesaQRService
+from src.core.compression import etag_coincide
+from src.core.config import get_settings
+from src.business_logic.notifications.websocket_hub import get_mesa_hub
+from src.core.utils.query_utils import split_csv_values
 from src.api.schemas.mesa_schema import (
     MesaCreate,
     MesaResponse,
     MesaUpdate,
     MesaList,
+    MesaTransicion,
+    MesaResumen,
 )
 from src.business_logic.exceptions.mesa_exceptions import (
     MesaValidationError,
     MesaNotFoundError,
     MesaConflictError,
+    MesaQRNoDisponibleError,
 )
 
 router = APIRouter(prefix="/mesas", tags=["Mesas"])
@@ -78,6 +87,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_database_session
 from src.business_logic.mesas.mesa_service import MesaService
+from src.business_logic.mesas.mesa_qr_service import ArchivoQR, MesaQRService
+from src.core.config import get_settings
 from src.api.schemas.mesa_schema import (
     MesaCreate,
     MesaResponse,
@@ -130,6 +141,158 @@ async def create_mesa(
         )
 
 
+@router.get(
+    "/resumen",
+    response_model=MesaResumen,
+    status_code=status.HTTP_200_OK,
+    summary="Resumen de ocupación por zona",
+    description=(
+        "Obtiene el número de mesas activas por zona y estado y los asientos libres y ocupados. "
+        "Pensado para el panel de sala, que lo consulta con frecuencia."
+    ),
+)
+async def get_resumen_mesas(
+    session: AsyncSession = Depends(get_database_session),
+) -> MesaResumen:
+    """
+    Obtiene el resumen de ocupación de las mesas.
+
+    Args:
+        session: Sesión de base de datos.
+
+    Returns:
+        Conteos por zona y estado y totales de asientos.
+
+    Raises:
+        HTTPException:
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        mesa_service = MesaService(session)
+        return await mesa_service.get_resumen()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+def _respuesta_qr(request: Request, archivo: ArchivoQR, filename: Optional[str] = None) -> Response:
+    """
+    Sirve un archivo QR cacheado con cabeceras de caché de larga duración.
+
+    Args:
+        request: Petición HTTP, usada para If-None-Match.
+        archivo: Archivo generado.
+        filename: Nombre de descarga, si debe servirse como adjunto.
+
+    Returns:
+        El archivo, o 304 si el cliente ya tiene esa versión.
+    """
+    headers = {
+        "ETag": archivo.etag,
+        "Cache-Control": f"public, max-age={get_settings().qr_cache_max_age}",
+    }
+    if etag_coincide(request.headers.get("if-none-match"), archivo.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(
+        archivo.ruta, media_type=archivo.media_type, headers=headers, filename=filename
+    )
+
+
+@router.get(
+    "/zonas/{zona}/qr",
+    status_code=status.HTTP_200_OK,
+    summary="Descargar los QR de una zona",
+    description="Descarga un ZIP con el código QR de cada mesa activa de la zona, nombrados por número de mesa.",
+    response_class=FileResponse,
+)
+async def get_qr_zona(
+    zona: str,
+    request: Request,
+    formato: Literal["png", "svg"] = Query("png", description="Formato de las imágenes"),
+    session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    """
+    Descarga los códigos QR de las mesas de una zona.
+
+    Args:
+        zona: Zona de las mesas.
+        request: Petición HTTP.
+        formato: Formato de las imágenes (png o svg).
+        session: Sesión de base de datos.
+
+    Returns:
+        Archivo ZIP con un QR por mesa.
+
+    Raises:
+        HTTPException:
+            - 404: Si la zona no tiene mesas activas.
+            - 503: Si la generación de QR no está disponible.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        archivo = await MesaQRService(session).get_qr_zona(zona, formato)
+    except MesaNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except MesaQRNoDisponibleError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+    return _respuesta_qr(request, archivo, filename=f"qr-{zona}.zip")
+
+
+@router.get(
+    "/{mesa_id}/qr",
+    status_code=status.HTTP_200_OK,
+    summary="Obtener el QR de una mesa",
+    description=(
+        "Obtiene el código QR con la URL pública de la mesa. La imagen se genera una sola vez "
+        "y se sirve desde caché con ETag."
+    ),
+    response_class=FileResponse,
+)
+async def get_qr_mesa(
+    mesa_id: str,
+    request: Request,
+    formato: Literal["png", "svg"] = Query("png", description="Formato de la imagen"),
+    session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    """
+    Obtiene el código QR de una mesa.
+
+    Args:
+        mesa_id: ID de la mesa.
+        request: Petición HTTP.
+        formato: Formato de la imagen (png o svg).
+        session: Sesión de base de datos.
+
+    Returns:
+        La imagen del QR, o 304 si el cliente ya la tiene.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra la mesa.
+            - 503: Si la generación de QR no está disponible.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        archivo = await MesaQRService(session).get_qr_mesa(mesa_id, formato)
+    except MesaNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except MesaQRNoDisponibleError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+    return _respuesta_qr(request, archivo)
+
+
 @router.get(
     "/{mesa_id}",
     response_model=MesaResponse,
@@ -235,7 +398,7 @@ async def update_mesa(
     Raises:
         HTTPException:
             - 404: Si no se encuentra la mesa.
-            - 409: Si hay un conflicto (e.g., nombre duplicado).
+            - 409: Si hay un conflicto (e.g., nombre duplicado) o el cambio de estado no está permitido.
             - 500: Si ocurre un error interno del servidor.
     """
     try:
@@ -252,6 +415,52 @@ async def update_mesa(
         )
 
 
+@router.post(
+    "/{mesa_id}/transition",
+    response_model=MesaResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cambiar el estado de una mesa",
+    description=(
+        "Aplica un cambio de estado permitido por la máquina de estados de mesas. "
+        "Si se envía la versión, el cambio falla con 409 cuando la mesa fue modificada por otra petición."
+    ),
+)
+async def transicionar_mesa(
+    mesa_id: str,
+    transicion: MesaTransicion,
+    session: AsyncSession = Depends(get_database_session),
+) -> MesaResponse:
+    """
+    Cambia el estado de una mesa.
+
+    Args:
+        mesa_id: ID de la mesa.
+        transicion: Estado solicitado y versión conocida por el cliente.
+        session: Sesión de base de datos.
+
+    Returns:
+        La mesa con su nuevo estado y versión.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra la mesa.
+            - 409: Si la transición no está permitida o la versión no coincide.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        mesa_service = MesaService(session)
+        return await mesa_service.transicionar_mesa(mesa_id, transicion)
+    except MesaNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except MesaConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
 @router.delete(
     "/{mesa_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -285,3 +494,25 @@ async def delete_mesa(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
         )
+
+
+@router.websocket("/ws")
+async def mesas_websocket(
+    websocket: WebSocket,
+    zona: List[str] = Query(default=[], description="Zonas a seguir; todas si se omite"),
+) -> None:
+    """
+    Canal en tiempo real con los cambios de estado de las mesas.
+
+    Cada cambio se envía como ``{"evento": "actualizacion_mesa", "payload": {...}}``
+    con el resumen de la mesa. El servidor envía ``ping`` periódicamente y
+    cierra la conexión si el cliente no envía nada en dos intervalos. Se
+    puede cambiar la suscripción enviando ``suscribir``/``desuscribir`` con
+    ``{"zonas": [...]}`` en el payload.
+
+    Args:
+        websocket: Conexión WebSocket entrante.
+        zona: Zonas a las que suscribirse (repetible o separadas por comas).
+    """
+    await websocket.accept()
+    await get_mesa_hub().atender(websocket, split_csv_values(zona))
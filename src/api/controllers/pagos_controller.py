@@ -0,0 +1,205 @@
+"""
+Endpoints para pagos y división de cuentas.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.business_logic.pagos.division_service import DivisionCuentaService
+from src.business_logic.pagos.pago_service import PagoService
+from src.api.schemas.pago_schema import (
+    DivisionCuentaRequest,
+    DivisionCuentaResponse,
+    PagoCreate,
+    PagoResponse,
+    PagoTransicion,
+)
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoNotFoundError,
+    PagoConflictError,
+)
+
+router = APIRouter(prefix="/pagos", tags=["Pagos"])
+
+
+@router.post(
+    "/division",
+    response_model=DivisionCuentaResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Dividir la cuenta de una mesa",
+    description=(
+        "Calcula lo que paga cada comensal: a partes iguales, por los ítems que consumió o con "
+        "importes indicados. Los céntimos se reparten de forma determinista y las partes suman "
+        "exactamente el total; lo que no se asigna se devuelve como pendiente."
+    ),
+)
+async def dividir_cuenta(
+    solicitud: DivisionCuentaRequest, session: AsyncSession = Depends(get_database_session)
+) -> DivisionCuentaResponse:
+    """
+    Divide la cuenta de una mesa.
+
+    Args:
+        solicitud: Mesa, pedidos, modo de división y sus datos.
+        session: Sesión de base de datos.
+
+    Returns:
+        La parte de cada comensal y el importe pendiente.
+
+    Raises:
+        HTTPException:
+            - 400: Si faltan los datos del modo elegido o no son válidos.
+            - 404: Si la mesa no tiene pedidos que cobrar.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        division_service = DivisionCuentaService(session)
+        return await division_service.dividir(solicitud)
+    except PagoValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PagoNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.post(
+    "",
+    response_model=PagoResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Registrar un pago",
+    description=(
+        "Registra un pago pendiente de una mesa. Con la cabecera Idempotency-Key, los reintentos "
+        "con la misma clave devuelven el pago ya registrado (cabecera Idempotent-Replayed) en "
+        "lugar de registrarlo otra vez; la clave se conserva 24 horas."
+    ),
+)
+async def registrar_pago(
+    pago_data: PagoCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, min_length=1, max_length=255),
+    session: AsyncSession = Depends(get_database_session),
+) -> PagoResponse:
+    """
+    Registra un nuevo pago.
+
+    Args:
+        pago_data: Mesa, pedido, medio de pago y monto.
+        response: Respuesta HTTP, para marcar los reintentos.
+        idempotency_key: Clave de idempotencia generada por el cliente.
+        session: Sesión de base de datos.
+
+    Returns:
+        El pago registrado, o el registrado originalmente si es un reintento.
+
+    Raises:
+        HTTPException:
+            - 400: Si la mesa o el pedido no son válidos o el monto supera el saldo.
+            - 409: Si la clave de idempotencia se usó con otros datos.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pago_service = PagoService(session)
+        pago, repetido = await pago_service.registrar_pago(pago_data, idempotency_key)
+        if repetido:
+            response.headers["Idempotent-Replayed"] = "true"
+        return pago
+    except PagoValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PagoConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.get(
+    "/{pago_id}",
+    response_model=PagoResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener un pago por ID",
+    description="Obtiene un pago con su estado actual.",
+)
+async def get_pago(
+    pago_id: str, session: AsyncSession = Depends(get_database_session)
+) -> PagoResponse:
+    """
+    Obtiene un pago específico por su ID.
+
+    Args:
+        pago_id: ID del pago a buscar.
+        session: Sesión de base de datos.
+
+    Returns:
+        El pago encontrado.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra el pago.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pago_service = PagoService(session)
+        return await pago_service.get_pago(pago_id)
+    except PagoNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.post(
+    "/{pago_id}/transition",
+    response_model=PagoResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cambiar el estado de un pago",
+    description=(
+        "Cambia el estado de un pago de forma atómica. Repetir una transición ya aplicada "
+        "devuelve el pago sin cambios, de modo que las confirmaciones reintentadas son seguras."
+    ),
+)
+async def transicionar_pago(
+    pago_id: str,
+    transicion: PagoTransicion,
+    session: AsyncSession = Depends(get_database_session),
+) -> PagoResponse:
+    """
+    Cambia el estado de un pago.
+
+    Args:
+        pago_id: ID del pago.
+        transicion: Estado solicitado y número de operación.
+        session: Sesión de base de datos.
+
+    Returns:
+        El pago con su estado actual.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra el pago.
+            - 409: Si la transición no está permitida desde el estado actual.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pago_service = PagoService(session)
+        return await pago_service.transicionar_pago(pago_id, transicion)
+    except PagoNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except PagoConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
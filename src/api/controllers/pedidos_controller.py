@@ -0,0 +1,142 @@
+"""
+Endpoints para gestión de pedidos.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_database_session
+from src.core.enums.pedido_enums import EstadoPedido
+from src.business_logic.pedidos.pedido_service import PedidoService
+from src.api.schemas.pedido_schema import PedidoCreate, PedidoResponse, PedidoList
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoValidationError,
+    PedidoNotFoundError,
+)
+
+router = APIRouter(prefix="/pedidos", tags=["Pedidos"])
+
+
+@router.post(
+    "",
+    response_model=PedidoResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Crear un pedido",
+    description=(
+        "Crea un pedido para una mesa. Los precios se calculan en el servidor con el menú vigente "
+        "y se guardan junto con las opciones elegidas."
+    ),
+)
+async def create_pedido(
+    pedido_data: PedidoCreate, session: AsyncSession = Depends(get_database_session)
+) -> PedidoResponse:
+    """
+    Crea un nuevo pedido.
+
+    Args:
+        pedido_data: Mesa, productos y opciones solicitados.
+        session: Sesión de base de datos.
+
+    Returns:
+        El pedido creado con sus precios.
+
+    Raises:
+        HTTPException:
+            - 400: Si la mesa, algún producto o alguna opción no es válida.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pedido_service = PedidoService(session)
+        return await pedido_service.create_pedido(pedido_data)
+    except PedidoValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.get(
+    "/{pedido_id}",
+    response_model=PedidoResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener un pedido por ID",
+    description="Obtiene un pedido con todos sus ítems.",
+)
+async def get_pedido(
+    pedido_id: str, session: AsyncSession = Depends(get_database_session)
+) -> PedidoResponse:
+    """
+    Obtiene un pedido específico por su ID.
+
+    Args:
+        pedido_id: ID del pedido a buscar.
+        session: Sesión de base de datos.
+
+    Returns:
+        El pedido encontrado con sus ítems.
+
+    Raises:
+        HTTPException:
+            - 404: Si no se encuentra el pedido.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pedido_service = PedidoService(session)
+        return await pedido_service.get_pedido_by_id(pedido_id)
+    except PedidoNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
+@router.get(
+    "",
+    response_model=PedidoList,
+    status_code=status.HTTP_200_OK,
+    summary="Listar pedidos",
+    description="Obtiene una lista paginada de pedidos, del más reciente al más antiguo.",
+)
+async def list_pedidos(
+    skip: int = Query(0, ge=0, description="Número de registros a omitir (paginación)"),
+    limit: int = Query(
+        100, gt=0, le=500, description="Número máximo de registros a retornar"
+    ),
+    id_mesa: Optional[str] = Query(None, description="Filtrar por mesa"),
+    estado: Optional[EstadoPedido] = Query(None, description="Filtrar por estado"),
+    session: AsyncSession = Depends(get_database_session),
+) -> PedidoList:
+    """
+    Obtiene una lista paginada de pedidos.
+
+    Args:
+        skip: Número de registros a omitir (offset), por defecto 0.
+        limit: Número máximo de registros a retornar, por defecto 100.
+        id_mesa: Mesa por la que filtrar.
+        estado: Estado por el que filtrar.
+        session: Sesión de base de datos.
+
+    Returns:
+        Lista paginada de pedidos y el número total de registros.
+
+    Raises:
+        HTTPException:
+            - 400: Si los parámetros de paginación son inválidos.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        pedido_service = PedidoService(session)
+        return await pedido_service.get_pedidos(skip, limit, id_mesa, estado)
+    except PedidoValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
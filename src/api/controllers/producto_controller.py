@@ -2,12 +2,15 @@
 Endpoints para gestión de productos.
 """
 
+from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_database_session
+from src.core.utils.query_utils import split_csv_values
 from src.business_logic.menu.producto_service import ProductoService
+from src.business_logic.menu.producto_alergeno_service import ProductoAlergenoService
 from src.api.schemas.producto_schema import (
     ProductoCreate,
     ProductoResponse,
@@ -16,11 +19,18 @@ from src.api.schemas.producto_schema import (
     ProductoCardList,
     ProductoConOpcionesResponse,
 )
+from src.api.schemas.producto_alergeno_schema import (
+    ProductoAlergenosBatchRequest,
+    ProductoAlergenosBatchResponse,
+)
 from src.business_logic.exceptions.producto_exceptions import (
     ProductoValidationError,
     ProductoNotFoundError,
     ProductoConflictError,
 )
+from src.business_logic.exceptions.producto_alergeno_exceptions import (
+    ProductoAlergenoValidationError,
+)
 
 router = APIRouter(prefix="/productos", tags=["Productos"])
 
@@ -74,6 +84,13 @@ async def list_all_productos_cards(
     limit: int = Query(
         100, gt=0, le=500, description="Número máximo de registros a retornar"
     ),
+    excluir_alergenos: List[str] = Query(
+        default=[],
+        description="IDs de alérgenos a excluir (repetido o separado por comas)",
+    ),
+    tolerar_trazas: bool = Query(
+        True, description="Si es false, también excluye productos con trazas del alérgeno"
+    ),
     session: AsyncSession = Depends(get_database_session),
 ) -> ProductoCardList:
     """
@@ -86,6 +103,8 @@ async def list_all_productos_cards(
     Args:
         skip: Número de registros a omitir (offset), por defecto 0.
         limit: Número máximo de registros a retornar, por defecto 100.
+        excluir_alergenos: IDs de alérgenos cuyos productos se excluyen.
+        tolerar_trazas: Si es False, también excluye trazas y "puede contener".
         session: Sesión de base de datos.
         
     Returns:
@@ -98,7 +117,13 @@ async def list_all_productos_cards(
     """
     try:
         producto_service = ProductoService(session)
-        return await producto_service.get_productos_cards_by_categoria(None, skip, limit)
+        return await producto_service.get_productos_cards_by_categoria(
+            None,
+            skip,
+            limit,
+            excluir_alergenos=split_csv_values(excluir_alergenos),
+            tolerar_trazas=tolerar_trazas,
+        )
     except ProductoValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -121,6 +146,13 @@ async def list_productos_cards_by_categoria(
     limit: int = Query(
         100, gt=0, le=500, description="Número máximo de registros a retornar"
     ),
+    excluir_alergenos: List[str] = Query(
+        default=[],
+        description="IDs de alérgenos a excluir (repetido o separado por comas)",
+    ),
+    tolerar_trazas: bool = Query(
+        True, description="Si es false, también excluye productos con trazas del alérgeno"
+    ),
     session: AsyncSession = Depends(get_database_session),
 ) -> ProductoCardList:
     """
@@ -134,6 +166,8 @@ async def list_productos_cards_by_categoria(
         categoria_id: ID de la categoría para filtrar productos.
         skip: Número de registros a omitir (offset), por defecto 0.
         limit: Número máximo de registros a retornar, por defecto 100.
+        excluir_alergenos: IDs de alérgenos cuyos productos se excluyen.
+        tolerar_trazas: Si es False, también excluye trazas y "puede contener".
         session: Sesión de base de datos.
         
     Returns:
@@ -146,7 +180,13 @@ async def list_productos_cards_by_categoria(
     """
     try:
         producto_service = ProductoService(session)
-        return await producto_service.get_productos_cards_by_categoria(categoria_id, skip, limit)
+        return await producto_service.get_productos_cards_by_categoria(
+            categoria_id,
+            skip,
+            limit,
+            excluir_alergenos=split_csv_values(excluir_alergenos),
+            tolerar_trazas=tolerar_trazas,
+        )
     except ProductoValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -156,6 +196,52 @@ async def list_productos_cards_by_categoria(
         )
 
 
+@router.post(
+    "/alergenos:batch",
+    response_model=ProductoAlergenosBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener alérgenos de varios productos",
+    description=(
+        "Obtiene en una sola llamada los alérgenos activos de hasta "
+        f"{ProductoAlergenosBatchRequest.MAX_PRODUCTOS} productos, con los detalles de cada alérgeno."
+    ),
+)
+async def get_alergenos_batch(
+    batch_data: ProductoAlergenosBatchRequest,
+    session: AsyncSession = Depends(get_database_session),
+) -> ProductoAlergenosBatchResponse:
+    """
+    Obtiene los alérgenos de varios productos a la vez.
+
+    Pensado para pantallas como el carrito, que necesitan los alérgenos de
+    todos sus productos. Los productos sin alérgenos se devuelven con lista vacía.
+
+    Args:
+        batch_data: IDs de los productos a consultar.
+        session: Sesión de base de datos.
+
+    Returns:
+        Alérgenos de cada producto en el orden solicitado.
+
+    Raises:
+        HTTPException:
+            - 400: Si la lista de productos es inválida.
+            - 500: Si ocurre un error interno del servidor.
+    """
+    try:
+        producto_alergeno_service = ProductoAlergenoService(session)
+        return await producto_alergeno_service.get_alergenos_by_productos(
+            batch_data.ids_producto
+        )
+    except ProductoAlergenoValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
+
+
 @router.get(
     "/{producto_id}",
     response_model=ProductoResponse,
@@ -277,6 +363,13 @@ async def list_productos(
         100, gt=0, le=500, description="Número máximo de registros a retornar"
     ),
     id_categoria: str = Query(None, description="Filtrar productos por ID de categoría"),
+    excluir_alergenos: List[str] = Query(
+        default=[],
+        description="IDs de alérgenos a excluir (repetido o separado por comas)",
+    ),
+    tolerar_trazas: bool = Query(
+        True, description="Si es false, también excluye productos con trazas del alérgeno"
+    ),
     session: AsyncSession = Depends(get_database_session),
 ) -> ProductoList:
     """
@@ -286,6 +379,8 @@ async def list_productos(
         skip: Número de registros a omitir (offset), por defecto 0.
         limit: Número máximo de registros a retornar, por defecto 100.
         id_categoria: ID de categoría para filtrar productos (opcional).
+        excluir_alergenos: IDs de alérgenos cuyos productos se excluyen.
+        tolerar_trazas: Si es False, también excluye trazas y "puede contener".
         session: Sesión de base de datos.
         
     Returns:
@@ -298,7 +393,13 @@ async def list_productos(
     """
     try:
         producto_service = ProductoService(session)
-        return await producto_service.get_productos(skip, limit, id_categoria) 
+        return await producto_service.get_productos(
+            skip,
+            limit,
+            id_categoria,
+            excluir_alergenos=split_csv_values(excluir_alergenos),
+            tolerar_trazas=tolerar_trazas,
+        )
     except ProductoValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
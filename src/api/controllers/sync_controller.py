@@ -5,8 +5,8 @@ Este módulo proporciona rutas para recibir datos de sincronización del sistema
 a través del scrapper, y procesarlos para actualizar la base de datos local.
 """
 
-from typing import List, Dict, Any, Set, Tuple
-from fastapi import APIRouter, Depends, HTTPException, status, Body
+from typing import List, Dict, Any, Optional, Set, Tuple
+from fastapi import APIRouter, Depends, HTTPException, status, Body, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from decimal import Decimal, InvalidOperation
@@ -17,6 +17,10 @@ from src.business_logic.menu.categoria_service import CategoriaService
 from src.business_logic.menu.producto_service import ProductoService
 from src.api.schemas.producto_schema import ProductoCreate, ProductoUpdate, ProductoBase
 from src.api.schemas.categoria_schema import CategoriaCreate, CategoriaUpdate
+from src.api.schemas.mesa_schema import MesaSync
+from src.business_logic.mesas.mesa_service import MesaService
+from src.business_logic.exceptions.mesa_exceptions import MesaValidationError
+from src.core.enums.mesa_enums import EstadoMesa
 
 # Configuración del logger
 logger = logging.getLogger(__name__)
@@ -229,95 +233,115 @@ async def sync_platos(
         )
 
 
+# Estados de Domotica que no coinciden literalmente con EstadoMesa
+ALIAS_ESTADO_MESA = {
+    "ocupado": EstadoMesa.OCUPADA,
+    "reservado": EstadoMesa.RESERVADA,
+}
+
+
+def _estado_desde_domotica(estado: Optional[str]) -> Optional[EstadoMesa]:
+    """
+    Convierte el estado textual de Domotica en un EstadoMesa.
+
+    Args:
+        estado: Estado recibido, en cualquier combinación de mayúsculas.
+
+    Returns:
+        El estado equivalente, o None si no se recibió o no se reconoce.
+    """
+    if not estado:
+        return None
+    estado = estado.strip().lower()
+    if estado in ALIAS_ESTADO_MESA:
+        return ALIAS_ESTADO_MESA[estado]
+    try:
+        return EstadoMesa(estado)
+    except ValueError:
+        return None
+
+
 @router.post(
     "/mesas",
     status_code=status.HTTP_200_OK,
     summary="Sincronizar mesas desde Domotica",
-    description="Recibe datos de mesas extraídos mediante scraping del sistema Domotica.",
+    description=(
+        "Recibe el estado completo de las mesas extraído del sistema Domotica. "
+        "Crea las mesas nuevas, actualiza solo las que cambiaron y desactiva las que ya no existen. "
+        "Es idempotente y puede llamarse cada pocos segundos. Si desactivaría mesas y trae "
+        "menos de la mitad de las mesas activas (por ejemplo, una lista vacía), se rechaza con "
+        "400 salvo que se indique forzar_desactivacion=true."
+    ),
 )
 async def sync_mesas(
     mesas_domotica: List[MesaDomotica] = Body(...),
+    forzar_desactivacion: bool = Query(
+        False, description="Aplicar aunque se reciban menos de la mitad de las mesas activas."
+    ),
     session: AsyncSession = Depends(get_database_session),
 ) -> Dict[str, Any]:
     """
-    Recibe y registra las mesas extraídas del sistema Domotica.
+    Sincroniza las mesas extraídas del sistema Domotica con la base de datos local.
 
-    Actualmente solo confirma la recepción de los datos sin procesamiento adicional.
+    Las mesas se identifican por su nombre (número en el sistema). Se
+    comparan zona, nota, capacidad y estado, y los cambios se publican a
+    los clientes conectados en tiempo real.
 
     Parameters
     ----------
     mesas_domotica : List[MesaDomotica]
         Lista de mesas extraídas del sistema Domotica
+    forzar_desactivacion : bool
+        Aplicar aunque se reciban menos de la mitad de las mesas activas
     session : AsyncSession
         Sesión de base de datos
 
     Returns
     -------
     Dict[str, Any]
-        Confirmación de recepción y conteo de mesas recibidas
+        Resumen de la operación con contadores de mesas creadas/actualizadas/desactivadas,
+        las mesas creadas (``mesas_creadas``) y las zonas recibidas (``zonas_recibidas``)
 
     Raises
     ------
     HTTPException
-        Si ocurre un error durante el proceso
+        400 si la sincronización desactivaría demasiadas mesas; 500 si ocurre
+        un error durante el proceso
     """
     try:
-        from src.business_logic.mesas.mesa_service import MesaService
-        from src.api.schemas.mesa_schema import MesaCreate, EstadoMesa
-
-        # LOG: Verificar los valores recibidos de zona
-        zonas_recibidas = [mesa.zona for mesa in mesas_domotica]
-        print(f"[SYNC MESAS] Zonas recibidas: {zonas_recibidas}")
-        logger.info(f"[SYNC MESAS] Zonas recibidas: {zonas_recibidas}")
-
-        # Transformar mesas_domotica a MesaCreate
-        mesas_a_crear = []
-        for mesa in mesas_domotica:
-            print(f"[SYNC MESAS] Mesa recibida: nombre={mesa.nombre}, zona={mesa.zona}, nota={mesa.nota}, estado={mesa.estado}")
-            # Asignar capacidad=4 si no viene
-            capacidad = getattr(mesa, "capacidad", None)
-            if capacidad is None:
-                capacidad = 4
-            # Estado: respeta tal cual lo manda el sistema externo (mayúsculas/minúsculas)
-            estado_str = getattr(mesa, "estado", None)
-            if estado_str:
-                try:
-                    estado = EstadoMesa(estado_str.lower()) if estado_str.lower() in [e.value for e in EstadoMesa] else EstadoMesa.DISPONIBLE
-                except Exception:
-                    estado = EstadoMesa.DISPONIBLE
-            else:
-                estado = EstadoMesa.DISPONIBLE
-            mesas_a_crear.append(
-                MesaCreate(
-                    numero=mesa.nombre,
-                    zona=mesa.zona,
-                    capacidad=capacidad,
-                    nota=mesa.nota if hasattr(mesa, "nota") else None,
-                    estado=estado
-                )
+        mesas = [
+            MesaSync(
+                numero=mesa.nombre,
+                zona=mesa.zona,
+                nota=mesa.nota,
+                estado=_estado_desde_domotica(mesa.estado),
             )
+            for mesa in mesas_domotica
+        ]
 
-        # Si no hay BD, solo mostrar lo que se recibiría
-        print(f"[SYNC MESAS] Mesas a crear: {[m.model_dump() for m in mesas_a_crear]}")
-        logger.info(f"[SYNC MESAS] Mesas a crear: {[m.model_dump() for m in mesas_a_crear]}")
-
-        # Si la BD está activa, guardar; si no, solo retornar los datos
-        mesas_creadas = []
-        try:
-            mesa_service = MesaService(session)
-            mesas_creadas = await mesa_service.batch_create_mesas(mesas_a_crear)
-        except Exception as db_exc:
-            print(f"[SYNC MESAS] (Sin BD) Error al guardar: {db_exc}")
-            logger.warning(f"[SYNC MESAS] (Sin BD) Error al guardar: {db_exc}")
+        resultado = await MesaService(session).sync_mesas(
+            mesas, forzar_desactivacion=forzar_desactivacion
+        )
+        logger.info(
+            "Sincronización de mesas: %d creadas, %d actualizadas, %d desactivadas, %d sin cambios",
+            resultado.creadas,
+            resultado.actualizadas,
+            resultado.desactivadas,
+            resultado.sin_cambios,
+        )
 
         return {
             "status": "success",
-            "message": f"Mesas sincronizadas correctamente: {len(mesas_creadas) if mesas_creadas else len(mesas_a_crear)} creadas (simulado si no hay BD)",
-            "mesas_creadas": [mesa.model_dump() for mesa in (mesas_creadas if mesas_creadas else mesas_a_crear)],
-            "zonas_recibidas": zonas_recibidas,
-            "total": len(mesas_creadas) if mesas_creadas else len(mesas_a_crear)
+            "message": "Mesas sincronizadas correctamente",
+            "resultados": resultado.model_dump(),
+            "mesas_creadas": [mesa.model_dump() for mesa in resultado.mesas_creadas],
+            "zonas_recibidas": [mesa.zona for mesa in mesas_domotica],
+            "total": len(mesas),
         }
 
+    except MesaValidationError as e:
+        logger.warning(f"Sincronización de mesas rechazada: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.exception(f"Error durante la sincronización de mesas: {str(e)}")
         raise HTTPException(
@@ -413,6 +437,11 @@ async def enrich_database(
         
         # Commit de los cambios
         await session.commit()
+
+        # Las relaciones se insertaron directamente: recalcular máscaras de alérgenos
+        from src.business_logic.menu.producto_alergeno_service import ProductoAlergenoService
+        productos_con_mascara = await ProductoAlergenoService(session).recalcular_mascaras()
+        logger.info(f"🧮 Máscaras de alérgenos recalculadas para {productos_con_mascara} productos")
         
         # Obtener estadísticas después del enriquecimiento
         query_alergenos_despues = select(func.count(AlergenoModel.id))
@@ -0,0 +1,14 @@
+"""
+Pydantic schemas for authentication operations.
+"""
+
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class LogoutRequest(BaseModel):
+    """Schema for closing a session."""
+
+    refresh_token: Optional[str] = Field(
+        default=None, description="Refresh token of the session, revoked together with the access token"
+    )
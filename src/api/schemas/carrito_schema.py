@@ -0,0 +1,49 @@
+"""
+Schemas de Pydantic para la cotización del carrito.
+
+El carrito no se guarda: la aplicación envía sus líneas y recibe los
+precios calculados con el menú vigente y los errores de cada línea.
+"""
+
+from typing import Optional, List
+from decimal import Decimal
+from pydantic import BaseModel, Field
+
+from src.api.schemas.pedido_schema import PedidoItemOpcion
+
+
+class CarritoLinea(BaseModel):
+    """Schema para una línea del carrito."""
+    id_producto: str = Field(description="ID del producto.")
+    cantidad: int = Field(default=1, ge=1, le=99, description="Unidades.")
+    opciones: List[str] = Field(
+        default_factory=list, max_length=50, description="IDs de las opciones elegidas."
+    )
+
+
+class CarritoCotizar(BaseModel):
+    """Schema con las líneas del carrito a cotizar."""
+    lineas: List[CarritoLinea] = Field(
+        min_length=1, max_length=100, description="Líneas del carrito."
+    )
+
+
+class LineaCotizada(BaseModel):
+    """Schema con el precio de una línea del carrito."""
+    id_producto: str = Field(description="ID del producto.")
+    nombre_producto: Optional[str] = Field(default=None, description="Nombre del producto, si está disponible.")
+    cantidad: int = Field(description="Unidades.")
+    precio_base: Decimal = Field(description="Precio base del producto.")
+    precio_unitario: Decimal = Field(description="Precio base más opciones.")
+    total: Decimal = Field(description="Precio unitario por cantidad.")
+    opciones: List[PedidoItemOpcion] = Field(default_factory=list, description="Opciones válidas elegidas.")
+    valida: bool = Field(description="Indica si la línea se puede pedir.")
+    errores: List[str] = Field(default_factory=list, description="Motivos por los que la línea no es válida.")
+
+
+class CarritoCotizacion(BaseModel):
+    """Schema con la cotización completa del carrito."""
+    version_menu: int = Field(description="Versión del menú usada para los precios.")
+    lineas: List[LineaCotizada] = Field(description="Líneas en el orden recibido.")
+    total: Decimal = Field(description="Suma de las líneas válidas.")
+    valido: bool = Field(description="Indica si todas las líneas se pueden pedir.")
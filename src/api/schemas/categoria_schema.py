@@ -26,8 +26,13 @@ class CategoriaBase(BaseModel):
 
 class CategoriaCreate(CategoriaBase):
     """Schema for creating a new categoria."""
-    
-    pass
+
+    estacion: str = Field(
+        default="cocina",
+        description="Kitchen station that prepares the category products",
+        min_length=1,
+        max_length=50
+    )
 
 
 class CategoriaUpdate(BaseModel):
@@ -49,6 +54,12 @@ class CategoriaUpdate(BaseModel):
         description="Category image path", 
         max_length=255
     )
+    estacion: Optional[str] = Field(
+        default=None,
+        description="Kitchen station that prepares the category products",
+        min_length=1,
+        max_length=50
+    )
     # NOTA: activo se maneja por endpoint separado (como en rol_schema)
 
 
@@ -58,6 +69,9 @@ class CategoriaResponse(CategoriaBase):
     model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
 
     id: str = Field(description="Category ID")
+    estacion: Optional[str] = Field(
+        default=None, description="Kitchen station that prepares the category products"
+    )
     activo: bool = Field(description="Indicates if the category is active")
     fecha_creacion: Optional[datetime] = Field(
         default=None, description="Creation timestamp"
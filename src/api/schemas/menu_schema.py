@@ -0,0 +1,107 @@
+"""
+Pydantic schemas for the public menu bundle.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.api.schemas.producto_schema import TipoOpcionConOpcionesSchema
+from src.api.schemas.producto_alergeno_schema import AlergenoDeProducto
+
+
+class MenuProducto(BaseModel):
+    """Schema for a product inside the menu bundle."""
+
+    id: str = Field(description="Product ID")
+    id_categoria: str = Field(description="Category ID")
+    nombre: str = Field(description="Product name")
+    descripcion: Optional[str] = Field(default=None, description="Product description")
+    precio_base: Decimal = Field(description="Base price")
+    imagen_path: Optional[str] = Field(default=None, description="Product image path")
+    imagen_alt_text: Optional[str] = Field(default=None, description="Image alt text")
+    destacado: bool = Field(default=False, description="Whether the product is featured")
+    alergenos: List[AlergenoDeProducto] = Field(
+        default_factory=list, description="Active allergens of the product"
+    )
+    tipos_opciones: List[TipoOpcionConOpcionesSchema] = Field(
+        default_factory=list, description="Option types with their grouped options"
+    )
+
+
+class MenuCategoriaResumen(BaseModel):
+    """Schema for a category without its products."""
+
+    id: str = Field(description="Category ID")
+    nombre: str = Field(description="Category name")
+    descripcion: Optional[str] = Field(default=None, description="Category description")
+    imagen_path: Optional[str] = Field(default=None, description="Category image path")
+    estacion: Optional[str] = Field(default=None, description="Kitchen station that prepares its products")
+
+
+class MenuCategoria(MenuCategoriaResumen):
+    """Schema for a category inside the menu bundle."""
+
+    productos: List[MenuProducto] = Field(
+        default_factory=list, description="Available products of the category"
+    )
+
+
+class MenuResponse(BaseModel):
+    """Schema for the whole public menu as a single document."""
+
+    version: int = Field(description="Menu version the document was built from")
+    generado_en: datetime = Field(description="Build timestamp")
+    categorias: List[MenuCategoria] = Field(description="Active categories with their products")
+
+
+class MenuCambiosResponse(BaseModel):
+    """Schema for the changes applied to the menu since a given version.
+
+    Upserted products carry their full current state. A removed category
+    implies removing its products on the client. When
+    ``requiere_menu_completo`` is true the lists are empty and the client
+    must download the whole menu again.
+    """
+
+    desde: int = Field(description="Version the changes are computed from")
+    version: int = Field(description="Current menu version")
+    requiere_menu_completo: bool = Field(
+        default=False, description="Whether the client must reload the whole menu"
+    )
+    categorias: List[MenuCategoriaResumen] = Field(
+        default_factory=list, description="Created or updated categories"
+    )
+    productos: List[MenuProducto] = Field(
+        default_factory=list, description="Created or updated products"
+    )
+    categorias_eliminadas: List[str] = Field(
+        default_factory=list, description="IDs of categories no longer in the menu"
+    )
+    productos_eliminados: List[str] = Field(
+        default_factory=list, description="IDs of products no longer in the menu"
+    )
+
+
+class ProductoDisponibilidad(BaseModel):
+    """Schema for the availability and price of a single product."""
+
+    id: str = Field(description="Product ID")
+    disponible: bool = Field(description="Whether the product can be ordered")
+    precio_base: Optional[Decimal] = Field(
+        default=None, description="Current base price (omitted when not available)"
+    )
+
+
+class MenuDisponibilidadEvento(BaseModel):
+    """Schema for a compact availability event pushed through the menu stream."""
+
+    version: int = Field(description="Menu version after applying the event")
+    requiere_menu_completo: bool = Field(
+        default=False, description="Whether the client must reload the whole menu"
+    )
+    productos: List[ProductoDisponibilidad] = Field(
+        default_factory=list, description="Products whose availability or price changed"
+    )
@@ -6,7 +6,7 @@ representar las mesas en la API.
 """
 
 
-from typing import Optional, ClassVar, List
+from typing import Optional, ClassVar, List, Dict
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
@@ -90,7 +90,10 @@ class MesaUpdate(BaseModel):
     )
     estado: Optional[EstadoMesa] = Field(
         default=None,
-        description="Nuevo estado de la mesa (libre, disponible, ocupada, reservada, fuera de servicio)."
+        description=(
+            "Nuevo estado de la mesa (libre, disponible, ocupada, reservada, fuera de servicio). "
+            "Debe ser una transición permitida desde el estado actual."
+        )
     )
 
 
@@ -105,6 +108,7 @@ class MesaResponse(MesaBase):
 
     id: str = Field(description="Identificador único de la mesa (ULID).")
     activo: bool = Field(description="Indica si la mesa está activa en el sistema.")
+    version: Optional[int] = Field(default=None, description="Versión de la mesa para control de concurrencia.")
     fecha_creacion: Optional[datetime] = Field(
         default=None, description="Fecha y hora de creación del registro."
     )
@@ -127,8 +131,70 @@ class MesaSummary(BaseModel):
     zona: Optional[str] = Field(description="Zona donde se encuentra la mesa.")
     nota: Optional[str] = Field(description="Notas adicionales sobre la mesa.")
     estado: EstadoMesa = Field(description="Estado actual de la mesa.")
+    version: Optional[int] = Field(default=None, description="Versión de la mesa para control de concurrencia.")
 
 class MesaList(BaseModel):
     """Schema para respuestas paginadas que contienen una lista de mesas."""
     items: List[MesaSummary] = Field(description="Lista de mesas en la página actual.")
     total: int = Field(description="Número total de mesas que coinciden con la consulta.")
+
+
+class MesaZonaResumen(BaseModel):
+    """Schema con la ocupación de una zona."""
+    zona: Optional[str] = Field(description="Zona; None agrupa las mesas sin zona.")
+    por_estado: Dict[EstadoMesa, int] = Field(description="Número de mesas en cada estado.")
+    total_mesas: int = Field(description="Número de mesas activas en la zona.")
+    asientos_libres: int = Field(description="Capacidad total de las mesas libres o disponibles.")
+    asientos_ocupados: int = Field(description="Capacidad total de las mesas ocupadas.")
+
+
+class MesaResumen(BaseModel):
+    """Schema con la ocupación de las mesas activas, por zona y en total."""
+    zonas: List[MesaZonaResumen] = Field(description="Ocupación de cada zona, ordenada por nombre.")
+    total_mesas: int = Field(description="Número total de mesas activas.")
+    asientos_libres: int = Field(description="Capacidad total de las mesas libres o disponibles.")
+    asientos_ocupados: int = Field(description="Capacidad total de las mesas ocupadas.")
+
+
+class MesaTransicion(BaseModel):
+    """
+    Schema para solicitar un cambio de estado de una mesa.
+
+    Si se indica la versión, el cambio solo se aplica si la mesa no fue
+    modificada desde que el cliente la leyó.
+    """
+    estado: EstadoMesa = Field(description="Estado al que se quiere pasar la mesa.")
+    version: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Versión de la mesa conocida por el cliente.",
+    )
+
+
+class MesaSync(BaseModel):
+    """
+    Schema con el estado de una mesa recibido del sistema externo.
+
+    Los campos en None no se comparan ni se sobrescriben en mesas existentes.
+    """
+    numero: str = Field(description="Número de la mesa; clave de la sincronización.", min_length=1, max_length=20)
+    zona: Optional[str] = Field(default=None, description="Zona donde se encuentra la mesa.")
+    nota: Optional[str] = Field(default=None, description="Notas adicionales sobre la mesa.")
+    capacidad: Optional[int] = Field(default=None, description="Capacidad de la mesa.")
+    estado: Optional[EstadoMesa] = Field(default=None, description="Estado actual de la mesa.")
+
+
+class MesaSyncResultado(BaseModel):
+    """Schema con el resumen de una sincronización de mesas."""
+    creadas: int = Field(default=0, description="Mesas nuevas insertadas.")
+    actualizadas: int = Field(default=0, description="Mesas con algún cambio aplicado.")
+    desactivadas: int = Field(default=0, description="Mesas que dejaron de recibirse.")
+    sin_cambios: int = Field(default=0, description="Mesas recibidas sin cambios.")
+    conflictos: int = Field(
+        default=0, description="Mesas no actualizadas porque otra petición las modificaba a la vez."
+    )
+    mesas_creadas: List[MesaResponse] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Mesas insertadas; se devuelven aparte de los contadores.",
+    )
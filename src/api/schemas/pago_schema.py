@@ -0,0 +1,95 @@
+"""
+Schemas de Pydantic para pagos y división de cuentas.
+"""
+
+from typing import Optional, ClassVar, List, Dict
+from datetime import datetime
+from decimal import Decimal
+from pydantic import BaseModel, Field, ConfigDict
+
+from src.core.enums.pago_enums import EstadoPago, MetodoPago
+from src.core.enums.pedido_enums import TipoDivision
+
+
+class AsignacionItem(BaseModel):
+    """Schema con los comensales que pagan un ítem."""
+    id_item: str = Field(description="ID del ítem de pedido.")
+    comensales: List[str] = Field(
+        min_length=1, max_length=50, description="Comensales que comparten el ítem."
+    )
+
+
+class DivisionCuentaRequest(BaseModel):
+    """Schema para calcular la división de la cuenta de una mesa."""
+    id_mesa: str = Field(description="ID de la mesa.")
+    tipo: TipoDivision = Field(description="Modo de división.")
+    pedidos: Optional[List[str]] = Field(
+        default=None,
+        max_length=100,
+        description="Pedidos a incluir; por defecto todos los no cancelados de la mesa.",
+    )
+    comensales: Optional[int] = Field(
+        default=None, ge=1, le=100, description="Número de comensales (división equitativa)."
+    )
+    asignaciones: List[AsignacionItem] = Field(
+        default_factory=list, max_length=1000, description="Comensales de cada ítem (división por ítems)."
+    )
+    importes: Dict[str, Decimal] = Field(
+        default_factory=dict, description="Importe de cada comensal (división manual)."
+    )
+
+
+class ParteCuenta(BaseModel):
+    """Schema con lo que paga un comensal."""
+    comensal: str = Field(description="Identificador del comensal.")
+    importe: Decimal = Field(description="Importe a pagar.")
+    items: List[str] = Field(default_factory=list, description="Ítems que paga (división por ítems).")
+
+
+class DivisionCuentaResponse(BaseModel):
+    """Schema con la división de la cuenta de una mesa."""
+    id_mesa: str = Field(description="ID de la mesa.")
+    tipo: TipoDivision = Field(description="Modo de división.")
+    pedidos: List[str] = Field(description="Pedidos incluidos en la cuenta.")
+    total: Decimal = Field(description="Importe total de la cuenta.")
+    partes: List[ParteCuenta] = Field(description="Parte de cada comensal.")
+    pendiente: Decimal = Field(description="Importe que no se asignó a ningún comensal.")
+    items_sin_asignar: List[str] = Field(default_factory=list, description="Ítems que nadie paga.")
+
+
+class PagoCreate(BaseModel):
+    """Schema para registrar un pago."""
+    id_mesa: str = Field(description="ID de la mesa que paga.")
+    id_pedido: Optional[str] = Field(default=None, description="Pedido al que se aplica el pago.")
+    comensal: Optional[str] = Field(
+        default=None, max_length=50, description="Comensal que paga, según la división de la cuenta."
+    )
+    metodo: MetodoPago = Field(description="Medio de pago.")
+    monto: Decimal = Field(gt=0, max_digits=10, decimal_places=2, description="Importe pagado.")
+    referencia: Optional[str] = Field(
+        default=None, max_length=100, description="Número de operación de Yape, Plin o tarjeta."
+    )
+
+
+class PagoTransicion(BaseModel):
+    """Schema para solicitar un cambio de estado de un pago."""
+    estado: EstadoPago = Field(description="Estado al que se quiere pasar el pago.")
+    referencia: Optional[str] = Field(
+        default=None, max_length=100, description="Número de operación recibido en la confirmación."
+    )
+
+
+class PagoResponse(BaseModel):
+    """Schema para representar un pago en las respuestas de la API."""
+    model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Identificador único del pago (ULID).")
+    id_mesa: str = Field(description="ID de la mesa.")
+    id_pedido: Optional[str] = Field(default=None, description="Pedido al que se aplica el pago.")
+    comensal: Optional[str] = Field(default=None, description="Comensal que paga.")
+    metodo: MetodoPago = Field(description="Medio de pago.")
+    estado: EstadoPago = Field(description="Estado actual del pago.")
+    monto: Decimal = Field(description="Importe pagado.")
+    referencia: Optional[str] = Field(default=None, description="Número de operación.")
+    version: int = Field(description="Versión del pago para control de concurrencia.")
+    fecha_creacion: Optional[datetime] = Field(default=None, description="Fecha y hora de creación.")
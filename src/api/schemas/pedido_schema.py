@@ -0,0 +1,124 @@
+"""
+Schemas de Pydantic para la entidad Pedido.
+
+Este módulo define las estructuras de datos para crear y representar los
+pedidos y sus ítems en la API.
+"""
+
+from typing import Optional, ClassVar, List
+from datetime import datetime
+from decimal import Decimal
+from pydantic import BaseModel, Field, ConfigDict
+
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+
+class PedidoItemCreate(BaseModel):
+    """Schema para un producto solicitado dentro de un pedido nuevo."""
+    id_producto: str = Field(description="ID del producto.")
+    cantidad: int = Field(default=1, ge=1, le=99, description="Unidades solicitadas.")
+    opciones: List[str] = Field(
+        default_factory=list, description="IDs de las opciones elegidas para el producto."
+    )
+    notas: Optional[str] = Field(default=None, max_length=255, description="Indicaciones para cocina.")
+
+
+class PedidoCreate(BaseModel):
+    """
+    Schema para la creación de un pedido.
+
+    Los precios no se envían: se calculan en el servidor con el menú vigente.
+    """
+    id_mesa: str = Field(description="ID de la mesa que realiza el pedido.")
+    items: List[PedidoItemCreate] = Field(
+        min_length=1, max_length=100, description="Productos solicitados."
+    )
+    prioridad: PrioridadPedido = Field(
+        default=PrioridadPedido.NORMAL, description="Prioridad del pedido en cocina."
+    )
+    notas: Optional[str] = Field(default=None, max_length=255, description="Indicaciones generales.")
+
+
+class PedidoItemOpcion(BaseModel):
+    """Schema con la copia de una opción elegida al crear el pedido."""
+    id: str = Field(description="ID de la opción.")
+    nombre: str = Field(description="Nombre de la opción.")
+    precio_adicional: Decimal = Field(description="Precio adicional cobrado.")
+
+
+class PedidoItemResponse(BaseModel):
+    """Schema para representar un ítem de pedido en las respuestas de la API."""
+    model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Identificador único del ítem (ULID).")
+    id_producto: str = Field(description="ID del producto.")
+    nombre_producto: str = Field(description="Nombre del producto al crear el pedido.")
+    cantidad: int = Field(description="Unidades solicitadas.")
+    precio_unitario: Decimal = Field(description="Precio base más opciones.")
+    subtotal: Decimal = Field(description="Precio unitario por cantidad.")
+    opciones: List[PedidoItemOpcion] = Field(description="Opciones elegidas.")
+    notas: Optional[str] = Field(default=None, description="Indicaciones para cocina.")
+    estacion: str = Field(default="cocina", description="Estación de cocina que prepara el ítem.")
+    estado: EstadoPedido = Field(default=EstadoPedido.PENDIENTE, description="Estado de preparación del ítem.")
+
+
+class PedidoResponse(BaseModel):
+    """Schema para representar un pedido en las respuestas de la API."""
+    model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Identificador único del pedido (ULID).")
+    id_mesa: str = Field(description="ID de la mesa.")
+    estado: EstadoPedido = Field(description="Estado actual del pedido.")
+    prioridad: PrioridadPedido = Field(description="Prioridad del pedido en cocina.")
+    total: Decimal = Field(description="Importe total del pedido.")
+    notas: Optional[str] = Field(default=None, description="Indicaciones generales.")
+    version_menu: int = Field(description="Versión del menú usada para los precios.")
+    version: Optional[int] = Field(default=None, description="Versión del pedido para control de concurrencia.")
+    fecha_creacion: Optional[datetime] = Field(default=None, description="Fecha y hora de creación.")
+    items: List[PedidoItemResponse] = Field(description="Productos solicitados.")
+
+
+class PedidoSummary(BaseModel):
+    """Schema con información resumida de un pedido para listas."""
+    model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Identificador único del pedido (ULID).")
+    id_mesa: str = Field(description="ID de la mesa.")
+    estado: EstadoPedido = Field(description="Estado actual del pedido.")
+    prioridad: PrioridadPedido = Field(description="Prioridad del pedido en cocina.")
+    total: Decimal = Field(description="Importe total del pedido.")
+    fecha_creacion: Optional[datetime] = Field(default=None, description="Fecha y hora de creación.")
+
+
+class PedidoList(BaseModel):
+    """Schema para respuestas paginadas que contienen una lista de pedidos."""
+    items: List[PedidoSummary] = Field(description="Lista de pedidos en la página actual.")
+    total: int = Field(description="Número total de pedidos que coinciden con la consulta.")
+
+
+class ItemCocina(BaseModel):
+    """Schema de un ítem tal como se muestra en la pantalla de su estación."""
+    id: str = Field(description="ID del ítem.")
+    id_pedido: str = Field(description="ID del pedido.")
+    id_mesa: str = Field(description="ID de la mesa.")
+    orden: int = Field(description="Posición del ítem dentro del pedido.")
+    nombre_producto: str = Field(description="Nombre del producto.")
+    cantidad: int = Field(description="Unidades a preparar.")
+    opciones: List[str] = Field(default_factory=list, description="Nombres de las opciones elegidas.")
+    notas: Optional[str] = Field(default=None, description="Indicaciones para cocina.")
+    estacion: str = Field(description="Estación que prepara el ítem.")
+    estado: EstadoPedido = Field(description="Estado de preparación del ítem.")
+    prioridad: PrioridadPedido = Field(description="Prioridad del pedido.")
+    fecha_pedido: Optional[datetime] = Field(default=None, description="Fecha y hora del pedido.")
+
+
+class ItemCocinaTransicion(BaseModel):
+    """Schema para cambiar el estado de preparación de un ítem."""
+    estado: EstadoPedido = Field(description="Estado al que debe pasar el ítem.")
+
+
+class ColaCocinaResponse(BaseModel):
+    """Schema con los ítems pendientes de una estación en orden de preparación."""
+    estacion: str = Field(description="Estación de cocina.")
+    items: List[ItemCocina] = Field(description="Ítems por prioridad y antigüedad del pedido.")
+    total: int = Field(description="Número de ítems en la cola.")
@@ -6,7 +6,7 @@ from typing import Optional, ClassVar, List
 # UUID removed - using str for ULID compatibility
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
-from src.core.enums.alergeno_enums import NivelPresencia
+from src.core.enums.alergeno_enums import NivelPresencia, NivelRiesgo
 
 
 class ProductoAlergenoBase(BaseModel):
@@ -81,3 +81,43 @@ class ProductoAlergenoList(BaseModel):
 
     items: List[ProductoAlergenoSummary]
     total: int = Field(description="Total number of producto-alergeno relationships")
+
+
+class AlergenoDeProducto(BaseModel):
+    """Schema for an allergen as it appears on a given product."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Allergen ID")
+    nombre: str = Field(description="Allergen name")
+    icono: Optional[str] = Field(default=None, description="Allergen icon")
+    nivel_riesgo: NivelRiesgo = Field(description="Allergen risk level")
+    nivel_presencia: NivelPresencia = Field(description="Allergen presence level in the product")
+    notas: Optional[str] = Field(default=None, description="Product-specific notes")
+
+
+class ProductoAlergenos(BaseModel):
+    """Schema for the allergens of a single product."""
+
+    id_producto: str = Field(description="Product ID")
+    alergenos: List[AlergenoDeProducto] = Field(
+        default_factory=list, description="Active allergens of the product"
+    )
+
+
+class ProductoAlergenosBatchRequest(BaseModel):
+    """Schema for requesting the allergens of many products at once."""
+
+    MAX_PRODUCTOS: ClassVar[int] = 500
+
+    ids_producto: List[str] = Field(
+        min_length=1,
+        max_length=MAX_PRODUCTOS,
+        description="Product IDs to look up (duplicates are ignored)",
+    )
+
+
+class ProductoAlergenosBatchResponse(BaseModel):
+    """Schema for the batch allergen lookup response, in request order."""
+
+    items: List[ProductoAlergenos]
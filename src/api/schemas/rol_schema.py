@@ -7,6 +7,8 @@ from typing import Optional, ClassVar, List
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.enums.user_enums import Permiso
+
 
 class RolBase(BaseModel):
     """Base schema for Rol."""
@@ -15,6 +17,10 @@ class RolBase(BaseModel):
     descripcion: Optional[str] = Field(
         default=None, description="Role description", max_length=255
     )
+    permisos: Optional[List[Permiso]] = Field(
+        default=None,
+        description="Role permissions; built-in roles use their defaults when omitted",
+    )
 
 
 class RolCreate(RolBase):
@@ -32,6 +38,9 @@ class RolUpdate(BaseModel):
     descripcion: Optional[str] = Field(
         default=None, description="Role description", max_length=255
     )
+    permisos: Optional[List[Permiso]] = Field(
+        default=None, description="Role permissions"
+    )
 
 
 class RolResponse(RolBase):
@@ -0,0 +1,212 @@
+"""
+Resolución de permisos por rol en memoria.
+
+Cada permiso ocupa un bit y los permisos de cada rol se compilan en un
+entero, de modo que comprobar un permiso es una búsqueda en un dict y un
+AND de bits, sin consultar la base de datos. El mapa se carga al arrancar
+y se recarga en todos los workers cuando ``RolService`` publica un cambio
+en el canal ``roles`` del bus de eventos, cuando el bus reconecta y cada
+``state_sync_interval`` segundos, por si se perdió algún aviso.
+"""
+
+import logging
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+
+from src.core.database import DatabaseManager
+from src.core.enums.user_enums import Permiso, RoleName
+from src.repositories.auth.rol_repository import RolRepository
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+FabricaSesion = Callable[[], AbstractAsyncContextManager]
+
+# Canal del bus en el que se anuncian los cambios de roles
+CANAL_ROLES = "roles"
+
+# Bit de cada permiso
+BIT_PERMISO: Dict[Permiso, int] = {permiso: 1 << i for i, permiso in enumerate(Permiso)}
+
+# Permisos de los roles predefinidos cuando el rol no define los suyos
+PERMISOS_POR_DEFECTO: Dict[RoleName, FrozenSet[Permiso]] = {
+    RoleName.CLIENTE: frozenset({Permiso.PEDIDOS_CREAR}),
+    RoleName.MESERO: frozenset({
+        Permiso.MESAS_VER,
+        Permiso.MESAS_GESTIONAR,
+        Permiso.PEDIDOS_CREAR,
+        Permiso.PEDIDOS_VER,
+        Permiso.PAGOS_REGISTRAR,
+    }),
+    RoleName.COCINA: frozenset({Permiso.PEDIDOS_VER, Permiso.COCINA_GESTIONAR}),
+    RoleName.ADMIN: frozenset(Permiso),
+}
+
+
+def compilar(permisos: Iterable[str]) -> int:
+    """
+    Compila una lista de permisos en su máscara de bits.
+
+    Parameters
+    ----------
+    permisos : Iterable[str]
+        Códigos de permiso; los desconocidos se ignoran.
+
+    Returns
+    -------
+    int
+        Máscara con un bit por permiso.
+    """
+    bits = 0
+    for codigo in permisos:
+        try:
+            bits |= BIT_PERMISO[Permiso(codigo)]
+        except ValueError:
+            logger.warning("Permiso desconocido ignorado: %s", codigo)
+    return bits
+
+
+def _mascaras_por_defecto() -> Dict[str, int]:
+    """Máscaras de los roles predefinidos."""
+    return {rol.value: compilar(permisos) for rol, permisos in PERMISOS_POR_DEFECTO.items()}
+
+
+class MapaPermisos:
+    """Permisos de cada rol compilados en máscaras de bits.
+
+    Hasta la primera carga contiene los permisos por defecto de los roles
+    predefinidos.
+
+    Attributes
+    ----------
+    version : int
+        Número de cargas realizadas.
+    """
+
+    def __init__(self, fabrica_sesion: Optional[FabricaSesion] = None):
+        """
+        Inicializa el mapa con los permisos por defecto.
+
+        Parameters
+        ----------
+        fabrica_sesion : Optional[FabricaSesion], optional
+            Crea sesiones de base de datos de corta duración. Por defecto
+            ``DatabaseManager().session``.
+        """
+        self._fabrica_sesion = fabrica_sesion or DatabaseManager().session
+        self._mascaras: Dict[str, int] = _mascaras_por_defecto()
+        self.version = 0
+
+    def mascara(self, rol: Optional[str]) -> int:
+        """
+        Obtiene la máscara de permisos de un rol.
+
+        Parameters
+        ----------
+        rol : Optional[str]
+            Nombre del rol (sin distinguir mayúsculas).
+
+        Returns
+        -------
+        int
+            Máscara del rol; cero si no existe o está inactivo.
+        """
+        if not rol:
+            return 0
+        return self._mascaras.get(rol.lower(), 0)
+
+    def tiene(self, rol: Optional[str], *permisos: Permiso) -> bool:
+        """
+        Indica si un rol tiene todos los permisos indicados.
+
+        Parameters
+        ----------
+        rol : Optional[str]
+            Nombre del rol.
+        *permisos : Permiso
+            Permisos requeridos.
+
+        Returns
+        -------
+        bool
+            True si el rol tiene todos los permisos.
+        """
+        requeridos = 0
+        for permiso in permisos:
+            requeridos |= BIT_PERMISO[permiso]
+        return self.mascara(rol) & requeridos == requeridos
+
+    def cargar(self, roles: Iterable) -> None:
+        """
+        Reemplaza el mapa con los roles indicados.
+
+        Los roles predefinidos sin fila conservan sus permisos por defecto;
+        con una tabla de roles vacía el mapa no deja a todos sin acceso.
+
+        Parameters
+        ----------
+        roles : Iterable[RolModel]
+            Roles con ``nombre``, ``activo`` y ``permisos``.
+        """
+        por_defecto = _mascaras_por_defecto()
+        mascaras: Dict[str, int] = dict(por_defecto)
+        for rol in roles:
+            nombre = rol.nombre.lower()
+            if not rol.activo:
+                mascaras.pop(nombre, None)
+                continue
+            if rol.permisos is None:
+                mascaras[nombre] = por_defecto.get(nombre, 0)
+            else:
+                mascaras[nombre] = compilar(rol.permisos)
+        # Se sustituye el dict completo: las lecturas nunca ven un mapa a medias
+        self._mascaras = mascaras
+        self.version += 1
+
+    async def recargar(self) -> int:
+        """
+        Carga los roles desde la base de datos.
+
+        Returns
+        -------
+        int
+            Número de roles activos en el mapa.
+        """
+        async with self._fabrica_sesion() as session:
+            roles = await RolRepository(session).get_todos()
+        self.cargar(roles)
+        logger.info("Permisos de roles cargados: %d roles activos", len(self._mascaras))
+        return len(self._mascaras)
+
+    async def entregar(self, evento: Evento) -> None:
+        """
+        Recarga el mapa al recibir un cambio de roles del bus.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento ``roles_actualizados``.
+        """
+        await self.recargar()
+
+
+# Instancia única del mapa de permisos (patrón singleton)
+_mapa_permisos: Optional[MapaPermisos] = None
+
+
+def get_mapa_permisos() -> MapaPermisos:
+    """
+    Obtiene o crea el mapa de permisos y lo suscribe al bus de eventos.
+
+    Returns
+    -------
+    MapaPermisos
+        Mapa compartido por todas las peticiones del worker.
+    """
+    global _mapa_permisos
+    if _mapa_permisos is None:
+        _mapa_permisos = MapaPermisos()
+        bus = get_event_bus()
+        bus.suscribir(CANAL_ROLES, _mapa_permisos.entregar)
+        bus.al_reconectar(_mapa_permisos.recargar)
+    return _mapa_permisos
@@ -0,0 +1,237 @@
+"""
+Lista de tokens revocados en memoria.
+
+Cada worker mantiene un filtro de Bloom con los ``jti`` revocados y un
+dict con el corte de los usuarios dados de baja. Comprobar un token
+normal cuesta un hash y unos accesos a memoria; solo un positivo del
+filtro (un token revocado o un falso positivo) consulta la base de
+datos, y el resultado se recuerda.
+
+La lista se carga al arrancar y, cuando ``RevocacionService`` publica una
+revocación en el canal ``revocaciones`` del bus de eventos, cada worker
+lee solo las revocaciones nuevas. Como el bus puede perder avisos, la
+lectura incremental se repite también cada ``state_sync_interval``
+segundos y la lista se recarga completa cuando el bus reconecta.
+"""
+
+import logging
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Optional
+
+from src.core.bloom import FiltroBloom
+from src.core.cache import TTLCache
+from src.core.config import get_settings
+from src.core.database import DatabaseManager
+from src.repositories.auth.token_revocado_repository import TokenRevocadoRepository
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+FabricaSesion = Callable[[], AbstractAsyncContextManager]
+
+# Canal del bus en el que se anuncian las revocaciones
+CANAL_REVOCACIONES = "revocaciones"
+
+# Margen con el que se releen las revocaciones al sincronizar: cubre las
+# que otro worker confirmó tarde con un ``revocado_en`` anterior
+MARGEN_SINCRONIZACION = timedelta(seconds=60)
+
+
+def a_timestamp(momento: datetime) -> float:
+    """Convierte un momento UTC sin zona horaria a segundos desde epoch."""
+    return momento.replace(tzinfo=timezone.utc).timestamp()
+
+
+class ListaRevocacion:
+    """Tokens revocados de todos los workers, consultables sin base de datos.
+
+    Attributes
+    ----------
+    filtro : FiltroBloom
+        ``jti`` de los tokens revocados que aún no expiraron.
+    version : int
+        Número de cargas completas realizadas.
+    """
+
+    def __init__(
+        self,
+        fabrica_sesion: Optional[FabricaSesion] = None,
+        capacidad: Optional[int] = None,
+        tasa_error: Optional[float] = None,
+    ):
+        """
+        Inicializa la lista vacía.
+
+        Parameters
+        ----------
+        fabrica_sesion : Optional[FabricaSesion], optional
+            Crea sesiones de base de datos de corta duración. Por defecto
+            ``DatabaseManager().session``.
+        capacidad : Optional[int], optional
+            Capacidad inicial del filtro. Por defecto ``token_revocation_capacity``.
+        tasa_error : Optional[float], optional
+            Tasa de falsos positivos. Por defecto ``token_revocation_error_rate``.
+        """
+        settings = get_settings()
+        self._fabrica_sesion = fabrica_sesion or DatabaseManager().session
+        self._capacidad = capacidad or settings.token_revocation_capacity
+        self._tasa_error = tasa_error or settings.token_revocation_error_rate
+        self.filtro = FiltroBloom(self._capacidad, self._tasa_error)
+        # id_usuario -> tokens emitidos hasta este momento (epoch) se rechazan
+        self._cortes: Dict[str, float] = {}
+        # jti -> resultado de la consulta a la base de datos tras un positivo
+        self._confirmados: TTLCache[bool] = TTLCache(maxsize=4096, ttl=3600)
+        self._marca: Optional[datetime] = None
+        self._cambios = 0
+        self.version = 0
+
+    def agregar(
+        self,
+        jti: Optional[str] = None,
+        id_usuario: Optional[str] = None,
+        revocado_en: Optional[datetime] = None,
+    ) -> None:
+        """
+        Añade una revocación a la lista de este worker.
+
+        Parameters
+        ----------
+        jti : Optional[str], optional
+            Token revocado.
+        id_usuario : Optional[str], optional
+            Usuario cuyos tokens se revocan, si no se indica ``jti``.
+        revocado_en : Optional[datetime], optional
+            Momento (UTC) de la revocación.
+        """
+        self._cambios += 1
+        if jti is not None:
+            # Las relecturas con margen no vuelven a contar en la capacidad
+            if jti not in self.filtro:
+                self.filtro.add(jti)
+            if self._confirmados.get(jti) is False:
+                self._confirmados.invalidate(jti)
+        elif id_usuario is not None and revocado_en is not None:
+            corte = a_timestamp(revocado_en)
+            self._cortes[id_usuario] = max(corte, self._cortes.get(id_usuario, corte))
+        if revocado_en is not None and (self._marca is None or revocado_en > self._marca):
+            self._marca = revocado_en
+
+    def _aplicar(self, revocaciones: Iterable) -> None:
+        """Añade revocaciones leídas de la base de datos."""
+        for revocacion in revocaciones:
+            self.agregar(revocacion.jti, revocacion.id_usuario, revocacion.revocado_en)
+
+    async def cargar(self) -> int:
+        """
+        Reconstruye la lista con las revocaciones vigentes.
+
+        Olvida las de tokens ya expirados; si hay más revocaciones que la
+        capacidad, el filtro nuevo se dimensiona al doble.
+
+        Returns
+        -------
+        int
+            Número de revocaciones vigentes.
+        """
+        ahora = datetime.utcnow()
+        async with self._fabrica_sesion() as session:
+            revocaciones = await TokenRevocadoRepository(session).get_vigentes(ahora)
+
+        capacidad = max(self._capacidad, 2 * len(revocaciones))
+        self.filtro = FiltroBloom(capacidad, self._tasa_error)
+        self._cortes = {}
+        self._confirmados.clear()
+        self._marca = None
+        self._aplicar(revocaciones)
+        if self._marca is None:
+            self._marca = ahora
+        self.version += 1
+        logger.info("Lista de revocación cargada: %d revocaciones vigentes", len(revocaciones))
+        return len(revocaciones)
+
+    async def sincronizar(self) -> int:
+        """
+        Añade las revocaciones registradas desde la última lectura.
+
+        Returns
+        -------
+        int
+            Número de revocaciones leídas.
+        """
+        if self._marca is None or self.filtro.saturado:
+            return await self.cargar()
+
+        async with self._fabrica_sesion() as session:
+            revocaciones = await TokenRevocadoRepository(session).get_vigentes(
+                datetime.utcnow(), desde=self._marca - MARGEN_SINCRONIZACION
+            )
+        self._aplicar(revocaciones)
+        return len(revocaciones)
+
+    async def esta_revocado(self, payload: dict) -> bool:
+        """
+        Indica si un token verificado está revocado.
+
+        Parameters
+        ----------
+        payload : dict
+            Contenido del token, con ``jti``, ``sub`` e ``iat``.
+
+        Returns
+        -------
+        bool
+            True si el token o todos los de su usuario fueron revocados.
+        """
+        corte = self._cortes.get(payload.get("sub"))
+        if corte is not None:
+            emitido = payload.get("iat")
+            if not isinstance(emitido, (int, float)) or emitido <= corte:
+                return True
+
+        jti = payload.get("jti")
+        if jti is None or jti not in self.filtro:
+            return False
+
+        revocado = self._confirmados.get(jti)
+        if revocado is None:
+            cambios = self._cambios
+            async with self._fabrica_sesion() as session:
+                revocado = await TokenRevocadoRepository(session).existe_jti(jti)
+            # Un "no revocado" leído mientras llegaba una revocación no se recuerda
+            if revocado or cambios == self._cambios:
+                self._confirmados.set(jti, revocado)
+        return revocado
+
+    async def entregar(self, evento: Evento) -> None:
+        """
+        Lee las revocaciones nuevas al recibir un aviso del bus.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento ``tokens_revocados``.
+        """
+        await self.sincronizar()
+
+
+# Instancia única de la lista de revocación (patrón singleton)
+_lista_revocacion: Optional[ListaRevocacion] = None
+
+
+def get_lista_revocacion() -> ListaRevocacion:
+    """
+    Obtiene o crea la lista de revocación y la suscribe al bus de eventos.
+
+    Returns
+    -------
+    ListaRevocacion
+        Lista compartida por todas las peticiones del worker.
+    """
+    global _lista_revocacion
+    if _lista_revocacion is None:
+        _lista_revocacion = ListaRevocacion()
+        bus = get_event_bus()
+        bus.suscribir(CANAL_REVOCACIONES, _lista_revocacion.entregar)
+        bus.al_reconectar(_lista_revocacion.cargar)
+    return _lista_revocacion
@@ -0,0 +1,131 @@
+"""
+Servicio para revocar tokens JWT (cierre de sesión y baja de personal).
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from src.core.config import get_settings
+from src.core.security import security
+from src.models.auth.token_revocado_model import TokenRevocadoModel
+from src.repositories.auth.token_revocado_repository import TokenRevocadoRepository
+from src.business_logic.auth.revocacion import CANAL_REVOCACIONES, get_lista_revocacion
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.exceptions.token_exceptions import TokenValidationError
+
+
+class RevocacionService:
+    """Servicio para revocar tokens.
+
+    La revocación se guarda en la base de datos, se aplica de inmediato en
+    la lista de este worker y se anuncia en el canal ``revocaciones`` para
+    que los demás lean las revocaciones nuevas.
+
+    Attributes
+    ----------
+    repository : TokenRevocadoRepository
+        Repositorio de revocaciones.
+    event_bus : EventBus
+        Bus en el que se anuncian las revocaciones.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.repository = TokenRevocadoRepository(session)
+        self.event_bus = get_event_bus()
+
+    async def _registrar(self, revocacion: TokenRevocadoModel) -> None:
+        """Guarda la revocación, la aplica en este worker y la anuncia."""
+        try:
+            await self.repository.create(revocacion)
+        except IntegrityError:
+            # El token ya estaba revocado: cerrar sesión dos veces no es un error
+            return
+
+        get_lista_revocacion().agregar(
+            revocacion.jti, revocacion.id_usuario, revocacion.revocado_en
+        )
+        await self.event_bus.publicar(Evento(
+            canal=CANAL_REVOCACIONES,
+            mensaje=WebSocketMessage(evento="tokens_revocados", payload={}),
+            clave="revocaciones",
+        ))
+
+    async def revocar_payload(self, payload: dict) -> None:
+        """
+        Revoca un token ya verificado.
+
+        Parameters
+        ----------
+        payload : dict
+            Contenido del token, con ``jti`` y ``exp``.
+
+        Raises
+        ------
+        TokenValidationError
+            Si el token no tiene ``jti`` o ``exp``.
+        """
+        jti = payload.get("jti")
+        expira = payload.get("exp")
+        if not jti or not isinstance(expira, (int, float)):
+            raise TokenValidationError("El token no se puede revocar individualmente")
+
+        await self._registrar(TokenRevocadoModel(
+            jti=jti,
+            id_usuario=payload.get("sub"),
+            revocado_en=datetime.utcnow(),
+            expira_en=datetime.utcfromtimestamp(expira),
+        ))
+
+    async def revocar_token(self, token: str, id_usuario: Optional[str] = None) -> None:
+        """
+        Revoca un token JWT, por ejemplo el refresh token al cerrar sesión.
+
+        Parameters
+        ----------
+        token : str
+            Token codificado.
+        id_usuario : Optional[str], optional
+            Si se indica, el token debe pertenecer a este usuario.
+
+        Raises
+        ------
+        TokenValidationError
+            Si el token no es válido, es de otro usuario o no se puede revocar.
+        """
+        payload = security.verify_token(token)
+        if payload is None:
+            raise TokenValidationError("Token inválido o expirado")
+        if id_usuario is not None and payload.get("sub") != id_usuario:
+            raise TokenValidationError("El token pertenece a otro usuario")
+        await self.revocar_payload(payload)
+
+    async def revocar_usuario(self, id_usuario: str) -> None:
+        """
+        Revoca todos los tokens emitidos hasta ahora para un usuario.
+
+        La revocación se conserva mientras pueda quedar algún token válido
+        del usuario, es decir, la vigencia de un refresh token.
+
+        Parameters
+        ----------
+        id_usuario : str
+            Identificador del usuario (``sub`` de sus tokens).
+        """
+        ahora = datetime.utcnow()
+        await self._registrar(TokenRevocadoModel(
+            id_usuario=id_usuario,
+            revocado_en=ahora,
+            expira_en=ahora + timedelta(days=get_settings().refresh_token_expire_days),
+        ))
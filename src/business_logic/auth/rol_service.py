@@ -7,6 +7,9 @@ from sqlalchemy.exc import IntegrityError
 
 from src.repositories.auth.rol_repository import RolRepository
 from src.models.auth.rol_model import RolModel
+from src.business_logic.auth.permisos import CANAL_ROLES
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+from src.api.schemas.scrapper_schemas import WebSocketMessage
 from src.api.schemas.rol_schema import (
     RolCreate,
     RolUpdate,
@@ -27,10 +30,15 @@ class RolService:
     Esta clase implementa la lógica de negocio para operaciones relacionadas
     con roles, incluyendo validaciones, transformaciones y manejo de excepciones.
 
+    Cada cambio se anuncia en el canal ``roles`` del bus de eventos para
+    que todos los workers recarguen su mapa de permisos.
+
     Attributes
     ----------
     repository : RolRepository
         Repositorio para acceso a datos de roles.
+    event_bus : EventBus
+        Bus en el que se anuncian los cambios de roles.
     """
 
     def __init__(self, session: AsyncSession):
@@ -43,6 +51,15 @@ class RolService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = RolRepository(session)
+        self.event_bus = get_event_bus()
+
+    async def _notificar_cambio(self) -> None:
+        """Anuncia que los roles cambiaron; los cambios pendientes se fusionan en uno."""
+        await self.event_bus.publicar(Evento(
+            canal=CANAL_ROLES,
+            mensaje=WebSocketMessage(evento="roles_actualizados", payload={}),
+            clave="roles",
+        ))
 
     async def create_rol(self, rol_data: RolCreate) -> RolResponse:
         """
@@ -65,10 +82,18 @@ class RolService:
         """
         try:
             # Crear modelo de rol desde los datos
-            rol = RolModel(nombre=rol_data.nombre, descripcion=rol_data.descripcion)
+            rol = RolModel(
+                nombre=rol_data.nombre,
+                descripcion=rol_data.descripcion,
+                permisos=(
+                    None if rol_data.permisos is None
+                    else [permiso.value for permiso in rol_data.permisos]
+                ),
+            )
 
             # Persistir en la base de datos
             created_rol = await self.repository.create(rol)
+            await self._notificar_cambio()
 
             # Convertir y retornar como esquema de respuesta
             return RolResponse.model_validate(created_rol)
@@ -133,6 +158,8 @@ class RolService:
 
         # Eliminar el rol
         result = await self.repository.delete(rol_id)
+        if result:
+            await self._notificar_cambio()
         return result
 
     async def get_roles(self, skip: int = 0, limit: int = 100) -> RolList:
@@ -193,7 +220,7 @@ class RolService:
         """
         # Convertir el esquema de actualización a un diccionario,
         # excluyendo valores None (campos no proporcionados para actualizar)
-        update_data = rol_data.model_dump(exclude_none=True)
+        update_data = rol_data.model_dump(mode="json", exclude_none=True)
 
         if not update_data:
             # Si no hay datos para actualizar, simplemente retornar el rol actual
@@ -206,6 +233,7 @@ class RolService:
             # Verificar si el rol fue encontrado
             if not updated_rol:
                 raise RolNotFoundError(f"No se encontró el rol con ID {rol_id}")
+            await self._notificar_cambio()
 
             # Convertir y retornar como esquema de respuesta
             return RolResponse.model_validate(updated_rol)
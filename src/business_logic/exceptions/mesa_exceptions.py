@@ -3,7 +3,7 @@ Excepciones específicas para la gestión de mesas.
 """
 
 from src.business_logic.exceptions.base_exceptions import (
-    ValidationError, NotFoundError, ConflictError
+    BusinessError, ValidationError, NotFoundError, ConflictError
 )
 
 
@@ -56,3 +56,58 @@ class MesaConflictError(ConflictError):
             Código de error para identificar el tipo específico de error.
         """
         super().__init__(message, error_code)
+
+
+class MesaTransicionError(MesaConflictError):
+    """Excepción lanzada cuando el cambio de estado de una mesa no está permitido."""
+
+    def __init__(self, message: str, error_code: str = "MESA_TRANSICION_INVALIDA"):
+        """
+        Inicializa la excepción de transición inválida.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+class MesaVersionConflictError(MesaConflictError):
+    """Excepción lanzada cuando la mesa fue modificada por otra petición."""
+
+    def __init__(self, message: str, error_code: str = "MESA_VERSION_CONFLICT"):
+        """
+        Inicializa la excepción de conflicto de versión.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+class MesaQRNoDisponibleError(BusinessError):
+    """Excepción lanzada cuando no se pueden generar códigos QR en este entorno."""
+
+    def __init__(
+        self,
+        message: str = "La generación de códigos QR requiere el paquete segno",
+        error_code: str = "MESA_QR_NO_DISPONIBLE",
+    ):
+        """
+        Inicializa la excepción de QR no disponible.
+
+        Parameters
+        ----------
+        message : str, optional
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
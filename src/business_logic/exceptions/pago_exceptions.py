@@ -0,0 +1,93 @@
+"""
+Excepciones específicas para la gestión de pagos.
+"""
+
+from src.business_logic.exceptions.base_exceptions import (
+    ValidationError, NotFoundError, ConflictError
+)
+
+
+class PagoValidationError(ValidationError):
+    """Excepción lanzada cuando la validación de un pago falla."""
+
+    def __init__(self, message: str, error_code: str = "PAGO_VALIDATION_ERROR"):
+        """
+        Inicializa la excepción de validación de pago.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error de validación.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+class PagoNotFoundError(NotFoundError):
+    """Excepción lanzada cuando no se encuentra un pago."""
+
+    def __init__(self, message: str = "Pago no encontrado", error_code: str = "PAGO_NOT_FOUND"):
+        """
+        Inicializa la excepción de pago no encontrado.
+
+        Parameters
+        ----------
+        message : str, optional
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+class PagoConflictError(ConflictError):
+    """Excepción lanzada cuando hay un conflicto con un pago."""
+
+    def __init__(self, message: str, error_code: str = "PAGO_CONFLICT"):
+        """
+        Inicializa la excepción de conflicto de pago.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error de conflicto.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+
+class PagoTransicionError(PagoConflictError):
+    """Excepción lanzada cuando el cambio de estado de un pago no está permitido."""
+
+    def __init__(self, message: str, error_code: str = "PAGO_TRANSICION_INVALIDA"):
+        """
+        Inicializa la excepción de transición inválida.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
+
+
+class PagoIdempotenciaError(PagoConflictError):
+    """Excepción lanzada cuando se reutiliza una clave de idempotencia con otros datos."""
+
+    def __init__(self, message: str, error_code: str = "PAGO_IDEMPOTENCIA_CONFLICT"):
+        """
+        Inicializa la excepción de conflicto de idempotencia.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
@@ -0,0 +1,22 @@
+"""
+Excepciones específicas para la gestión de tokens.
+"""
+
+from src.business_logic.exceptions.base_exceptions import ValidationError
+
+
+class TokenValidationError(ValidationError):
+    """Excepción lanzada cuando un token no es válido para la operación."""
+
+    def __init__(self, message: str, error_code: str = "TOKEN_VALIDATION_ERROR"):
+        """
+        Inicializa la excepción de validación de token.
+
+        Parameters
+        ----------
+        message : str
+            Mensaje descriptivo del error de validación.
+        error_code : str, optional
+            Código de error para identificar el tipo específico de error.
+        """
+        super().__init__(message, error_code)
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from src.repositories.menu.alergeno_repository import AlergenoRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
 from src.models.menu.alergeno_model import AlergenoModel
 from src.api.schemas.alergeno_schema import (
     AlergenoCreate,
@@ -31,6 +33,8 @@ class AlergenoService:
     ----------
     repository : AlergenoRepository
         Repositorio para acceso a datos de alérgenos.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
     """
 
     def __init__(self, session: AsyncSession):
@@ -43,6 +47,7 @@ class AlergenoService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = AlergenoRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
 
     async def create_alergeno(self, alergeno_data: AlergenoCreate) -> AlergenoResponse:
         """
@@ -135,8 +140,8 @@ class AlergenoService:
             raise AlergenoNotFoundError(f"No se encontró el alérgeno con ID {alergeno_id}")
 
         # Eliminar el alérgeno
-        result = await self.repository.delete(alergeno_id)
-        return result
+        await self.menu_cambio_repository.registrar(EntidadMenu.ALERGENO, [alergeno_id])
+        return await self.repository.delete(alergeno_id)
 
     async def get_alergenos(self, skip: int = 0, limit: int = 100) -> AlergenoList:
         """
@@ -204,6 +209,7 @@ class AlergenoService:
 
         try:
             # Actualizar el alérgeno
+            await self.menu_cambio_repository.registrar(EntidadMenu.ALERGENO, [alergeno_id])
             updated_alergeno = await self.repository.update(alergeno_id, **update_data)
 
             # Verificar si el alérgeno fue encontrado
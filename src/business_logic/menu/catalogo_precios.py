@@ -0,0 +1,310 @@
+"""
+Catálogo de precios derivado del menú público.
+
+Indexa por ID los productos visibles y sus opciones para validar y
+valorar pedidos en tiempo constante por línea, sin consultar la base de
+datos. Se construye una vez por versión del menú.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.api.schemas.menu_schema import MenuResponse
+
+CENTIMO = Decimal("0.01")
+
+# Estación que prepara los productos de categorías sin estación asignada
+ESTACION_POR_DEFECTO = "cocina"
+
+
+def redondear(importe: Decimal) -> Decimal:
+    """
+    Redondea un importe a céntimos (mitad hacia arriba).
+
+    Parameters
+    ----------
+    importe : Decimal
+        Importe a redondear.
+
+    Returns
+    -------
+    Decimal
+        Importe con dos decimales.
+    """
+    return importe.quantize(CENTIMO, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class OpcionPrecio:
+    """Opción de un producto con su precio adicional.
+
+    Attributes
+    ----------
+    id : str
+        Identificador de la opción.
+    nombre : str
+        Nombre de la opción.
+    precio_adicional : Decimal
+        Importe que se suma al precio base.
+    id_tipo_opcion : str
+        Grupo de opciones al que pertenece.
+    """
+
+    id: str
+    nombre: str
+    precio_adicional: Decimal
+    id_tipo_opcion: str
+
+
+@dataclass(frozen=True)
+class GrupoOpciones:
+    """Tipo de opción de un producto con sus límites de selección.
+
+    Attributes
+    ----------
+    id_tipo_opcion : str
+        Identificador del tipo de opción.
+    nombre : str
+        Nombre del tipo (por ejemplo "Tamaño").
+    seleccion_minima : int
+        Opciones que hay que elegir como mínimo (0 = opcional).
+    seleccion_maxima : Optional[int]
+        Opciones que se pueden elegir como máximo (None = sin límite).
+    """
+
+    id_tipo_opcion: str
+    nombre: str
+    seleccion_minima: int = 0
+    seleccion_maxima: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ProductoPrecio:
+    """Producto visible del menú con sus opciones indexadas por ID.
+
+    Attributes
+    ----------
+    id : str
+        Identificador del producto.
+    nombre : str
+        Nombre del producto.
+    precio_base : Decimal
+        Precio sin opciones.
+    opciones : Dict[str, OpcionPrecio]
+        Opciones activas del producto.
+    estacion : str
+        Estación de cocina que lo prepara.
+    grupos : Dict[str, GrupoOpciones]
+        Tipos de opción del producto indexados por ID.
+    """
+
+    id: str
+    nombre: str
+    precio_base: Decimal
+    opciones: Dict[str, OpcionPrecio] = field(default_factory=dict)
+    estacion: str = ESTACION_POR_DEFECTO
+    grupos: Dict[str, GrupoOpciones] = field(default_factory=dict)
+
+    def elegir_opciones(self, ids_opcion: Sequence[str]) -> Tuple[List[OpcionPrecio], List[str]]:
+        """
+        Valida una selección de opciones contra los índices del producto.
+
+        Cada opción se resuelve en tiempo constante y los límites de cada
+        grupo se comprueban con un único recuento, así que el coste es
+        lineal en el número de opciones elegidas más el de grupos.
+
+        Parameters
+        ----------
+        ids_opcion : Sequence[str]
+            IDs de las opciones elegidas, en el orden de la petición.
+
+        Returns
+        -------
+        Tuple[List[OpcionPrecio], List[str]]
+            Opciones válidas en el orden recibido y mensajes de error; la
+            selección es válida si no hay errores.
+        """
+        errores: List[str] = []
+        if len(set(ids_opcion)) != len(ids_opcion):
+            errores.append(f"Hay opciones repetidas para '{self.nombre}'")
+
+        elegidas: List[OpcionPrecio] = []
+        por_grupo: Dict[str, int] = {}
+        vistas = set()
+        for id_opcion in ids_opcion:
+            if id_opcion in vistas:
+                continue
+            vistas.add(id_opcion)
+            opcion = self.opciones.get(id_opcion)
+            if opcion is None:
+                errores.append(f"La opción '{id_opcion}' no está disponible para '{self.nombre}'")
+                continue
+            elegidas.append(opcion)
+            por_grupo[opcion.id_tipo_opcion] = por_grupo.get(opcion.id_tipo_opcion, 0) + 1
+
+        for grupo in self.grupos.values():
+            elegidas_grupo = por_grupo.get(grupo.id_tipo_opcion, 0)
+            if elegidas_grupo < grupo.seleccion_minima:
+                errores.append(
+                    f"Hay que elegir al menos {grupo.seleccion_minima} en '{grupo.nombre}' "
+                    f"para '{self.nombre}'"
+                )
+            elif grupo.seleccion_maxima is not None and elegidas_grupo > grupo.seleccion_maxima:
+                errores.append(
+                    f"Se pueden elegir como máximo {grupo.seleccion_maxima} en '{grupo.nombre}' "
+                    f"para '{self.nombre}'"
+                )
+        return elegidas, errores
+
+    def precio_unitario(self, opciones: Sequence[OpcionPrecio]) -> Decimal:
+        """
+        Calcula el precio de una unidad con las opciones indicadas.
+
+        Parameters
+        ----------
+        opciones : Sequence[OpcionPrecio]
+            Opciones ya validadas.
+
+        Returns
+        -------
+        Decimal
+            Precio base más los precios adicionales, en céntimos exactos.
+        """
+        return redondear(
+            self.precio_base + sum((opcion.precio_adicional for opcion in opciones), Decimal("0"))
+        )
+
+
+@dataclass(frozen=True)
+class LineaValorada:
+    """Resultado de valorar una línea de carrito o pedido.
+
+    Attributes
+    ----------
+    producto : Optional[ProductoPrecio]
+        Producto del catálogo, o None si no está disponible.
+    cantidad : int
+        Unidades solicitadas.
+    opciones : List[OpcionPrecio]
+        Opciones válidas elegidas.
+    precio_unitario : Decimal
+        Precio base más opciones.
+    total : Decimal
+        Precio unitario por cantidad.
+    errores : List[str]
+        Motivos por los que la línea no se puede pedir.
+    """
+
+    producto: Optional[ProductoPrecio]
+    cantidad: int
+    opciones: List[OpcionPrecio] = field(default_factory=list)
+    precio_unitario: Decimal = Decimal("0.00")
+    total: Decimal = Decimal("0.00")
+    errores: List[str] = field(default_factory=list)
+
+    @property
+    def valida(self) -> bool:
+        """True si la línea se puede pedir."""
+        return not self.errores
+
+
+@dataclass(frozen=True)
+class CatalogoPrecios:
+    """Productos visibles de una versión del menú indexados por ID.
+
+    Attributes
+    ----------
+    version : int
+        Versión del menú de la que procede.
+    productos : Dict[str, ProductoPrecio]
+        Productos disponibles.
+    """
+
+    version: int
+    productos: Dict[str, ProductoPrecio]
+
+    def valorar(self, id_producto: str, cantidad: int, ids_opcion: Sequence[str]) -> LineaValorada:
+        """
+        Valida y valora una línea con los índices del catálogo.
+
+        Parameters
+        ----------
+        id_producto : str
+            Producto solicitado.
+        cantidad : int
+            Unidades solicitadas.
+        ids_opcion : Sequence[str]
+            Opciones elegidas.
+
+        Returns
+        -------
+        LineaValorada
+            Precios de la línea y, si no es válida, los motivos.
+        """
+        producto = self.productos.get(id_producto)
+        if producto is None:
+            return LineaValorada(
+                producto=None,
+                cantidad=cantidad,
+                errores=[f"El producto '{id_producto}' no está disponible"],
+            )
+
+        opciones, errores = producto.elegir_opciones(ids_opcion)
+        precio_unitario = producto.precio_unitario(opciones)
+        return LineaValorada(
+            producto=producto,
+            cantidad=cantidad,
+            opciones=opciones,
+            precio_unitario=precio_unitario,
+            total=precio_unitario * cantidad,
+            errores=errores,
+        )
+
+    @classmethod
+    def desde_menu(cls, menu: MenuResponse) -> "CatalogoPrecios":
+        """
+        Construye el catálogo a partir del menú público.
+
+        Parameters
+        ----------
+        menu : MenuResponse
+            Menú completo de una versión.
+
+        Returns
+        -------
+        CatalogoPrecios
+            Catálogo indexado.
+        """
+        productos: Dict[str, ProductoPrecio] = {}
+        for categoria in menu.categorias:
+            for producto in categoria.productos:
+                grupos = {
+                    grupo.id_tipo_opcion: GrupoOpciones(
+                        id_tipo_opcion=grupo.id_tipo_opcion,
+                        nombre=grupo.nombre_tipo,
+                        seleccion_minima=grupo.seleccion_minima,
+                        seleccion_maxima=grupo.seleccion_maxima,
+                    )
+                    for grupo in producto.tipos_opciones
+                }
+                opciones = {
+                    opcion.id: OpcionPrecio(
+                        id=opcion.id,
+                        nombre=opcion.nombre,
+                        precio_adicional=opcion.precio_adicional,
+                        id_tipo_opcion=grupo.id_tipo_opcion,
+                    )
+                    for grupo in producto.tipos_opciones
+                    for opcion in grupo.opciones
+                    if opcion.activo
+                }
+                productos[producto.id] = ProductoPrecio(
+                    id=producto.id,
+                    nombre=producto.nombre,
+                    precio_base=producto.precio_base,
+                    opciones=opciones,
+                    estacion=categoria.estacion or ESTACION_POR_DEFECTO,
+                    grupos=grupos,
+                )
+        return cls(version=menu.version, productos=productos)
@@ -2,11 +2,16 @@
 Servicio para la gestión de categorías en el sistema.
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from ulid import ULID
 
 from src.repositories.menu.categoria_repository import CategoriaRepository
+from src.repositories.menu.alergeno_repository import AlergenoRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
+from src.core.single_flight import coalescer
 from src.models.menu.categoria_model import CategoriaModel
 from src.api.schemas.categoria_schema import (
     CategoriaCreate,
@@ -35,6 +40,10 @@ class CategoriaService:
     ----------
     repository : CategoriaRepository
         Repositorio para acceso a datos de categorías.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
+    alergeno_repository : AlergenoRepository
+        Repositorio de alérgenos, usado para resolver filtros de exclusión.
     """
 
     def __init__(self, session: AsyncSession):
@@ -47,6 +56,8 @@ class CategoriaService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = CategoriaRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
+        self.alergeno_repository = AlergenoRepository(session)
 
     async def create_categoria(self, categoria_data: CategoriaCreate) -> CategoriaResponse:
         """
@@ -70,12 +81,15 @@ class CategoriaService:
         try:
             # Crear modelo de categoría desde los datos
             categoria = CategoriaModel(
+                id=str(ULID()),
                 nombre=categoria_data.nombre,
                 descripcion=categoria_data.descripcion,
-                imagen_path=categoria_data.imagen_path
+                imagen_path=categoria_data.imagen_path,
+                estacion=categoria_data.estacion,
             )
 
-            # Persistir en la base de datos
+            # Persistir en la base de datos junto con el registro del cambio
+            await self.menu_cambio_repository.registrar(EntidadMenu.CATEGORIA, [categoria.id])
             created_categoria = await self.repository.create(categoria)
 
             # Convertir y retornar como esquema de respuesta
@@ -140,6 +154,7 @@ class CategoriaService:
             raise CategoriaNotFoundError(f"No se encontró la categoría con ID {categoria_id}")
 
         # Eliminar la categoría
+        await self.menu_cambio_repository.registrar(EntidadMenu.CATEGORIA, [categoria_id])
         result = await self.repository.delete(categoria_id)
         return result
 
@@ -209,6 +224,7 @@ class CategoriaService:
 
         try:
             # Actualizar la categoría
+            await self.menu_cambio_repository.registrar(EntidadMenu.CATEGORIA, [categoria_id])
             updated_categoria = await self.repository.update(categoria_id, **update_data)
 
             # Verificar si la categoría fue encontrada
@@ -254,14 +270,19 @@ class CategoriaService:
             # Crear modelos de categorías desde los datos
             categoria_models = [
                 CategoriaModel(
+                    id=str(ULID()),
                     nombre=categoria_data.nombre,
                     descripcion=categoria_data.descripcion,
                     imagen_path=categoria_data.imagen_path,
+                    estacion=categoria_data.estacion,
                 )
                 for categoria_data in categorias_data
             ]
 
             # Persistir en la base de datos usando batch insert
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.CATEGORIA, [categoria.id for categoria in categoria_models]
+            )
             created_categorias = await self.repository.batch_insert(categoria_models)
 
             # Convertir y retornar como esquemas de respuesta
@@ -314,6 +335,9 @@ class CategoriaService:
                     repository_updates.append((categoria_id, update_data))
 
             # Realizar actualización en lote
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.CATEGORIA, [categoria_id for categoria_id, _ in repository_updates]
+            )
             updated_categorias = await self.repository.batch_update(repository_updates)
 
             # Verificar si todas las categorías fueron actualizadas
@@ -337,10 +361,13 @@ class CategoriaService:
                 "Una o más actualizaciones causaron conflictos de integridad"
             )
 
+    @coalescer
     async def get_categorias_con_productos_cards(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        excluir_alergenos: Optional[List[str]] = None,
+        tolerar_trazas: bool = True,
     ) -> CategoriaConProductosCardList:
         """
         Obtiene una lista de categorías con sus productos en formato minimal (solo id, nombre, imagen).
@@ -351,6 +378,10 @@ class CategoriaService:
             Número de registros a omitir (offset), por defecto 0.
         limit : int, optional
             Número máximo de registros a retornar, por defecto 100.
+        excluir_alergenos : Optional[List[str]], optional
+            IDs de alérgenos cuyos productos deben excluirse.
+        tolerar_trazas : bool, optional
+            Si es False también excluye trazas y "puede contener", por defecto True.
 
         Returns
         -------
@@ -364,6 +395,11 @@ class CategoriaService:
             activo=True  # Solo categorías activas
         )
 
+        # Las máscaras ya vienen cargadas con los productos: el filtro es bit a bit en memoria
+        mascara, excluidos = await self.alergeno_repository.get_filtro_exclusion(
+            excluir_alergenos or [], tolerar_trazas
+        )
+
         # Construir la lista de categorías con productos
         items = []
         for categoria in categorias:
@@ -375,6 +411,8 @@ class CategoriaService:
                     imagen_path=producto.imagen_path
                 )
                 for producto in categoria.productos
+                if not (mascara and producto.contiene_alergenos(mascara, tolerar_trazas))
+                and producto.id not in excluidos
             ]
 
             # Construir categoría con productos
@@ -0,0 +1,424 @@
+"""
+Servicio para construir y cachear el menú público completo.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.menu.menu_repository import MenuRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
+from src.core.cache import TTLCache
+from src.core.single_flight import coalescer
+from src.core.compression import CODIFICACIONES_DISPONIBLES, comprimir
+from src.business_logic.menu.catalogo_precios import CatalogoPrecios
+from src.api.schemas.menu_schema import (
+    MenuCambiosResponse,
+    MenuCategoria,
+    MenuCategoriaResumen,
+    MenuDisponibilidadEvento,
+    MenuProducto,
+    MenuResponse,
+    ProductoDisponibilidad,
+)
+from src.api.schemas.producto_alergeno_schema import AlergenoDeProducto
+from src.api.schemas.producto_schema import (
+    ProductoOpcionDetalleSchema,
+    TipoOpcionConOpcionesSchema,
+)
+
+
+@dataclass(frozen=True)
+class MenuSerializado:
+    """Menú ya serializado a JSON, en claro y precomprimido.
+
+    Attributes
+    ----------
+    version : int
+        Versión del menú a partir de la que se construyó.
+    json : bytes
+        Documento JSON codificado en UTF-8.
+    gzip : bytes
+        El mismo documento comprimido con gzip.
+    br : Optional[bytes]
+        El mismo documento comprimido con brotli, si está disponible.
+    """
+
+    version: int
+    json: bytes
+    gzip: bytes
+    br: Optional[bytes] = None
+
+    def etag(self, codificacion: Optional[str] = None) -> str:
+        """
+        ETag fuerte de la versión del menú en una codificación.
+
+        Cada codificación es una representación con bytes distintos, así que
+        lleva su propio ETag.
+
+        Parameters
+        ----------
+        codificacion : Optional[str], optional
+            Codificación servida, o None para el documento sin comprimir.
+
+        Returns
+        -------
+        str
+            ``"menu-<versión>"`` sin comprimir o ``"menu-<versión>-<codificación>"``.
+        """
+        sufijo = f"-{codificacion}" if codificacion else ""
+        return f'"menu-{self.version}{sufijo}"'
+
+    @property
+    def codificaciones(self) -> Tuple[str, ...]:
+        """Codificaciones precomprimidas, por orden de preferencia."""
+        return ("br", "gzip") if self.br is not None else ("gzip",)
+
+    def cuerpo(self, codificacion: Optional[str]) -> bytes:
+        """Retorna los bytes para la codificación indicada (None para sin comprimir)."""
+        if codificacion == "br" and self.br is not None:
+            return self.br
+        if codificacion == "gzip":
+            return self.gzip
+        return self.json
+
+
+# Pocas entradas bastan: solo se consulta la versión vigente
+menu_cache: TTLCache[MenuSerializado] = TTLCache(maxsize=4, ttl=3600)
+
+# Catálogo de precios para valorar pedidos, por versión del menú
+catalogo_cache: TTLCache[CatalogoPrecios] = TTLCache(maxsize=4, ttl=3600)
+
+# Por encima de este número de entidades cambiadas es más barato recargar el menú
+LIMITE_CAMBIOS = 500
+
+
+class MenuService:
+    """Servicio para obtener el menú público como un único documento.
+
+    El menú se construye con un número fijo de consultas y se guarda ya
+    serializado y comprimido, de forma que las peticiones siguientes solo
+    copian bytes hasta que una escritura registra un cambio y con ello una
+    nueva versión.
+
+    Attributes
+    ----------
+    repository : MenuRepository
+        Repositorio de consultas del menú.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios que define la versión del menú.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.repository = MenuRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
+
+    async def get_menu(self) -> MenuResponse:
+        """
+        Construye el menú público completo.
+
+        Returns
+        -------
+        MenuResponse
+            Categorías activas con sus productos disponibles, opciones y alérgenos.
+        """
+        # La versión se lee antes que los datos: el documento nunca es más
+        # antiguo que la versión que declara
+        version = await self.menu_cambio_repository.get_version_actual()
+
+        categorias = await self.repository.get_categorias()
+        productos_por_categoria = await self._construir_productos()
+
+        return MenuResponse(
+            version=version,
+            generado_en=datetime.now(timezone.utc),
+            categorias=[
+                MenuCategoria(
+                    id=categoria.id,
+                    nombre=categoria.nombre,
+                    descripcion=categoria.descripcion,
+                    imagen_path=categoria.imagen_path,
+                    estacion=categoria.estacion,
+                    productos=productos_por_categoria.get(categoria.id, []),
+                )
+                for categoria in categorias
+            ],
+        )
+
+    async def get_cambios(self, desde: int) -> MenuCambiosResponse:
+        """
+        Obtiene los cambios del menú posteriores a una versión.
+
+        Parameters
+        ----------
+        desde : int
+            Última versión que el cliente tiene aplicada.
+
+        Returns
+        -------
+        MenuCambiosResponse
+            Entidades actualizadas (con su estado actual) y eliminadas.
+        """
+        version = await self.menu_cambio_repository.get_version_actual()
+        if desde == version:
+            return MenuCambiosResponse(desde=desde, version=version)
+        if desde > version:
+            # El cliente viene de otra base de datos o de un registro reiniciado
+            return MenuCambiosResponse(desde=desde, version=version, requiere_menu_completo=True)
+
+        cambios = await self.menu_cambio_repository.get_cambios_desde(desde, LIMITE_CAMBIOS + 1)
+        ids: Dict[EntidadMenu, Set[str]] = {entidad: set() for entidad in EntidadMenu}
+        for entidad, id_entidad in cambios:
+            ids[entidad].add(id_entidad)
+
+        if len(cambios) > LIMITE_CAMBIOS or ids[EntidadMenu.MENU]:
+            return MenuCambiosResponse(desde=desde, version=version, requiere_menu_completo=True)
+
+        # Productos afectados indirectamente: los de categorías, tipos de opción
+        # o alérgenos modificados
+        ids_producto = ids[EntidadMenu.PRODUCTO] | await self.repository.get_ids_productos_relacionados(
+            ids_categoria=ids[EntidadMenu.CATEGORIA],
+            ids_tipo_opcion=ids[EntidadMenu.TIPO_OPCION],
+            ids_alergeno=ids[EntidadMenu.ALERGENO],
+        )
+
+        categorias = []
+        if ids[EntidadMenu.CATEGORIA]:
+            categorias = await self.repository.get_categorias(ids[EntidadMenu.CATEGORIA])
+
+        productos: List[MenuProducto] = []
+        if ids_producto:
+            por_categoria = await self._construir_productos(ids_producto)
+            productos = [producto for grupo in por_categoria.values() for producto in grupo]
+
+        ids_categoria_visibles = {categoria.id for categoria in categorias}
+        ids_producto_visibles = {producto.id for producto in productos}
+
+        return MenuCambiosResponse(
+            desde=desde,
+            version=version,
+            categorias=[
+                MenuCategoriaResumen(
+                    id=categoria.id,
+                    nombre=categoria.nombre,
+                    descripcion=categoria.descripcion,
+                    imagen_path=categoria.imagen_path,
+                    estacion=categoria.estacion,
+                )
+                for categoria in categorias
+            ],
+            productos=productos,
+            categorias_eliminadas=sorted(ids[EntidadMenu.CATEGORIA] - ids_categoria_visibles),
+            productos_eliminados=sorted(ids_producto - ids_producto_visibles),
+        )
+
+    async def get_disponibilidad(self, desde: int) -> MenuDisponibilidadEvento:
+        """
+        Obtiene en forma compacta los cambios de disponibilidad y precio desde una versión.
+
+        Parameters
+        ----------
+        desde : int
+            Última versión que el cliente tiene aplicada.
+
+        Returns
+        -------
+        MenuDisponibilidadEvento
+            Productos visibles con su precio y productos retirados del menú.
+        """
+        cambios = await self.get_cambios(desde)
+        return MenuDisponibilidadEvento(
+            version=cambios.version,
+            requiere_menu_completo=cambios.requiere_menu_completo,
+            productos=[
+                ProductoDisponibilidad(id=producto.id, disponible=True, precio_base=producto.precio_base)
+                for producto in cambios.productos
+            ]
+            + [
+                ProductoDisponibilidad(id=id_producto, disponible=False)
+                for id_producto in cambios.productos_eliminados
+            ],
+        )
+
+    async def get_menu_serializado(self) -> MenuSerializado:
+        """
+        Obtiene el menú vigente ya serializado, construyéndolo si no está en caché.
+
+        Returns
+        -------
+        MenuSerializado
+            Bytes en claro y precomprimidos del menú para la versión vigente.
+        """
+        version = await self.menu_cambio_repository.get_version_actual()
+        cached = menu_cache.get(version)
+        if cached is not None:
+            return cached
+        return await self._serializar_menu(version)
+
+    @coalescer
+    async def _serializar_menu(self, version: int) -> MenuSerializado:
+        """
+        Construye y cachea el menú serializado tras un fallo de caché.
+
+        Las peticiones concurrentes con la caché fría comparten una sola
+        construcción en lugar de repetir todas las consultas.
+
+        Parameters
+        ----------
+        version : int
+            Versión vigente leída antes del fallo de caché.
+
+        Returns
+        -------
+        MenuSerializado
+            Bytes en claro y precomprimidos del menú.
+        """
+        menu = await self.get_menu()
+        cuerpo = menu.model_dump_json().encode("utf-8")
+        serializado = MenuSerializado(
+            version=menu.version,
+            json=cuerpo,
+            gzip=comprimir(cuerpo, "gzip", gzip_level=9),
+            # Se comprime una vez por versión: compensa usar la calidad máxima
+            br=comprimir(cuerpo, "br", brotli_quality=11)
+            if "br" in CODIFICACIONES_DISPONIBLES
+            else None,
+        )
+        # Si hubo escrituras durante la construcción, la entrada queda bajo
+        # una versión antigua que ya nadie consulta
+        menu_cache.set(menu.version, serializado)
+        return serializado
+
+    async def get_catalogo_precios(self) -> CatalogoPrecios:
+        """
+        Obtiene el catálogo de precios de la versión vigente del menú.
+
+        Mientras la versión no cambie solo cuesta una consulta (la de la versión).
+
+        Returns
+        -------
+        CatalogoPrecios
+            Productos visibles y sus opciones indexados por ID.
+        """
+        version = await self.menu_cambio_repository.get_version_actual()
+        cached = catalogo_cache.get(version)
+        if cached is not None:
+            return cached
+        return await self._construir_catalogo(version)
+
+    @coalescer
+    async def _construir_catalogo(self, version: int) -> CatalogoPrecios:
+        """
+        Construye y cachea el catálogo de precios tras un fallo de caché.
+
+        Parameters
+        ----------
+        version : int
+            Versión vigente leída antes del fallo de caché; las peticiones
+            concurrentes de la misma versión comparten la construcción.
+
+        Returns
+        -------
+        CatalogoPrecios
+            Productos visibles y sus opciones indexados por ID.
+        """
+        catalogo = CatalogoPrecios.desde_menu(await self.get_menu())
+        catalogo_cache.set(catalogo.version, catalogo)
+        return catalogo
+
+    async def _construir_productos(
+        self, ids_producto: Optional[Set[str]] = None
+    ) -> Dict[str, List[MenuProducto]]:
+        """
+        Construye los productos visibles con sus opciones y alérgenos.
+
+        Parameters
+        ----------
+        ids_producto : Optional[Set[str]], optional
+            Restringe la construcción a estos productos. Si es None, todos.
+
+        Returns
+        -------
+        Dict[str, List[MenuProducto]]
+            Productos agrupados por ID de categoría, ordenados por nombre.
+        """
+        productos = await self.repository.get_productos(ids_producto)
+        opciones = await self.repository.get_opciones(ids_producto)
+        relaciones = await self.repository.get_alergenos(ids_producto)
+
+        # Agrupar opciones por producto y tipo
+        tipos_por_producto: Dict[str, Dict[str, TipoOpcionConOpcionesSchema]] = {}
+        for opcion, tipo in opciones:
+            tipos = tipos_por_producto.setdefault(opcion.id_producto, {})
+            grupo = tipos.get(tipo.id)
+            if grupo is None:
+                grupo = TipoOpcionConOpcionesSchema(
+                    id_tipo_opcion=tipo.id,
+                    nombre_tipo=tipo.nombre,
+                    descripcion_tipo=tipo.descripcion,
+                    seleccion_minima=tipo.seleccion_minima,
+                    seleccion_maxima=tipo.seleccion_maxima,
+                    orden_tipo=tipo.orden or 0,
+                )
+                tipos[tipo.id] = grupo
+            grupo.opciones.append(
+                ProductoOpcionDetalleSchema(
+                    id=opcion.id,
+                    nombre=opcion.nombre,
+                    precio_adicional=opcion.precio_adicional,
+                    activo=opcion.activo,
+                    orden=opcion.orden or 0,
+                    fecha_creacion=opcion.fecha_creacion,
+                    fecha_modificacion=opcion.fecha_modificacion,
+                )
+            )
+
+        alergenos_por_producto: Dict[str, List[AlergenoDeProducto]] = {}
+        for relacion, alergeno in relaciones:
+            alergenos_por_producto.setdefault(relacion.id_producto, []).append(
+                AlergenoDeProducto(
+                    id=alergeno.id,
+                    nombre=alergeno.nombre,
+                    icono=alergeno.icono,
+                    nivel_riesgo=alergeno.nivel_riesgo,
+                    nivel_presencia=relacion.nivel_presencia,
+                    notas=relacion.notas,
+                )
+            )
+
+        productos_por_categoria: Dict[str, List[MenuProducto]] = {}
+        for producto in productos:
+            tipos = sorted(
+                tipos_por_producto.get(producto.id, {}).values(),
+                key=lambda grupo: grupo.orden_tipo,
+            )
+            for grupo in tipos:
+                grupo.opciones.sort(key=lambda opcion: opcion.orden)
+
+            productos_por_categoria.setdefault(producto.id_categoria, []).append(
+                MenuProducto(
+                    id=producto.id,
+                    id_categoria=producto.id_categoria,
+                    nombre=producto.nombre,
+                    descripcion=producto.descripcion,
+                    precio_base=producto.precio_base,
+                    imagen_path=producto.imagen_path,
+                    imagen_alt_text=producto.imagen_alt_text,
+                    destacado=bool(producto.destacado),
+                    alergenos=alergenos_por_producto.get(producto.id, []),
+                    tipos_opciones=tipos,
+                )
+            )
+
+        return productos_por_categoria
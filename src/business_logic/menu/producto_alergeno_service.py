@@ -2,10 +2,14 @@
 Servicio para la gestión de relaciones producto-alérgeno en el sistema.
 """
 
+from typing import Dict, List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from src.repositories.menu.producto_alergeno_repository import ProductoAlergenoRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
 from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
 from src.api.schemas.producto_alergeno_schema import (
     ProductoAlergenoCreate,
@@ -13,7 +17,11 @@ from src.api.schemas.producto_alergeno_schema import (
     ProductoAlergenoResponse,
     ProductoAlergenoSummary,
     ProductoAlergenoList,
+    AlergenoDeProducto,
+    ProductoAlergenos,
+    ProductoAlergenosBatchResponse,
 )
+from src.core.cache import TTLCache
 from src.business_logic.exceptions.producto_alergeno_exceptions import (
     ProductoAlergenoValidationError,
     ProductoAlergenoNotFoundError,
@@ -21,6 +29,14 @@ from src.business_logic.exceptions.producto_alergeno_exceptions import (
 )
 
 
+# Alérgenos por producto, con clave (versión del menú, id del producto). Toda
+# escritura de relaciones, productos o alérgenos avanza la versión al
+# confirmarse, así que ningún worker sirve entradas anteriores a un cambio
+alergenos_por_producto_cache: TTLCache[List[AlergenoDeProducto]] = TTLCache(
+    maxsize=4096, ttl=300
+)
+
+
 class ProductoAlergenoService:
     """Servicio para la gestión de relaciones producto-alérgeno en el sistema.
 
@@ -32,6 +48,8 @@ class ProductoAlergenoService:
     ----------
     repository : ProductoAlergenoRepository
         Repositorio para acceso a datos de relaciones producto-alérgeno.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
     """
 
     def __init__(self, session: AsyncSession):
@@ -44,6 +62,7 @@ class ProductoAlergenoService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = ProductoAlergenoRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
 
     async def create_producto_alergeno(
         self, producto_alergeno_data: ProductoAlergenoCreate
@@ -75,11 +94,11 @@ class ProductoAlergenoService:
                 notas=producto_alergeno_data.notas,
             )
 
-            # Persistir en la base de datos
+            # Persistir en la base de datos, con su cambio del menú en la misma transacción
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.PRODUCTO, [producto_alergeno_data.id_producto]
+            )
             created_producto_alergeno = await self.repository.create(producto_alergeno)
-
-            # Convertir y retornar como esquema de respuesta
-            return ProductoAlergenoResponse.model_validate(created_producto_alergeno)
         except IntegrityError:
             # Capturar errores de integridad (relación duplicada)
             raise ProductoAlergenoConflictError(
@@ -88,6 +107,12 @@ class ProductoAlergenoService:
                 f"{producto_alergeno_data.id_alergeno}"
             )
 
+        # Mantener sincronizadas las máscaras de alérgenos del producto
+        await self.repository.recalcular_mascaras([producto_alergeno_data.id_producto])
+
+        # Convertir y retornar como esquema de respuesta
+        return ProductoAlergenoResponse.model_validate(created_producto_alergeno)
+
     async def get_producto_alergeno_by_id(
         self, id_producto: str, id_alergeno: str
     ) -> ProductoAlergenoResponse:
@@ -155,8 +180,11 @@ class ProductoAlergenoService:
                 f"y alérgeno {id_alergeno}"
             )
 
-        # Eliminar la relación
+        # Eliminar la relación, con su cambio del menú en la misma transacción
+        await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [id_producto])
         result = await self.repository.delete(id_producto, id_alergeno)
+        if result:
+            await self.repository.recalcular_mascaras([id_producto])
         return result
 
     async def get_producto_alergenos(
@@ -234,7 +262,9 @@ class ProductoAlergenoService:
             # Si no hay datos para actualizar, simplemente retornar la relación actual
             return await self.get_producto_alergeno_by_id(id_producto, id_alergeno)
 
-        # Actualizar la relación
+        # Actualizar la relación; el nivel de presencia o el estado activo
+        # pueden haber cambiado
+        await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [id_producto])
         updated_producto_alergeno = await self.repository.update(
             id_producto, id_alergeno, **update_data
         )
@@ -246,5 +276,95 @@ class ProductoAlergenoService:
                 f"y alérgeno {id_alergeno}"
             )
 
+        await self.repository.recalcular_mascaras([id_producto])
+
         # Convertir y retornar como esquema de respuesta
         return ProductoAlergenoResponse.model_validate(updated_producto_alergeno)
+
+    async def recalcular_mascaras(self) -> int:
+        """
+        Recalcula las máscaras de alérgenos de todo el catálogo.
+
+        Útil tras cargas masivas que escriben directamente en la tabla de
+        relaciones sin pasar por este servicio.
+
+        Returns
+        -------
+        int
+            Número de productos cuyas máscaras fueron recalculadas.
+        """
+        # Puede afectar a todo el catálogo: los clientes deben recargar el menú
+        await self.menu_cambio_repository.registrar(EntidadMenu.MENU, ["*"])
+        actualizados = await self.repository.recalcular_mascaras()
+        return actualizados
+
+    async def get_alergenos_by_productos(
+        self, ids_producto: List[str]
+    ) -> ProductoAlergenosBatchResponse:
+        """
+        Obtiene los alérgenos activos de varios productos a la vez.
+
+        Los productos ya cacheados para la versión vigente del menú se
+        sirven desde memoria; el resto se resuelve con una única consulta IN
+        unida a la tabla de alérgenos.
+
+        Parameters
+        ----------
+        ids_producto : List[str]
+            Identificadores de los productos. Los duplicados se ignoran.
+
+        Returns
+        -------
+        ProductoAlergenosBatchResponse
+            Alérgenos de cada producto, en el orden solicitado. Los productos
+            sin alérgenos (o inexistentes) aparecen con una lista vacía.
+
+        Raises
+        ------
+        ProductoAlergenoValidationError
+            Si no se proporciona ningún producto.
+        """
+        ids_unicos = list(dict.fromkeys(ids_producto))
+        if not ids_unicos:
+            raise ProductoAlergenoValidationError(
+                "Debe proporcionar al menos un ID de producto"
+            )
+
+        # Si hay una escritura mientras se consulta, lo leído queda bajo una
+        # versión antigua que ya nadie consulta
+        version = await self.menu_cambio_repository.get_version_actual()
+        encontrados: Dict[str, List[AlergenoDeProducto]] = {
+            id_producto: alergenos
+            for (_, id_producto), alergenos in alergenos_por_producto_cache.get_many(
+                [(version, id_producto) for id_producto in ids_unicos]
+            ).items()
+        }
+        faltantes = [id_producto for id_producto in ids_unicos if id_producto not in encontrados]
+
+        if faltantes:
+            nuevos: Dict[str, List[AlergenoDeProducto]] = {
+                id_producto: [] for id_producto in faltantes
+            }
+            filas = await self.repository.get_alergenos_by_productos(faltantes)
+            for relacion, alergeno in filas:
+                nuevos[relacion.id_producto].append(
+                    AlergenoDeProducto(
+                        id=alergeno.id,
+                        nombre=alergeno.nombre,
+                        icono=alergeno.icono,
+                        nivel_riesgo=alergeno.nivel_riesgo,
+                        nivel_presencia=relacion.nivel_presencia,
+                        notas=relacion.notas,
+                    )
+                )
+            alergenos_por_producto_cache.set_many(
+                {(version, id_producto): alergenos for id_producto, alergenos in nuevos.items()}
+            )
+            encontrados.update(nuevos)
+
+        return ProductoAlergenosBatchResponse(
+            items=[
+                ProductoAlergenos(id_producto=id_producto, alergenos=encontrados[id_producto])
+                for id_producto in ids_unicos
+            ]
+        )
@@ -2,11 +2,16 @@
 Servicio para la gestión de productos en el sistema.
 """
 
-from typing import List, Tuple
+from typing import List, Set, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from ulid import ULID
 
 from src.repositories.menu.producto_repository import ProductoRepository
+from src.repositories.menu.alergeno_repository import AlergenoRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
+from src.core.single_flight import coalescer
 from src.models.menu.producto_model import ProductoModel
 from src.api.schemas.producto_schema import (
     ProductoCreate,
@@ -35,6 +40,10 @@ class ProductoService:
     ----------
     repository : ProductoRepository
         Repositorio para acceso a datos de productos.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
+    alergeno_repository : AlergenoRepository
+        Repositorio de alérgenos, usado para resolver filtros de exclusión.
     """
 
     def __init__(self, session: AsyncSession):
@@ -47,6 +56,31 @@ class ProductoService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = ProductoRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
+        self.alergeno_repository = AlergenoRepository(session)
+
+    async def _resolver_exclusion(
+        self, excluir_alergenos: Optional[List[str]], tolerar_trazas: bool
+    ) -> Tuple[int, Set[str]]:
+        """
+        Traduce una lista de IDs de alérgenos a su filtro de exclusión.
+
+        Parameters
+        ----------
+        excluir_alergenos : Optional[List[str]]
+            IDs de alérgenos a excluir.
+        tolerar_trazas : bool
+            Si es False también cuentan las trazas y el "puede contener".
+
+        Returns
+        -------
+        Tuple[int, Set[str]]
+            Máscara de bits (0 si no hay filtro) y productos con alérgenos
+            sin bit que también deben excluirse.
+        """
+        if not excluir_alergenos:
+            return 0, set()
+        return await self.alergeno_repository.get_filtro_exclusion(excluir_alergenos, tolerar_trazas)
 
     async def create_producto(self, producto_data: ProductoCreate) -> ProductoResponse:
         """
@@ -70,6 +104,7 @@ class ProductoService:
         try:
             # Crear modelo de producto desde los datos
             producto = ProductoModel(
+                id=str(ULID()),
                 id_categoria=producto_data.id_categoria,
                 nombre=producto_data.nombre,
                 descripcion=producto_data.descripcion,
@@ -78,7 +113,8 @@ class ProductoService:
                 imagen_alt_text=producto_data.imagen_alt_text,
             )
 
-            # Persistir en la base de datos
+            # Persistir en la base de datos junto con el registro del cambio
+            await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [producto.id])
             created_producto = await self.repository.create(producto)
 
             # Convertir y retornar como esquema de respuesta
@@ -118,6 +154,7 @@ class ProductoService:
         # Convertir y retornar como esquema de respuesta
         return ProductoResponse.model_validate(producto)
 
+    @coalescer
     async def get_producto_con_opciones(self, producto_id: str) -> "ProductoConOpcionesResponse":
         """
         Obtiene un producto por su ID con todas sus opciones agrupadas por tipo.
@@ -255,6 +292,7 @@ class ProductoService:
             raise ProductoNotFoundError(f"No se encontró el producto con ID {producto_id}")
 
         # Eliminar el producto
+        await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [producto_id])
         result = await self.repository.delete(producto_id)
         return result
 
@@ -262,7 +300,9 @@ class ProductoService:
         self, 
         skip: int = 0, 
         limit: int = 100,
-        id_categoria: str | None = None
+        id_categoria: str | None = None,
+        excluir_alergenos: Optional[List[str]] = None,
+        tolerar_trazas: bool = True,
     ) -> ProductoList:
         """
         Obtiene una lista paginada de productos.
@@ -273,6 +313,12 @@ class ProductoService:
             Número de registros a omitir (offset), por defecto 0.
         limit : int, optional
             Número máximo de registros a retornar, por defecto 100.
+        id_categoria : str | None, optional
+            ID de categoría para filtrar productos.
+        excluir_alergenos : Optional[List[str]], optional
+            IDs de alérgenos cuyos productos deben excluirse.
+        tolerar_trazas : bool, optional
+            Si es False también excluye trazas y "puede contener", por defecto True.
 
         Returns
         -------
@@ -288,7 +334,12 @@ class ProductoService:
             raise ProductoValidationError("El parámetro 'limit' debe ser mayor a cero")
 
         # Obtener productos desde el repositorio
-        productos, total = await self.repository.get_all(skip, limit, id_categoria)
+        mascara, excluidos = await self._resolver_exclusion(excluir_alergenos, tolerar_trazas)
+        productos, total = await self.repository.get_all(
+            skip, limit, id_categoria,
+            mascara_excluida=mascara, tolerar_trazas=tolerar_trazas,
+            productos_excluidos=excluidos,
+        )
 
         # Convertir modelos a esquemas de resumen
         producto_summaries = [ProductoSummary.model_validate(producto) for producto in productos]
@@ -329,6 +380,7 @@ class ProductoService:
 
         try:
             # Actualizar el producto
+            await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [producto_id])
             updated_producto = await self.repository.update(producto_id, **update_data)
 
             # Verificar si el producto fue encontrado
@@ -374,6 +426,7 @@ class ProductoService:
             # Crear modelos de productos desde los datos
             producto_models = [
                 ProductoModel(
+                    id=str(ULID()),
                     id_categoria=producto_data.id_categoria,
                     nombre=producto_data.nombre,
                     descripcion=producto_data.descripcion,
@@ -385,6 +438,9 @@ class ProductoService:
             ]
 
             # Persistir en la base de datos usando batch insert
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.PRODUCTO, [producto.id for producto in producto_models]
+            )
             created_productos = await self.repository.batch_insert(producto_models)
 
             # Convertir y retornar como esquemas de respuesta
@@ -404,6 +460,11 @@ class ProductoService:
         """
         Actualiza múltiples productos en una sola operación.
 
+        Solo se escriben, y se anotan en el registro de cambios del menú,
+        los productos en los que algún valor es distinto del guardado: una
+        sincronización que no cambia nada no obliga a los clientes a
+        descargar el menú.
+
         Parameters
         ----------
         updates : List[Tuple[str, ProductoUpdate]]
@@ -436,23 +497,44 @@ class ProductoService:
                 if update_data:  # Solo incluir si hay datos para actualizar
                     repository_updates.append((producto_id, update_data))
 
-            # Realizar actualización en lote
-            updated_productos = await self.repository.batch_update(repository_updates)
+            # Verificar que existen todos los productos
+            actuales = {
+                str(producto.id): producto
+                for producto in await self.repository.get_by_ids(
+                    [producto_id for producto_id, _ in repository_updates]
+                )
+            }
+            missing_ids = set(u[0] for u in repository_updates) - set(actuales)
+            if missing_ids:
+                raise ProductoNotFoundError(
+                    f"No se encontraron los productos con IDs: {missing_ids}"
+                )
 
-            # Verificar si todos los productos fueron actualizados
-            if len(updated_productos) != len(repository_updates):
-                missing_ids = set(u[0] for u in repository_updates) - set(
-                    str(p.id) for p in updated_productos
+            # Descartar las actualizaciones que no cambian ningún valor
+            cambios = [
+                (producto_id, update_data)
+                for producto_id, update_data in repository_updates
+                if any(
+                    getattr(actuales[producto_id], campo, valor) != valor
+                    for campo, valor in update_data.items()
                 )
-                if missing_ids:
-                    raise ProductoNotFoundError(
-                        f"No se encontraron los productos con IDs: {missing_ids}"
-                    )
+            ]
+
+            # Realizar actualización en lote
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.PRODUCTO, [producto_id for producto_id, _ in cambios]
+            )
+            actualizados = {
+                str(producto.id): producto
+                for producto in await self.repository.batch_update(cambios)
+            }
 
             # Convertir y retornar como esquemas de respuesta
             return [
-                ProductoResponse.model_validate(producto)
-                for producto in updated_productos
+                ProductoResponse.model_validate(
+                    actualizados.get(producto_id, actuales[producto_id])
+                )
+                for producto_id, _ in repository_updates
             ]
         except IntegrityError:
             # Capturar errores de integridad (nombre duplicado)
@@ -460,11 +542,14 @@ class ProductoService:
                 "Una o más actualizaciones causaron conflictos de integridad"
             )
 
+    @coalescer
     async def get_productos_cards_by_categoria(
         self, 
         categoria_id: str | None = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        excluir_alergenos: Optional[List[str]] = None,
+        tolerar_trazas: bool = True,
     ) -> ProductoCardList:
         """
         Obtiene una lista paginada de productos en formato card (nombre, imagen, categoría).
@@ -477,6 +562,10 @@ class ProductoService:
             Número de registros a omitir (offset), por defecto 0.
         limit : int, optional
             Número máximo de registros a retornar, por defecto 100.
+        excluir_alergenos : Optional[List[str]], optional
+            IDs de alérgenos cuyos productos deben excluirse.
+        tolerar_trazas : bool, optional
+            Si es False también excluye trazas y "puede contener", por defecto True.
 
         Returns
         -------
@@ -497,7 +586,12 @@ class ProductoService:
             raise ProductoValidationError("El parámetro 'limit' debe ser mayor a cero")
 
         # Obtener productos desde el repositorio (con o sin filtro de categoría)
-        productos, total = await self.repository.get_all(skip, limit, categoria_id)
+        mascara, excluidos = await self._resolver_exclusion(excluir_alergenos, tolerar_trazas)
+        productos, total = await self.repository.get_all(
+            skip, limit, categoria_id,
+            mascara_excluida=mascara, tolerar_trazas=tolerar_trazas,
+            productos_excluidos=excluidos,
+        )
 
         # Convertir modelos a esquemas de card
         # Necesitamos incluir la información de la categoría para cada producto
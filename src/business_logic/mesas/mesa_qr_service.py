@@ -0,0 +1,255 @@
+"""
+Servicio para generar los códigos QR de las mesas.
+
+Cada QR codifica la URL pública de la mesa. Las imágenes se guardan en
+``Settings.upload_dir/qr`` con un nombre derivado del contenido (URL,
+formato y escala), de modo que solo se generan la primera vez y se
+regeneran únicamente si cambia la URL. Al generar el ZIP de una zona se
+borran los ZIP anteriores de esa zona. La generación usa el paquete
+``segno`` (en requirements.txt; si falta, los endpoints responden 503) y
+se ejecuta en un hilo para no bloquear el event loop.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.business_logic.exceptions.mesa_exceptions import (
+    MesaNotFoundError,
+    MesaQRNoDisponibleError,
+)
+from src.core.config import get_settings
+from src.models.mesas.mesa_model import MesaModel
+from src.repositories.mesas.mesa_repository import MesaRepository
+
+try:
+    import segno
+except ImportError:  # pragma: no cover - depende del entorno
+    segno = None
+
+
+# Formatos de imagen soportados y su tipo de contenido
+FORMATOS_QR: Dict[str, str] = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+# Segundos que se conserva un ZIP reemplazado: una descarga que ya resolvió
+# su ruta antes del cambio todavía puede abrirlo
+GRACIA_ZIP_OBSOLETO = 60.0
+
+
+@dataclass(frozen=True)
+class ArchivoQR:
+    """Archivo generado y cacheado en disco.
+
+    Attributes
+    ----------
+    ruta : Path
+        Ubicación del archivo.
+    digest : str
+        Huella del contenido; forma parte del nombre del archivo.
+    media_type : str
+        Tipo de contenido HTTP.
+    """
+
+    ruta: Path
+    digest: str
+    media_type: str
+
+    @property
+    def etag(self) -> str:
+        """ETag fuerte derivado de la huella del contenido."""
+        return f'"{self.digest}"'
+
+
+def _huella(*partes: str) -> str:
+    """Calcula una huella corta y estable de las partes indicadas."""
+    return hashlib.sha256("\x1f".join(partes).encode("utf-8")).hexdigest()[:32]
+
+
+def _escribir_atomico(ruta: Path, contenido: bytes) -> None:
+    """
+    Escribe un archivo de forma atómica para que nunca se lea a medias.
+
+    Cada escritura usa su propio temporal, así que dos hilos o procesos que
+    generan el mismo archivo a la vez no se pisan: gana el último ``replace``.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=ruta.parent, prefix=f".{ruta.name}.", suffix=".tmp", delete=False
+    ) as temporal:
+        temporal.write(contenido)
+    try:
+        os.replace(temporal.name, ruta)
+    except OSError:
+        os.unlink(temporal.name)
+        raise
+
+
+def _podar_zips(vigente: Path, prefijo: str) -> None:
+    """Borra los ZIP de la misma zona y formato reemplazados hace más de la gracia."""
+    limite = time.time() - GRACIA_ZIP_OBSOLETO
+    for ruta in vigente.parent.glob(f"{prefijo}-*.zip"):
+        try:
+            if ruta != vigente and ruta.stat().st_mtime < limite:
+                ruta.unlink()
+        except FileNotFoundError:
+            # Otro worker lo borró antes
+            pass
+
+
+def _renderizar(url: str, formato: str, escala: int) -> bytes:
+    """Genera la imagen de un QR; es la parte costosa en CPU."""
+    buffer = io.BytesIO()
+    segno.make(url, error="m").save(buffer, kind=formato, scale=escala, border=2)
+    return buffer.getvalue()
+
+
+class MesaQRService:
+    """Servicio para obtener los códigos QR de las mesas.
+
+    Attributes
+    ----------
+    repository : MesaRepository
+        Repositorio para acceso a datos de mesas.
+    directorio : Path
+        Carpeta donde se cachean las imágenes.
+    base_url : str
+        URL pública a la que se añade el ID de la mesa.
+    escala : int
+        Tamaño en píxeles de cada módulo del QR.
+    """
+
+    def __init__(self, session: AsyncSession, directorio: Optional[Path] = None):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        directorio : Optional[Path], optional
+            Carpeta de caché. Por defecto ``Settings.upload_dir/qr``.
+        """
+        settings = get_settings()
+        self.repository = MesaRepository(session)
+        self.directorio = directorio or Path(settings.upload_dir) / "qr"
+        self.base_url = settings.qr_base_url.rstrip("/")
+        self.escala = settings.qr_scale
+
+    def url_mesa(self, mesa: MesaModel) -> str:
+        """
+        Obtiene la URL que codifica el QR de una mesa.
+
+        Parameters
+        ----------
+        mesa : MesaModel
+            Mesa a identificar.
+
+        Returns
+        -------
+        str
+            URL pública de la mesa.
+        """
+        return f"{self.base_url}/{mesa.id}"
+
+    async def get_qr_mesa(self, mesa_id: str, formato: str = "png") -> ArchivoQR:
+        """
+        Obtiene el QR de una mesa, generándolo solo si no está en caché.
+
+        Parameters
+        ----------
+        mesa_id : str
+            Identificador único de la mesa.
+        formato : str, optional
+            "png" o "svg", por defecto "png".
+
+        Returns
+        -------
+        ArchivoQR
+            Imagen cacheada en disco.
+
+        Raises
+        ------
+        MesaNotFoundError
+            Si la mesa no existe.
+        MesaQRNoDisponibleError
+            Si hay que generar el QR y segno no está instalado.
+        """
+        mesa = await self.repository.get_by_id(mesa_id)
+        if mesa is None:
+            raise MesaNotFoundError(f"No se encontró la mesa con ID {mesa_id}")
+        return await self._obtener_qr(self.url_mesa(mesa), formato)
+
+    async def get_qr_zona(self, zona: str, formato: str = "png") -> ArchivoQR:
+        """
+        Obtiene un ZIP con los QR de todas las mesas activas de una zona.
+
+        Los archivos del ZIP se nombran con el número de cada mesa.
+
+        Parameters
+        ----------
+        zona : str
+            Zona de las mesas.
+        formato : str, optional
+            "png" o "svg", por defecto "png".
+
+        Returns
+        -------
+        ArchivoQR
+            ZIP cacheado en disco.
+
+        Raises
+        ------
+        MesaNotFoundError
+            Si la zona no tiene mesas activas.
+        MesaQRNoDisponibleError
+            Si hay que generar algún QR y segno no está instalado.
+        """
+        mesas = await self.repository.get_activas_por_zona(zona)
+        if not mesas:
+            raise MesaNotFoundError(f"No hay mesas activas en la zona '{zona}'")
+
+        qrs: List[Tuple[str, ArchivoQR]] = [
+            (mesa.numero, await self._obtener_qr(self.url_mesa(mesa), formato)) for mesa in mesas
+        ]
+        digest = _huella("zip", *(f"{numero}={qr.digest}" for numero, qr in qrs))
+        # El prefijo identifica la zona y el formato para podar sus ZIP anteriores
+        prefijo = f"zona-{_huella(zona, formato)[:16]}"
+        ruta = self.directorio / f"{prefijo}-{digest}.zip"
+        if not ruta.exists():
+            await asyncio.to_thread(self._escribir_zip, ruta, qrs, formato)
+            await asyncio.to_thread(_podar_zips, ruta, prefijo)
+        return ArchivoQR(ruta=ruta, digest=digest, media_type="application/zip")
+
+    async def _obtener_qr(self, url: str, formato: str) -> ArchivoQR:
+        """Retorna el QR de una URL desde disco o lo genera y guarda."""
+        digest = _huella(url, formato, str(self.escala))
+        ruta = self.directorio / f"{digest}.{formato}"
+        if not ruta.exists():
+            if segno is None:
+                raise MesaQRNoDisponibleError()
+            contenido = await asyncio.to_thread(_renderizar, url, formato, self.escala)
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            _escribir_atomico(ruta, contenido)
+        return ArchivoQR(ruta=ruta, digest=digest, media_type=FORMATOS_QR[formato])
+
+    @staticmethod
+    def _escribir_zip(ruta: Path, qrs: List[Tuple[str, ArchivoQR]], formato: str) -> None:
+        """Empaqueta los QR en un ZIP; los PNG ya están comprimidos y se guardan tal cual."""
+        compresion = zipfile.ZIP_STORED if formato == "png" else zipfile.ZIP_DEFLATED
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=compresion) as archivo:
+            for numero, qr in qrs:
+                nombre = numero.replace("/", "-").replace("\\", "-")
+                archivo.write(qr.ruta, arcname=f"{nombre}.{formato}")
+        _escribir_atomico(ruta, buffer.getvalue())
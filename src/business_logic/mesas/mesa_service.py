@@ -2,7 +2,9 @@
 Servicio para la gestión de mesas en el sistema.
 """
 
+from typing import Iterable, Optional
 from uuid import UUID
+from ulid import ULID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -14,14 +16,43 @@ from src.api.schemas.mesa_schema import (
     MesaResponse,
     MesaSummary,
     MesaList,
+    MesaSync,
+    MesaSyncResultado,
+    MesaTransicion,
+    MesaResumen,
+    MesaZonaResumen,
 )
+from src.core.enums.mesa_enums import EstadoMesa
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+from src.business_logic.notifications.websocket_hub import CANAL_MESAS
+from src.business_logic.mesas.transiciones_mesa import es_transicion_valida, estados_origen
 from src.business_logic.exceptions.mesa_exceptions import (
     MesaValidationError,
     MesaNotFoundError,
     MesaConflictError,
+    MesaTransicionError,
+    MesaVersionConflictError,
 )
 
 
+# Capacidad asignada a las mesas nuevas cuando el sistema externo no la indica
+CAPACIDAD_POR_DEFECTO = 4
+
+# Estados cuyas mesas cuentan como asientos libres en el resumen de ocupación
+ESTADOS_LIBRES = (EstadoMesa.LIBRE, EstadoMesa.DISPONIBLE)
+
+# Campos que se comparan al sincronizar mesas con el sistema externo
+CAMPOS_SINCRONIZADOS = ("zona", "nota", "capacidad", "estado")
+
+# Veces que se recalcula una mesa modificada por otra petición durante la sincronización
+REINTENTOS_SYNC = 3
+
+# Una sincronización que desactiva mesas debe traer al menos esta fracción de
+# las mesas activas: un scraping vacío o truncado no debe vaciar el salón
+MIN_FRACCION_RECIBIDAS = 0.5
+
+
 class MesaService:
     async def batch_create_mesas(self, mesas_data: list[MesaCreate]) -> list[MesaResponse]:
         """
@@ -47,6 +78,7 @@ class MesaService:
             for mesa in mesas_data
         ]
         created_mesas = await self.repository.batch_insert(mesas_models)
+        await self._notificar_cambios(created_mesas)
         return [MesaResponse.model_validate(mesa) for mesa in created_mesas]
 
     async def batch_delete_mesas(self, mesa_ids: list[UUID]) -> int:
@@ -74,6 +106,8 @@ class MesaService:
     ----------
     repository : MesaRepository
         Repositorio para acceso a datos de mesas.
+    event_bus : EventBus
+        Bus en el que se publican los cambios de estado de las mesas.
     """
 
     def __init__(self, session: AsyncSession):
@@ -86,6 +120,7 @@ class MesaService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = MesaRepository(session)
+        self.event_bus = get_event_bus()
 
     async def create_mesa(self, mesa_data: MesaCreate) -> MesaResponse:
         """
@@ -216,10 +251,53 @@ class MesaService:
         # Retornar esquema de lista
         return MesaList(items=mesa_summaries, total=total)
 
+    async def get_resumen(self) -> MesaResumen:
+        """
+        Obtiene la ocupación de las mesas activas por zona y estado.
+
+        Se calcula con una sola consulta agregada, sin cargar las mesas.
+
+        Returns
+        -------
+        MesaResumen
+            Conteo de mesas por zona y estado y asientos libres y ocupados.
+        """
+        zonas: dict[Optional[str], MesaZonaResumen] = {}
+        for zona, estado, mesas, asientos in await self.repository.get_conteo_por_zona_estado():
+            resumen = zonas.get(zona)
+            if resumen is None:
+                resumen = MesaZonaResumen(
+                    zona=zona,
+                    por_estado={e: 0 for e in EstadoMesa},
+                    total_mesas=0,
+                    asientos_libres=0,
+                    asientos_ocupados=0,
+                )
+                zonas[zona] = resumen
+            resumen.por_estado[estado] += mesas
+            resumen.total_mesas += mesas
+            if estado in ESTADOS_LIBRES:
+                resumen.asientos_libres += asientos
+            elif estado == EstadoMesa.OCUPADA:
+                resumen.asientos_ocupados += asientos
+
+        ordenadas = sorted(zonas.values(), key=lambda r: (r.zona is None, r.zona or ""))
+        return MesaResumen(
+            zonas=ordenadas,
+            total_mesas=sum(r.total_mesas for r in ordenadas),
+            asientos_libres=sum(r.asientos_libres for r in ordenadas),
+            asientos_ocupados=sum(r.asientos_ocupados for r in ordenadas),
+        )
+
     async def update_mesa(self, mesa_id: UUID, mesa_data: MesaUpdate) -> MesaResponse:
         """
         Actualiza una mesa existente.
 
+        Un cambio de estado pasa por ``transicionar_mesa``, con la misma
+        validación de la máquina de estados, el mismo compare-and-set y el
+        mismo evento; se aplica antes que el resto de campos, de modo que
+        si no está permitido no se escribe nada.
+
         Parameters
         ----------
         mesa_id : UUID
@@ -236,6 +314,8 @@ class MesaService:
         ------
         MesaNotFoundError
             Si no se encuentra una mesa con el ID proporcionado.
+        MesaTransicionError
+            Si el cambio de estado no está permitido.
         MesaConflictError
             Si ya existe otra mesa con el mismo nombre.
         """
@@ -243,6 +323,16 @@ class MesaService:
         # excluyendo valores None (campos no proporcionados para actualizar)
         update_data = mesa_data.model_dump(exclude_none=True)
 
+        estado = update_data.pop("estado", None)
+        if estado is not None:
+            actual = await self.repository.get_by_id(mesa_id)
+            if actual is None:
+                raise MesaNotFoundError(f"No se encontró la mesa con ID {mesa_id}")
+            if actual.estado != estado:
+                mesa = await self.transicionar_mesa(str(mesa_id), MesaTransicion(estado=estado))
+                if not update_data:
+                    return mesa
+
         if not update_data:
             # Si no hay datos para actualizar, simplemente retornar la mesa actual
             return await self.get_mesa_by_id(mesa_id)
@@ -255,6 +345,8 @@ class MesaService:
             if not updated_mesa:
                 raise MesaNotFoundError(f"No se encontró la mesa con ID {mesa_id}")
 
+            await self._notificar_cambios([updated_mesa])
+
             # Convertir y retornar como esquema de respuesta
             return MesaResponse.model_validate(updated_mesa)
         except IntegrityError:
@@ -264,4 +356,241 @@ class MesaService:
                     f"Ya existe una mesa con el nombre '{update_data['nombre']}'"
                 )
             # Si no es por nombre, reenviar la excepción original
-            raise
\ No newline at end of file
+            raise
+
+    async def transicionar_mesa(self, mesa_id: str, transicion: MesaTransicion) -> MesaResponse:
+        """
+        Cambia el estado de una mesa respetando la máquina de estados.
+
+        El cambio se aplica con una única sentencia condicional; solo si no
+        se aplica se vuelve a leer la mesa para explicar el motivo.
+
+        Parameters
+        ----------
+        mesa_id : str
+            Identificador único de la mesa.
+        transicion : MesaTransicion
+            Estado solicitado y, opcionalmente, la versión conocida por el cliente.
+
+        Returns
+        -------
+        MesaResponse
+            La mesa con su nuevo estado y versión.
+
+        Raises
+        ------
+        MesaNotFoundError
+            Si la mesa no existe.
+        MesaVersionConflictError
+            Si la mesa fue modificada después de la versión indicada.
+        MesaTransicionError
+            Si la mesa está inactiva o la transición no está permitida.
+        """
+        mesa = await self.repository.cambiar_estado(
+            mesa_id,
+            transicion.estado,
+            estados_origen(transicion.estado),
+            transicion.version,
+        )
+
+        if mesa is None:
+            actual = await self.repository.get_by_id(mesa_id)
+            if actual is None:
+                raise MesaNotFoundError(f"No se encontró la mesa con ID {mesa_id}")
+            if transicion.version is not None and actual.version != transicion.version:
+                raise MesaVersionConflictError(
+                    f"La mesa fue modificada (versión actual {actual.version}, "
+                    f"recibida {transicion.version})"
+                )
+            if not actual.activo:
+                raise MesaTransicionError(f"La mesa '{actual.numero}' está inactiva")
+            if not es_transicion_valida(actual.estado, transicion.estado):
+                raise MesaTransicionError(
+                    f"No se puede pasar la mesa '{actual.numero}' de "
+                    f"'{actual.estado.value}' a '{transicion.estado.value}'"
+                )
+            # Otra petición cambió la mesa entre la escritura y la lectura
+            raise MesaVersionConflictError("La mesa fue modificada por otra petición")
+
+        await self._notificar_cambios([mesa])
+        return MesaResponse.model_validate(mesa)
+
+    @staticmethod
+    def _cambio_sync(actual: MesaModel, datos: MesaSync) -> Optional[dict]:
+        """
+        Calcula los valores a escribir en una mesa existente al sincronizar.
+
+        Parameters
+        ----------
+        actual : MesaModel
+            Mesa tal como se leyó de la base de datos.
+        datos : MesaSync
+            Estado recibido del sistema externo.
+
+        Returns
+        -------
+        Optional[dict]
+            ``id``, valores finales y ``version`` leída, o None si no cambia nada.
+        """
+        # Valores finales: los recibidos sustituyen a los actuales salvo si son None
+        valores = {campo: getattr(actual, campo) for campo in CAMPOS_SINCRONIZADOS}
+        valores.update(
+            {campo: getattr(datos, campo) for campo in CAMPOS_SINCRONIZADOS
+             if getattr(datos, campo) is not None}
+        )
+        valores["activo"] = True
+
+        if all(valor == getattr(actual, campo) for campo, valor in valores.items()):
+            return None
+        return {"id": actual.id, **valores, "version": actual.version}
+
+    async def sync_mesas(
+        self, mesas_data: list[MesaSync], forzar_desactivacion: bool = False
+    ) -> MesaSyncResultado:
+        """
+        Sincroniza las mesas con el estado recibido del sistema externo.
+
+        Las mesas se identifican por su número. Solo se escriben las mesas
+        nuevas o con algún cambio, todo en una transacción, y las mesas
+        activas que no se recibieron se desactivan. Se publica un evento
+        por cada mesa afectada.
+
+        Cada mesa existente solo se actualiza si conserva la versión leída.
+        Si otra petición la cambió entretanto (por ejemplo una transición
+        de estado), se vuelve a leer y se recalcula el cambio, hasta
+        ``REINTENTOS_SYNC`` veces; las que sigan en conflicto se cuentan
+        en ``conflictos`` sin escribirse.
+
+        Un estado que desactivaría mesas y trae menos de
+        ``MIN_FRACCION_RECIBIDAS`` de las mesas activas (por ejemplo, uno
+        vacío) suele ser un scraping fallido: se rechaza sin escribir nada
+        salvo que se indique ``forzar_desactivacion``.
+
+        Parameters
+        ----------
+        mesas_data : list[MesaSync]
+            Estado completo de las mesas en el sistema externo. Si un número
+            se repite, prevalece la última aparición.
+        forzar_desactivacion : bool, optional
+            Aplica la sincronización aunque traiga menos de
+            ``MIN_FRACCION_RECIBIDAS`` de las mesas activas, por defecto False.
+
+        Returns
+        -------
+        MesaSyncResultado
+            Conteo de mesas creadas, actualizadas, desactivadas, sin cambios
+            y en conflicto, y las mesas creadas.
+
+        Raises
+        ------
+        MesaValidationError
+            Si desactivaría demasiadas mesas sin ``forzar_desactivacion``.
+        """
+        existentes = {mesa.numero: mesa for mesa in await self.repository.get_todas()}
+        recibidas = {mesa.numero: mesa for mesa in mesas_data}
+
+        resultado = MesaSyncResultado()
+        nuevas: list[MesaModel] = []
+        cambios: list[dict] = []
+
+        for numero, datos in recibidas.items():
+            actual = existentes.get(numero)
+            if actual is None:
+                nuevas.append(
+                    MesaModel(
+                        id=str(ULID()),
+                        numero=numero,
+                        zona=datos.zona,
+                        nota=datos.nota,
+                        capacidad=datos.capacidad or CAPACIDAD_POR_DEFECTO,
+                        estado=datos.estado or EstadoMesa.DISPONIBLE,
+                        activo=True,
+                    )
+                )
+                continue
+
+            cambio = self._cambio_sync(actual, datos)
+            if cambio is None:
+                resultado.sin_cambios += 1
+            else:
+                cambios.append(cambio)
+
+        ids_desactivar = [
+            mesa.id for numero, mesa in existentes.items()
+            if numero not in recibidas and mesa.activo
+        ]
+        activas = sum(1 for mesa in existentes.values() if mesa.activo)
+        if (
+            ids_desactivar
+            and not forzar_desactivacion
+            and len(recibidas) < activas * MIN_FRACCION_RECIBIDAS
+        ):
+            raise MesaValidationError(
+                f"La sincronización desactivaría {len(ids_desactivar)} de {activas} mesas "
+                f"activas con {len(recibidas)} mesas recibidas; si es correcto, "
+                "repítala forzando la desactivación"
+            )
+
+        afectadas = await self.repository.aplicar_sincronizacion(nuevas, cambios, ids_desactivar)
+        resultado.creadas = len(nuevas)
+        resultado.mesas_creadas = [MesaResponse.model_validate(mesa) for mesa in nuevas]
+        resultado.desactivadas = len(ids_desactivar)
+
+        for intento in range(REINTENTOS_SYNC + 1):
+            escritas = {mesa.id for mesa in afectadas}
+            pendientes = [c for c in cambios if c["id"] not in escritas]
+            resultado.actualizadas += len(cambios) - len(pendientes)
+            if not pendientes or intento == REINTENTOS_SYNC:
+                resultado.conflictos = len(pendientes)
+                break
+
+            # Releer las mesas en conflicto y recalcular su cambio
+            numeros = {mesa.id: mesa.numero for mesa in existentes.values()}
+            cambios = []
+            for pendiente in pendientes:
+                actual = await self.repository.get_by_id(pendiente["id"])
+                if actual is None:
+                    # Se eliminó mientras tanto: no hay nada que sincronizar
+                    continue
+                cambio = self._cambio_sync(actual, recibidas[numeros[pendiente["id"]]])
+                if cambio is None:
+                    resultado.sin_cambios += 1
+                else:
+                    cambios.append(cambio)
+            reintentadas = await self.repository.aplicar_sincronizacion([], cambios, [])
+            afectadas = afectadas + reintentadas
+
+        desactivadas = set(ids_desactivar)
+        await self._notificar_cambios([m for m in afectadas if m.id not in desactivadas])
+        await self._notificar_cambios(
+            [m for m in afectadas if m.id in desactivadas], evento="mesa_desactivada"
+        )
+        return resultado
+
+    async def _notificar_cambios(
+        self, mesas: Iterable[MesaModel], evento: str = "actualizacion_mesa"
+    ) -> None:
+        """
+        Publica el estado actual de las mesas en el canal de su zona.
+
+        Se llama después de que el repositorio confirme la transacción.
+
+        Parameters
+        ----------
+        mesas : Iterable[MesaModel]
+            Mesas creadas o modificadas.
+        evento : str, optional
+            Nombre del evento, por defecto "actualizacion_mesa".
+        """
+        for mesa in mesas:
+            await self.event_bus.publicar(
+                Evento(
+                    canal=CANAL_MESAS,
+                    zona=mesa.zona,
+                    clave=mesa.id,
+                    mensaje=WebSocketMessage(
+                        evento=evento,
+                        payload=MesaSummary.model_validate(mesa).model_dump(mode="json"),
+                    ),
+                )
+            )
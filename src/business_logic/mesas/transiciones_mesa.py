@@ -0,0 +1,72 @@
+"""
+Máquina de estados de las mesas.
+
+Define qué cambios de estado están permitidos. Los estados LIBRE y
+DISPONIBLE son equivalentes a efectos de transición.
+"""
+
+from typing import Dict, FrozenSet
+
+from src.core.enums.mesa_enums import EstadoMesa
+
+_LIBRES = frozenset({EstadoMesa.LIBRE, EstadoMesa.DISPONIBLE})
+
+# Estados a los que se puede pasar desde cada estado
+TRANSICIONES_MESA: Dict[EstadoMesa, FrozenSet[EstadoMesa]] = {
+    EstadoMesa.LIBRE: frozenset({
+        EstadoMesa.DISPONIBLE,
+        EstadoMesa.OCUPADA,
+        EstadoMesa.RESERVADA,
+        EstadoMesa.MANTENIMIENTO,
+        EstadoMesa.FUERA_SERVICIO,
+    }),
+    EstadoMesa.DISPONIBLE: frozenset({
+        EstadoMesa.LIBRE,
+        EstadoMesa.OCUPADA,
+        EstadoMesa.RESERVADA,
+        EstadoMesa.MANTENIMIENTO,
+        EstadoMesa.FUERA_SERVICIO,
+    }),
+    EstadoMesa.OCUPADA: _LIBRES,
+    EstadoMesa.RESERVADA: _LIBRES | {EstadoMesa.OCUPADA},
+    EstadoMesa.MANTENIMIENTO: _LIBRES | {EstadoMesa.FUERA_SERVICIO},
+    EstadoMesa.FUERA_SERVICIO: _LIBRES | {EstadoMesa.MANTENIMIENTO},
+}
+
+
+def es_transicion_valida(origen: EstadoMesa, destino: EstadoMesa) -> bool:
+    """
+    Indica si una mesa puede pasar de un estado a otro.
+
+    Parameters
+    ----------
+    origen : EstadoMesa
+        Estado actual de la mesa.
+    destino : EstadoMesa
+        Estado solicitado.
+
+    Returns
+    -------
+    bool
+        True si la transición está permitida.
+    """
+    return destino in TRANSICIONES_MESA.get(origen, frozenset())
+
+
+def estados_origen(destino: EstadoMesa) -> FrozenSet[EstadoMesa]:
+    """
+    Obtiene los estados desde los que se puede llegar a un estado.
+
+    Parameters
+    ----------
+    destino : EstadoMesa
+        Estado solicitado.
+
+    Returns
+    -------
+    FrozenSet[EstadoMesa]
+        Estados de origen permitidos.
+    """
+    return frozenset(
+        origen for origen, destinos in TRANSICIONES_MESA.items() if destino in destinos
+    )
@@ -0,0 +1,486 @@
+"""
+Bus de eventos para repartir notificaciones entre workers.
+
+Los servicios publican eventos tras confirmar sus cambios y los hubs de
+WebSocket de cada worker se suscriben a los canales que les interesan.
+Hay dos backends:
+
+- ``memory``: en el propio proceso; suficiente con un solo worker.
+- ``redis``: pub/sub de Redis sobre ``Settings.redis_url``; cada worker
+  recibe también sus propios eventos, así todos los ven en el mismo orden.
+  Requiere el paquete opcional ``redis``.
+
+En ambos casos la entrega es asíncrona, en orden de publicación, y los
+eventos con la misma clave que aún no se entregaron se fusionan: solo se
+entrega el más reciente.
+
+Redis pub/sub entrega cada evento como mucho una vez: lo publicado mientras
+un worker está desconectado se pierde. Por eso el estado en memoria que se
+mantiene con eventos se registra también con ``al_reconectar`` y se relee
+completo cuando el bus recupera la conexión.
+"""
+
+import asyncio
+import inspect
+import itertools
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
+
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.core.config import get_settings
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - depende del entorno
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Evento:
+    """Evento publicado en el bus.
+
+    Attributes
+    ----------
+    canal : str
+        Canal lógico del evento (por ejemplo "mesas").
+    mensaje : WebSocketMessage
+        Mensaje a reenviar a los clientes.
+    zona : Optional[str]
+        Zona a la que va dirigido, si aplica.
+    clave : Optional[str]
+        Identifica la entidad afectada. Los eventos pendientes con igual
+        canal y clave se fusionan y solo se entrega el último.
+    """
+
+    canal: str
+    mensaje: WebSocketMessage
+    zona: Optional[str] = None
+    clave: Optional[str] = None
+
+    def to_json(self) -> str:
+        """Serializa el evento para enviarlo entre procesos."""
+        return json.dumps(
+            {
+                "canal": self.canal,
+                "zona": self.zona,
+                "clave": self.clave,
+                "mensaje": self.mensaje.model_dump(mode="json"),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Evento":
+        """Reconstruye un evento serializado con ``to_json``."""
+        contenido: Dict[str, Any] = json.loads(data)
+        return cls(
+            canal=contenido["canal"],
+            mensaje=WebSocketMessage.model_validate(contenido["mensaje"]),
+            zona=contenido.get("zona"),
+            clave=contenido.get("clave"),
+        )
+
+
+Manejador = Callable[[Evento], Union[None, Awaitable[None]]]
+
+Resincronizador = Callable[[], Union[None, Awaitable[Any]]]
+
+
+class ColaCoalescente:
+    """Cola FIFO de eventos que fusiona los pendientes con la misma clave.
+
+    Al fusionar, el evento nuevo ocupa la posición del más reciente, de
+    modo que los eventos entregados conservan el orden de publicación.
+
+    Attributes
+    ----------
+    max_pendientes : int
+        Límite de eventos pendientes; al superarlo se descartan los más antiguos.
+    fusionados : int
+        Número de eventos reemplazados por uno más reciente.
+    descartados : int
+        Número de eventos descartados por superar el límite.
+    """
+
+    def __init__(self, max_pendientes: int = 10000):
+        """
+        Inicializa la cola vacía.
+
+        Parameters
+        ----------
+        max_pendientes : int, optional
+            Límite de eventos pendientes, por defecto 10000.
+        """
+        self.max_pendientes = max_pendientes
+        self.fusionados = 0
+        self.descartados = 0
+        self._pendientes: "OrderedDict[Hashable, Evento]" = OrderedDict()
+        self._secuencia = itertools.count()
+        self._hay_eventos = asyncio.Event()
+
+    def poner(self, evento: Evento) -> None:
+        """
+        Añade un evento sin bloquear.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento a encolar.
+        """
+        if evento.clave is None:
+            clave: Hashable = next(self._secuencia)
+        else:
+            clave = (evento.canal, evento.clave)
+            if self._pendientes.pop(clave, None) is not None:
+                self.fusionados += 1
+
+        self._pendientes[clave] = evento
+        while len(self._pendientes) > self.max_pendientes:
+            self._pendientes.popitem(last=False)
+            self.descartados += 1
+        self._hay_eventos.set()
+
+    async def sacar(self) -> Evento:
+        """
+        Extrae el evento más antiguo, esperando si no hay ninguno.
+
+        Returns
+        -------
+        Evento
+            Siguiente evento pendiente.
+        """
+        while not self._pendientes:
+            self._hay_eventos.clear()
+            await self._hay_eventos.wait()
+        return self._pendientes.popitem(last=False)[1]
+
+    def __len__(self) -> int:
+        return len(self._pendientes)
+
+
+class EventBus(ABC):
+    """Base de los backends del bus de eventos.
+
+    Gestiona las suscripciones y la entrega local: un único despachador
+    por proceso saca los eventos recibidos de una ``ColaCoalescente`` y
+    llama a los manejadores suscritos a su canal. Cada backend implementa
+    ``publicar``.
+    """
+
+    def __init__(self, max_pendientes: int = 10000):
+        """
+        Inicializa el bus sin suscriptores.
+
+        Parameters
+        ----------
+        max_pendientes : int, optional
+            Límite de eventos pendientes de entrega, por defecto 10000.
+        """
+        self.max_pendientes = max_pendientes
+        self._manejadores: Dict[str, List[Manejador]] = {}
+        self._cola: Optional[ColaCoalescente] = None
+        self._despachador: Optional[asyncio.Task] = None
+        self._entregando = False
+        self._resincronizadores: List[Resincronizador] = []
+
+    def suscribir(self, canal: str, manejador: Manejador) -> None:
+        """
+        Registra un manejador para los eventos de un canal.
+
+        Parameters
+        ----------
+        canal : str
+            Canal a escuchar.
+        manejador : Manejador
+            Función (síncrona o asíncrona) que recibe cada evento.
+        """
+        self._manejadores.setdefault(canal, []).append(manejador)
+
+    def al_reconectar(self, resincronizador: Resincronizador) -> None:
+        """
+        Registra una función que relee el estado tras perder la conexión del bus.
+
+        Parameters
+        ----------
+        resincronizador : Resincronizador
+            Función (síncrona o asíncrona) sin argumentos; se llama cada vez
+            que el backend vuelve a suscribirse después de un fallo, porque
+            los eventos publicados mientras tanto no llegaron.
+        """
+        self._resincronizadores.append(resincronizador)
+
+    async def _resincronizar(self) -> None:
+        """Llama a los resincronizadores registrados; un fallo no detiene al resto."""
+        for resincronizador in list(self._resincronizadores):
+            try:
+                resultado = resincronizador()
+                if inspect.isawaitable(resultado):
+                    await resultado
+            except Exception:
+                logger.exception("Error al resincronizar tras reconectar el bus de eventos")
+
+    @abstractmethod
+    async def publicar(self, evento: Evento) -> None:
+        """
+        Publica un evento para todos los workers.
+
+        No lanza excepciones: se llama después de confirmar la transacción y
+        un fallo del backend no debe convertir una escritura hecha en un error.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento a publicar. Debe llamarse después de confirmar la transacción.
+        """
+
+    async def iniciar(self) -> None:
+        """Arranca las tareas de fondo del backend."""
+        self._asegurar_despachador()
+
+    async def detener(self) -> None:
+        """Detiene las tareas de fondo del backend."""
+        if self._despachador is not None:
+            self._despachador.cancel()
+            await asyncio.gather(self._despachador, return_exceptions=True)
+            self._despachador = None
+
+    async def esperar_entregas(self) -> None:
+        """Espera a que se entreguen los eventos ya recibidos (útil en pruebas)."""
+        await asyncio.sleep(0)
+        while self._entregando or (self._cola is not None and len(self._cola)):
+            await asyncio.sleep(0)
+
+    def _recibir(self, evento: Evento) -> None:
+        """Encola un evento recibido para su entrega local."""
+        self._asegurar_despachador()
+        self._cola.poner(evento)
+
+    def _asegurar_despachador(self) -> None:
+        """Crea el despachador si no existe o pertenece a otro event loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._despachador is not None
+            and not self._despachador.done()
+            and self._despachador.get_loop() is loop
+        ):
+            return
+        pendientes = self._cola
+        self._cola = ColaCoalescente(self.max_pendientes)
+        if pendientes is not None:
+            # asyncio.Event queda ligado a su loop: se trasladan los pendientes
+            while pendientes._pendientes:
+                self._cola.poner(pendientes._pendientes.popitem(last=False)[1])
+        self._despachador = loop.create_task(self._despachar(self._cola))
+
+    async def _despachar(self, cola: ColaCoalescente) -> None:
+        """Entrega los eventos en orden a los manejadores de su canal."""
+        while True:
+            evento = await cola.sacar()
+            self._entregando = True
+            try:
+                for manejador in list(self._manejadores.get(evento.canal, ())):
+                    try:
+                        resultado = manejador(evento)
+                        if inspect.isawaitable(resultado):
+                            await resultado
+                    except Exception:
+                        logger.exception("Error al entregar evento del canal %s", evento.canal)
+            finally:
+                self._entregando = False
+
+
+class MemoryEventBus(EventBus):
+    """Bus de eventos dentro del proceso."""
+
+    async def publicar(self, evento: Evento) -> None:
+        """
+        Publica un evento para los suscriptores de este proceso.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento a publicar.
+        """
+        self._recibir(evento)
+
+
+class RedisEventBus(EventBus):
+    """Bus de eventos sobre Redis pub/sub.
+
+    Attributes
+    ----------
+    cliente : Any
+        Cliente asíncrono de Redis (``redis.asyncio.Redis`` o compatible).
+    prefijo : str
+        Prefijo de los canales de Redis.
+    espera_reconexion : float
+        Segundos de la primera espera antes de reconectar; se duplica en
+        cada fallo seguido hasta 30.
+    """
+
+    def __init__(
+        self,
+        cliente: Any,
+        prefijo: str = "restaurant:eventos:",
+        max_pendientes: int = 10000,
+        espera_reconexion: float = 1.0,
+    ):
+        """
+        Inicializa el bus sobre un cliente de Redis.
+
+        Parameters
+        ----------
+        cliente : Any
+            Cliente asíncrono de Redis.
+        prefijo : str, optional
+            Prefijo de los canales de Redis, por defecto "restaurant:eventos:".
+        max_pendientes : int, optional
+            Límite de eventos pendientes de entrega, por defecto 10000.
+        espera_reconexion : float, optional
+            Primera espera antes de reconectar, por defecto 1 segundo.
+        """
+        super().__init__(max_pendientes)
+        self.cliente = cliente
+        self.prefijo = prefijo
+        self.espera_reconexion = espera_reconexion
+        self._escucha: Optional[asyncio.Task] = None
+        self._resincronizacion: Optional[asyncio.Task] = None
+        self._suscrito = asyncio.Event()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisEventBus":
+        """
+        Crea el bus conectándose a la URL de Redis indicada.
+
+        Parameters
+        ----------
+        url : str
+            URL de conexión a Redis.
+
+        Returns
+        -------
+        RedisEventBus
+            Bus listo para iniciarse.
+
+        Raises
+        ------
+        RuntimeError
+            Si el paquete ``redis`` no está instalado.
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("El backend 'redis' del bus de eventos requiere el paquete redis")
+        return cls(redis_asyncio.from_url(url), **kwargs)
+
+    async def publicar(self, evento: Evento) -> None:
+        """
+        Publica un evento en Redis; todos los workers, incluido este, lo recibirán.
+
+        Si Redis no responde, el fallo se registra y el evento se entrega
+        solo a los suscriptores de este proceso.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento a publicar.
+        """
+        try:
+            await self.cliente.publish(f"{self.prefijo}{evento.canal}", evento.to_json())
+        except Exception:
+            logger.exception(
+                "No se pudo publicar en Redis un evento del canal %s; solo se entrega en este worker",
+                evento.canal,
+            )
+            self._recibir(evento)
+
+    async def iniciar(self) -> None:
+        """Arranca el despachador local y la escucha de Redis."""
+        await super().iniciar()
+        if self._escucha is None or self._escucha.done():
+            self._suscrito = asyncio.Event()
+            self._escucha = asyncio.create_task(self._escuchar())
+        await self._suscrito.wait()
+
+    async def detener(self) -> None:
+        """Detiene la escucha de Redis y el despachador local."""
+        for tarea in (self._escucha, self._resincronizacion):
+            if tarea is not None:
+                tarea.cancel()
+                await asyncio.gather(tarea, return_exceptions=True)
+        self._escucha = None
+        self._resincronizacion = None
+        await super().detener()
+
+    async def _escuchar(self) -> None:
+        """
+        Recibe los eventos de Redis, reconectando con espera exponencial.
+
+        Tras volver a suscribirse después de un fallo lanza los
+        resincronizadores en una tarea aparte, para seguir recibiendo los
+        eventos que lleguen mientras releen el estado.
+        """
+        espera = self.espera_reconexion
+        perdida = False
+        while True:
+            pubsub = self.cliente.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self.prefijo}*")
+                self._suscrito.set()
+                espera = self.espera_reconexion
+                if perdida:
+                    perdida = False
+                    self._resincronizacion = asyncio.create_task(self._resincronizar())
+                async for mensaje in pubsub.listen():
+                    if mensaje.get("type") != "pmessage":
+                        continue
+                    try:
+                        self._recibir(Evento.from_json(mensaje["data"]))
+                    except (ValueError, KeyError):
+                        logger.warning("Evento de Redis mal formado descartado")
+                raise ConnectionError("La suscripción de Redis terminó")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Conexión con Redis perdida; reintentando en %.0fs", espera)
+                perdida = True
+                # No bloquear el arranque si Redis no está disponible
+                self._suscrito.set()
+                await asyncio.sleep(espera)
+                espera = min(espera * 2, 30.0)
+            finally:
+                await pubsub.aclose()
+
+
+# Instancia única del bus de eventos (patrón singleton)
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """
+    Obtiene o crea el bus de eventos según ``Settings.event_bus_backend``.
+
+    Returns
+    -------
+    EventBus
+        Bus en memoria o sobre Redis.
+
+    Raises
+    ------
+    ValueError
+        Si el backend configurado no existe.
+    """
+    global _event_bus
+    if _event_bus is None:
+        settings = get_settings()
+        backend = settings.event_bus_backend.lower()
+        if backend == "memory":
+            _event_bus = MemoryEventBus()
+        elif backend == "redis":
+            _event_bus = RedisEventBus.from_url(settings.redis_url)
+        else:
+            raise ValueError(f"Backend de bus de eventos desconocido: {settings.event_bus_backend}")
+    return _event_bus
@@ -0,0 +1,301 @@
+"""
+Difusión de cambios de disponibilidad del menú mediante Server-Sent Events.
+
+Un único vigilante por worker consulta la versión del menú una vez por
+ventana de agrupación, y solo mientras haya clientes conectados. Cuando
+cambia, calcula el evento una vez por cada versión de partida distinta
+(normalmente una sola) y lo encola ya formateado en cada conexión. Las
+conexiones inactivas no consultan la base de datos ni tienen tareas
+propias más allá de su generador.
+"""
+
+import asyncio
+import logging
+from contextlib import AbstractAsyncContextManager
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
+
+from src.api.schemas.menu_schema import MenuDisponibilidadEvento
+from src.business_logic.menu.menu_service import MenuService
+from src.core.config import get_settings
+from src.core.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Comentario SSE que mantiene viva la conexión a través de proxies
+KEEPALIVE = ": keepalive\n\n"
+
+FabricaSesion = Callable[[], AbstractAsyncContextManager]
+
+
+def formatear_evento(evento: str, data: str, id_evento: Optional[int] = None) -> str:
+    """
+    Formatea un evento según el protocolo Server-Sent Events.
+
+    Parameters
+    ----------
+    evento : str
+        Nombre del evento.
+    data : str
+        Contenido en una sola línea (JSON).
+    id_evento : Optional[int], optional
+        Identificador que el cliente reenviará en Last-Event-ID.
+
+    Returns
+    -------
+    str
+        Texto del evento terminado en línea en blanco.
+    """
+    lineas = []
+    if id_evento is not None:
+        lineas.append(f"id: {id_evento}")
+    lineas.append(f"event: {evento}")
+    lineas.append(f"data: {data}")
+    return "\n".join(lineas) + "\n\n"
+
+
+def formatear_disponibilidad(evento: MenuDisponibilidadEvento) -> str:
+    """
+    Formatea un evento de disponibilidad; si hay que recargar, emite ``recargar``.
+
+    Parameters
+    ----------
+    evento : MenuDisponibilidadEvento
+        Cambios compactos del menú.
+
+    Returns
+    -------
+    str
+        Evento SSE con la versión como identificador.
+    """
+    nombre = "recargar" if evento.requiere_menu_completo else "disponibilidad"
+    return formatear_evento(nombre, evento.model_dump_json(), id_evento=evento.version)
+
+
+class ConexionSSE:
+    """Cliente conectado al flujo del menú.
+
+    Attributes
+    ----------
+    version : int
+        Última versión del menú enviada al cliente.
+    cola : asyncio.Queue
+        Eventos formateados pendientes de envío.
+    saturada : bool
+        True si la cola se llenó; el flujo termina y el cliente reconecta.
+    """
+
+    def __init__(self, version: int, max_cola: int):
+        """
+        Inicializa la conexión.
+
+        Parameters
+        ----------
+        version : int
+            Versión del menú que el cliente tiene aplicada.
+        max_cola : int
+            Número máximo de eventos pendientes.
+        """
+        self.version = version
+        self.cola: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_cola)
+        self.saturada = False
+
+    def encolar(self, texto: str) -> None:
+        """
+        Encola un evento sin bloquear; si la cola está llena marca la conexión.
+
+        Parameters
+        ----------
+        texto : str
+            Evento ya formateado.
+        """
+        try:
+            self.cola.put_nowait(texto)
+        except asyncio.QueueFull:
+            self.saturada = True
+
+
+class MenuStreamBroadcaster:
+    """Difunde a las conexiones SSE los cambios de disponibilidad del menú.
+
+    Attributes
+    ----------
+    ventana : float
+        Segundos entre consultas de la versión; agrupa los cambios en ese intervalo.
+    max_cola : int
+        Tamaño de la cola de cada conexión.
+    intervalo_keepalive : float
+        Segundos sin eventos tras los que se envía un comentario de keepalive.
+    """
+
+    def __init__(
+        self,
+        fabrica_sesion: Optional[FabricaSesion] = None,
+        ventana: float = 1.0,
+        max_cola: int = 32,
+        intervalo_keepalive: float = 15.0,
+    ):
+        """
+        Inicializa el difusor sin conexiones.
+
+        Parameters
+        ----------
+        fabrica_sesion : Optional[FabricaSesion], optional
+            Crea sesiones de base de datos de corta duración. Por defecto
+            ``DatabaseManager().session``.
+        ventana : float, optional
+            Segundos entre consultas de la versión, por defecto 1.
+        max_cola : int, optional
+            Tamaño de la cola de cada conexión, por defecto 32.
+        intervalo_keepalive : float, optional
+            Segundos entre keepalives, por defecto 15.
+        """
+        self._fabrica_sesion = fabrica_sesion or DatabaseManager().session
+        self.ventana = ventana
+        self.max_cola = max_cola
+        self.intervalo_keepalive = intervalo_keepalive
+        self._conexiones: Set[ConexionSSE] = set()
+        self._vigilante: Optional[asyncio.Task] = None
+
+    @property
+    def total_conexiones(self) -> int:
+        """Número de conexiones abiertas."""
+        return len(self._conexiones)
+
+    async def conectar(self, desde: Optional[int]) -> ConexionSSE:
+        """
+        Registra una conexión y le encola el evento inicial.
+
+        Si el cliente indica una versión se le envían los cambios posteriores;
+        si no, solo la versión vigente para que pueda reanudar más adelante.
+
+        Parameters
+        ----------
+        desde : Optional[int]
+            Versión que el cliente tiene aplicada (Last-Event-ID), si la conoce.
+
+        Returns
+        -------
+        ConexionSSE
+            La conexión registrada.
+        """
+        async with self._fabrica_sesion() as session:
+            servicio = MenuService(session)
+            if desde is None:
+                version = await servicio.menu_cambio_repository.get_version_actual()
+                inicial = formatear_evento("version", f'{{"version":{version}}}', id_evento=version)
+            else:
+                evento = await servicio.get_disponibilidad(desde)
+                version = evento.version
+                inicial = formatear_disponibilidad(evento)
+
+        conexion = ConexionSSE(version, self.max_cola)
+        conexion.encolar(inicial)
+        self._conexiones.add(conexion)
+        self._asegurar_vigilante()
+        return conexion
+
+    def desconectar(self, conexion: ConexionSSE) -> None:
+        """
+        Elimina una conexión.
+
+        Parameters
+        ----------
+        conexion : ConexionSSE
+            Conexión a eliminar.
+        """
+        self._conexiones.discard(conexion)
+
+    async def eventos(self, conexion: ConexionSSE) -> AsyncIterator[str]:
+        """
+        Genera los eventos de una conexión hasta que el cliente se desconecte.
+
+        Parameters
+        ----------
+        conexion : ConexionSSE
+            Conexión registrada con ``conectar``.
+
+        Yields
+        ------
+        str
+            Eventos SSE y keepalives.
+        """
+        try:
+            while not conexion.saturada:
+                try:
+                    yield await asyncio.wait_for(conexion.cola.get(), timeout=self.intervalo_keepalive)
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+        finally:
+            self.desconectar(conexion)
+
+    async def difundir(self) -> None:
+        """
+        Envía a cada conexión los cambios posteriores a su versión.
+
+        Se calcula un solo evento por cada versión de partida distinta.
+        """
+        if not self._conexiones:
+            return
+
+        async with self._fabrica_sesion() as session:
+            servicio = MenuService(session)
+            version = await servicio.menu_cambio_repository.get_version_actual()
+
+            por_version: Dict[int, List[ConexionSSE]] = {}
+            for conexion in list(self._conexiones):
+                if conexion.version < version:
+                    por_version.setdefault(conexion.version, []).append(conexion)
+
+            for desde, conexiones in por_version.items():
+                evento = await servicio.get_disponibilidad(desde)
+                texto = formatear_disponibilidad(evento)
+                # Sin productos afectados no hace falta despertar a los clientes
+                enviar = evento.requiere_menu_completo or bool(evento.productos)
+                for conexion in conexiones:
+                    conexion.version = evento.version
+                    if enviar:
+                        conexion.encolar(texto)
+
+    def _asegurar_vigilante(self) -> None:
+        """Arranca el vigilante si no está activo en el event loop actual."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._vigilante is not None
+            and not self._vigilante.done()
+            and self._vigilante.get_loop() is loop
+        ):
+            return
+        self._vigilante = loop.create_task(self._vigilar())
+
+    async def _vigilar(self) -> None:
+        """Consulta la versión una vez por ventana mientras haya conexiones."""
+        while self._conexiones:
+            await asyncio.sleep(self.ventana)
+            try:
+                await self.difundir()
+            except Exception:
+                logger.exception("Error al difundir cambios del menú")
+
+
+# Instancia única del difusor del menú (patrón singleton)
+_menu_broadcaster: Optional[MenuStreamBroadcaster] = None
+
+
+def get_menu_broadcaster() -> MenuStreamBroadcaster:
+    """
+    Obtiene o crea el difusor de cambios del menú.
+
+    Returns
+    -------
+    MenuStreamBroadcaster
+        Difusor configurado según ``menu_stream_*``.
+    """
+    global _menu_broadcaster
+    if _menu_broadcaster is None:
+        settings = get_settings()
+        _menu_broadcaster = MenuStreamBroadcaster(
+            ventana=settings.menu_stream_batch_window,
+            max_cola=settings.menu_stream_queue_size,
+            intervalo_keepalive=settings.menu_stream_keepalive,
+        )
+    return _menu_broadcaster
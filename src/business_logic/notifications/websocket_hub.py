@@ -0,0 +1,352 @@
+"""
+Hub de conexiones WebSocket para notificar cambios en tiempo real.
+
+Cada conexión se suscribe a uno o varios canales (las zonas del local) y
+tiene su propia cola de envío acotada. Publicar nunca bloquea: el mensaje
+se serializa una vez y se encola en cada conexión suscrita. Si un cliente
+lento llena su cola se cierra su conexión, y al reconectar vuelve a cargar
+el estado completo.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional, Set
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.notifications.event_bus import Evento, get_event_bus
+from src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Canal que recibe los mensajes de todas las zonas
+CANAL_TODOS = "*"
+
+# Canal del bus de eventos con los cambios de estado de las mesas
+CANAL_MESAS = "mesas"
+
+# Código de cierre "Try Again Later" (RFC 6455): el cliente no consumía a tiempo
+CIERRE_CLIENTE_LENTO = 1013
+
+# Código de cierre por falta de actividad del cliente
+CIERRE_SIN_HEARTBEAT = 1001
+
+MENSAJE_PING = json.dumps({"evento": "ping", "payload": {}})
+
+
+class ConexionWebSocket:
+    """Conexión WebSocket suscrita a un conjunto de canales.
+
+    Attributes
+    ----------
+    websocket : WebSocket
+        Conexión aceptada.
+    canales : Set[str]
+        Canales a los que está suscrita.
+    cola : asyncio.Queue
+        Mensajes serializados pendientes de envío.
+    saturada : bool
+        True si la cola se llenó; la conexión se cerrará.
+    """
+
+    def __init__(self, websocket: WebSocket, canales: Iterable[str], max_cola: int):
+        """
+        Inicializa la conexión.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            Conexión ya aceptada.
+        canales : Iterable[str]
+            Canales iniciales.
+        max_cola : int
+            Número máximo de mensajes pendientes antes de cerrar la conexión.
+        """
+        self.websocket = websocket
+        self.canales: Set[str] = set(canales)
+        self.cola: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_cola)
+        self.saturada = False
+
+    def encolar(self, mensaje: str) -> bool:
+        """
+        Encola un mensaje sin bloquear.
+
+        Parameters
+        ----------
+        mensaje : str
+            Mensaje ya serializado.
+
+        Returns
+        -------
+        bool
+            False si la cola está llena; la conexión queda marcada como saturada.
+        """
+        if self.saturada:
+            return False
+        try:
+            self.cola.put_nowait(mensaje)
+            return True
+        except asyncio.QueueFull:
+            self.saturada = True
+            return False
+
+    async def emitir(self, intervalo_heartbeat: float) -> None:
+        """
+        Envía los mensajes encolados y un ping si no hubo tráfico en el intervalo.
+
+        Termina cerrando la conexión si esta se saturó.
+
+        Parameters
+        ----------
+        intervalo_heartbeat : float
+            Segundos sin mensajes tras los que se envía un ping.
+        """
+        while True:
+            if self.saturada:
+                logger.warning("Cerrando WebSocket con cola de envío llena")
+                await self.websocket.close(code=CIERRE_CLIENTE_LENTO)
+                return
+            try:
+                mensaje = await asyncio.wait_for(self.cola.get(), timeout=intervalo_heartbeat)
+            except asyncio.TimeoutError:
+                mensaje = MENSAJE_PING
+            await self.websocket.send_text(mensaje)
+
+
+class WebSocketHub:
+    """Registro de conexiones WebSocket agrupadas por canal.
+
+    Attributes
+    ----------
+    intervalo_heartbeat : float
+        Segundos entre pings del servidor. Un cliente que no envía nada en el
+        doble de este tiempo se considera caído.
+    max_cola : int
+        Tamaño de la cola de envío de cada conexión.
+    """
+
+    def __init__(self, intervalo_heartbeat: float = 30, max_cola: int = 100):
+        """
+        Inicializa el hub sin conexiones.
+
+        Parameters
+        ----------
+        intervalo_heartbeat : float, optional
+            Segundos entre pings del servidor, por defecto 30.
+        max_cola : int, optional
+            Tamaño de la cola de envío de cada conexión, por defecto 100.
+        """
+        self.intervalo_heartbeat = intervalo_heartbeat
+        self.max_cola = max_cola
+        self._canales: Dict[str, Set[ConexionWebSocket]] = {}
+
+    def conectar(self, websocket: WebSocket, canales: Iterable[str]) -> ConexionWebSocket:
+        """
+        Registra una conexión ya aceptada.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            Conexión aceptada.
+        canales : Iterable[str]
+            Canales a suscribir; si está vacío, se suscribe a todos.
+
+        Returns
+        -------
+        ConexionWebSocket
+            La conexión registrada.
+        """
+        conexion = ConexionWebSocket(websocket, [], self.max_cola)
+        self.suscribir(conexion, list(canales) or [CANAL_TODOS])
+        return conexion
+
+    def desconectar(self, conexion: ConexionWebSocket) -> None:
+        """
+        Elimina una conexión de todos sus canales.
+
+        Parameters
+        ----------
+        conexion : ConexionWebSocket
+            Conexión a eliminar.
+        """
+        self.desuscribir(conexion, list(conexion.canales))
+
+    def suscribir(self, conexion: ConexionWebSocket, canales: Iterable[str]) -> None:
+        """
+        Suscribe una conexión a más canales.
+
+        Parameters
+        ----------
+        conexion : ConexionWebSocket
+            Conexión a suscribir.
+        canales : Iterable[str]
+            Canales a añadir.
+        """
+        for canal in canales:
+            conexion.canales.add(canal)
+            self._canales.setdefault(canal, set()).add(conexion)
+
+    def desuscribir(self, conexion: ConexionWebSocket, canales: Iterable[str]) -> None:
+        """
+        Elimina la suscripción de una conexión a algunos canales.
+
+        Parameters
+        ----------
+        conexion : ConexionWebSocket
+            Conexión a desuscribir.
+        canales : Iterable[str]
+            Canales a quitar.
+        """
+        for canal in canales:
+            conexion.canales.discard(canal)
+            suscriptores = self._canales.get(canal)
+            if suscriptores is not None:
+                suscriptores.discard(conexion)
+                if not suscriptores:
+                    del self._canales[canal]
+
+    def publicar(self, canal: Optional[str], mensaje: WebSocketMessage) -> int:
+        """
+        Envía un mensaje a las conexiones del canal y a las suscritas a todos.
+
+        Parameters
+        ----------
+        canal : Optional[str]
+            Canal de destino (la zona). Si es None solo lo reciben las
+            conexiones suscritas a todos los canales.
+        mensaje : WebSocketMessage
+            Mensaje a enviar.
+
+        Returns
+        -------
+        int
+            Número de conexiones a las que se encoló el mensaje.
+        """
+        destinatarios = set(self._canales.get(CANAL_TODOS, ()))
+        if canal is not None:
+            destinatarios |= self._canales.get(canal, set())
+        if not destinatarios:
+            return 0
+
+        # Se serializa una sola vez para todas las conexiones
+        texto = mensaje.model_dump_json()
+        return sum(1 for conexion in destinatarios if conexion.encolar(texto))
+
+    def entregar(self, evento: Evento) -> int:
+        """
+        Reenvía a las conexiones locales un evento recibido del bus.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento del bus; su zona determina el canal de destino.
+
+        Returns
+        -------
+        int
+            Número de conexiones a las que se encoló el mensaje.
+        """
+        return self.publicar(evento.zona, evento.mensaje)
+
+    @property
+    def total_conexiones(self) -> int:
+        """Número de conexiones registradas."""
+        return len({c for suscriptores in self._canales.values() for c in suscriptores})
+
+    async def atender(
+        self,
+        websocket: WebSocket,
+        canales: Iterable[str],
+        iniciales: Iterable[WebSocketMessage] = (),
+    ) -> None:
+        """
+        Atiende una conexión aceptada hasta que se cierre.
+
+        Los clientes pueden enviar ``suscribir``/``desuscribir`` con
+        ``{"zonas": [...]}`` en el payload y deben responder a los pings con
+        cualquier mensaje (por convención ``pong``).
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            Conexión ya aceptada.
+        canales : Iterable[str]
+            Canales iniciales.
+        iniciales : Iterable[WebSocketMessage], optional
+            Mensajes a enviar antes que cualquier cambio posterior (por
+            ejemplo el estado completo). Se encolan al registrar la conexión,
+            así no se pierde ningún cambio publicado entretanto.
+        """
+        conexion = self.conectar(websocket, canales)
+        for mensaje in iniciales:
+            conexion.encolar(mensaje.model_dump_json())
+        emisor = asyncio.create_task(conexion.emitir(self.intervalo_heartbeat))
+        receptor = asyncio.create_task(self._recibir(conexion))
+        try:
+            await asyncio.wait({emisor, receptor}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.desconectar(conexion)
+            for tarea in (emisor, receptor):
+                tarea.cancel()
+            await asyncio.gather(emisor, receptor, return_exceptions=True)
+
+    async def _recibir(self, conexion: ConexionWebSocket) -> None:
+        """Procesa los mensajes del cliente y detecta clientes inactivos."""
+        try:
+            while True:
+                try:
+                    texto = await asyncio.wait_for(
+                        conexion.websocket.receive_text(),
+                        timeout=self.intervalo_heartbeat * 2,
+                    )
+                except asyncio.TimeoutError:
+                    await conexion.websocket.close(code=CIERRE_SIN_HEARTBEAT)
+                    return
+                self._procesar_mensaje(conexion, texto)
+        except WebSocketDisconnect:
+            return
+
+    def _procesar_mensaje(self, conexion: ConexionWebSocket, texto: str) -> None:
+        """Aplica un mensaje de control del cliente; los desconocidos se ignoran."""
+        try:
+            mensaje: Dict[str, Any] = json.loads(texto)
+            evento = mensaje.get("evento")
+            zonas = (mensaje.get("payload") or {}).get("zonas") or []
+        except (ValueError, AttributeError):
+            return
+        if isinstance(zonas, str):
+            zonas = [zonas]
+
+        if evento == "suscribir":
+            self.suscribir(conexion, [str(zona) for zona in zonas])
+        elif evento == "desuscribir":
+            self.desuscribir(conexion, [str(zona) for zona in zonas])
+
+
+# Instancia única del hub de mesas (patrón singleton)
+_mesa_hub: Optional[WebSocketHub] = None
+
+
+def get_mesa_hub() -> WebSocketHub:
+    """
+    Obtiene o crea el hub de WebSocket para el estado de las mesas.
+
+    El hub recibe los cambios a través del bus de eventos, de modo que las
+    conexiones de este worker ven también los cambios hechos en otros.
+
+    Returns
+    -------
+    WebSocketHub
+        Hub configurado según ``ws_heartbeat_interval`` y ``ws_send_queue_size``.
+    """
+    global _mesa_hub
+    if _mesa_hub is None:
+        settings = get_settings()
+        _mesa_hub = WebSocketHub(
+            intervalo_heartbeat=settings.ws_heartbeat_interval,
+            max_cola=settings.ws_send_queue_size,
+        )
+        get_event_bus().suscribir(CANAL_MESAS, _mesa_hub.entregar)
+    return _mesa_hub
@@ -0,0 +1,265 @@
+"""
+Cálculo de la división de una cuenta entre comensales.
+
+Los importes se reparten con fracciones exactas y se redondean a céntimos
+una sola vez por comensal con el método del mayor resto: cada comensal
+recibe la parte entera de sus céntimos y los céntimos sobrantes van a los
+de mayor fracción, desempatando por el orden de los comensales. Así la
+suma de las partes es siempre exactamente el total y el resultado no
+depende del orden de los datos de entrada.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from math import floor
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+CENTIMOS_POR_UNIDAD = 100
+
+
+@dataclass(frozen=True)
+class ParteCalculada:
+    """Importe que paga un comensal.
+
+    Attributes
+    ----------
+    comensal : str
+        Identificador del comensal.
+    importe : Decimal
+        Importe en céntimos exactos.
+    items : Tuple[str, ...]
+        Ítems en los que participa (solo en la división por ítems).
+    """
+
+    comensal: str
+    importe: Decimal
+    items: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class DivisionCalculada:
+    """Resultado de dividir una cuenta.
+
+    Attributes
+    ----------
+    total : Decimal
+        Importe total de la cuenta.
+    partes : List[ParteCalculada]
+        Parte de cada comensal, ordenadas por comensal.
+    pendiente : Decimal
+        Importe que no se asignó a ningún comensal.
+    items_sin_asignar : List[str]
+        Ítems que nadie paga (solo en la división por ítems).
+    """
+
+    total: Decimal
+    partes: List[ParteCalculada]
+    pendiente: Decimal = Decimal("0.00")
+    items_sin_asignar: List[str] = field(default_factory=list)
+
+
+def a_centimos(importe: Decimal) -> int:
+    """
+    Convierte un importe con dos decimales a céntimos.
+
+    Parameters
+    ----------
+    importe : Decimal
+        Importe a convertir.
+
+    Returns
+    -------
+    int
+        Número de céntimos.
+
+    Raises
+    ------
+    ValueError
+        Si el importe tiene fracciones de céntimo.
+    """
+    centimos = importe * CENTIMOS_POR_UNIDAD
+    if centimos != centimos.to_integral_value():
+        raise ValueError(f"El importe {importe} tiene fracciones de céntimo")
+    return int(centimos)
+
+
+def desde_centimos(centimos: int) -> Decimal:
+    """Convierte céntimos a un importe con dos decimales."""
+    return Decimal(centimos).scaleb(-2)
+
+
+def orden_comensales(comensales: Iterable[str]) -> List[str]:
+    """
+    Ordena los comensales de forma estable e independiente de la entrada.
+
+    Los identificadores formados solo por dígitos ASCII se ordenan por su
+    valor ("2" antes que "10") y después el resto alfabéticamente; otros
+    dígitos Unicode, como "²", que ``int()`` no acepta, cuentan como texto.
+
+    Parameters
+    ----------
+    comensales : Iterable[str]
+        Identificadores de los comensales.
+
+    Returns
+    -------
+    List[str]
+        Comensales sin repetir, ordenados.
+    """
+    return sorted(
+        set(comensales),
+        key=lambda c: (0, int(c), c) if c.isascii() and c.isdigit() else (1, 0, c),
+    )
+
+
+def repartir(partes: Mapping[str, Fraction], total_centimos: int) -> Dict[str, int]:
+    """
+    Redondea partes exactas a céntimos conservando el total (mayor resto).
+
+    Parameters
+    ----------
+    partes : Mapping[str, Fraction]
+        Céntimos exactos de cada comensal; deben sumar ``total_centimos``.
+    total_centimos : int
+        Total a repartir.
+
+    Returns
+    -------
+    Dict[str, int]
+        Céntimos de cada comensal.
+    """
+    orden = orden_comensales(partes)
+    posicion = {comensal: indice for indice, comensal in enumerate(orden)}
+    enteros = {comensal: floor(partes[comensal]) for comensal in orden}
+    sobrantes = total_centimos - sum(enteros.values())
+
+    # Mayor fracción primero; a igual fracción, el comensal que va antes
+    por_resto = sorted(orden, key=lambda c: (-(partes[c] - enteros[c]), posicion[c]))
+    for comensal in por_resto[:sobrantes]:
+        enteros[comensal] += 1
+    return enteros
+
+
+def dividir_equitativa(total: Decimal, comensales: int) -> DivisionCalculada:
+    """
+    Divide la cuenta a partes iguales.
+
+    Parameters
+    ----------
+    total : Decimal
+        Importe total.
+    comensales : int
+        Número de comensales (al menos uno).
+
+    Returns
+    -------
+    DivisionCalculada
+        Partes de los comensales "1" a "n"; los primeros pagan un céntimo
+        más cuando el total no es divisible.
+    """
+    centimos = a_centimos(total)
+    partes = {str(n): Fraction(centimos, comensales) for n in range(1, comensales + 1)}
+    repartidos = repartir(partes, centimos)
+    return DivisionCalculada(
+        total=total,
+        partes=[
+            ParteCalculada(comensal, desde_centimos(repartidos[comensal]))
+            for comensal in orden_comensales(partes)
+        ],
+    )
+
+
+def dividir_por_items(
+    total: Decimal,
+    importes_items: Mapping[str, Decimal],
+    asignaciones: Mapping[str, Sequence[str]],
+) -> DivisionCalculada:
+    """
+    Divide la cuenta según quién consumió cada ítem.
+
+    Un ítem compartido se reparte a partes iguales entre sus comensales.
+
+    Parameters
+    ----------
+    total : Decimal
+        Importe total de la cuenta.
+    importes_items : Mapping[str, Decimal]
+        Importe de cada ítem de la cuenta.
+    asignaciones : Mapping[str, Sequence[str]]
+        Comensales que pagan cada ítem.
+
+    Returns
+    -------
+    DivisionCalculada
+        Partes de cada comensal; los ítems sin asignar quedan pendientes.
+    """
+    exactas: Dict[str, Fraction] = {}
+    items_por_comensal: Dict[str, List[str]] = {}
+    sin_asignar: List[str] = []
+
+    for id_item in sorted(importes_items):
+        comensales = orden_comensales(asignaciones.get(id_item, ()))
+        if not comensales:
+            sin_asignar.append(id_item)
+            continue
+        parte = Fraction(a_centimos(importes_items[id_item]), len(comensales))
+        for comensal in comensales:
+            exactas[comensal] = exactas.get(comensal, Fraction(0)) + parte
+            items_por_comensal.setdefault(comensal, []).append(id_item)
+
+    asignado = sum(exactas.values(), Fraction(0))
+    repartidos = repartir(exactas, int(asignado))
+    return DivisionCalculada(
+        total=total,
+        partes=[
+            ParteCalculada(
+                comensal,
+                desde_centimos(repartidos[comensal]),
+                tuple(items_por_comensal[comensal]),
+            )
+            for comensal in orden_comensales(exactas)
+        ],
+        pendiente=desde_centimos(a_centimos(total) - int(asignado)),
+        items_sin_asignar=sin_asignar,
+    )
+
+
+def dividir_manual(total: Decimal, importes: Mapping[str, Decimal]) -> DivisionCalculada:
+    """
+    Valida una división con importes indicados por los comensales.
+
+    Parameters
+    ----------
+    total : Decimal
+        Importe total de la cuenta.
+    importes : Mapping[str, Decimal]
+        Importe que paga cada comensal.
+
+    Returns
+    -------
+    DivisionCalculada
+        Partes indicadas y el importe que falta por cubrir.
+
+    Raises
+    ------
+    ValueError
+        Si algún importe es negativo o tiene fracciones de céntimo, o si
+        los importes superan el total.
+    """
+    centimos = {comensal: a_centimos(importe) for comensal, importe in importes.items()}
+    if any(valor < 0 for valor in centimos.values()):
+        raise ValueError("Los importes no pueden ser negativos")
+    pendiente = a_centimos(total) - sum(centimos.values())
+    if pendiente < 0:
+        raise ValueError(
+            f"Los importes suman {desde_centimos(sum(centimos.values()))}, más que el total {total}"
+        )
+    return DivisionCalculada(
+        total=total,
+        partes=[
+            ParteCalculada(comensal, desde_centimos(centimos[comensal]))
+            for comensal in orden_comensales(centimos)
+        ],
+        pendiente=desde_centimos(pendiente),
+    )
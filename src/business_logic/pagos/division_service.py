@@ -0,0 +1,183 @@
+"""
+Servicio para dividir la cuenta de una mesa entre sus comensales.
+"""
+
+from decimal import Decimal
+from typing import Dict, Hashable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.enums.pedido_enums import EstadoPedido, TipoDivision
+from src.repositories.pedidos.pedido_repository import PedidoRepository
+from src.business_logic.pagos.division_cuenta import (
+    DivisionCalculada,
+    dividir_equitativa,
+    dividir_manual,
+    dividir_por_items,
+    orden_comensales,
+)
+from src.api.schemas.pago_schema import (
+    DivisionCuentaRequest,
+    DivisionCuentaResponse,
+    ParteCuenta,
+)
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoNotFoundError,
+)
+
+# Divisiones calculadas, por mesa, versiones de sus pedidos y parámetros.
+# Cualquier cambio en un pedido incrementa su versión, así que una entrada
+# nunca se sirve para una cuenta distinta; el TTL solo limita la memoria.
+division_cache: TTLCache[DivisionCuentaResponse] = TTLCache(maxsize=1024, ttl=900)
+
+
+class DivisionCuentaService:
+    """Servicio para calcular la división de la cuenta de una mesa.
+
+    Cada comensal suele pedir su parte desde su teléfono; mientras los
+    pedidos no cambien, todas esas peticiones se sirven desde la caché con
+    una sola consulta ligera de versiones.
+
+    Attributes
+    ----------
+    pedido_repository : PedidoRepository
+        Repositorio para leer los pedidos de la mesa.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.pedido_repository = PedidoRepository(session)
+
+    async def dividir(self, solicitud: DivisionCuentaRequest) -> DivisionCuentaResponse:
+        """
+        Calcula la división de la cuenta de una mesa.
+
+        Parameters
+        ----------
+        solicitud : DivisionCuentaRequest
+            Mesa, pedidos, modo de división y sus datos.
+
+        Returns
+        -------
+        DivisionCuentaResponse
+            Parte de cada comensal; las partes suman exactamente lo asignado.
+
+        Raises
+        ------
+        PagoNotFoundError
+            Si la mesa no tiene pedidos que cobrar.
+        PagoValidationError
+            Si faltan los datos del modo elegido, algún pedido no es de la
+            mesa, se asignan ítems desconocidos o los importes manuales no
+            son válidos.
+        """
+        parametros = self._clave_parametros(solicitud)
+        versiones = await self.pedido_repository.get_versiones_por_mesa(
+            solicitud.id_mesa, solicitud.pedidos
+        )
+        if solicitud.pedidos is not None:
+            ajenos = set(solicitud.pedidos) - {pedido_id for pedido_id, _ in versiones}
+            if ajenos:
+                raise PagoValidationError(
+                    f"Los pedidos {sorted(ajenos)} no son de la mesa o están cancelados"
+                )
+        if not versiones:
+            raise PagoNotFoundError(f"La mesa {solicitud.id_mesa} no tiene pedidos que cobrar")
+
+        cached = division_cache.get((solicitud.id_mesa, tuple(versiones), parametros))
+        if cached is not None:
+            return cached
+
+        pedidos = await self.pedido_repository.get_by_ids(pedido_id for pedido_id, _ in versiones)
+        importes_items = {
+            item.id: item.subtotal
+            for pedido in pedidos
+            for item in pedido.items
+            if item.estado != EstadoPedido.CANCELADO
+        }
+        total = sum(importes_items.values(), Decimal("0.00"))
+        division = self._calcular(solicitud, total, importes_items)
+
+        respuesta = DivisionCuentaResponse(
+            id_mesa=solicitud.id_mesa,
+            tipo=solicitud.tipo,
+            pedidos=[pedido.id for pedido in pedidos],
+            total=division.total,
+            partes=[
+                ParteCuenta(comensal=parte.comensal, importe=parte.importe, items=list(parte.items))
+                for parte in division.partes
+            ],
+            pendiente=division.pendiente,
+            items_sin_asignar=division.items_sin_asignar,
+        )
+        # Se guarda con las versiones leídas junto con los ítems
+        clave_versiones = tuple((pedido.id, pedido.version) for pedido in pedidos)
+        division_cache.set((solicitud.id_mesa, clave_versiones, parametros), respuesta)
+        return respuesta
+
+    @staticmethod
+    def _calcular(
+        solicitud: DivisionCuentaRequest, total: Decimal, importes_items: Dict[str, Decimal]
+    ) -> DivisionCalculada:
+        """Aplica el modo de división solicitado."""
+        try:
+            if solicitud.tipo == TipoDivision.EQUITATIVA:
+                return dividir_equitativa(total, solicitud.comensales)
+
+            if solicitud.tipo == TipoDivision.POR_ITEMS:
+                asignaciones = DivisionCuentaService._asignaciones(solicitud)
+                desconocidos = set(asignaciones) - set(importes_items)
+                if desconocidos:
+                    raise PagoValidationError(
+                        f"Los ítems {sorted(desconocidos)} no están en la cuenta"
+                    )
+                return dividir_por_items(total, importes_items, asignaciones)
+
+            return dividir_manual(total, solicitud.importes)
+        except ValueError as e:
+            raise PagoValidationError(str(e))
+
+    @staticmethod
+    def _asignaciones(solicitud: DivisionCuentaRequest) -> Dict[str, List[str]]:
+        """Agrupa las asignaciones por ítem; un ítem repetido suma sus comensales."""
+        asignaciones: Dict[str, List[str]] = {}
+        for asignacion in solicitud.asignaciones:
+            asignaciones.setdefault(asignacion.id_item, []).extend(asignacion.comensales)
+        return {id_item: orden_comensales(comensales) for id_item, comensales in asignaciones.items()}
+
+    @staticmethod
+    def _clave_parametros(solicitud: DivisionCuentaRequest) -> Tuple[Hashable, ...]:
+        """
+        Valida los datos del modo elegido y los normaliza como clave de caché.
+
+        Raises
+        ------
+        PagoValidationError
+            Si faltan los datos del modo elegido.
+        """
+        if solicitud.tipo == TipoDivision.EQUITATIVA:
+            if solicitud.comensales is None:
+                raise PagoValidationError("La división equitativa requiere el número de comensales")
+            return (solicitud.tipo, solicitud.comensales)
+
+        if solicitud.tipo == TipoDivision.POR_ITEMS:
+            if not solicitud.asignaciones:
+                raise PagoValidationError("La división por ítems requiere asignar los ítems")
+            asignaciones = DivisionCuentaService._asignaciones(solicitud)
+            return (
+                solicitud.tipo,
+                tuple(sorted((id_item, tuple(c)) for id_item, c in asignaciones.items())),
+            )
+
+        if not solicitud.importes:
+            raise PagoValidationError("La división manual requiere el importe de cada comensal")
+        return (solicitud.tipo, tuple(sorted(solicitud.importes.items())))
@@ -0,0 +1,199 @@
+"""
+Almacén de respuestas para peticiones con ``Idempotency-Key``.
+
+Las respuestas se guardan en la tabla ``idempotencia`` en la misma
+transacción que la operación, de modo que nunca hay un pago sin su
+respuesta ni una respuesta sin su pago. Delante de la tabla hay una caché
+LRU acotada por worker: los reintentos de un cliente llegan casi siempre
+en los segundos siguientes y se resuelven sin consultar la base de datos.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.models.pagos.idempotencia_model import IdempotenciaModel
+from src.repositories.pagos.idempotencia_repository import IdempotenciaRepository
+from src.business_logic.exceptions.pago_exceptions import PagoIdempotenciaError
+
+# Tiempo durante el que una clave devuelve la misma respuesta
+VIGENCIA_CLAVE = timedelta(hours=24)
+
+# Segundos mínimos entre dos borrados de claves expiradas en un worker
+INTERVALO_PURGA = 600.0
+
+
+@dataclass(frozen=True)
+class RespuestaGuardada:
+    """Respuesta guardada de una petición idempotente.
+
+    Attributes
+    ----------
+    huella : str
+        SHA-256 del cuerpo de la petición original.
+    codigo_estado : int
+        Código HTTP de la respuesta.
+    cuerpo : str
+        Cuerpo JSON de la respuesta.
+    """
+
+    huella: str
+    codigo_estado: int
+    cuerpo: str
+
+
+# Caché LRU de respuestas por (ámbito, clave); la tabla es la fuente de verdad
+respuestas_cache: TTLCache[RespuestaGuardada] = TTLCache(maxsize=4096, ttl=3600)
+
+_ultima_purga = 0.0
+
+
+def calcular_huella(datos: BaseModel) -> str:
+    """
+    Calcula la huella del cuerpo de una petición.
+
+    Parameters
+    ----------
+    datos : BaseModel
+        Cuerpo de la petición ya validado.
+
+    Returns
+    -------
+    str
+        SHA-256 en hexadecimal de su representación JSON.
+    """
+    return hashlib.sha256(datos.model_dump_json().encode()).hexdigest()
+
+
+def ahora_utc() -> datetime:
+    """Momento actual en UTC, sin zona horaria, como se guarda en la base de datos."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class AlmacenIdempotencia:
+    """Almacén de respuestas idempotentes de una operación.
+
+    Attributes
+    ----------
+    ambito : str
+        Operación a la que pertenecen las claves.
+    repository : IdempotenciaRepository
+        Repositorio de las respuestas guardadas.
+    """
+
+    def __init__(self, session: AsyncSession, ambito: str):
+        """
+        Inicializa el almacén de una operación.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        ambito : str
+            Operación a la que pertenecen las claves.
+        """
+        self.ambito = ambito
+        self.repository = IdempotenciaRepository(session)
+
+    async def buscar(self, clave: str, huella: str) -> Optional[RespuestaGuardada]:
+        """
+        Obtiene la respuesta guardada de una clave, primero en memoria.
+
+        Parameters
+        ----------
+        clave : str
+            Clave de idempotencia enviada por el cliente.
+        huella : str
+            Huella del cuerpo de la petición actual.
+
+        Returns
+        -------
+        Optional[RespuestaGuardada]
+            La respuesta guardada o None si la clave es nueva.
+
+        Raises
+        ------
+        PagoIdempotenciaError
+            Si la clave se usó antes con un cuerpo distinto.
+        """
+        guardada = respuestas_cache.get((self.ambito, clave))
+        if guardada is None:
+            registro = await self.repository.get(self.ambito, clave, ahora_utc())
+            if registro is None:
+                return None
+            guardada = self.recordar(registro)
+
+        if guardada.huella != huella:
+            raise PagoIdempotenciaError(
+                "La clave de idempotencia ya se usó con datos distintos"
+            )
+        return guardada
+
+    def preparar(self, clave: str, huella: str, codigo_estado: int, cuerpo: str) -> IdempotenciaModel:
+        """
+        Crea el registro a guardar junto con la operación.
+
+        Parameters
+        ----------
+        clave : str
+            Clave de idempotencia enviada por el cliente.
+        huella : str
+            Huella del cuerpo de la petición.
+        codigo_estado : int
+            Código HTTP de la respuesta.
+        cuerpo : str
+            Cuerpo JSON de la respuesta.
+
+        Returns
+        -------
+        IdempotenciaModel
+            Registro sin persistir.
+        """
+        return IdempotenciaModel(
+            ambito=self.ambito,
+            clave=clave,
+            huella=huella,
+            codigo_estado=codigo_estado,
+            respuesta=cuerpo,
+            expira_en=ahora_utc() + VIGENCIA_CLAVE,
+        )
+
+    def recordar(self, registro: IdempotenciaModel) -> RespuestaGuardada:
+        """
+        Guarda en memoria un registro ya persistido.
+
+        Parameters
+        ----------
+        registro : IdempotenciaModel
+            Registro confirmado en la base de datos.
+
+        Returns
+        -------
+        RespuestaGuardada
+            La respuesta guardada en la caché.
+        """
+        guardada = RespuestaGuardada(registro.huella, registro.codigo_estado, registro.respuesta)
+        respuestas_cache.set((self.ambito, registro.clave), guardada)
+        return guardada
+
+    async def purgar_expiradas(self) -> int:
+        """
+        Elimina las claves expiradas, como mucho una vez cada ``INTERVALO_PURGA``.
+
+        Returns
+        -------
+        int
+            Número de claves eliminadas; cero si aún no tocaba.
+        """
+        global _ultima_purga
+        ahora = time.monotonic()
+        if ahora - _ultima_purga < INTERVALO_PURGA:
+            return 0
+        _ultima_purga = ahora
+        return await self.repository.eliminar_expiradas(ahora_utc())
@@ -0,0 +1,243 @@
+"""
+Servicio para el registro de pagos y sus cambios de estado.
+"""
+
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from src.repositories.pagos.pago_repository import PagoRepository
+from src.repositories.pedidos.pedido_repository import PedidoRepository
+from src.repositories.mesas.mesa_repository import MesaRepository
+from src.business_logic.pagos.idempotencia import AlmacenIdempotencia, ahora_utc, calcular_huella
+from src.business_logic.pagos.transiciones_pago import (
+    ESTADOS_ACTIVOS,
+    es_transicion_valida,
+    estados_origen,
+)
+from src.models.pagos.pago_model import PagoModel
+from src.core.enums.pago_enums import EstadoPago
+from src.core.enums.pedido_enums import EstadoPedido
+from src.api.schemas.pago_schema import PagoCreate, PagoResponse, PagoTransicion
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoNotFoundError,
+    PagoTransicionError,
+    PagoIdempotenciaError,
+)
+
+# Ámbito de las claves de idempotencia del registro de pagos
+AMBITO_REGISTRAR_PAGO = "pagos.registrar"
+
+
+class PagoService:
+    """Servicio para la gestión de pagos.
+
+    El registro admite una clave de idempotencia: los reintentos de un
+    cliente con la misma clave devuelven la respuesta original sin volver
+    a validar ni registrar el pago. Los cambios de estado se aplican con
+    compare-and-set sobre el estado actual.
+
+    Attributes
+    ----------
+    repository : PagoRepository
+        Repositorio para acceso a datos de pagos.
+    pedido_repository : PedidoRepository
+        Repositorio para comprobar el pedido y su saldo.
+    mesa_repository : MesaRepository
+        Repositorio para comprobar la mesa del pago.
+    idempotencia : AlmacenIdempotencia
+        Respuestas guardadas del registro de pagos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.repository = PagoRepository(session)
+        self.pedido_repository = PedidoRepository(session)
+        self.mesa_repository = MesaRepository(session)
+        self.idempotencia = AlmacenIdempotencia(session, AMBITO_REGISTRAR_PAGO)
+
+    async def registrar_pago(
+        self, pago_data: PagoCreate, clave_idempotencia: Optional[str] = None
+    ) -> Tuple[PagoResponse, bool]:
+        """
+        Registra un pago pendiente.
+
+        Parameters
+        ----------
+        pago_data : PagoCreate
+            Datos del pago.
+        clave_idempotencia : Optional[str], optional
+            Valor de la cabecera ``Idempotency-Key``, si se envió.
+
+        Returns
+        -------
+        Tuple[PagoResponse, bool]
+            El pago registrado y True si es la respuesta guardada de un
+            reintento.
+
+        Raises
+        ------
+        PagoValidationError
+            Si la mesa o el pedido no son válidos o el monto supera el saldo
+            pendiente del pedido.
+        PagoIdempotenciaError
+            Si la clave se usó antes con datos distintos.
+        """
+        huella = None
+        if clave_idempotencia is not None:
+            huella = calcular_huella(pago_data)
+            guardada = await self.idempotencia.buscar(clave_idempotencia, huella)
+            if guardada is not None:
+                return PagoResponse.model_validate_json(guardada.cuerpo), True
+
+        await self._validar(pago_data)
+
+        # ID y fechas se asignan aquí para guardar la respuesta en la misma transacción
+        ahora = ahora_utc()
+        pago = PagoModel(
+            id=str(ULID()),
+            estado=EstadoPago.PENDIENTE,
+            version=1,
+            fecha_creacion=ahora,
+            fecha_modificacion=ahora,
+            **pago_data.model_dump(),
+        )
+        respuesta = PagoResponse.model_validate(pago)
+
+        registro = None
+        if clave_idempotencia is not None:
+            registro = self.idempotencia.preparar(
+                clave_idempotencia, huella, 201, respuesta.model_dump_json()
+            )
+
+        try:
+            await self.repository.create(pago, registro)
+        except IntegrityError:
+            if registro is None:
+                raise
+            # Un reintento concurrente con la misma clave se registró primero
+            guardada = await self.idempotencia.buscar(clave_idempotencia, huella)
+            if guardada is None:
+                raise PagoIdempotenciaError("La clave de idempotencia está en uso; reintente más tarde")
+            return PagoResponse.model_validate_json(guardada.cuerpo), True
+
+        if registro is not None:
+            self.idempotencia.recordar(registro)
+            await self.idempotencia.purgar_expiradas()
+        return respuesta, False
+
+    async def get_pago(self, pago_id: str) -> PagoResponse:
+        """
+        Obtiene un pago por su ID.
+
+        Parameters
+        ----------
+        pago_id : str
+            Identificador único del pago.
+
+        Returns
+        -------
+        PagoResponse
+            El pago encontrado.
+
+        Raises
+        ------
+        PagoNotFoundError
+            Si no se encuentra el pago.
+        """
+        pago = await self.repository.get_by_id(pago_id)
+        if not pago:
+            raise PagoNotFoundError(f"No se encontró el pago con ID {pago_id}")
+        return PagoResponse.model_validate(pago)
+
+    async def transicionar_pago(self, pago_id: str, transicion: PagoTransicion) -> PagoResponse:
+        """
+        Cambia el estado de un pago.
+
+        Repetir una transición ya aplicada (por ejemplo, un reintento de la
+        confirmación de Yape) devuelve el pago sin modificarlo.
+
+        Parameters
+        ----------
+        pago_id : str
+            Identificador único del pago.
+        transicion : PagoTransicion
+            Estado solicitado y número de operación, si lo hay.
+
+        Returns
+        -------
+        PagoResponse
+            El pago con su estado actual.
+
+        Raises
+        ------
+        PagoNotFoundError
+            Si no se encuentra el pago.
+        PagoTransicionError
+            Si la transición no está permitida desde el estado actual.
+        """
+        pago = await self.repository.cambiar_estado(
+            pago_id, transicion.estado, estados_origen(transicion.estado), transicion.referencia
+        )
+
+        if pago is None:
+            actual = await self.repository.get_by_id(pago_id)
+            if actual is None:
+                raise PagoNotFoundError(f"No se encontró el pago con ID {pago_id}")
+            if actual.estado == transicion.estado:
+                return PagoResponse.model_validate(actual)
+            if not es_transicion_valida(actual.estado, transicion.estado):
+                raise PagoTransicionError(
+                    f"No se puede pasar el pago de '{actual.estado.value}' a "
+                    f"'{transicion.estado.value}'"
+                )
+            # Otra petición cambió el pago entre la escritura y la lectura
+            raise PagoTransicionError("El pago fue modificado por otra petición")
+
+        return PagoResponse.model_validate(pago)
+
+    async def _validar(self, pago_data: PagoCreate) -> None:
+        """
+        Comprueba la mesa, el pedido y el saldo pendiente del pedido.
+
+        Raises
+        ------
+        PagoValidationError
+            Si algún dato no es válido.
+        """
+        mesa = await self.mesa_repository.get_by_id(pago_data.id_mesa)
+        if mesa is None or not mesa.activo:
+            raise PagoValidationError(f"No existe una mesa activa con ID {pago_data.id_mesa}")
+
+        if pago_data.id_pedido is None:
+            return
+
+        pedido = await self.pedido_repository.get_by_id(pago_data.id_pedido)
+        if pedido is None or pedido.id_mesa != pago_data.id_mesa:
+            raise PagoValidationError(
+                f"El pedido {pago_data.id_pedido} no pertenece a la mesa {pago_data.id_mesa}"
+            )
+        if pedido.estado == EstadoPedido.CANCELADO:
+            raise PagoValidationError(f"El pedido {pedido.id} está cancelado")
+
+        total = sum(
+            (item.subtotal for item in pedido.items if item.estado != EstadoPedido.CANCELADO),
+            Decimal("0.00"),
+        )
+        pagado = await self.repository.get_total_por_pedido(pedido.id, ESTADOS_ACTIVOS)
+        saldo = total - pagado
+        if pago_data.monto > saldo:
+            raise PagoValidationError(
+                f"El monto {pago_data.monto} supera el saldo pendiente del pedido ({saldo})"
+            )
@@ -0,0 +1,71 @@
+"""
+Máquina de estados de los pagos.
+
+Un pago se registra pendiente; los pagos con Yape, Plin o tarjeta pueden
+pasar por PROCESANDO mientras se espera la confirmación. COMPLETADO,
+FALLIDO y CANCELADO son estados finales.
+"""
+
+from typing import Dict, FrozenSet
+
+from src.core.enums.pago_enums import EstadoPago
+
+# Estados a los que se puede pasar desde cada estado
+TRANSICIONES_PAGO: Dict[EstadoPago, FrozenSet[EstadoPago]] = {
+    EstadoPago.PENDIENTE: frozenset({
+        EstadoPago.PROCESANDO,
+        EstadoPago.COMPLETADO,
+        EstadoPago.FALLIDO,
+        EstadoPago.CANCELADO,
+    }),
+    EstadoPago.PROCESANDO: frozenset({
+        EstadoPago.COMPLETADO,
+        EstadoPago.FALLIDO,
+        EstadoPago.CANCELADO,
+    }),
+}
+
+# Estados de los pagos que cuentan para el saldo de un pedido
+ESTADOS_ACTIVOS: FrozenSet[EstadoPago] = frozenset({
+    EstadoPago.PENDIENTE,
+    EstadoPago.PROCESANDO,
+    EstadoPago.COMPLETADO,
+})
+
+
+def es_transicion_valida(origen: EstadoPago, destino: EstadoPago) -> bool:
+    """
+    Indica si un pago puede pasar de un estado a otro.
+
+    Parameters
+    ----------
+    origen : EstadoPago
+        Estado actual del pago.
+    destino : EstadoPago
+        Estado solicitado.
+
+    Returns
+    -------
+    bool
+        True si la transición está permitida.
+    """
+    return destino in TRANSICIONES_PAGO.get(origen, frozenset())
+
+
+def estados_origen(destino: EstadoPago) -> FrozenSet[EstadoPago]:
+    """
+    Obtiene los estados desde los que se puede llegar a un estado.
+
+    Parameters
+    ----------
+    destino : EstadoPago
+        Estado solicitado.
+
+    Returns
+    -------
+    FrozenSet[EstadoPago]
+        Estados de origen permitidos.
+    """
+    return frozenset(
+        origen for origen, destinos in TRANSICIONES_PAGO.items() if destino in destinos
+    )
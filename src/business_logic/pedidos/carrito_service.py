@@ -0,0 +1,90 @@
+"""
+Servicio para la cotización del carrito.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.business_logic.menu.menu_service import MenuService
+from src.business_logic.menu.catalogo_precios import LineaValorada
+from src.api.schemas.carrito_schema import (
+    CarritoCotizar,
+    CarritoCotizacion,
+    CarritoLinea,
+    LineaCotizada,
+)
+from src.api.schemas.pedido_schema import PedidoItemOpcion
+
+
+class CarritoService:
+    """Servicio para calcular el precio del carrito.
+
+    Usa el mismo catálogo en memoria que la creación de pedidos, de modo
+    que el precio cotizado es el que se cobrará, y no consulta la base de
+    datos salvo para leer la versión vigente del menú.
+
+    Attributes
+    ----------
+    menu_service : MenuService
+        Servicio del menú que proporciona el catálogo de precios.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.menu_service = MenuService(session)
+
+    async def cotizar(self, carrito: CarritoCotizar) -> CarritoCotizacion:
+        """
+        Valida y valora todas las líneas del carrito.
+
+        Las líneas no válidas no interrumpen la cotización: se devuelven con
+        sus errores y no suman al total.
+
+        Parameters
+        ----------
+        carrito : CarritoCotizar
+            Líneas del carrito.
+
+        Returns
+        -------
+        CarritoCotizacion
+            Precio de cada línea y total del carrito.
+        """
+        catalogo = await self.menu_service.get_catalogo_precios()
+        lineas = [
+            self._cotizar_linea(linea, catalogo.valorar(linea.id_producto, linea.cantidad, linea.opciones))
+            for linea in carrito.lineas
+        ]
+        return CarritoCotizacion(
+            version_menu=catalogo.version,
+            lineas=lineas,
+            total=sum((linea.total for linea in lineas if linea.valida), Decimal("0.00")),
+            valido=all(linea.valida for linea in lineas),
+        )
+
+    @staticmethod
+    def _cotizar_linea(linea: CarritoLinea, valorada: LineaValorada) -> LineaCotizada:
+        """Convierte una línea valorada al esquema de respuesta."""
+        producto = valorada.producto
+        return LineaCotizada(
+            id_producto=linea.id_producto,
+            nombre_producto=producto.nombre if producto else None,
+            cantidad=linea.cantidad,
+            precio_base=producto.precio_base if producto else Decimal("0.00"),
+            precio_unitario=valorada.precio_unitario,
+            total=valorada.total,
+            opciones=[
+                PedidoItemOpcion(id=o.id, nombre=o.nombre, precio_adicional=o.precio_adicional)
+                for o in valorada.opciones
+            ],
+            valida=valorada.valida,
+            errores=valorada.errores,
+        )
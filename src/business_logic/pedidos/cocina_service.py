@@ -0,0 +1,128 @@
+"""
+Servicio para el avance de los ítems de pedido en cocina.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.pedidos.pedido_repository import PedidoRepository
+from src.business_logic.notifications.event_bus import get_event_bus
+from src.business_logic.pedidos.cola_cocina import get_cola_cocina, item_cocina, publicar_items
+from src.business_logic.pedidos.transiciones_pedido import (
+    es_transicion_valida,
+    estado_pedido,
+    estados_origen,
+)
+from src.api.schemas.pedido_schema import ColaCocinaResponse, ItemCocina, ItemCocinaTransicion
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoNotFoundError,
+    PedidoTransicionError,
+)
+
+# Veces que se recalcula un cambio cuando otra petición modificó el pedido entretanto
+REINTENTOS_ITEM = 3
+
+
+class CocinaService:
+    """Servicio para la gestión de las colas de cocina.
+
+    Los cambios de estado se guardan en la base de datos y se publican en
+    el bus; las colas en memoria de cada worker se actualizan al recibirlos.
+
+    Attributes
+    ----------
+    repository : PedidoRepository
+        Repositorio para acceso a datos de pedidos.
+    event_bus : EventBus
+        Bus en el que se publican los cambios de los ítems.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.repository = PedidoRepository(session)
+        self.event_bus = get_event_bus()
+
+    def get_cola(self, estacion: str) -> ColaCocinaResponse:
+        """
+        Obtiene la cola de una estación desde memoria, sin consultar la base de datos.
+
+        Parameters
+        ----------
+        estacion : str
+            Estación de cocina.
+
+        Returns
+        -------
+        ColaCocinaResponse
+            Ítems pendientes y en preparación en orden.
+        """
+        items = get_cola_cocina().items(estacion)
+        return ColaCocinaResponse(estacion=estacion, items=items, total=len(items))
+
+    async def transicionar_item(
+        self, item_id: str, transicion: ItemCocinaTransicion
+    ) -> ItemCocina:
+        """
+        Cambia el estado de preparación de un ítem y actualiza el de su pedido.
+
+        El estado del pedido se deriva de sus ítems con el cambio aplicado y
+        se escribe en la misma transacción que el ítem, condicionado a la
+        versión leída del pedido. Si otro ítem del pedido cambió entretanto se
+        vuelve a leer y recalcular, hasta ``REINTENTOS_ITEM`` veces.
+
+        Parameters
+        ----------
+        item_id : str
+            Identificador único del ítem.
+        transicion : ItemCocinaTransicion
+            Estado solicitado.
+
+        Returns
+        -------
+        ItemCocina
+            El ítem con su nuevo estado.
+
+        Raises
+        ------
+        PedidoNotFoundError
+            Si el ítem no existe.
+        PedidoTransicionError
+            Si la transición no está permitida desde el estado actual o el
+            pedido sigue cambiando tras los reintentos.
+        """
+        for _ in range(REINTENTOS_ITEM):
+            actual = await self.repository.get_item(item_id)
+            if actual is None:
+                raise PedidoNotFoundError(f"No se encontró el ítem de pedido con ID {item_id}")
+            if not es_transicion_valida(actual.estado, transicion.estado):
+                raise PedidoTransicionError(
+                    f"No se puede pasar '{actual.nombre_producto}' de "
+                    f"'{actual.estado.value}' a '{transicion.estado.value}'"
+                )
+
+            pedido = await self.repository.get_by_id(actual.id_pedido)
+            nuevo_estado = estado_pedido(
+                transicion.estado if i.id == item_id else i.estado for i in pedido.items
+            )
+            if nuevo_estado == pedido.estado:
+                nuevo_estado = None
+
+            item = await self.repository.cambiar_estado_item(
+                item_id,
+                transicion.estado,
+                estados_origen(transicion.estado),
+                pedido.id,
+                pedido.version,
+                nuevo_estado,
+            )
+            if item is not None:
+                await publicar_items(self.event_bus, [(item, pedido)])
+                return item_cocina(item, pedido)
+
+        raise PedidoTransicionError("El pedido fue modificado por otra petición")
@@ -0,0 +1,445 @@
+"""
+Colas de preparación de cocina en memoria, una por estación.
+
+Cada estación mantiene sus ítems abiertos en un montículo ordenado por
+prioridad del pedido y antigüedad (los IDs de pedido son ULID, que se
+ordenan por fecha de creación), con un índice por ID. Añadir un ítem o
+cambiar su estado cuesta O(log n); los ítems que salen de la cola se
+marcan en el índice y el montículo se compacta cuando acumula demasiadas
+entradas obsoletas.
+
+La base de datos sigue siendo la fuente de verdad: las colas se
+reconstruyen al arrancar y se mantienen con los eventos del canal
+``cocina`` del bus, de modo que todos los workers ven los mismos cambios;
+si el bus pierde la conexión, se reconstruyen al recuperarla.
+Las pantallas reciben la cola completa al conectarse y después solo los
+ítems que cambian.
+"""
+
+import heapq
+import logging
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+from src.api.schemas.pedido_schema import ItemCocina
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.notifications.event_bus import Evento, EventBus, get_event_bus
+from src.business_logic.notifications.websocket_hub import WebSocketHub
+from src.business_logic.pedidos.transiciones_pedido import ESTADOS_EN_COCINA
+from src.core.config import get_settings
+from src.core.database import DatabaseManager
+from src.core.enums.pedido_enums import PrioridadPedido
+from src.models.pedidos.pedido_item_model import PedidoItemModel
+from src.models.pedidos.pedido_model import PedidoModel
+from src.repositories.pedidos.pedido_repository import PedidoRepository
+
+logger = logging.getLogger(__name__)
+
+# Canal del bus de eventos con los cambios de los ítems en cocina
+CANAL_COCINA = "cocina"
+
+# Posición de cada prioridad en la cola: primero los urgentes
+RANGO_PRIORIDAD: Dict[PrioridadPedido, int] = {
+    PrioridadPedido.URGENTE: 0,
+    PrioridadPedido.ALTA: 1,
+    PrioridadPedido.NORMAL: 2,
+}
+
+Clave = Tuple[int, str, int, str]
+
+FabricaSesion = Callable[[], AbstractAsyncContextManager]
+
+
+def item_cocina(item: PedidoItemModel, pedido: PedidoModel) -> ItemCocina:
+    """
+    Construye la vista de cocina de un ítem.
+
+    Parameters
+    ----------
+    item : PedidoItemModel
+        Ítem del pedido.
+    pedido : PedidoModel
+        Pedido al que pertenece.
+
+    Returns
+    -------
+    ItemCocina
+        Datos que muestra la pantalla de la estación.
+    """
+    return ItemCocina(
+        id=item.id,
+        id_pedido=pedido.id,
+        id_mesa=pedido.id_mesa,
+        orden=item.orden,
+        nombre_producto=item.nombre_producto,
+        cantidad=item.cantidad,
+        opciones=[opcion["nombre"] for opcion in item.opciones or []],
+        notas=item.notas,
+        estacion=item.estacion,
+        estado=item.estado,
+        prioridad=pedido.prioridad,
+        fecha_pedido=pedido.fecha_creacion,
+    )
+
+
+def mensaje_item(item: ItemCocina) -> WebSocketMessage:
+    """
+    Crea el mensaje incremental que describe el estado actual de un ítem.
+
+    Parameters
+    ----------
+    item : ItemCocina
+        Ítem modificado.
+
+    Returns
+    -------
+    WebSocketMessage
+        Evento ``item_cocina``; los clientes quitan el ítem de la pantalla
+        cuando su estado ya no es pendiente ni en preparación.
+    """
+    return WebSocketMessage(evento="item_cocina", payload=item.model_dump(mode="json"))
+
+
+async def publicar_items(
+    event_bus: EventBus, items: Iterable[Tuple[PedidoItemModel, PedidoModel]]
+) -> None:
+    """
+    Publica en el canal de cocina el estado actual de varios ítems.
+
+    Se llama después de confirmar la transacción; cada worker actualiza
+    sus colas al recibir los eventos.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        Bus en el que publicar.
+    items : Iterable[Tuple[PedidoItemModel, PedidoModel]]
+        Ítems creados o modificados junto con su pedido.
+    """
+    for item, pedido in items:
+        vista = item_cocina(item, pedido)
+        await event_bus.publicar(
+            Evento(
+                canal=CANAL_COCINA,
+                zona=vista.estacion,
+                clave=vista.id,
+                mensaje=mensaje_item(vista),
+            )
+        )
+
+
+class ColaEstacion:
+    """Ítems abiertos de una estación ordenados por prioridad y antigüedad.
+
+    Attributes
+    ----------
+    max_obsoletas : int
+        Entradas obsoletas toleradas en el montículo antes de compactarlo.
+    """
+
+    def __init__(self, max_obsoletas: int = 64):
+        """
+        Inicializa la cola vacía.
+
+        Parameters
+        ----------
+        max_obsoletas : int, optional
+            Entradas obsoletas toleradas además del tamaño de la cola, por defecto 64.
+        """
+        self.max_obsoletas = max_obsoletas
+        self._monticulo: List[Tuple[Clave, str]] = []
+        self._entradas: Dict[str, Tuple[Clave, ItemCocina]] = {}
+
+    @staticmethod
+    def clave(item: ItemCocina) -> Clave:
+        """Clave de ordenación: prioridad, antigüedad del pedido y posición en él."""
+        return (RANGO_PRIORIDAD[item.prioridad], item.id_pedido, item.orden, item.id)
+
+    def poner(self, item: ItemCocina) -> None:
+        """
+        Añade un ítem o actualiza el que ya estaba en la cola.
+
+        Parameters
+        ----------
+        item : ItemCocina
+            Estado actual del ítem.
+        """
+        clave = self.clave(item)
+        anterior = self._entradas.get(item.id)
+        self._entradas[item.id] = (clave, item)
+        # Un cambio de estado conserva la posición; solo se reordena si cambia la clave
+        if anterior is None or anterior[0] != clave:
+            heapq.heappush(self._monticulo, (clave, item.id))
+            self._compactar_si_hace_falta()
+
+    def quitar(self, item_id: str) -> bool:
+        """
+        Saca un ítem de la cola.
+
+        Parameters
+        ----------
+        item_id : str
+            ID del ítem.
+
+        Returns
+        -------
+        bool
+            True si el ítem estaba en la cola.
+        """
+        if self._entradas.pop(item_id, None) is None:
+            return False
+        self._compactar_si_hace_falta()
+        return True
+
+    def siguiente(self) -> Optional[ItemCocina]:
+        """
+        Obtiene el ítem que debe prepararse primero sin sacarlo de la cola.
+
+        Returns
+        -------
+        Optional[ItemCocina]
+            El primer ítem o None si la cola está vacía.
+        """
+        while self._monticulo and not self._vigente(*self._monticulo[0]):
+            heapq.heappop(self._monticulo)
+        if not self._monticulo:
+            return None
+        return self._entradas[self._monticulo[0][1]][1]
+
+    def ordenados(self) -> List[ItemCocina]:
+        """
+        Lista los ítems en orden de preparación.
+
+        Returns
+        -------
+        List[ItemCocina]
+            Ítems de la cola, el primero es el siguiente a preparar.
+        """
+        return [item for _, item in sorted(self._entradas.values(), key=lambda e: e[0])]
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._entradas
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def _vigente(self, clave: Clave, item_id: str) -> bool:
+        """Indica si una entrada del montículo corresponde al estado actual del ítem."""
+        entrada = self._entradas.get(item_id)
+        return entrada is not None and entrada[0] == clave
+
+    def _compactar_si_hace_falta(self) -> None:
+        """Reconstruye el montículo si las entradas obsoletas superan el límite."""
+        if len(self._monticulo) > 2 * len(self._entradas) + self.max_obsoletas:
+            self._monticulo = [(clave, item_id) for item_id, (clave, _) in self._entradas.items()]
+            heapq.heapify(self._monticulo)
+
+
+class ColaCocina:
+    """Colas de preparación de todas las estaciones y sus pantallas conectadas.
+
+    Attributes
+    ----------
+    hub : WebSocketHub
+        Hub de las pantallas de cocina; cada estación es un canal.
+    """
+
+    def __init__(self, hub: WebSocketHub, fabrica_sesion: Optional[FabricaSesion] = None):
+        """
+        Inicializa las colas vacías.
+
+        Parameters
+        ----------
+        hub : WebSocketHub
+            Hub al que se envían los cambios.
+        fabrica_sesion : Optional[FabricaSesion], optional
+            Crea sesiones de base de datos para la restauración. Por defecto
+            ``DatabaseManager().session``.
+        """
+        self.hub = hub
+        self._fabrica_sesion = fabrica_sesion or DatabaseManager().session
+        self._estaciones: Dict[str, ColaEstacion] = {}
+        self._recibidos_al_restaurar: Optional[Set[str]] = None
+
+    @property
+    def estaciones(self) -> List[str]:
+        """Estaciones con ítems en cola."""
+        return sorted(estacion for estacion, cola in self._estaciones.items() if cola)
+
+    def aplicar(self, item: ItemCocina) -> None:
+        """
+        Refleja en la cola de su estación el estado actual de un ítem.
+
+        Parameters
+        ----------
+        item : ItemCocina
+            Ítem nuevo o modificado.
+        """
+        if item.estado in ESTADOS_EN_COCINA:
+            self._estaciones.setdefault(item.estacion, ColaEstacion()).poner(item)
+        else:
+            cola = self._estaciones.get(item.estacion)
+            if cola is not None:
+                cola.quitar(item.id)
+
+    def items(self, estacion: str) -> List[ItemCocina]:
+        """
+        Lista los ítems de una estación en orden de preparación.
+
+        Parameters
+        ----------
+        estacion : str
+            Estación de cocina.
+
+        Returns
+        -------
+        List[ItemCocina]
+            Ítems pendientes y en preparación.
+        """
+        cola = self._estaciones.get(estacion)
+        return cola.ordenados() if cola is not None else []
+
+    def instantanea(self, estacion: str) -> WebSocketMessage:
+        """
+        Crea el mensaje con la cola completa de una estación.
+
+        Parameters
+        ----------
+        estacion : str
+            Estación de cocina.
+
+        Returns
+        -------
+        WebSocketMessage
+            Evento ``cola_cocina`` con los ítems en orden.
+        """
+        return WebSocketMessage(
+            evento="cola_cocina",
+            payload={
+                "estacion": estacion,
+                "items": [item.model_dump(mode="json") for item in self.items(estacion)],
+            },
+        )
+
+    def entregar(self, evento: Evento) -> int:
+        """
+        Aplica un evento del bus y lo reenvía a las pantallas de la estación.
+
+        Parameters
+        ----------
+        evento : Evento
+            Evento ``item_cocina`` publicado tras confirmar el cambio.
+
+        Returns
+        -------
+        int
+            Número de conexiones a las que se encoló el mensaje.
+        """
+        item = ItemCocina.model_validate(evento.mensaje.payload)
+        if self._recibidos_al_restaurar is not None:
+            self._recibidos_al_restaurar.add(item.id)
+        self.aplicar(item)
+        return self.hub.publicar(item.estacion, evento.mensaje)
+
+    async def restaurar(self) -> int:
+        """
+        Reconstruye las colas con los ítems abiertos guardados en la base de datos.
+
+        Los ítems que cambian mientras dura la consulta conservan el estado
+        recibido por el bus, que es más reciente.
+
+        Returns
+        -------
+        int
+            Número de ítems en cola tras la restauración.
+        """
+        self._recibidos_al_restaurar = set()
+        try:
+            async with self._fabrica_sesion() as session:
+                filas = await PedidoRepository(session).get_items_en_cocina(ESTADOS_EN_COCINA)
+
+            actuales = {
+                item.id: item
+                for cola in self._estaciones.values()
+                for item in cola.ordenados()
+                if item.id in self._recibidos_al_restaurar
+            }
+            self._estaciones = {}
+            for item, pedido in filas:
+                if item.id not in self._recibidos_al_restaurar:
+                    self.aplicar(item_cocina(item, pedido))
+            for item in actuales.values():
+                self.aplicar(item)
+        finally:
+            self._recibidos_al_restaurar = None
+
+        total = sum(len(cola) for cola in self._estaciones.values())
+        logger.info("Colas de cocina restauradas: %d ítems en %d estaciones", total, len(self.estaciones))
+        return total
+
+    async def resincronizar(self) -> int:
+        """
+        Restaura las colas y envía la cola completa a las pantallas conectadas.
+
+        Se usa cuando el bus de eventos recupera la conexión: los cambios
+        publicados mientras tanto no llegaron ni a las colas ni a las pantallas.
+
+        Returns
+        -------
+        int
+            Número de ítems en cola tras la restauración.
+        """
+        anteriores = set(self.estaciones)
+        total = await self.restaurar()
+        for estacion in anteriores | set(self.estaciones):
+            self.hub.publicar(estacion, self.instantanea(estacion))
+        return total
+
+    async def atender(self, websocket: WebSocket, estaciones: Iterable[str]) -> None:
+        """
+        Atiende una pantalla de cocina: envía sus colas y después los cambios.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            Conexión ya aceptada.
+        estaciones : Iterable[str]
+            Estaciones que muestra la pantalla.
+        """
+        estaciones = list(estaciones)
+        await self.hub.atender(
+            websocket,
+            estaciones,
+            iniciales=[self.instantanea(estacion) for estacion in estaciones],
+        )
+
+
+# Instancia única de las colas de cocina (patrón singleton)
+_cola_cocina: Optional[ColaCocina] = None
+
+
+def get_cola_cocina() -> ColaCocina:
+    """
+    Obtiene o crea las colas de cocina y las suscribe al bus de eventos.
+
+    Returns
+    -------
+    ColaCocina
+        Colas con un hub configurado según ``ws_heartbeat_interval`` y
+        ``ws_send_queue_size``.
+    """
+    global _cola_cocina
+    if _cola_cocina is None:
+        settings = get_settings()
+        _cola_cocina = ColaCocina(
+            WebSocketHub(
+                intervalo_heartbeat=settings.ws_heartbeat_interval,
+                max_cola=settings.ws_send_queue_size,
+            )
+        )
+        bus = get_event_bus()
+        bus.suscribir(CANAL_COCINA, _cola_cocina.entregar)
+        bus.al_reconectar(_cola_cocina.resincronizar)
+    return _cola_cocina
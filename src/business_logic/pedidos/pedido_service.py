@@ -0,0 +1,217 @@
+"""
+Servicio para la gestión de pedidos en el sistema.
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.pedidos.pedido_repository import PedidoRepository
+from src.repositories.mesas.mesa_repository import MesaRepository
+from src.business_logic.menu.menu_service import MenuService
+from src.business_logic.menu.catalogo_precios import CatalogoPrecios
+from src.business_logic.notifications.event_bus import get_event_bus
+from src.business_logic.pedidos.cola_cocina import publicar_items
+from src.models.pedidos.pedido_model import PedidoModel
+from src.models.pedidos.pedido_item_model import PedidoItemModel
+from src.core.enums.pedido_enums import EstadoPedido
+from src.api.schemas.pedido_schema import (
+    PedidoCreate,
+    PedidoItemCreate,
+    PedidoResponse,
+    PedidoSummary,
+    PedidoList,
+)
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoValidationError,
+    PedidoNotFoundError,
+)
+
+
+class PedidoService:
+    """Servicio para la gestión de pedidos.
+
+    Los pedidos se valoran contra el catálogo de precios del menú, que se
+    mantiene en memoria por versión, y se guardan con todos sus ítems en
+    una sola transacción. Crear un pedido cuesta un número fijo de
+    consultas, independiente del número de ítems.
+
+    Attributes
+    ----------
+    repository : PedidoRepository
+        Repositorio para acceso a datos de pedidos.
+    mesa_repository : MesaRepository
+        Repositorio para comprobar la mesa del pedido.
+    menu_service : MenuService
+        Servicio del menú que proporciona el catálogo de precios.
+    event_bus : EventBus
+        Bus en el que se publican los ítems para las colas de cocina.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.repository = PedidoRepository(session)
+        self.mesa_repository = MesaRepository(session)
+        self.menu_service = MenuService(session)
+        self.event_bus = get_event_bus()
+
+    async def create_pedido(self, pedido_data: PedidoCreate) -> PedidoResponse:
+        """
+        Crea un pedido valorando sus ítems con el menú vigente.
+
+        Parameters
+        ----------
+        pedido_data : PedidoCreate
+            Mesa, productos y opciones solicitados.
+
+        Returns
+        -------
+        PedidoResponse
+            El pedido creado con sus precios.
+
+        Raises
+        ------
+        PedidoValidationError
+            Si la mesa no existe o está inactiva, o algún producto u opción
+            no está disponible.
+        """
+        mesa = await self.mesa_repository.get_by_id(pedido_data.id_mesa)
+        if mesa is None or not mesa.activo:
+            raise PedidoValidationError(f"La mesa '{pedido_data.id_mesa}' no existe o está inactiva")
+
+        catalogo = await self.menu_service.get_catalogo_precios()
+        items = [
+            self._valorar_item(catalogo, item, orden)
+            for orden, item in enumerate(pedido_data.items)
+        ]
+
+        pedido = PedidoModel(
+            id_mesa=mesa.id,
+            estado=EstadoPedido.PENDIENTE,
+            prioridad=pedido_data.prioridad,
+            notas=pedido_data.notas,
+            version_menu=catalogo.version,
+            version=1,
+            total=sum((item.subtotal for item in items), Decimal("0.00")),
+            items=items,
+        )
+        created_pedido = await self.repository.create(pedido)
+        await publicar_items(self.event_bus, [(item, created_pedido) for item in created_pedido.items])
+        return PedidoResponse.model_validate(created_pedido)
+
+    async def get_pedido_by_id(self, pedido_id: str) -> PedidoResponse:
+        """
+        Obtiene un pedido con sus ítems.
+
+        Parameters
+        ----------
+        pedido_id : str
+            Identificador único del pedido.
+
+        Returns
+        -------
+        PedidoResponse
+            Esquema de respuesta con los datos del pedido.
+
+        Raises
+        ------
+        PedidoNotFoundError
+            Si no se encuentra el pedido.
+        """
+        pedido = await self.repository.get_by_id(pedido_id)
+        if not pedido:
+            raise PedidoNotFoundError(f"No se encontró el pedido con ID {pedido_id}")
+        return PedidoResponse.model_validate(pedido)
+
+    async def get_pedidos(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        id_mesa: Optional[str] = None,
+        estado: Optional[EstadoPedido] = None,
+    ) -> PedidoList:
+        """
+        Obtiene una lista paginada de pedidos.
+
+        Parameters
+        ----------
+        skip : int, optional
+            Número de registros a omitir (offset), por defecto 0.
+        limit : int, optional
+            Número máximo de registros a retornar, por defecto 100.
+        id_mesa : Optional[str], optional
+            Filtra por mesa.
+        estado : Optional[EstadoPedido], optional
+            Filtra por estado.
+
+        Returns
+        -------
+        PedidoList
+            Esquema con la lista de pedidos y el total.
+        """
+        if skip < 0:
+            raise PedidoValidationError("El parámetro 'skip' debe ser mayor o igual a cero")
+        if limit < 1:
+            raise PedidoValidationError("El parámetro 'limit' debe ser mayor a cero")
+
+        pedidos, total = await self.repository.get_all(skip, limit, id_mesa, estado)
+        return PedidoList(
+            items=[PedidoSummary.model_validate(pedido) for pedido in pedidos],
+            total=total,
+        )
+
+    @staticmethod
+    def _valorar_item(
+        catalogo: CatalogoPrecios, item: PedidoItemCreate, orden: int
+    ) -> PedidoItemModel:
+        """
+        Valida un ítem contra el catálogo y copia su nombre, opciones y precios.
+
+        Parameters
+        ----------
+        catalogo : CatalogoPrecios
+            Catálogo de la versión vigente del menú.
+        item : PedidoItemCreate
+            Producto solicitado.
+        orden : int
+            Posición del ítem en el pedido.
+
+        Returns
+        -------
+        PedidoItemModel
+            Ítem listo para insertar.
+
+        Raises
+        ------
+        PedidoValidationError
+            Si el producto o alguna opción no está disponible, hay opciones
+            repetidas o no se respetan los límites de selección de un grupo.
+        """
+        linea = catalogo.valorar(item.id_producto, item.cantidad, item.opciones)
+        if not linea.valida:
+            raise PedidoValidationError(linea.errores[0])
+
+        producto = linea.producto
+        return PedidoItemModel(
+            id_producto=producto.id,
+            estacion=producto.estacion,
+            estado=EstadoPedido.PENDIENTE,
+            orden=orden,
+            nombre_producto=producto.nombre,
+            cantidad=item.cantidad,
+            precio_unitario=linea.precio_unitario,
+            subtotal=linea.total,
+            opciones=[
+                {"id": o.id, "nombre": o.nombre, "precio_adicional": str(o.precio_adicional)}
+                for o in linea.opciones
+            ],
+            notas=item.notas,
+        )
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from src.repositories.pedidos.producto_opcion_repository import ProductoOpcionRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
 from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
 from src.api.schemas.producto_opcion_schema import (
     ProductoOpcionCreate,
@@ -32,6 +34,8 @@ class ProductoOpcionService:
     ----------
     repository : ProductoOpcionRepository
         Repositorio para acceso a datos de opciones de productos.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
     """
 
     def __init__(self, session: AsyncSession):
@@ -44,6 +48,7 @@ class ProductoOpcionService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = ProductoOpcionRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
 
     async def create_producto_opcion(self, producto_opcion_data: ProductoOpcionCreate) -> ProductoOpcionResponse:
         """
@@ -75,7 +80,10 @@ class ProductoOpcionService:
                 orden=producto_opcion_data.orden
             )
 
-            # Persistir en la base de datos
+            # Persistir en la base de datos junto con el registro del cambio
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.PRODUCTO, [producto_opcion.id_producto]
+            )
             created_producto_opcion = await self.repository.create(producto_opcion)
 
             # Convertir y retornar como esquema de respuesta
@@ -140,6 +148,7 @@ class ProductoOpcionService:
             raise ProductoOpcionNotFoundError(f"No se encontró la opción de producto con ID {producto_opcion_id}")
 
         # Eliminar la opción de producto
+        await self.menu_cambio_repository.registrar(EntidadMenu.PRODUCTO, [producto_opcion.id_producto])
         result = await self.repository.delete(producto_opcion_id)
         return result
 
@@ -207,8 +216,17 @@ class ProductoOpcionService:
             # Si no hay datos para actualizar, simplemente retornar la opción de producto actual
             return await self.get_producto_opcion_by_id(producto_opcion_id)
 
+        # El cambio se registra antes de escribir, así que se necesita el producto actual
+        producto_opcion = await self.repository.get_by_id(producto_opcion_id)
+        if not producto_opcion:
+            raise ProductoOpcionNotFoundError(f"No se encontró la opción de producto con ID {producto_opcion_id}")
+
         try:
-            # Actualizar la opción de producto
+            # Actualizar la opción de producto; si cambia de producto, cambian los dos
+            await self.menu_cambio_repository.registrar(
+                EntidadMenu.PRODUCTO,
+                [producto_opcion.id_producto, update_data.get("id_producto", producto_opcion.id_producto)],
+            )
             updated_producto_opcion = await self.repository.update(producto_opcion_id, **update_data)
 
             # Verificar si la opción de producto fue encontrada
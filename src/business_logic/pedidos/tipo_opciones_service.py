@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from src.repositories.pedidos.tipo_opciones_repository import TipoOpcionRepository
+from src.repositories.menu.menu_cambio_repository import MenuCambioRepository
+from src.core.enums.menu_enums import EntidadMenu
 from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
 from src.api.schemas.tipo_opciones_schema import (
     TipoOpcionCreate,
@@ -32,6 +34,8 @@ class TipoOpcionService:
     ----------
     repository : TipoOpcionRepository
         Repositorio para acceso a datos de tipos de opciones.
+    menu_cambio_repository : MenuCambioRepository
+        Registro de cambios del menú, alimentado en cada escritura.
     """
 
     def __init__(self, session: AsyncSession):
@@ -44,6 +48,7 @@ class TipoOpcionService:
             Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
         """
         self.repository = TipoOpcionRepository(session)
+        self.menu_cambio_repository = MenuCambioRepository(session)
 
     async def create_tipo_opcion(self, tipo_opcion_data: TipoOpcionCreate) -> TipoOpcionResponse:
         """
@@ -139,6 +144,7 @@ class TipoOpcionService:
             raise TipoOpcionNotFoundError(f"No se encontró el tipo de opción con ID {tipo_opcion_id}")
 
         # Eliminar el tipo de opción
+        await self.menu_cambio_repository.registrar(EntidadMenu.TIPO_OPCION, [tipo_opcion_id])
         result = await self.repository.delete(tipo_opcion_id)
         return result
 
@@ -208,6 +214,7 @@ class TipoOpcionService:
 
         try:
             # Actualizar el tipo de opción
+            await self.menu_cambio_repository.registrar(EntidadMenu.TIPO_OPCION, [tipo_opcion_id])
             updated_tipo_opcion = await self.repository.update(tipo_opcion_id, **update_data)
 
             # Verificar si el tipo de opción fue encontrado
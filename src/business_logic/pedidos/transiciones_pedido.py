@@ -0,0 +1,90 @@
+"""
+Máquina de estados de los ítems de pedido en cocina.
+
+Cada ítem avanza por su estación de forma independiente
+(pendiente → en_preparacion → listo → entregado) y el estado del pedido
+se deriva del de sus ítems.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from src.core.enums.pedido_enums import EstadoPedido
+
+# Estados en los que un ítem aparece en la pantalla de su estación
+ESTADOS_EN_COCINA: FrozenSet[EstadoPedido] = frozenset({
+    EstadoPedido.PENDIENTE,
+    EstadoPedido.EN_PREPARACION,
+})
+
+# Estados a los que se puede pasar desde cada estado
+TRANSICIONES_ITEM: Dict[EstadoPedido, FrozenSet[EstadoPedido]] = {
+    EstadoPedido.PENDIENTE: frozenset({EstadoPedido.EN_PREPARACION, EstadoPedido.CANCELADO}),
+    EstadoPedido.EN_PREPARACION: frozenset({EstadoPedido.LISTO, EstadoPedido.CANCELADO}),
+    EstadoPedido.LISTO: frozenset({EstadoPedido.ENTREGADO}),
+}
+
+
+def es_transicion_valida(origen: EstadoPedido, destino: EstadoPedido) -> bool:
+    """
+    Indica si un ítem puede pasar de un estado a otro.
+
+    Parameters
+    ----------
+    origen : EstadoPedido
+        Estado actual del ítem.
+    destino : EstadoPedido
+        Estado solicitado.
+
+    Returns
+    -------
+    bool
+        True si la transición está permitida.
+    """
+    return destino in TRANSICIONES_ITEM.get(origen, frozenset())
+
+
+def estados_origen(destino: EstadoPedido) -> FrozenSet[EstadoPedido]:
+    """
+    Obtiene los estados desde los que un ítem puede llegar a un estado.
+
+    Parameters
+    ----------
+    destino : EstadoPedido
+        Estado solicitado.
+
+    Returns
+    -------
+    FrozenSet[EstadoPedido]
+        Estados de origen permitidos.
+    """
+    return frozenset(
+        origen for origen, destinos in TRANSICIONES_ITEM.items() if destino in destinos
+    )
+
+
+def estado_pedido(estados_items: Iterable[EstadoPedido]) -> Optional[EstadoPedido]:
+    """
+    Deriva el estado de un pedido a partir del de sus ítems.
+
+    Parameters
+    ----------
+    estados_items : Iterable[EstadoPedido]
+        Estados de todos los ítems del pedido.
+
+    Returns
+    -------
+    Optional[EstadoPedido]
+        Estado que corresponde al pedido, o None si ningún ítem ha empezado
+        a prepararse (el pedido conserva su estado actual).
+    """
+    estados = list(estados_items)
+    activos = [estado for estado in estados if estado != EstadoPedido.CANCELADO]
+    if not activos:
+        return EstadoPedido.CANCELADO if estados else None
+    if all(estado == EstadoPedido.ENTREGADO for estado in activos):
+        return EstadoPedido.ENTREGADO
+    if all(estado in (EstadoPedido.LISTO, EstadoPedido.ENTREGADO) for estado in activos):
+        return EstadoPedido.LISTO
+    if all(estado == EstadoPedido.PENDIENTE for estado in activos):
+        return None
+    return EstadoPedido.EN_PREPARACION
@@ -136,7 +136,8 @@ class ProductoValidator:
         if not selected_options:
             return  # No options selected is valid
 
-        available_option_ids = [opt["id"] for opt in available_options if opt.get("activo", True)]
+        # Set lookup keeps the check linear in the number of options
+        available_option_ids = {opt["id"] for opt in available_options if opt.get("activo", True)}
 
         for option_id in selected_options:
             if option_id not in available_option_ids:
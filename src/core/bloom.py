@@ -0,0 +1,99 @@
+"""
+Filtro de Bloom en memoria para pruebas de pertenencia aproximadas.
+"""
+
+import hashlib
+import math
+from typing import Iterable
+
+
+class FiltroBloom:
+    """
+    Conjunto aproximado con falsos positivos acotados y sin falsos negativos.
+
+    Si ``x in filtro`` es False, el elemento no se añadió nunca; si es True,
+    probablemente sí, con una probabilidad de error cercana a
+    ``tasa_error`` mientras no se superen ``capacidad`` elementos. Los
+    elementos no se pueden eliminar: para olvidar los antiguos se
+    reconstruye el filtro.
+
+    Las posiciones de cada elemento se obtienen de un único BLAKE2b con
+    doble hashing, así que una consulta cuesta un hash y unos pocos
+    accesos a un ``bytearray``.
+
+    Attributes
+    ----------
+    capacidad : int
+        Número de elementos para el que se dimensionó el filtro.
+    tasa_error : float
+        Probabilidad de falso positivo prevista con ``capacidad`` elementos.
+    num_bits : int
+        Tamaño del filtro en bits.
+    num_hashes : int
+        Número de posiciones que ocupa cada elemento.
+    elementos : int
+        Número de elementos añadidos (con repeticiones).
+    """
+
+    def __init__(self, capacidad: int, tasa_error: float = 0.001):
+        """
+        Inicializa el filtro vacío con el tamaño óptimo.
+
+        Parameters
+        ----------
+        capacidad : int
+            Número de elementos previsto; debe ser mayor a cero.
+        tasa_error : float, optional
+            Probabilidad de falso positivo deseada, por defecto 0.001.
+
+        Raises
+        ------
+        ValueError
+            Si la capacidad o la tasa de error no son válidas.
+        """
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser mayor a cero")
+        if not 0 < tasa_error < 1:
+            raise ValueError("tasa_error debe estar entre 0 y 1")
+        self.capacidad = capacidad
+        self.tasa_error = tasa_error
+        self.num_bits = max(8, math.ceil(-capacidad * math.log(tasa_error) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacidad * math.log(2)))
+        self.elementos = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _posiciones(self, elemento: str) -> Iterable[int]:
+        """Calcula las posiciones de un elemento con doble hashing."""
+        digest = hashlib.blake2b(elemento.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, elemento: str) -> None:
+        """
+        Añade un elemento al filtro.
+
+        Parameters
+        ----------
+        elemento : str
+            Elemento a añadir.
+        """
+        for posicion in self._posiciones(elemento):
+            self._bits[posicion >> 3] |= 1 << (posicion & 7)
+        self.elementos += 1
+
+    def __contains__(self, elemento: str) -> bool:
+        """Indica si el elemento probablemente se añadió al filtro."""
+        return all(
+            self._bits[posicion >> 3] & (1 << (posicion & 7))
+            for posicion in self._posiciones(elemento)
+        )
+
+    def __len__(self) -> int:
+        """Número de elementos añadidos."""
+        return self.elementos
+
+    @property
+    def saturado(self) -> bool:
+        """True si se superó la capacidad y la tasa de error ya no está garantizada."""
+        return self.elementos > self.capacidad
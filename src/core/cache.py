@@ -0,0 +1,162 @@
+"""
+Caché en memoria con expiración por tiempo y desalojo LRU.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Caché en memoria del proceso con expiración y límite de entradas.
+
+    Cada entrada expira ``ttl`` segundos después de escribirse. Cuando se
+    alcanza ``maxsize`` se desaloja la entrada usada menos recientemente.
+    No es compartida entre procesos: cada worker mantiene su propia copia,
+    por lo que toda escritura relevante debe invalidar explícitamente.
+
+    Attributes
+    ----------
+    maxsize : int
+        Número máximo de entradas almacenadas.
+    ttl : float
+        Tiempo de vida de cada entrada, en segundos.
+    hits : int
+        Número de lecturas servidas desde la caché.
+    misses : int
+        Número de lecturas que no encontraron una entrada vigente.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa la caché vacía.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Número máximo de entradas, por defecto 1024.
+        ttl : float, optional
+            Tiempo de vida de cada entrada en segundos, por defecto 300.
+        clock : Callable[[], float], optional
+            Reloj monotónico; inyectable para pruebas.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize debe ser mayor a cero")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """
+        Obtiene el valor vigente de una clave.
+
+        Parameters
+        ----------
+        key : Hashable
+            Clave a consultar.
+        default : Optional[V], optional
+            Valor a retornar si la clave no existe o expiró.
+
+        Returns
+        -------
+        Optional[V]
+            El valor almacenado o ``default``.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, V]:
+        """
+        Obtiene los valores vigentes de varias claves.
+
+        Parameters
+        ----------
+        keys : Iterable[Hashable]
+            Claves a consultar.
+
+        Returns
+        -------
+        Dict[Hashable, V]
+            Solo las claves encontradas; las ausentes se omiten.
+        """
+        missing = object()
+        found: Dict[Hashable, V] = {}
+        for key in keys:
+            value = self.get(key, missing)  # type: ignore[arg-type]
+            if value is not missing:
+                found[key] = value
+        return found
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Almacena un valor, desalojando la entrada menos usada si hace falta.
+
+        Parameters
+        ----------
+        key : Hashable
+            Clave a escribir.
+        value : V
+            Valor a almacenar.
+        """
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def set_many(self, items: Dict[Hashable, V]) -> None:
+        """
+        Almacena varios valores.
+
+        Parameters
+        ----------
+        items : Dict[Hashable, V]
+            Pares clave-valor a escribir.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Elimina las claves indicadas, existan o no.
+
+        Parameters
+        ----------
+        *keys : Hashable
+            Claves a eliminar.
+        """
+        for key in keys:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._data)
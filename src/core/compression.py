@@ -0,0 +1,326 @@
+"""
+Compresión de respuestas HTTP con negociación de contenido.
+
+Se usa gzip siempre y brotli cuando el paquete ``brotli`` está instalado;
+brotli es una dependencia opcional y su ausencia solo desactiva esa
+codificación. Como el middleware convierte en débiles los ETag de las
+respuestas que comprime, aquí se resuelve también la comparación de
+If-None-Match.
+"""
+
+import re
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+
+# Codificaciones soportadas en orden de preferencia ante igual q
+CODIFICACIONES_DISPONIBLES: Tuple[str, ...] = ("br", "gzip") if brotli else ("gzip",)
+
+# Tipos de contenido que merece la pena comprimir
+TIPOS_COMPRIMIBLES: Tuple[str, ...] = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Los eventos SSE deben llegar al cliente en cuanto se emiten
+TIPOS_EXCLUIDOS: Tuple[str, ...] = ("text/event-stream",)
+
+
+def parse_accept_encoding(cabecera: str) -> Dict[str, float]:
+    """
+    Interpreta la cabecera Accept-Encoding.
+
+    Parameters
+    ----------
+    cabecera : str
+        Valor de la cabecera Accept-Encoding.
+
+    Returns
+    -------
+    Dict[str, float]
+        Peso q de cada codificación, en minúsculas. Un q inválido cuenta como 0.
+    """
+    pesos: Dict[str, float] = {}
+    for parte in cabecera.split(","):
+        codificacion, _, parametros = parte.partition(";")
+        codificacion = codificacion.strip().lower()
+        if not codificacion:
+            continue
+
+        q = 1.0
+        for parametro in parametros.split(";"):
+            nombre, _, valor = parametro.strip().partition("=")
+            if nombre.strip().lower() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        pesos[codificacion] = q
+    return pesos
+
+
+def elegir_codificacion(
+    accept_encoding: str,
+    disponibles: Sequence[str] = CODIFICACIONES_DISPONIBLES,
+) -> Optional[str]:
+    """
+    Elige la mejor codificación aceptada por el cliente.
+
+    Parameters
+    ----------
+    accept_encoding : str
+        Valor de la cabecera Accept-Encoding.
+    disponibles : Sequence[str], optional
+        Codificaciones que el servidor puede producir, por orden de preferencia.
+
+    Returns
+    -------
+    Optional[str]
+        La codificación con mayor q (desempatando por preferencia del
+        servidor), o None si debe enviarse sin comprimir.
+    """
+    pesos = parse_accept_encoding(accept_encoding)
+    comodin = pesos.get("*", 0.0)
+
+    mejor: Optional[str] = None
+    mejor_q = 0.0
+    for codificacion in disponibles:
+        q = pesos.get(codificacion, comodin)
+        if q > mejor_q:
+            mejor, mejor_q = codificacion, q
+    return mejor
+
+
+# Cada entidad de If-None-Match: un ETag entre comillas, débil o fuerte, o el comodín
+_ETIQUETA = re.compile(r'(?:W/)?"[^"]*"|\*')
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica si un ETag está entre los de una cabecera If-None-Match.
+
+    La cabecera puede ser una lista separada por comas o ``*``. Se usa la
+    comparación débil: ``W/"v1"`` coincide con ``"v1"``, así que sigue
+    validando la copia que el cliente recibió comprimida por el middleware.
+
+    Parameters
+    ----------
+    if_none_match : Optional[str]
+        Valor de la cabecera If-None-Match, si se envió.
+    etag : str
+        ETag vigente de la representación.
+
+    Returns
+    -------
+    bool
+        True si el cliente ya tiene esa representación.
+    """
+    if not if_none_match:
+        return False
+    opaco = etag.removeprefix("W/")
+    return any(
+        etiqueta == "*" or etiqueta.removeprefix("W/") == opaco
+        for etiqueta in _ETIQUETA.findall(if_none_match)
+    )
+
+
+def _crear_compresor(
+    codificacion: str, gzip_level: int, brotli_quality: int
+) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Crea un compresor incremental y retorna sus funciones (comprimir, finalizar)."""
+    if codificacion == "br":
+        compresor = brotli.Compressor(quality=brotli_quality)
+        return compresor.process, compresor.finish
+
+    # wbits=31 produce el formato gzip (cabecera y CRC) en lugar de zlib
+    compresor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+    return compresor.compress, compresor.flush
+
+
+def comprimir(
+    cuerpo: bytes, codificacion: str, gzip_level: int = 6, brotli_quality: int = 5
+) -> bytes:
+    """
+    Comprime un cuerpo completo con la codificación indicada.
+
+    Parameters
+    ----------
+    cuerpo : bytes
+        Contenido a comprimir.
+    codificacion : str
+        "gzip" o "br".
+    gzip_level : int, optional
+        Nivel de compresión gzip, por defecto 6.
+    brotli_quality : int, optional
+        Calidad de brotli, por defecto 5.
+
+    Returns
+    -------
+    bytes
+        Contenido comprimido.
+
+    Raises
+    ------
+    ValueError
+        Si la codificación no está disponible en este entorno.
+    """
+    if codificacion not in CODIFICACIONES_DISPONIBLES:
+        raise ValueError(f"Codificación no disponible: {codificacion}")
+
+    procesar, finalizar = _crear_compresor(codificacion, gzip_level, brotli_quality)
+    return procesar(cuerpo) + finalizar()
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime las respuestas según Accept-Encoding.
+
+    Las respuestas se acumulan hasta alcanzar ``minimum_size``: si terminan
+    antes se envían sin comprimir, y si no se comprimen en streaming. No se
+    tocan las respuestas que ya traen Content-Encoding (por ejemplo el menú,
+    que se sirve precomprimido) ni los tipos de contenido no comprimibles.
+
+    Attributes
+    ----------
+    app : ASGIApp
+        Aplicación envuelta.
+    minimum_size : int
+        Tamaño mínimo en bytes a partir del cual se comprime.
+    gzip_level : int
+        Nivel de compresión gzip.
+    brotli_quality : int
+        Calidad de brotli; valores bajos priorizan la CPU.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        """
+        Inicializa el middleware.
+
+        Parameters
+        ----------
+        app : ASGIApp
+            Aplicación envuelta.
+        minimum_size : int, optional
+            Tamaño mínimo en bytes a partir del cual se comprime, por defecto 500.
+        gzip_level : int, optional
+            Nivel de compresión gzip, por defecto 6.
+        brotli_quality : int, optional
+            Calidad de brotli, por defecto 5.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codificacion = elegir_codificacion(Headers(scope=scope).get("accept-encoding", ""))
+        if codificacion is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, codificacion, send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """Intercepta los mensajes de una respuesta y decide si comprimirla."""
+
+    def __init__(self, middleware: CompressionMiddleware, codificacion: str, send: Send):
+        self.middleware = middleware
+        self.codificacion = codificacion
+        self.send = send
+        self.inicio: Optional[Message] = None
+        self.pendiente: List[bytes] = []
+        self.tamano_pendiente = 0
+        self.comprimible = False
+        self.decidido = False
+        self.procesar: Optional[Callable[[bytes], bytes]] = None
+        self.finalizar: Optional[Callable[[], bytes]] = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.inicio = message
+            self.comprimible = self._es_comprimible(Headers(raw=message["headers"]))
+            if not self.comprimible:
+                self.decidido = True
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or (self.decidido and self.procesar is None):
+            await self.send(message)
+            return
+
+        cuerpo = message.get("body", b"")
+        mas = message.get("more_body", False)
+
+        if self.procesar is not None:
+            salida = self.procesar(cuerpo)
+            if not mas:
+                salida += self.finalizar()
+            await self.send({"type": "http.response.body", "body": salida, "more_body": mas})
+            return
+
+        self.pendiente.append(cuerpo)
+        self.tamano_pendiente += len(cuerpo)
+        if mas and self.tamano_pendiente < self.middleware.minimum_size:
+            return
+
+        self.decidido = True
+        acumulado = b"".join(self.pendiente)
+        self.pendiente = []
+        cabeceras = MutableHeaders(raw=self.inicio["headers"])
+        cabeceras.add_vary_header("Accept-Encoding")
+
+        if not mas and len(acumulado) < self.middleware.minimum_size:
+            await self.send(self.inicio)
+            await self.send({"type": "http.response.body", "body": acumulado, "more_body": False})
+            return
+
+        self.procesar, self.finalizar = _crear_compresor(
+            self.codificacion, self.middleware.gzip_level, self.middleware.brotli_quality
+        )
+        salida = self.procesar(acumulado)
+        if not mas:
+            salida += self.finalizar()
+            cabeceras["Content-Length"] = str(len(salida))
+        elif "content-length" in cabeceras:
+            del cabeceras["Content-Length"]
+        cabeceras["Content-Encoding"] = self.codificacion
+
+        # El cuerpo transmitido ya no es byte a byte el que identifica un ETag fuerte
+        etag = cabeceras.get("etag")
+        if etag and not etag.startswith("W/"):
+            cabeceras["ETag"] = f"W/{etag}"
+
+        await self.send(self.inicio)
+        await self.send({"type": "http.response.body", "body": salida, "more_body": mas})
+
+    @staticmethod
+    def _es_comprimible(cabeceras: Headers) -> bool:
+        if "content-encoding" in cabeceras:
+            return False
+        tipo = cabeceras.get("content-type", "").split(";")[0].strip().lower()
+        if not tipo or tipo.startswith(TIPOS_EXCLUIDOS):
+            return False
+        return tipo.startswith(TIPOS_COMPRIMIBLES) or tipo.endswith("+json")
@@ -3,7 +3,7 @@ Configuración de la aplicación Restaurant Backend.
 """
 
 import os
-from typing import List, Optional, ClassVar
+from typing import Dict, List, Optional, ClassVar
 from pydantic import field_validator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -51,14 +51,40 @@ class Settings(BaseSettings):
     database_url: str
     database_test_url: Optional[str] = None
 
+    # Segundos que un worker espera a que otro termine las migraciones
+    migrations_lock_timeout: float = 60.0
+
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
+    # Bus de eventos entre workers: "memory" (un solo worker) o "redis"
+    event_bus_backend: str = "memory"
+    # Segundos entre relecturas de las revocaciones y los permisos de roles:
+    # cubren los avisos que el bus pierda (0 las desactiva)
+    state_sync_interval: float = 30.0
+
     # Security
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 30
+    # Claves asimétricas (RS*/ES*): kid -> clave pública PEM. Para rotar, se
+    # añade la clave nueva, se cambia jwt_active_kid y se retira la antigua
+    # cuando expiren sus tokens. Los servicios que solo verifican no
+    # necesitan jwt_private_key.
+    jwt_public_keys: Dict[str, str] = {}
+    jwt_private_key: Optional[str] = None
+    jwt_active_kid: Optional[str] = None
+    # Tokens verificados que se recuerdan por worker
+    token_cache_size: int = 4096
+    # Coste de bcrypt (2^rounds); al cambiarlo, los hashes se actualizan en el login
+    bcrypt_rounds: int = 12
+    # Hilos dedicados a bcrypt por worker
+    password_hash_workers: int = 2
+    # Filtro de Bloom de tokens revocados: capacidad inicial y tasa de falsos
+    # positivos (solo un positivo consulta la base de datos)
+    token_revocation_capacity: int = 100000
+    token_revocation_error_rate: float = 0.001
 
     # CORS
     allowed_origins: List[str] = ["http://localhost:3000"]
@@ -70,6 +96,11 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     allowed_extensions: List[str] = ["jpg", "jpeg", "png", "gif", "webp"]
 
+    # Códigos QR de las mesas (generados con el paquete segno)
+    qr_base_url: str = "http://localhost:3000/mesa"
+    qr_scale: int = 10
+    qr_cache_max_age: int = 86400
+
     # Email configuration (optional)
     smtp_host: Optional[str] = None
     smtp_port: Optional[int] = None
@@ -77,8 +108,44 @@ class Settings(BaseSettings):
     smtp_password: Optional[str] = None
     email_from: Optional[str] = None
 
+    # Compresión de respuestas (brotli se usa solo si el paquete está instalado)
+    compression_minimum_size: int = 500
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
+
+    # Límite de peticiones de los endpoints públicos (cubeta de tokens por
+    # regla e IP del cliente): "memory" por worker o "redis" compartido.
+    # Los límites son holgados porque los comensales de un local suelen
+    # salir a internet por la misma IP (NAT de la Wi-Fi del restaurante)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_public_burst: int = 300
+    rate_limit_public_per_second: float = 20.0
+    rate_limit_sync_burst: int = 30
+    rate_limit_sync_per_second: float = 1.0
+    # Solo detrás de un proxy que fije X-Forwarded-For; sin activarlo detrás
+    # de un proxy, todos los clientes comparten la cubeta de su IP
+    rate_limit_trust_forwarded: bool = False
+    # Proxies propios que añaden su entrada a X-Forwarded-For (se toma la
+    # entrada de esa posición contando desde la derecha)
+    rate_limit_trusted_proxies: int = 1
+    # Descarte de peticiones públicas con sobrecarga (segundos)
+    load_shedding_loop_lag: float = 0.2
+    load_shedding_pool_wait: float = 0.5
+
+    # Arranque: importar cada controlador con la primera petición a su
+    # prefijo y leer el esquema OpenAPI generado en el build (si existe)
+    lazy_routers: bool = True
+    openapi_cache_path: Optional[str] = None
+
+    # Flujo SSE del menú
+    menu_stream_batch_window: float = 1.0
+    menu_stream_queue_size: int = 32
+    menu_stream_keepalive: int = 15
+
     # WebSocket
     ws_heartbeat_interval: int = 30
+    ws_send_queue_size: int = 100
 
     # Logging
     log_level: str = "INFO"
@@ -8,6 +8,7 @@ from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from src.core.config import get_settings
+from src.core.load_monitor import PoolMedido
 from src.models.base_model import BaseModel
 
 
@@ -67,6 +68,7 @@ class DatabaseManager:
                     pool_pre_ping=True,  # Enable pessimistic disconnect handling
                     pool_size=10,  # Connection pool size
                     max_overflow=20,  # Max overflow connections
+                    poolclass=PoolMedido,  # Reports checkout waits for load shedding
                     future=True,  # Enable SQLAlchemy 2.0 features
                 )
 
@@ -189,32 +191,76 @@ async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def create_tables():
+def register_models() -> None:
     """
-    Crea todas las tablas definidas en el modelo de datos.
-
-    Esta función debe ejecutarse durante el inicio de la aplicación
-    para asegurar que todas las tablas necesarias existan en la base
-    de datos antes de realizar operaciones.
+    Importa todos los modelos para registrarlos en los metadatos de BaseModel.
 
     Notes
     -----
-    Importa todos los modelos necesarios para asegurar que estén
-    registrados con la clase base antes de crear las tablas.
+    Los modelos se importan aquí y no al cargar este módulo para que
+    importar la configuración de la base de datos siga siendo ligero.
     """
-    # Import all models to ensure they are registered with the Base
     from src.models.auth.rol_model import RolModel  # noqa: F401
+    from src.models.auth.token_revocado_model import TokenRevocadoModel  # noqa: F401
     from src.models.menu.categoria_model import CategoriaModel  # noqa: F401
     from src.models.menu.alergeno_model import AlergenoModel  # noqa: F401
     from src.models.menu.producto_model import ProductoModel  # noqa: F401
     from src.models.menu.producto_alergeno_model import ProductoAlergenoModel  # noqa: F401
     from src.models.pedidos.tipo_opciones_model import TipoOpcionModel  # noqa: F401
     from src.models.pedidos.producto_opcion_model import ProductoOpcionModel  # noqa: F401
+    from src.models.menu.menu_cambio_model import MenuCambioModel  # noqa: F401
+    from src.models.menu.menu_version_model import MenuVersionModel  # noqa: F401
+    from src.models.mesas.mesa_model import MesaModel  # noqa: F401
+    from src.models.pedidos.pedido_model import PedidoModel  # noqa: F401
+    from src.models.pedidos.pedido_item_model import PedidoItemModel  # noqa: F401
+    from src.models.pagos.pago_model import PagoModel  # noqa: F401
+    from src.models.pagos.idempotencia_model import IdempotenciaModel  # noqa: F401
+
+
+async def create_tables():
+    """
+    Crea todas las tablas definidas en el modelo de datos.
+
+    Crea las tablas que falten sin versionar el esquema; útil en pruebas
+    y scripts. La aplicación usa ``migrate_database`` al arrancar.
+
+    Notes
+    -----
+    Importa todos los modelos necesarios para asegurar que estén
+    registrados con la clase base antes de crear las tablas.
+    """
+    register_models()
 
     async with db.engine.begin() as conn:
         await conn.run_sync(BaseModel.metadata.create_all)
 
 
+async def migrate_database() -> int:
+    """
+    Aplica las migraciones pendientes del esquema.
+
+    Si el esquema ya está en la última versión solo cuesta una consulta,
+    así que puede ejecutarse en cada arranque de cada worker. Los modelos
+    se registran siempre, también cuando no hay nada que migrar: lo que se
+    ejecuta después (colas de cocina, permisos) consulta modelos con
+    relaciones hacia otros que nadie más ha importado.
+
+    Returns
+    -------
+    int
+        Número de migraciones aplicadas por este proceso.
+
+    Raises
+    ------
+    MigracionError
+        Si no se obtiene el bloqueo de migraciones o falla una migración.
+    """
+    from src.core.migrations.runner import aplicar_migraciones
+
+    register_models()
+    return await aplicar_migraciones(db.engine, espera=get_settings().migrations_lock_timeout)
+
+
 async def drop_tables():
     """
     Elimina todas las tablas de la base de datos.
@@ -1,14 +1,64 @@
 """
 Core dependencies and middleware for the application.
-Includes database session management and error handling.
+Includes database session management, error handling and authorization.
 """
 
 import logging
-from typing import Callable
-from fastapi import Request, Response
+from typing import Awaitable, Callable, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.core.enums.user_enums import Permiso
+from src.core.security import security
+from src.business_logic.auth.permisos import get_mapa_permisos
+from src.business_logic.auth.revocacion import get_lista_revocacion
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def requiere_permiso(*permisos: Permiso) -> Callable[..., Awaitable[dict]]:
+    """
+    Build a dependency that requires an access token whose role has all permissions.
+
+    The check uses the cached token verification, the in-memory revocation
+    filter and the in-memory permission bitsets, so it adds no database
+    round trip unless the revocation filter reports a possible match.
+
+    Usage:
+        @router.post("", dependencies=[Depends(requiere_permiso(Permiso.PAGOS_REGISTRAR))])
+
+    Args:
+        *permisos: Required permissions
+
+    Returns:
+        Dependency returning the token payload
+    """
+
+    async def verificar_permisos(
+        credenciales: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+    ) -> dict:
+        payload = security.verify_token(credenciales.credentials) if credenciales else None
+        if (
+            payload is None
+            or payload.get("type") != "access"
+            or await get_lista_revocacion().esta_revocado(payload)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token de acceso inválido o ausente",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if not get_mapa_permisos().tiene(payload.get("rol"), *permisos):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="El rol no tiene permiso para esta operación",
+            )
+        return payload
+
+    return verificar_permisos
+
 
 # Error handling middleware
 class ErrorHandlerMiddleware(BaseHTTPMiddleware):
@@ -0,0 +1,14 @@
+"""
+Menu-related enumerations.
+"""
+
+from enum import Enum
+
+
+class EntidadMenu(str, Enum):
+    """Menu entities tracked by the change log."""
+    CATEGORIA = "categoria"
+    PRODUCTO = "producto"
+    TIPO_OPCION = "tipo_opcion"
+    ALERGENO = "alergeno"
+    MENU = "menu"  # Cambio masivo: los clientes deben recargar el menú completo
@@ -10,4 +10,17 @@ class RoleName(str, Enum):
     CLIENTE = "cliente"
     MESERO = "mesero"
     COCINA = "cocina"
-    ADMIN = "admin"
\ No newline at end of file
+    ADMIN = "admin"
+
+class Permiso(str, Enum):
+    """Permissions that can be granted to a role."""
+    MENU_GESTIONAR = "menu:gestionar"
+    MESAS_VER = "mesas:ver"
+    MESAS_GESTIONAR = "mesas:gestionar"
+    PEDIDOS_CREAR = "pedidos:crear"
+    PEDIDOS_VER = "pedidos:ver"
+    COCINA_GESTIONAR = "cocina:gestionar"
+    PAGOS_REGISTRAR = "pagos:registrar"
+    PAGOS_GESTIONAR = "pagos:gestionar"
+    ROLES_GESTIONAR = "roles:gestionar"
+    USUARIOS_GESTIONAR = "usuarios:gestionar"
@@ -0,0 +1,186 @@
+"""
+Carga de los routers bajo demanda para acelerar el arranque.
+
+Importar un controlador arrastra su servicio, repositorios, esquemas y
+modelos; importarlos todos al arrancar retrasa la primera respuesta tras
+un arranque en frío. ``CargadorRouters`` conoce el prefijo de cada
+controlador sin importarlo y ``LazyRouterMiddleware`` lo importa y
+registra con la primera petición que llega a ese prefijo. La
+documentación OpenAPI necesita todas las rutas, así que al pedirla se
+cargan todos, salvo que exista un esquema ya generado en disco.
+"""
+
+import importlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+from fastapi import APIRouter, FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# (módulo, tag, prefijo del router dentro del módulo)
+Controlador = Tuple[str, str, str]
+
+
+class CargadorRouters:
+    """
+    Registra los routers de los controladores en la aplicación, al vuelo o todos a la vez.
+
+    Attributes
+    ----------
+    app : FastAPI
+        Aplicación en la que se registran los routers.
+    controladores : Tuple[Controlador, ...]
+        Módulo, tag y prefijo de cada controlador.
+    api_prefix : str
+        Prefijo común de todas las rutas (por ejemplo "/v1").
+    cargados : Set[str]
+        Módulos ya procesados, con o sin éxito.
+    """
+
+    def __init__(self, app: FastAPI, controladores: Sequence[Controlador], api_prefix: str):
+        """
+        Inicializa el cargador sin importar ningún controlador.
+
+        Parameters
+        ----------
+        app : FastAPI
+            Aplicación en la que se registran los routers.
+        controladores : Sequence[Controlador]
+            Módulo, tag y prefijo de cada controlador.
+        api_prefix : str
+            Prefijo común de todas las rutas.
+        """
+        self.app = app
+        self.controladores = tuple(controladores)
+        self.api_prefix = api_prefix
+        self.cargados: Set[str] = set()
+
+    def cargar(self, module_name: str, tag: str) -> bool:
+        """
+        Importa un controlador y registra su router.
+
+        Un controlador que no se puede importar se registra en el log y no
+        se vuelve a intentar, igual que en el registro al arrancar.
+
+        Parameters
+        ----------
+        module_name : str
+            Módulo del controlador.
+        tag : str
+            Tag de sus rutas en la documentación.
+
+        Returns
+        -------
+        bool
+            True si el router se registró en esta llamada.
+        """
+        if module_name in self.cargados:
+            return False
+        self.cargados.add(module_name)
+
+        try:
+            module = importlib.import_module(module_name)
+            router = getattr(module, "router", None)
+
+            if router and isinstance(router, APIRouter):
+                self.app.include_router(router, prefix=self.api_prefix, tags=[tag])
+                logger.info(f"Router '{tag}' registrado correctamente")
+                return True
+            logger.warning(f"No se encontró un router válido en {module_name}")
+        except Exception as e:
+            logger.error(f"Error al cargar el controlador {module_name}: {e}")
+        return False
+
+    def cargar_todos(self) -> None:
+        """Registra todos los routers que aún no se cargaron."""
+        for module_name, tag, _ in self.controladores:
+            self.cargar(module_name, tag)
+
+    def cargar_para(self, ruta: str) -> None:
+        """
+        Registra el router cuyo prefijo corresponde a una ruta.
+
+        Parameters
+        ----------
+        ruta : str
+            Ruta de la petición, sin el ``root_path`` de la aplicación.
+        """
+        for module_name, tag, prefijo in self.controladores:
+            completo = f"{self.api_prefix}{prefijo}"
+            if ruta == completo or ruta.startswith(completo + "/"):
+                self.cargar(module_name, tag)
+                return
+
+
+class LazyRouterMiddleware:
+    """
+    Middleware ASGI que registra el router de cada petición antes de enrutarla.
+
+    Tras la primera petición de cada prefijo solo cuesta una comprobación
+    en un set por petición.
+
+    Attributes
+    ----------
+    app : ASGIApp
+        Aplicación envuelta.
+    cargador : CargadorRouters
+        Cargador de los routers pendientes.
+    """
+
+    def __init__(self, app: ASGIApp, cargador: CargadorRouters):
+        """
+        Inicializa el middleware.
+
+        Parameters
+        ----------
+        app : ASGIApp
+            Aplicación envuelta.
+        cargador : CargadorRouters
+            Cargador de los routers pendientes.
+        """
+        self.app = app
+        self.cargador = cargador
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and len(self.cargador.cargados) < len(
+            self.cargador.controladores
+        ):
+            ruta = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and ruta.startswith(root_path):
+                ruta = ruta[len(root_path):]
+            self.cargador.cargar_para(ruta)
+        await self.app(scope, receive, send)
+
+
+def leer_openapi_cache(ruta: Optional[str], version: str) -> Optional[Dict[str, Any]]:
+    """
+    Lee un esquema OpenAPI generado de antemano.
+
+    Parameters
+    ----------
+    ruta : Optional[str]
+        Fichero del esquema; None si no hay caché configurada.
+    version : str
+        Versión de la aplicación; un esquema de otra versión se ignora.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        El esquema, o None si no existe, no se puede leer o es de otra versión.
+    """
+    if not ruta:
+        return None
+    try:
+        esquema = json.loads(Path(ruta).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.info(f"Esquema OpenAPI en caché no disponible ({ruta}): {e}")
+        return None
+    if esquema.get("info", {}).get("version") != version:
+        logger.info(f"Esquema OpenAPI en caché de otra versión ignorado: {ruta}")
+        return None
+    return esquema
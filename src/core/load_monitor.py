@@ -0,0 +1,192 @@
+"""
+Medición de la carga del worker para descartar peticiones prescindibles.
+
+Se vigilan dos señales:
+
+- el retraso del bucle de eventos: una tarea duerme un intervalo fijo y
+  mide cuánto tarda de más en despertar;
+- la espera para obtener una conexión del pool de la base de datos,
+  medida por ``PoolMedido`` en cada checkout.
+
+Cuando alguna supera su umbral, ``MonitorCarga.probabilidad_descarte``
+crece de forma proporcional al exceso, para que el middleware rechace
+una fracción creciente de las peticiones públicas y la toma de pedidos
+conserve su latencia.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class MonitorCarga:
+    """
+    Señales de sobrecarga del worker, suavizadas con una media exponencial.
+
+    Attributes
+    ----------
+    umbral_retraso : float
+        Retraso del bucle de eventos, en segundos, a partir del cual se descarta.
+    umbral_espera_pool : float
+        Espera por una conexión, en segundos, a partir de la cual se descarta.
+    intervalo : float
+        Cada cuánto se mide el retraso del bucle, en segundos.
+    retraso_bucle : float
+        Retraso medio reciente del bucle de eventos.
+    espera_pool : float
+        Espera media reciente por una conexión del pool.
+    """
+
+    def __init__(
+        self,
+        umbral_retraso: float = 0.2,
+        umbral_espera_pool: float = 0.5,
+        intervalo: float = 0.25,
+        suavizado: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa el monitor sin carga.
+
+        Parameters
+        ----------
+        umbral_retraso : float, optional
+            Umbral del retraso del bucle en segundos, por defecto 0.2.
+        umbral_espera_pool : float, optional
+            Umbral de la espera por conexión en segundos, por defecto 0.5.
+        intervalo : float, optional
+            Intervalo de medición del bucle en segundos, por defecto 0.25.
+        suavizado : float, optional
+            Peso de cada medida nueva en la media, entre 0 y 1, por defecto 0.3.
+        clock : Callable[[], float], optional
+            Reloj monotónico; inyectable para pruebas.
+        """
+        self.umbral_retraso = umbral_retraso
+        self.umbral_espera_pool = umbral_espera_pool
+        self.intervalo = intervalo
+        self._suavizado = suavizado
+        self._clock = clock
+        self.retraso_bucle = 0.0
+        self.espera_pool = 0.0
+        self._checkouts_intervalo = 0
+        self._tarea: Optional[asyncio.Task] = None
+
+    def _media(self, actual: float, medida: float) -> float:
+        """Media exponencial: reacciona a los picos sin saltar con cada medida aislada."""
+        return actual + self._suavizado * (medida - actual)
+
+    def registrar_retraso(self, segundos: float) -> None:
+        """
+        Registra una medida del retraso del bucle de eventos.
+
+        Parameters
+        ----------
+        segundos : float
+            Tiempo que tardó de más en despertar la tarea de medición.
+        """
+        self.retraso_bucle = self._media(self.retraso_bucle, max(0.0, segundos))
+
+    def registrar_espera_pool(self, segundos: float) -> None:
+        """
+        Registra lo que tardó una petición en obtener una conexión.
+
+        Parameters
+        ----------
+        segundos : float
+            Duración del checkout del pool.
+        """
+        self.espera_pool = self._media(self.espera_pool, max(0.0, segundos))
+        self._checkouts_intervalo += 1
+
+    def cerrar_intervalo(self) -> None:
+        """
+        Cierra un intervalo de medición de la espera del pool.
+
+        Si en el intervalo no se obtuvo ninguna conexión, la espera media
+        decae como si se hubiese medido 0. Sin esto, con el descarte al
+        máximo las peticiones públicas dejan de usar el pool y la señal
+        quedaría fija hasta que otra petición obtuviese una conexión.
+        """
+        if self._checkouts_intervalo == 0:
+            self.espera_pool = self._media(self.espera_pool, 0.0)
+        self._checkouts_intervalo = 0
+
+    def probabilidad_descarte(self) -> float:
+        """
+        Calcula la fracción de peticiones prescindibles que se deben rechazar.
+
+        Returns
+        -------
+        float
+            0 por debajo de los umbrales; crece linealmente con el exceso
+            y llega a 1 cuando una señal duplica su umbral.
+        """
+        exceso = max(
+            (self.retraso_bucle - self.umbral_retraso) / self.umbral_retraso,
+            (self.espera_pool - self.umbral_espera_pool) / self.umbral_espera_pool,
+        )
+        return min(1.0, max(0.0, exceso))
+
+    async def _medir_bucle(self) -> None:
+        """Mide periódicamente el retraso del bucle de eventos y cierra el intervalo del pool."""
+        while True:
+            inicio = self._clock()
+            await asyncio.sleep(self.intervalo)
+            self.registrar_retraso(self._clock() - inicio - self.intervalo)
+            self.cerrar_intervalo()
+
+    async def iniciar(self) -> None:
+        """Arranca la medición del retraso del bucle de eventos."""
+        if self._tarea is None:
+            self._tarea = asyncio.create_task(self._medir_bucle())
+
+    async def detener(self) -> None:
+        """Detiene la medición del retraso del bucle de eventos."""
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+
+
+class PoolMedido(AsyncAdaptedQueuePool):
+    """Pool de conexiones que informa al monitor de carga de cada espera."""
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            get_monitor_carga().registrar_espera_pool(time.perf_counter() - inicio)
+
+
+# Instancia única del monitor de carga (patrón singleton)
+_monitor_carga: Optional[MonitorCarga] = None
+
+
+def get_monitor_carga() -> MonitorCarga:
+    """
+    Obtiene o crea el monitor de carga con los umbrales configurados.
+
+    Returns
+    -------
+    MonitorCarga
+        Monitor compartido por todo el worker.
+    """
+    global _monitor_carga
+    if _monitor_carga is None:
+        settings = get_settings()
+        _monitor_carga = MonitorCarga(
+            umbral_retraso=settings.load_shedding_loop_lag,
+            umbral_espera_pool=settings.load_shedding_pool_wait,
+        )
+    return _monitor_carga
@@ -0,0 +1,5 @@
+"""
+Migraciones versionadas del esquema de la base de datos.
+
+``runner`` aplica las migraciones pendientes y ``versions`` las define.
+"""
@@ -0,0 +1,321 @@
+"""
+Aplicación de las migraciones del esquema al arrancar.
+
+La versión del esquema se guarda en la tabla ``esquema_version``, con una
+fila por migración aplicada. En cada arranque:
+
+1. Se lee la versión con una sola consulta. Si ya es la última, no se
+   hace nada más: ni reflexión de tablas ni DDL (camino rápido).
+2. Si no, el worker toma un bloqueo consultivo para que, cuando varios
+   arrancan a la vez, solo uno migre y el resto espere:
+
+   - PostgreSQL: ``pg_try_advisory_lock``;
+   - MySQL: ``GET_LOCK``;
+   - SQLite en fichero: un fichero de bloqueo junto a la base de datos;
+   - SQLite en memoria: sin bloqueo, solo la ve este proceso.
+
+3. Con el bloqueo tomado vuelve a leer la versión (otro worker pudo
+   migrar mientras esperaba) y aplica las pendientes en orden, cada una
+   en su transacción junto con el registro de su versión.
+
+En MySQL el DDL confirma la transacción implícitamente, así que las
+migraciones comprueban lo que ya existe antes de cambiarlo y se pueden
+repetir si una falla a medias.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Clave del bloqueo consultivo (PostgreSQL usa un entero, MySQL un nombre)
+CLAVE_BLOQUEO = 7_311_946_020
+NOMBRE_BLOQUEO = "restaurant_backend_migraciones"
+
+esquema_version = Table(
+    "esquema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("descripcion", String(255), nullable=False),
+    Column("aplicada_en", DateTime, nullable=False),
+)
+
+
+class MigracionError(RuntimeError):
+    """No se pudo aplicar una migración o tomar el bloqueo de migraciones."""
+
+
+@dataclass(frozen=True)
+class Migracion:
+    """Cambio del esquema identificado por una versión creciente.
+
+    Attributes
+    ----------
+    version : int
+        Versión del esquema tras aplicarla.
+    descripcion : str
+        Resumen del cambio; se guarda en ``esquema_version``.
+    aplicar : Callable[[AsyncConnection], Awaitable[None]]
+        Aplica el cambio en una conexión con una transacción abierta.
+    """
+
+    version: int
+    descripcion: str
+    aplicar: Callable[[AsyncConnection], Awaitable[None]]
+
+
+async def version_actual(engine: AsyncEngine) -> int:
+    """
+    Lee la versión del esquema.
+
+    Parameters
+    ----------
+    engine : AsyncEngine
+        Motor de la base de datos.
+
+    Returns
+    -------
+    int
+        Última versión aplicada; 0 si la tabla de versiones no existe o está vacía.
+    """
+    try:
+        # Conexión propia: en PostgreSQL una consulta fallida anula su transacción
+        async with engine.connect() as conn:
+            version = await conn.scalar(select(func.max(esquema_version.c.version)))
+    except DBAPIError:
+        return 0
+    return version or 0
+
+
+class BloqueoMigraciones:
+    """
+    Bloqueo entre procesos para que un solo worker aplique las migraciones.
+
+    Attributes
+    ----------
+    engine : AsyncEngine
+        Motor de la base de datos a migrar.
+    espera : float
+        Segundos que se espera el bloqueo antes de fallar.
+    intervalo : float
+        Segundos entre intentos.
+    abandono : float
+        En SQLite, antigüedad a partir de la cual un fichero de bloqueo se
+        considera de un proceso que murió migrando y se elimina.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        espera: float = 60.0,
+        intervalo: float = 0.5,
+        abandono: float = 600.0,
+    ):
+        """
+        Inicializa el bloqueo sin tomarlo.
+
+        Parameters
+        ----------
+        engine : AsyncEngine
+            Motor de la base de datos a migrar.
+        espera : float, optional
+            Segundos máximos de espera, por defecto 60.
+        intervalo : float, optional
+            Segundos entre intentos, por defecto 0.5.
+        abandono : float, optional
+            Antigüedad en segundos de un fichero de bloqueo abandonado, por defecto 600.
+        """
+        self.engine = engine
+        self.espera = espera
+        self.intervalo = intervalo
+        self.abandono = abandono
+        self._conn: Optional[AsyncConnection] = None
+        self._fichero: Optional[str] = None
+        self._fichero_propio = False
+
+    @property
+    def dialecto(self) -> str:
+        """Nombre del dialecto SQL del motor."""
+        return self.engine.dialect.name
+
+    def _ruta_fichero(self) -> Optional[str]:
+        """Fichero de bloqueo de SQLite; None para bases en memoria."""
+        database = self.engine.url.database
+        if not database or database == ":memory:" or database.startswith("file::memory:"):
+            return None
+        return f"{database}.migraciones.lock"
+
+    async def _intentar(self) -> bool:
+        """Intenta tomar el bloqueo una vez, sin esperar."""
+        if self.dialecto == "postgresql":
+            return bool(await self._conn.scalar(
+                text("SELECT pg_try_advisory_lock(:clave)"), {"clave": CLAVE_BLOQUEO}
+            ))
+        if self.dialecto in ("mysql", "mariadb"):
+            return await self._conn.scalar(
+                text("SELECT GET_LOCK(:nombre, 0)"), {"nombre": NOMBRE_BLOQUEO}
+            ) == 1
+
+        try:
+            descriptor = os.open(self._fichero, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                abandonado = time.time() - os.path.getmtime(self._fichero) > self.abandono
+            except FileNotFoundError:
+                return False
+            if abandonado:
+                logger.warning(f"Fichero de bloqueo de migraciones abandonado: {self._fichero}")
+                os.remove(self._fichero)
+            return False
+        os.write(descriptor, str(os.getpid()).encode())
+        os.close(descriptor)
+        self._fichero_propio = True
+        return True
+
+    async def adquirir(self) -> None:
+        """
+        Espera hasta tomar el bloqueo.
+
+        Raises
+        ------
+        MigracionError
+            Si no se obtiene en ``espera`` segundos.
+        """
+        if self.dialecto in ("postgresql", "mysql", "mariadb"):
+            # Los bloqueos consultivos pertenecen a la sesión: se mantiene la conexión
+            self._conn = await self.engine.connect()
+        elif self.dialecto == "sqlite":
+            self._fichero = self._ruta_fichero()
+            if self._fichero is None:
+                return
+        else:
+            logger.warning(f"Dialecto {self.dialecto} sin bloqueo de migraciones")
+            return
+
+        limite = time.monotonic() + self.espera
+        while not await self._intentar():
+            if time.monotonic() >= limite:
+                await self.liberar()
+                raise MigracionError(
+                    f"No se obtuvo el bloqueo de migraciones en {self.espera} segundos"
+                )
+            await asyncio.sleep(self.intervalo)
+
+    async def liberar(self) -> None:
+        """Suelta el bloqueo si se tomó."""
+        if self._conn is not None:
+            try:
+                if self.dialecto == "postgresql":
+                    await self._conn.execute(
+                        text("SELECT pg_advisory_unlock(:clave)"), {"clave": CLAVE_BLOQUEO}
+                    )
+                else:
+                    await self._conn.execute(
+                        text("SELECT RELEASE_LOCK(:nombre)"), {"nombre": NOMBRE_BLOQUEO}
+                    )
+            finally:
+                await self._conn.close()
+                self._conn = None
+        if self._fichero_propio:
+            try:
+                os.remove(self._fichero)
+            except FileNotFoundError:
+                pass
+            self._fichero_propio = False
+        self._fichero = None
+
+
+@asynccontextmanager
+async def bloqueo_migraciones(engine: AsyncEngine, espera: float = 60.0) -> AsyncIterator[None]:
+    """
+    Mantiene el bloqueo de migraciones durante el bloque ``async with``.
+
+    Parameters
+    ----------
+    engine : AsyncEngine
+        Motor de la base de datos a migrar.
+    espera : float, optional
+        Segundos máximos de espera por el bloqueo, por defecto 60.
+    """
+    bloqueo = BloqueoMigraciones(engine, espera)
+    await bloqueo.adquirir()
+    try:
+        yield
+    finally:
+        await bloqueo.liberar()
+
+
+async def aplicar_migraciones(
+    engine: AsyncEngine,
+    migraciones: Optional[Sequence[Migracion]] = None,
+    espera: float = 60.0,
+) -> int:
+    """
+    Lleva el esquema a la última versión.
+
+    Parameters
+    ----------
+    engine : AsyncEngine
+        Motor de la base de datos a migrar.
+    migraciones : Optional[Sequence[Migracion]], optional
+        Migraciones en orden de versión; por defecto las de ``versions``.
+    espera : float, optional
+        Segundos máximos de espera por el bloqueo, por defecto 60.
+
+    Returns
+    -------
+    int
+        Número de migraciones aplicadas por este proceso.
+
+    Raises
+    ------
+    MigracionError
+        Si no se obtiene el bloqueo o falla una migración.
+    """
+    if migraciones is None:
+        from src.core.migrations.versions import MIGRACIONES
+        migraciones = MIGRACIONES
+    if not migraciones:
+        return 0
+
+    ultima = migraciones[-1].version
+    if await version_actual(engine) >= ultima:
+        return 0
+
+    async with bloqueo_migraciones(engine, espera):
+        async with engine.begin() as conn:
+            await conn.run_sync(esquema_version.create, checkfirst=True)
+
+        actual = await version_actual(engine)
+        aplicadas = 0
+        for migracion in migraciones:
+            if migracion.version <= actual:
+                continue
+            logger.info(f"Aplicando migración {migracion.version}: {migracion.descripcion}")
+            try:
+                async with engine.begin() as conn:
+                    await migracion.aplicar(conn)
+                    await conn.execute(insert(esquema_version).values(
+                        version=migracion.version,
+                        descripcion=migracion.descripcion,
+                        aplicada_en=datetime.utcnow(),
+                    ))
+            except Exception as e:
+                raise MigracionError(
+                    f"Falló la migración {migracion.version} ({migracion.descripcion}): {e}"
+                ) from e
+            aplicadas += 1
+
+    if aplicadas:
+        logger.info(f"Esquema actualizado a la versión {ultima}")
+    return aplicadas
@@ -0,0 +1,193 @@
+"""
+Migraciones del esquema, en orden de versión.
+
+La versión 1 crea las tablas que falten a partir de los modelos; en una
+base de datos nueva deja el esquema completo y las siguientes no tienen
+nada que hacer. Las demás recogen los cambios que antes se aplicaban con
+scripts sueltos en ``scripts/``, para las bases de datos creadas antes
+de cada cambio. Todas comprueban lo que ya existe mediante el inspector
+de SQLAlchemy, que funciona igual en SQLite, MySQL y PostgreSQL, y
+generan el DDL con el dialecto de la conexión.
+
+Para cambiar el esquema se actualiza el modelo y se añade al final de
+``MIGRACIONES`` una migración con la versión siguiente.
+"""
+
+from typing import List, Sequence, Set
+
+from sqlalchemy import BigInteger, Column, Integer, JSON, SmallInteger, String, inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.schema import CreateColumn
+
+from src.core.migrations.runner import Migracion
+
+
+async def _columnas(conn: AsyncConnection, tabla: str) -> Set[str]:
+    """Nombres de las columnas de una tabla."""
+    return await conn.run_sync(
+        lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns(tabla)}
+    )
+
+
+async def _agregar_columna(conn: AsyncConnection, tabla: str, columna: Column) -> bool:
+    """
+    Agrega una columna si no existe.
+
+    Parameters
+    ----------
+    conn : AsyncConnection
+        Conexión con la transacción de la migración.
+    tabla : str
+        Tabla a modificar.
+    columna : Column
+        Definición de la columna; el DDL se genera con el dialecto de la conexión.
+
+    Returns
+    -------
+    bool
+        True si la columna se agregó; False si ya existía.
+    """
+    if columna.name in await _columnas(conn, tabla):
+        return False
+    preparer = conn.dialect.identifier_preparer
+    definicion = CreateColumn(columna).compile(dialect=conn.dialect)
+    await conn.execute(text(f"ALTER TABLE {preparer.quote(tabla)} ADD COLUMN {definicion}"))
+    return True
+
+
+async def _crear_indice(
+    conn: AsyncConnection, nombre: str, tabla: str, columnas: Sequence[str], unico: bool = False
+) -> None:
+    """Crea un índice si no existe otro con el mismo nombre."""
+    existentes = await conn.run_sync(
+        lambda sync_conn: {i["name"] for i in inspect(sync_conn).get_indexes(tabla)}
+    )
+    if nombre in existentes:
+        return
+    preparer = conn.dialect.identifier_preparer
+    lista = ", ".join(preparer.quote(c) for c in columnas)
+    await conn.execute(text(
+        f"CREATE {'UNIQUE ' if unico else ''}INDEX {preparer.quote(nombre)} "
+        f"ON {preparer.quote(tabla)} ({lista})"
+    ))
+
+
+async def crear_tablas(conn: AsyncConnection) -> None:
+    """Crea las tablas de los modelos que aún no existen."""
+    from src.core.database import register_models
+    from src.models.base_model import BaseModel
+
+    register_models()
+    await conn.run_sync(BaseModel.metadata.create_all)
+
+
+async def limites_seleccion(conn: AsyncConnection) -> None:
+    """Agrega los límites de selección a tipo_opcion y los ajusta según el nombre."""
+    agregada = await _agregar_columna(
+        conn, "tipo_opcion", Column("seleccion_minima", Integer, nullable=False, server_default="0")
+    )
+    await _agregar_columna(conn, "tipo_opcion", Column("seleccion_maxima", Integer, nullable=True))
+    if not agregada:
+        return
+
+    # (mínimo, máximo, condición sobre el nombre del tipo)
+    limites = [
+        (1, 1, "LOWER(nombre) LIKE '%tamaño%' OR LOWER(nombre) LIKE '%tamano%'"),
+        (0, 1, "LOWER(nombre) LIKE '%picante%' OR LOWER(nombre) LIKE '%ají%' "
+               "OR LOWER(nombre) LIKE '%aji%'"),
+        (0, None, "LOWER(nombre) LIKE '%extra%' OR LOWER(nombre) LIKE '%adicional%' "
+                  "OR LOWER(nombre) LIKE '%agregado%'"),
+        (0, 3, "LOWER(nombre) LIKE '%acompañamiento%' OR LOWER(nombre) LIKE '%acompanamiento%'"),
+    ]
+    for minimo, maximo, condicion in limites:
+        await conn.execute(
+            text(f"UPDATE tipo_opcion SET seleccion_minima = :minimo, "
+                 f"seleccion_maxima = :maximo WHERE {condicion}"),
+            {"minimo": minimo, "maximo": maximo},
+        )
+
+
+async def mascaras_alergenos(conn: AsyncConnection) -> None:
+    """Agrega las máscaras de alérgenos precalculadas y las calcula para todo el catálogo."""
+    from src.repositories.menu.producto_alergeno_repository import ProductoAlergenoRepository
+
+    if await _agregar_columna(conn, "alergeno", Column("bit_index", SmallInteger, nullable=True)):
+        await _crear_indice(conn, "uq_alergeno_bit_index", "alergeno", ["bit_index"], unico=True)
+
+    agregadas: List[bool] = []
+    for nombre in ("contiene", "trazas", "puede_contener"):
+        agregadas.append(await _agregar_columna(conn, "producto", Column(
+            f"mascara_alergenos_{nombre}", BigInteger, nullable=False, server_default="0"
+        )))
+
+    if any(agregadas):
+        # La sesión se une a la transacción de la migración: su commit no la cierra
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        try:
+            await ProductoAlergenoRepository(session).recalcular_mascaras()
+        finally:
+            await session.close()
+
+
+async def version_mesas(conn: AsyncConnection) -> None:
+    """Agrega la versión de las mesas para el control de concurrencia optimista."""
+    await _agregar_columna(
+        conn, "mesas", Column("version", Integer, nullable=False, server_default="1")
+    )
+
+
+async def estaciones_cocina(conn: AsyncConnection) -> None:
+    """Agrega la estación de cocina a categorías e ítems y el estado de preparación."""
+    for tabla in ("categoria", "pedido_item"):
+        await _agregar_columna(
+            conn, tabla, Column("estacion", String(50), nullable=False, server_default="cocina")
+        )
+    await _agregar_columna(
+        conn, "pedido_item", Column("estado", String(14), nullable=False, server_default="PENDIENTE")
+    )
+    await _crear_indice(conn, "idx_pedido_item_estado", "pedido_item", ["estado"])
+
+
+async def permisos_roles(conn: AsyncConnection) -> None:
+    """Agrega los permisos configurables de los roles."""
+    await _agregar_columna(conn, "rol", Column("permisos", JSON, nullable=True))
+
+
+async def version_menu(conn: AsyncConnection) -> None:
+    """
+    Crea el contador de versiones del menú y versiona el registro de cambios.
+
+    Hasta ahora la versión era el identificador de cada cambio; los cambios
+    existentes conservan ese valor y el contador parte del mayor.
+    """
+    from src.models.menu.menu_version_model import ID_VERSION_MENU, MenuVersionModel
+
+    await conn.run_sync(
+        lambda sync_conn: MenuVersionModel.__table__.create(sync_conn, checkfirst=True)
+    )
+    if await _agregar_columna(
+        conn, "menu_cambio", Column("version", Integer, nullable=False, server_default="0")
+    ):
+        await conn.execute(text("UPDATE menu_cambio SET version = id"))
+    await _crear_indice(conn, "idx_menu_cambio_version", "menu_cambio", ["version"])
+
+    existe = await conn.scalar(
+        text("SELECT COUNT(*) FROM menu_version WHERE id = :id"), {"id": ID_VERSION_MENU}
+    )
+    if not existe:
+        await conn.execute(
+            text("INSERT INTO menu_version (id, version) "
+                 "SELECT :id, COALESCE(MAX(version), 0) FROM menu_cambio"),
+            {"id": ID_VERSION_MENU},
+        )
+
+
+MIGRACIONES: List[Migracion] = [
+    Migracion(1, "Esquema inicial", crear_tablas),
+    Migracion(2, "Límites de selección en tipo_opcion", limites_seleccion),
+    Migracion(3, "Máscaras de alérgenos en producto", mascaras_alergenos),
+    Migracion(4, "Versión de mesas", version_mesas),
+    Migracion(5, "Estaciones de cocina", estaciones_cocina),
+    Migracion(6, "Permisos de roles", permisos_roles),
+    Migracion(7, "Versión del menú", version_menu),
+]
@@ -0,0 +1,427 @@
+"""
+Limitación de peticiones y descarte por sobrecarga de los endpoints públicos.
+
+Los endpoints que usan los clientes al escanear el QR de una mesa (carta,
+carrito, sincronización) son accesibles para cualquiera. Cada regla
+limita sus rutas con una cubeta de tokens por regla y dirección IP del
+cliente: admite ráfagas de ``capacidad`` peticiones y después ``tasa``
+por segundo. La mesa no forma parte de la clave: la indica el propio
+cliente, y cambiarla en cada petición le daría una cubeta llena nueva.
+Hay dos backends:
+
+- ``memory``: cubetas en el propio proceso; cada worker limita por su cuenta.
+- ``redis``: cubetas compartidas por todos los workers, actualizadas con
+  un script Lua atómico. Requiere el paquete opcional ``redis``; si Redis
+  falla, las peticiones se dejan pasar.
+
+Además, cuando el monitor de carga detecta retraso en el bucle de eventos
+o esperas en el pool de la base de datos, se rechaza con 503 una fracción
+de esas peticiones para que la toma de pedidos conserve su latencia.
+"""
+
+import logging
+import math
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, FrozenSet, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import Settings, get_settings
+from src.core.load_monitor import MonitorCarga, get_monitor_carga
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - depende del entorno
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReglaLimite:
+    """Límite aplicado a un grupo de rutas.
+
+    Attributes
+    ----------
+    nombre : str
+        Identifica la regla en las claves de las cubetas.
+    prefijo : str
+        Prefijo de las rutas afectadas, sin el ``root_path`` de la aplicación.
+    capacidad : int
+        Peticiones admitidas en ráfaga.
+    tasa : float
+        Peticiones por segundo admitidas de forma sostenida.
+    metodos : FrozenSet[str]
+        Métodos HTTP afectados; vacío para todos.
+    """
+
+    nombre: str
+    prefijo: str
+    capacidad: int
+    tasa: float
+    metodos: FrozenSet[str] = frozenset()
+
+    def aplica(self, metodo: str, ruta: str) -> bool:
+        """Indica si la regla limita la petición."""
+        return ruta.startswith(self.prefijo) and (not self.metodos or metodo in self.metodos)
+
+
+def reglas_publicas(settings: Settings) -> Tuple[ReglaLimite, ...]:
+    """
+    Construye las reglas de los endpoints públicos a partir de la configuración.
+
+    Parameters
+    ----------
+    settings : Settings
+        Configuración de la aplicación.
+
+    Returns
+    -------
+    Tuple[ReglaLimite, ...]
+        Reglas en orden de evaluación; se aplica la primera que coincide.
+    """
+    rafaga = settings.rate_limit_public_burst
+    tasa = settings.rate_limit_public_per_second
+    return (
+        ReglaLimite(
+            "sync", "/v1/sync", settings.rate_limit_sync_burst, settings.rate_limit_sync_per_second
+        ),
+        ReglaLimite("productos", "/v1/productos", rafaga, tasa, frozenset({"GET"})),
+        ReglaLimite("menu", "/v1/menu", rafaga, tasa, frozenset({"GET"})),
+        ReglaLimite("carrito", "/v1/carrito", rafaga, tasa),
+    )
+
+
+class LimitadorMemoria:
+    """
+    Cubetas de tokens en memoria del proceso.
+
+    Se guardan como mucho ``maxsize`` cubetas; al superarlo se olvida la
+    usada hace más tiempo, que en el peor caso vuelve a empezar llena.
+
+    Attributes
+    ----------
+    maxsize : int
+        Número máximo de cubetas.
+    """
+
+    def __init__(self, maxsize: int = 100000, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el limitador sin cubetas.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Número máximo de cubetas, por defecto 100000.
+        clock : Callable[[], float], optional
+            Reloj monotónico; inyectable para pruebas.
+        """
+        self.maxsize = maxsize
+        self._clock = clock
+        self._cubetas: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consumir(self, clave: str, capacidad: int, tasa: float) -> float:
+        """
+        Intenta consumir un token de la cubeta.
+
+        Parameters
+        ----------
+        clave : str
+            Identifica la cubeta.
+        capacidad : int
+            Tokens máximos de la cubeta.
+        tasa : float
+            Tokens que se reponen por segundo.
+
+        Returns
+        -------
+        float
+            0 si se admite la petición; si no, segundos hasta que haya un token.
+        """
+        ahora = self._clock()
+        cubeta = self._cubetas.pop(clave, None)
+        if cubeta is None:
+            tokens = float(capacidad)
+        else:
+            tokens, ultimo = cubeta
+            tokens = min(float(capacidad), tokens + (ahora - ultimo) * tasa)
+
+        espera = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            espera = (1 - tokens) / tasa
+
+        self._cubetas[clave] = (tokens, ahora)
+        while len(self._cubetas) > self.maxsize:
+            self._cubetas.popitem(last=False)
+        return espera
+
+
+# Repone y consume la cubeta en una sola operación atómica de Redis
+_SCRIPT_CUBETA = """
+local capacidad = tonumber(ARGV[1])
+local tasa = tonumber(ARGV[2])
+local ahora = tonumber(ARGV[3])
+local datos = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(datos[1])
+local ts = tonumber(datos[2])
+if tokens == nil then
+    tokens = capacidad
+    ts = ahora
+end
+tokens = math.min(capacidad, tokens + math.max(0, ahora - ts) * tasa)
+local espera = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    espera = (1 - tokens) / tasa
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', ahora)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacidad / tasa * 1000) + 1000)
+return tostring(espera)
+"""
+
+
+class LimitadorRedis:
+    """
+    Cubetas de tokens compartidas por todos los workers en Redis.
+
+    Attributes
+    ----------
+    cliente : Any
+        Cliente asíncrono de Redis (``redis.asyncio.Redis`` o compatible).
+    prefijo : str
+        Prefijo de las claves de Redis.
+    """
+
+    def __init__(self, cliente: Any, prefijo: str = "restaurant:limite:"):
+        """
+        Inicializa el limitador sobre un cliente de Redis.
+
+        Parameters
+        ----------
+        cliente : Any
+            Cliente asíncrono de Redis.
+        prefijo : str, optional
+            Prefijo de las claves de Redis, por defecto "restaurant:limite:".
+        """
+        self.cliente = cliente
+        self.prefijo = prefijo
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "LimitadorRedis":
+        """
+        Crea el limitador conectándose a la URL de Redis indicada.
+
+        Parameters
+        ----------
+        url : str
+            URL de conexión a Redis.
+
+        Returns
+        -------
+        LimitadorRedis
+            Limitador listo para usarse.
+
+        Raises
+        ------
+        RuntimeError
+            Si el paquete ``redis`` no está instalado.
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("El backend 'redis' del limitador requiere el paquete redis")
+        return cls(redis_asyncio.from_url(url), **kwargs)
+
+    async def consumir(self, clave: str, capacidad: int, tasa: float) -> float:
+        """
+        Intenta consumir un token de la cubeta compartida.
+
+        Parameters
+        ----------
+        clave : str
+            Identifica la cubeta.
+        capacidad : int
+            Tokens máximos de la cubeta.
+        tasa : float
+            Tokens que se reponen por segundo.
+
+        Returns
+        -------
+        float
+            0 si se admite la petición (también si Redis no responde); si
+            no, segundos hasta que haya un token.
+        """
+        try:
+            espera = await self.cliente.eval(
+                _SCRIPT_CUBETA, 1, f"{self.prefijo}{clave}", capacidad, tasa, time.time()
+            )
+        except Exception as e:
+            logger.warning("Limitador en Redis no disponible, se admite la petición: %s", e)
+            return 0.0
+        return float(espera)
+
+
+Limitador = Any
+
+
+# Instancia única del limitador (patrón singleton)
+_limitador: Optional[Limitador] = None
+
+
+def get_limitador() -> Limitador:
+    """
+    Obtiene o crea el limitador según ``Settings.rate_limit_backend``.
+
+    Returns
+    -------
+    Limitador
+        Limitador en memoria o sobre Redis.
+
+    Raises
+    ------
+    ValueError
+        Si el backend configurado no existe.
+    """
+    global _limitador
+    if _limitador is None:
+        settings = get_settings()
+        backend = settings.rate_limit_backend.lower()
+        if backend == "memory":
+            _limitador = LimitadorMemoria()
+        elif backend == "redis":
+            _limitador = LimitadorRedis.from_url(settings.redis_url)
+        else:
+            raise ValueError(f"Backend de limitador desconocido: {settings.rate_limit_backend}")
+    return _limitador
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que limita y, con sobrecarga, descarta peticiones públicas.
+
+    Las rutas sin regla no se tocan, así que los endpoints del personal y
+    la creación de pedidos nunca se limitan ni se descartan aquí.
+
+    Attributes
+    ----------
+    app : ASGIApp
+        Aplicación envuelta.
+    reglas : Sequence[ReglaLimite]
+        Reglas en orden de evaluación.
+    limitador : Limitador
+        Backend de las cubetas.
+    monitor : MonitorCarga
+        Señales de sobrecarga del worker.
+    confiar_forwarded : bool
+        Si se identifica al cliente por la cabecera X-Forwarded-For.
+    proxies_confiables : int
+        Proxies propios que añaden su entrada a X-Forwarded-For.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        reglas: Sequence[ReglaLimite],
+        limitador: Optional[Limitador] = None,
+        monitor: Optional[MonitorCarga] = None,
+        confiar_forwarded: bool = False,
+        proxies_confiables: int = 1,
+    ):
+        """
+        Inicializa el middleware.
+
+        Parameters
+        ----------
+        app : ASGIApp
+            Aplicación envuelta.
+        reglas : Sequence[ReglaLimite]
+            Reglas en orden de evaluación.
+        limitador : Optional[Limitador], optional
+            Backend de las cubetas. Por defecto ``get_limitador()``.
+        monitor : Optional[MonitorCarga], optional
+            Monitor de carga. Por defecto ``get_monitor_carga()``.
+        confiar_forwarded : bool, optional
+            Activarlo solo detrás de un proxy que fije X-Forwarded-For, por defecto False.
+        proxies_confiables : int, optional
+            Proxies propios delante de la aplicación, por defecto 1.
+        """
+        self.app = app
+        self.reglas = tuple(reglas)
+        self.limitador = limitador or get_limitador()
+        self.monitor = monitor or get_monitor_carga()
+        self.confiar_forwarded = confiar_forwarded
+        self.proxies_confiables = max(1, proxies_confiables)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        regla = self._regla(scope)
+        if regla is None:
+            await self.app(scope, receive, send)
+            return
+
+        if random.random() < self.monitor.probabilidad_descarte():
+            respuesta = JSONResponse(
+                {"detail": "Servicio sobrecargado, inténtelo de nuevo en unos segundos"},
+                status_code=503,
+                headers={"Retry-After": "1"},
+            )
+            await respuesta(scope, receive, send)
+            return
+
+        espera = await self.limitador.consumir(self._clave(regla, scope), regla.capacidad, regla.tasa)
+        if espera > 0:
+            respuesta = JSONResponse(
+                {"detail": "Demasiadas peticiones, inténtelo de nuevo más tarde"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, math.ceil(espera)))},
+            )
+            await respuesta(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _regla(self, scope: Scope) -> Optional[ReglaLimite]:
+        """Busca la primera regla que limita la petición."""
+        ruta = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and ruta.startswith(root_path):
+            ruta = ruta[len(root_path):]
+        for regla in self.reglas:
+            if regla.aplica(scope["method"], ruta):
+                return regla
+        return None
+
+    def _ip(self, scope: Scope) -> str:
+        """
+        Dirección IP del cliente.
+
+        Cada proxy añade a la derecha de X-Forwarded-For la dirección de
+        quien le conectó; las entradas de la izquierda las puede escribir
+        el cliente. Por eso se toma la entrada añadida por el primero de
+        los ``proxies_confiables``, contando desde la derecha.
+        """
+        cliente = scope.get("client")
+        ip = cliente[0] if cliente else "-"
+        if not self.confiar_forwarded:
+            return ip
+        entradas = [
+            e.strip()
+            for e in ",".join(Headers(scope=scope).getlist("x-forwarded-for")).split(",")
+            if e.strip()
+        ]
+        if len(entradas) >= self.proxies_confiables:
+            return entradas[-self.proxies_confiables]
+        return ip
+
+    def _clave(self, regla: ReglaLimite, scope: Scope) -> str:
+        """Identifica la cubeta por regla e IP del cliente."""
+        return f"{regla.nombre}:{self._ip(scope)}"
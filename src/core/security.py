@@ -2,22 +2,133 @@
 Security configuration for authentication and authorization.
 """
 
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 from jose import JWTError, jwt
+from jose.constants import ALGORITHMS
 from passlib.context import CryptContext
+from ulid import ULID
 
+from src.core.cache import TTLCache
 from src.core.config import get_settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Algorithms signed with a private key and verified with a public key (kid -> key)
+ASYMMETRIC_ALGORITHMS = frozenset(ALGORITHMS.RSA_DS | ALGORITHMS.EC_DS)
 
 
 class SecurityConfig:
-    """Security configuration class."""
+    """Security configuration class.
+
+    Tokens can be signed with the shared ``secret_key`` (HS*) or with an
+    asymmetric key (RS*/ES*). Asymmetric tokens carry a ``kid`` header that
+    selects the public key used to verify them, so keys can be rotated and
+    other services can verify tokens without holding any secret.
+
+    Verified tokens are remembered in a bounded per-worker cache keyed by
+    the SHA-256 of the token; an entry is only served until the token's own
+    ``exp``, so a cached token is never accepted after it expires. The cache
+    only covers the signature: revocation (logout, staff offboarding) is
+    checked on top of it by the token revocation list.
+
+    Password hashing is deliberately slow (100-300 ms per bcrypt call), so
+    async code must use the ``*_async`` variants: they run bcrypt in a small
+    dedicated thread pool, leaving the event loop free to serve other
+    requests while staff log in.
+    """
 
     def __init__(self):
         self.settings = get_settings()
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=self.settings.bcrypt_rounds,
+        )
+        self._password_executor: Optional[ThreadPoolExecutor] = None
+        self.algorithm = self.settings.algorithm
+        if self.algorithm not in ALGORITHMS.SUPPORTED:
+            raise ValueError(f"Unsupported JWT algorithm: {self.algorithm}")
+        self.public_keys: Dict[str, str] = dict(self.settings.jwt_public_keys)
+        self.private_key = self.settings.jwt_private_key
+        self.active_kid = self.settings.jwt_active_kid
+        # The TTL is only an upper bound; each entry also stops at its token's exp
+        self._token_cache: TTLCache[Tuple[float, dict]] = TTLCache(
+            maxsize=self.settings.token_cache_size,
+            ttl=self.settings.access_token_expire_minutes * 60,
+        )
+
+    @property
+    def is_asymmetric(self) -> bool:
+        """True if tokens are signed with a private key."""
+        return self.algorithm in ASYMMETRIC_ALGORITHMS
+
+    def configure_keys(
+        self,
+        public_keys: Dict[str, str],
+        active_kid: Optional[str] = None,
+        private_key: Optional[str] = None,
+    ) -> None:
+        """
+        Replace the asymmetric keys, e.g. after a key rotation.
+
+        The verified-token cache is cleared, so tokens signed with a key that
+        was removed stop being accepted immediately.
+
+        Args:
+            public_keys: Public keys (PEM) by kid
+            active_kid: kid of the key used to sign new tokens
+            private_key: Private key (PEM) matching ``active_kid``
+        """
+        self.public_keys = dict(public_keys)
+        self.active_kid = active_kid
+        self.private_key = private_key
+        self._token_cache.clear()
+
+    def _encode(self, claims: dict) -> str:
+        """
+        Sign claims with the configured algorithm and key.
+
+        Args:
+            claims: Claims to encode
+
+        Returns:
+            Encoded JWT token
+
+        Raises:
+            ValueError: If an asymmetric algorithm is configured without a private key
+        """
+        if not self.is_asymmetric:
+            return jwt.encode(claims, self.settings.secret_key, algorithm=self.algorithm)
+
+        if not self.private_key or not self.active_kid:
+            raise ValueError("Signing tokens requires jwt_private_key and jwt_active_kid")
+        return jwt.encode(
+            claims,
+            self.private_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid},
+        )
+
+    def _verification_key(self, token: str) -> Optional[str]:
+        """
+        Select the key that verifies a token.
+
+        Args:
+            token: JWT token
+
+        Returns:
+            The secret or public key, or None if the token's kid is unknown
+        """
+        if not self.is_asymmetric:
+            return self.settings.secret_key
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None and len(self.public_keys) == 1:
+            return next(iter(self.public_keys.values()))
+        return self.public_keys.get(kid)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -30,7 +141,7 @@ class SecurityConfig:
         Returns:
             True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return self.pwd_context.verify(plain_password, hashed_password)
 
     def get_password_hash(self, password: str) -> str:
         """
@@ -42,7 +153,86 @@ class SecurityConfig:
         Returns:
             Hashed password
         """
-        return pwd_context.hash(password)
+        return self.pwd_context.hash(password)
+
+    def _run_in_password_pool(self, func, *args):
+        """
+        Run a blocking hashing function in the password thread pool.
+
+        The pool is created on first use and limited to
+        ``password_hash_workers`` threads, so a burst of logins queues up
+        instead of taking over the default executor.
+
+        Args:
+            func: Blocking function
+            *args: Arguments for ``func``
+
+        Returns:
+            Awaitable with the function's result
+        """
+        if self._password_executor is None:
+            self._password_executor = ThreadPoolExecutor(
+                max_workers=self.settings.password_hash_workers,
+                thread_name_prefix="password-hash",
+            )
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._password_executor, func, *args)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash without blocking the event loop.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        return await self._run_in_password_pool(
+            self.pwd_context.verify, plain_password, hashed_password
+        )
+
+    async def get_password_hash_async(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+        """
+        return await self._run_in_password_pool(self.pwd_context.hash, password)
+
+    async def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its work factor is outdated.
+
+        Intended for login: when ``bcrypt_rounds`` changes, each user's hash
+        is upgraded the next time they log in, with no extra bcrypt call for
+        hashes that are already current. No endpoint checks passwords yet;
+        the login flow must call this and save ``new_hash`` when it is set.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Stored hash
+
+        Returns:
+            Tuple (matches, new_hash); new_hash is None unless the password
+            matched and the stored hash must be replaced
+        """
+        return await self._run_in_password_pool(
+            self.pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+    def close(self) -> None:
+        """Shut down the password thread pool, waiting for running hashes."""
+        if self._password_executor is not None:
+            self._password_executor.shutdown(wait=True)
+            self._password_executor = None
 
     def create_access_token(
         self,
@@ -52,6 +242,9 @@ class SecurityConfig:
         """
         Create a JWT access token.
 
+        Every token gets a unique ``jti`` and an ``iat`` so it can be revoked
+        individually or together with all tokens of its user.
+
         Args:
             data: Data to encode in token
             expires_delta: Token expiration time
@@ -60,20 +253,17 @@ class SecurityConfig:
             Encoded JWT token
         """
         to_encode = data.copy()
+        issued_at = datetime.utcnow()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
+            expire = issued_at + timedelta(
                 minutes=self.settings.access_token_expire_minutes
             )
 
-        to_encode.update({"exp": expire, "type": "access"})
-        encoded_jwt = jwt.encode(
-            to_encode,
-            self.settings.secret_key,
-            algorithm=self.settings.algorithm
-        )
-        return encoded_jwt
+        to_encode.setdefault("jti", str(ULID()))
+        to_encode.update({"exp": expire, "iat": issued_at, "type": "access"})
+        return self._encode(to_encode)
 
     def create_refresh_token(
         self,
@@ -91,41 +281,54 @@ class SecurityConfig:
             Encoded JWT refresh token
         """
         to_encode = data.copy()
+        issued_at = datetime.utcnow()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
+            expire = issued_at + timedelta(
                 days=self.settings.refresh_token_expire_days
             )
 
-        to_encode.update({"exp": expire, "type": "refresh"})
-        encoded_jwt = jwt.encode(
-            to_encode,
-            self.settings.secret_key,
-            algorithm=self.settings.algorithm
-        )
-        return encoded_jwt
+        to_encode.setdefault("jti", str(ULID()))
+        to_encode.update({"exp": expire, "iat": issued_at, "type": "refresh"})
+        return self._encode(to_encode)
 
     def verify_token(self, token: str) -> Optional[dict]:
         """
         Verify and decode a JWT token.
 
+        A token already verified by this worker is served from the cache
+        until its ``exp`` without checking the signature again. Tokens
+        without ``exp`` are never cached.
+
         Args:
             token: JWT token to verify
 
         Returns:
             Decoded token payload or None if invalid
         """
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at > time.time():
+                return dict(payload)
+            self._token_cache.invalidate(cache_key)
+            return None
+
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.secret_key,
-                algorithms=[self.settings.algorithm]
-            )
-            return payload
+            key = self._verification_key(token)
+            if key is None:
+                return None
+            payload = jwt.decode(token, key, algorithms=[self.algorithm])
         except JWTError:
             return None
 
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            self._token_cache.set(cache_key, (float(expires_at), dict(payload)))
+        return payload
+
     def extract_user_id_from_token(self, token: str) -> Optional[int]:
         """
         Extract user ID from JWT token.
@@ -0,0 +1,145 @@
+"""
+Fusión de llamadas concurrentes idénticas (single-flight).
+
+Cuando la caché está fría, muchas peticiones iguales llegan a la vez y
+cada una repetiría las mismas consultas. Con ``SingleFlight`` la primera
+llamada de cada clave (la líder) ejecuta el trabajo en la corrutina de
+quien la hizo, con la sesión de base de datos de su servicio, y las que
+llegan mientras tanto esperan su resultado sin usar la suya. Por eso el
+resultado compartido no debe depender de la sesión de la líder (objetos
+ORM sin cargar que se lean después): los métodos fusionados devuelven
+esquemas ya construidos.
+
+Según cómo acabe cada llamada:
+
+- si la líder termina, todas reciben el mismo resultado;
+- si la líder falla, todas reciben la misma excepción;
+- si la líder se cancela (el cliente cerró la conexión), sus seguidoras
+  no se cancelan: una de ellas repite el trabajo como nueva líder;
+- si una seguidora se cancela, solo deja de esperar.
+
+Solo se fusionan las llamadas en curso; nada se guarda al terminar.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _LiderCancelada(Exception):
+    """La llamada líder se canceló antes de obtener un resultado."""
+
+
+class SingleFlight(Generic[T]):
+    """
+    Grupo de llamadas en curso, una por clave.
+
+    Attributes
+    ----------
+    fusionadas : int
+        Número de llamadas que esperaron el resultado de otra en lugar de ejecutarse.
+    """
+
+    def __init__(self):
+        """Inicializa el grupo sin llamadas en curso."""
+        self._en_curso: Dict[Hashable, "asyncio.Future[T]"] = {}
+        self.fusionadas = 0
+
+    async def ejecutar(self, clave: Hashable, funcion: Callable[[], Awaitable[T]]) -> T:
+        """
+        Ejecuta ``funcion`` o espera el resultado de la llamada en curso con la misma clave.
+
+        Parameters
+        ----------
+        clave : Hashable
+            Identifica las llamadas equivalentes.
+        funcion : Callable[[], Awaitable[T]]
+            Crea la corrutina que hace el trabajo; solo se invoca en la líder.
+
+        Returns
+        -------
+        T
+            Resultado de la llamada, propio o compartido.
+
+        Raises
+        ------
+        Exception
+            La excepción de la llamada líder, compartida con sus seguidoras.
+        """
+        while True:
+            en_curso = self._en_curso.get(clave)
+            if en_curso is None:
+                break
+            self.fusionadas += 1
+            try:
+                # shield: cancelar esta espera no cancela el futuro compartido
+                return await asyncio.shield(en_curso)
+            except _LiderCancelada:
+                continue
+
+        futuro: "asyncio.Future[T]" = asyncio.get_running_loop().create_future()
+        self._en_curso[clave] = futuro
+        try:
+            resultado = await funcion()
+        except asyncio.CancelledError:
+            futuro.set_exception(_LiderCancelada())
+            raise
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            if self._en_curso.get(clave) is futuro:
+                del self._en_curso[clave]
+            # Sin seguidoras nadie lee la excepción; así asyncio no la registra como perdida
+            if futuro.done() and not futuro.cancelled():
+                futuro.exception()
+
+    def __len__(self) -> int:
+        """Número de claves con una llamada en curso."""
+        return len(self._en_curso)
+
+
+def _congelar(valor: Any) -> Hashable:
+    """Convierte argumentos habituales (listas, dicts, sets) en una clave hashable."""
+    if isinstance(valor, (list, tuple)):
+        return tuple(_congelar(v) for v in valor)
+    if isinstance(valor, dict):
+        return tuple(sorted((k, _congelar(v)) for k, v in valor.items()))
+    if isinstance(valor, (set, frozenset)):
+        return frozenset(_congelar(v) for v in valor)
+    return valor
+
+
+def coalescer(metodo: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Decora un método asíncrono de servicio para fusionar llamadas concurrentes idénticas.
+
+    La clave es el nombre del método y sus argumentos, sin ``self``: dos
+    instancias del servicio (una por petición) con los mismos argumentos
+    comparten la llamada. Los argumentos deben identificar por completo
+    el resultado.
+
+    Parameters
+    ----------
+    metodo : Callable[..., Awaitable[T]]
+        Método a decorar.
+
+    Returns
+    -------
+    Callable[..., Awaitable[T]]
+        Método decorado; su grupo queda en el atributo ``vuelos``.
+    """
+    vuelos: SingleFlight[T] = SingleFlight()
+
+    @functools.wraps(metodo)
+    async def envoltura(self, *args, **kwargs) -> T:
+        clave = (metodo.__qualname__, _congelar(args), _congelar(kwargs))
+        return await vuelos.ejecutar(clave, lambda: metodo(self, *args, **kwargs))
+
+    envoltura.vuelos = vuelos
+    return envoltura
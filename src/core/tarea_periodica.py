@@ -0,0 +1,75 @@
+"""
+Tarea de fondo que repite una función a intervalos fijos.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class TareaPeriodica:
+    """Llama a una función cada ``intervalo`` segundos mientras está iniciada.
+
+    Un fallo de la función se registra y no detiene la tarea.
+
+    Attributes
+    ----------
+    nombre : str
+        Nombre de la tarea en los registros.
+    funcion : Callable[[], Union[None, Awaitable[Any]]]
+        Función (síncrona o asíncrona) sin argumentos.
+    intervalo : float
+        Segundos entre llamadas; con 0 o menos la tarea no se inicia.
+    """
+
+    def __init__(
+        self,
+        nombre: str,
+        funcion: Callable[[], Union[None, Awaitable[Any]]],
+        intervalo: float,
+    ):
+        """
+        Inicializa la tarea sin iniciarla.
+
+        Parameters
+        ----------
+        nombre : str
+            Nombre de la tarea en los registros.
+        funcion : Callable[[], Union[None, Awaitable[Any]]]
+            Función a repetir.
+        intervalo : float
+            Segundos entre llamadas.
+        """
+        self.nombre = nombre
+        self.funcion = funcion
+        self.intervalo = intervalo
+        self._tarea: Optional[asyncio.Task] = None
+
+    async def _repetir(self) -> None:
+        """Espera el intervalo y llama a la función, indefinidamente."""
+        while True:
+            await asyncio.sleep(self.intervalo)
+            try:
+                resultado = self.funcion()
+                if inspect.isawaitable(resultado):
+                    await resultado
+            except Exception:
+                logger.exception("Error en la tarea periódica %s", self.nombre)
+
+    async def iniciar(self) -> None:
+        """Arranca la tarea si tiene un intervalo positivo."""
+        if self._tarea is None and self.intervalo > 0:
+            self._tarea = asyncio.create_task(self._repetir())
+
+    async def detener(self) -> None:
+        """Detiene la tarea."""
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
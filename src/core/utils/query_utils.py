@@ -0,0 +1,30 @@
+"""
+Query parameter utilities for API endpoints.
+"""
+
+from typing import List, Optional
+
+
+def split_csv_values(values: Optional[List[str]]) -> List[str]:
+    """
+    Normalize a multi-valued query parameter.
+
+    Accepts both repeated parameters (``?x=a&x=b``) and comma-separated
+    values (``?x=a,b``), dropping blanks and duplicates while keeping order.
+
+    Args:
+        values: Raw values received by FastAPI for the parameter
+
+    Returns:
+        Flat list of non-empty values
+    """
+    if not values:
+        return []
+
+    result: List[str] = []
+    for value in values:
+        for item in value.split(","):
+            item = item.strip()
+            if item and item not in result:
+                result.append(item)
+    return result
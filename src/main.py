@@ -2,17 +2,27 @@
 Punto de entrada principal de la aplicación FastAPI.
 """
 
-import importlib
 import logging
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.core.database import create_tables, close_database
+from src.core.database import migrate_database, close_database, register_models
 from src.core.config import get_settings
 from src.core.logging import configure_logging
 from src.core.dependencies import ErrorHandlerMiddleware
+from src.core.compression import CompressionMiddleware
+from src.core.rate_limit import RateLimitMiddleware, reglas_publicas
+from src.core.load_monitor import get_monitor_carga
+from src.core.lazy_routers import CargadorRouters, LazyRouterMiddleware, leer_openapi_cache
+from src.core.tarea_periodica import TareaPeriodica
+from src.core.security import security
+from src.business_logic.notifications.event_bus import get_event_bus
+from src.business_logic.pedidos.cola_cocina import get_cola_cocina
+from src.business_logic.auth.permisos import get_mapa_permisos
+from src.business_logic.auth.revocacion import get_lista_revocacion
 
 
 # Configurar logger para este módulo
@@ -69,6 +79,18 @@ async def auto_seed_database():
         logger.warning("⚠️ La aplicación continuará sin datos de seed")
 
 
+async def sincronizar_estado() -> None:
+    """
+    Relee las revocaciones nuevas y los permisos de los roles.
+
+    El bus de eventos entrega cada aviso como mucho una vez; esta lectura
+    periódica, barata, acota cuánto tarda un worker en ver un cambio cuyo
+    aviso se perdió.
+    """
+    await get_lista_revocacion().sincronizar()
+    await get_mapa_permisos().recargar()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -95,12 +117,29 @@ async def lifespan(app: FastAPI):
     # Configurar sistema de logging
     configure_logging()
 
-    # Crear tablas en la base de datos si no existen
-    await create_tables()
-    
-    # Pequeña espera para asegurar que las tablas estén completamente creadas
-    import asyncio
-    await asyncio.sleep(0.5)
+    # Aplicar las migraciones pendientes (una consulta si el esquema está al día)
+    await migrate_database()
+
+    # Medir el retraso del bucle de eventos para descartar peticiones con sobrecarga
+    await get_monitor_carga().iniciar()
+
+    # Arrancar el bus de eventos entre workers
+    await get_event_bus().iniciar()
+
+    # Reconstruir las colas de cocina con los ítems abiertos
+    await get_cola_cocina().restaurar()
+
+    # Compilar los permisos de los roles en memoria
+    await get_mapa_permisos().recargar()
+
+    # Cargar los tokens revocados en el filtro en memoria
+    await get_lista_revocacion().cargar()
+
+    # Releer periódicamente el estado cuyos avisos del bus pueden perderse
+    sincronizacion = TareaPeriodica(
+        "sincronización de estado", sincronizar_estado, get_settings().state_sync_interval
+    )
+    await sincronizacion.iniciar()
 
     # Ejecutar seed automáticamente si la BD está vacía
     # await auto_seed_database()
@@ -112,56 +151,95 @@ async def lifespan(app: FastAPI):
     # Fase de limpieza
     logger.info("Cerrando Restaurant Backend API...")
 
+    # Detener la relectura periódica y el bus de eventos
+    await sincronizacion.detener()
+    await get_event_bus().detener()
+
+    # Detener la medición de carga
+    await get_monitor_carga().detener()
+
+    # Esperar los hashes de contraseñas en curso
+    security.close()
+
     # Cerrar conexiones de base de datos
     await close_database()
 
     logger.info("Recursos liberados correctamente")
 
 
-def register_routers(app: FastAPI) -> None:
+# Controladores de la API: (módulo, tag, prefijo de su router)
+CONTROLADORES = [
+    ("src.api.controllers.auth_controller", "Autenticación", "/auth"),
+    ("src.api.controllers.rol_controller", "Roles", "/roles"),
+    ("src.api.controllers.categoria_controller", "Categorías", "/categorias"),
+    ("src.api.controllers.alergeno_controller", "Alérgenos", "/alergenos"),
+    ("src.api.controllers.producto_controller", "Productos", "/productos"),
+    ("src.api.controllers.tipo_opciones_controller", "Tipos de Opciones", "/tipos-opciones"),
+    ("src.api.controllers.producto_opcion_controller", "Producto Opciones", "/producto-opciones"),
+    ("src.api.controllers.menu_controller", "Menú", "/menu"),
+    ("src.api.controllers.sync_controller", "Sincronización", "/sync"),
+    # ("src.api.controllers.usuarios_controller", "Usuarios", "/usuarios"),
+    ("src.api.controllers.mesa_controller", "Mesas", "/mesas"),
+    ("src.api.controllers.pedidos_controller", "Pedidos", "/pedidos"),
+    ("src.api.controllers.cocina_controller", "Cocina", "/cocina"),
+    ("src.api.controllers.carrito_controller", "Carrito", "/carrito"),
+    ("src.api.controllers.pagos_controller", "Pagos", "/pagos"),
+]
+
+# Prefijo API común para todas las rutas
+API_PREFIX = "/v1"
+
+
+def register_routers(app: FastAPI, lazy: bool = False) -> CargadorRouters:
     """
     Registra todos los routers de la aplicación.
 
     Carga dinámicamente los controladores disponibles y los registra
-    con la aplicación FastAPI.
+    con la aplicación FastAPI, todos ahora o cada uno con la primera
+    petición a su prefijo.
 
     Parameters
     ----------
     app : FastAPI
         La instancia de la aplicación FastAPI donde registrar los routers
+    lazy : bool, optional
+        Si es True, los controladores se importan bajo demanda, por defecto False
+
+    Returns
+    -------
+    CargadorRouters
+        Cargador con los controladores pendientes y los ya registrados
     """
-    # Estructura de controladores a cargar: (módulo, tag)
-    controllers = [
-        ("src.api.controllers.rol_controller", "Roles"),
-        ("src.api.controllers.categoria_controller", "Categorías"),
-        ("src.api.controllers.alergeno_controller", "Alérgenos"),
-        ("src.api.controllers.producto_controller", "Productos"),
-        ("src.api.controllers.tipo_opciones_controller", "Tipos de Opciones"),
-        ("src.api.controllers.producto_opcion_controller", "Producto Opciones"),
-        ("src.api.controllers.sync_controller", "Sincronización"),
-        # ("src.api.controllers.usuarios_controller", "Usuarios"),
-        ("src.api.controllers.mesa_controller", "Mesas"),
-        # ("src.api.controllers.pedidos_controller", "Pedidos"),
-        # ("src.api.controllers.pagos_controller", "Pagos"),
-    ]
-
-    # Prefijo API común para todas las rutas
-    api_prefix = "/v1"
-
-    for module_name, tag in controllers:
-        try:
-            # Importar dinámicamente el módulo del controlador
-            module = importlib.import_module(module_name)
-            router = getattr(module, "router", None)
-
-            if router and isinstance(router, APIRouter):
-                # Registrar el router con la aplicación
-                app.include_router(router, prefix=api_prefix, tags=[tag])
-                logger.info(f"Router '{tag}' registrado correctamente")
-            else:
-                logger.warning(f"No se encontró un router válido en {module_name}")
-        except Exception as e:
-            logger.error(f"Error al cargar el controlador {module_name}: {e}")
+    cargador = CargadorRouters(app, CONTROLADORES, API_PREFIX)
+    if lazy:
+        app.add_middleware(LazyRouterMiddleware, cargador=cargador)
+    else:
+        cargador.cargar_todos()
+    return cargador
+
+
+def configure_openapi(app: FastAPI, cargador: CargadorRouters, cache_path: Optional[str]) -> None:
+    """
+    Genera el esquema OpenAPI con todas las rutas, o lo lee de la caché en disco.
+
+    Parameters
+    ----------
+    app : FastAPI
+        La instancia de la aplicación FastAPI
+    cargador : CargadorRouters
+        Cargador de los routers que aún no se registraron
+    cache_path : Optional[str]
+        Esquema generado de antemano con scripts/build_openapi_cache.py
+    """
+    def openapi() -> dict:
+        if app.openapi_schema is None:
+            app.openapi_schema = leer_openapi_cache(cache_path, app.version)
+        if app.openapi_schema is None:
+            cargador.cargar_todos()
+            app.openapi_schema = FastAPI.openapi(app)
+        return app.openapi_schema
+
+    app.openapi = openapi
 
 
 def create_app() -> FastAPI:
@@ -178,6 +256,11 @@ def create_app() -> FastAPI:
     """
     settings = get_settings()
 
+    # Registrar todos los modelos una sola vez: los controladores se cargan
+    # bajo demanda, pero los mappers de cualquier modelo necesitan todas las
+    # clases a las que apuntan sus relaciones
+    register_models()
+
     # Crear la instancia de FastAPI
     app = FastAPI(
         title=settings.app_name,
@@ -188,6 +271,11 @@ def create_app() -> FastAPI:
         root_path="/api",
     )
 
+    # Registrar los routers (el middleware de carga perezosa es el más interno)
+    cargador = register_routers(app, lazy=settings.lazy_routers)
+    app.state.cargador_routers = cargador
+    configure_openapi(app, cargador, settings.openapi_cache_path)
+
     # Agregar middleware CORS
     app.add_middleware(
         CORSMiddleware,
@@ -200,8 +288,27 @@ def create_app() -> FastAPI:
     # Agregar middleware para manejo de errores
     app.add_middleware(ErrorHandlerMiddleware)
 
-    # Registrar todos los routers disponibles
-    register_routers(app)
+    # Agregar middleware de compresión (comprime también los errores)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
+    # Limitar los endpoints públicos (el más externo: rechaza antes de hacer trabajo)
+    if settings.rate_limit_enabled:
+        if settings.environment == "production" and not settings.rate_limit_trust_forwarded:
+            logger.warning(
+                "Límite de peticiones por IP sin RATE_LIMIT_TRUST_FORWARDED: detrás de "
+                "un proxy todos los clientes compartirán la misma cubeta"
+            )
+        app.add_middleware(
+            RateLimitMiddleware,
+            reglas=reglas_publicas(settings),
+            confiar_forwarded=settings.rate_limit_trust_forwarded,
+            proxies_confiables=settings.rate_limit_trusted_proxies,
+        )
 
     # Registrar endpoints básicos
     @app.get("/")
@@ -5,9 +5,9 @@ Implementa la estructura de datos para los roles de usuario en el sistema,
 adaptado para coincidir con el esquema existente de MySQL restaurant_dp2.rol.
 """
 
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Boolean, inspect
+from sqlalchemy import String, Boolean, JSON, inspect
 from src.models.base_model import BaseModel
 from src.models.mixins.audit_mixin import AuditMixin
 
@@ -29,6 +29,9 @@ class RolModel(BaseModel, AuditMixin):
         Descripción detallada del propósito y alcance del rol.
     activo : bool
         Indica si el rol está activo en el sistema.
+    permisos : List[str], optional
+        Códigos de los permisos del rol. Si es None, los roles predefinidos
+        (``RoleName``) usan sus permisos por defecto.
     fecha_creacion : datetime
         Fecha y hora de creación del registro (heredado de AuditableModel).
     fecha_modificacion : datetime
@@ -45,6 +48,7 @@ class RolModel(BaseModel, AuditMixin):
     nombre: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     descripcion: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     activo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    permisos: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
 
     # Métodos comunes para todos los modelos
     def to_dict(self) -> Dict[str, Any]:
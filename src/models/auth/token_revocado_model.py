@@ -0,0 +1,47 @@
+"""
+Modelo de revocaciones de tokens JWT.
+
+Cada fila revoca un token concreto (por su ``jti``) o todos los tokens de
+un usuario emitidos hasta ``revocado_en`` (baja de personal). Las filas
+se conservan hasta que expiran los tokens a los que afectan.
+"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, TIMESTAMP, Index
+from src.models.base_model import BaseModel
+from src.models.mixins.audit_mixin import AuditMixin
+
+
+class TokenRevocadoModel(BaseModel, AuditMixin):
+    """Modelo para representar la revocación de uno o varios tokens.
+
+    Attributes
+    ----------
+    jti : Optional[str]
+        Identificador del token revocado; None si se revocan todos los del usuario.
+    id_usuario : Optional[str]
+        Usuario (``sub``) al que pertenecen los tokens.
+    revocado_en : datetime
+        Momento (UTC) de la revocación; sin ``jti``, se rechazan los tokens
+        del usuario emitidos hasta este momento.
+    expira_en : datetime
+        Momento (UTC) en que expiran los tokens afectados y la fila deja de ser necesaria.
+    """
+
+    __tablename__ = "token_revocado"
+
+    jti: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, unique=True)
+    id_usuario: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    revocado_en: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+    expira_en: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        Index("idx_token_revocado_revocado_en", "revocado_en"),
+        Index("idx_token_revocado_expira_en", "expira_en"),
+    )
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo TokenRevocado."""
+        return f"<TokenRevocadoModel(jti={self.jti}, id_usuario={self.id_usuario})>"
@@ -7,7 +7,7 @@ del menú, adaptado para coincidir con el esquema existente de MySQL restaurant_
 
 from typing import Any, Dict, Optional, Type, TypeVar
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Text, Boolean, Enum, inspect
+from sqlalchemy import String, Text, Boolean, Enum, SmallInteger, inspect
 from src.models.base_model import BaseModel
 from src.models.mixins.audit_mixin import AuditMixin
 from src.core.enums.alergeno_enums import NivelRiesgo
@@ -37,6 +37,9 @@ class AlergenoModel(BaseModel, AuditMixin):
         Nivel de riesgo del alérgeno (bajo, medio, alto, crítico).
     activo : bool
         Indica si el alérgeno está activo en el sistema.
+    bit_index : int, optional
+        Posición del alérgeno en las máscaras de bits precalculadas de los productos.
+        Se asigna de forma perezosa al vincular el alérgeno con un producto.
     fecha_creacion : datetime
         Fecha y hora de creación del registro (heredado de AuditMixin).
     fecha_modificacion : datetime
@@ -72,6 +75,12 @@ class AlergenoModel(BaseModel, AuditMixin):
         nullable=False, 
         default=True
     )
+    bit_index: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
+        nullable=True,
+        unique=True,
+        comment="Posición del alérgeno en las máscaras de bits de producto"
+    )
 
     # Métodos comunes para todos los modelos
     def to_dict(self) -> Dict[str, Any]:
@@ -32,6 +32,8 @@ class CategoriaModel(BaseModel, AuditMixin):
         Descripción detallada de la categoría y sus productos.
     imagen_path : str, optional
         Ruta de la imagen representativa de la categoría.
+    estacion : str
+        Estación de cocina que prepara sus productos (por ejemplo "cocina" o "bar").
     activo : bool
         Indica si la categoría está activa en el sistema.
     fecha_creacion : datetime
@@ -52,6 +54,9 @@ class CategoriaModel(BaseModel, AuditMixin):
     )
     descripcion: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     imagen_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    estacion: Mapped[str] = mapped_column(
+        String(50), nullable=False, default="cocina", server_default="cocina"
+    )
     activo: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=True, server_default="1", index=True
     )
@@ -0,0 +1,62 @@
+"""
+Modelo del registro de cambios del menú.
+
+Cada fila representa una entidad del menú que cambió y guarda la versión
+del menú que le asignó el contador de ``menu_version`` en la misma
+transacción que el cambio.
+"""
+
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Integer, String, Enum, DateTime, Index, func
+from src.models.base_model import BaseModel
+from src.core.enums.menu_enums import EntidadMenu
+
+
+class MenuCambioModel(BaseModel):
+    """Modelo para representar un cambio en el menú público.
+
+    El registro solo guarda qué entidad cambió, no cómo: al consultar los
+    cambios desde una versión se lee el estado actual de cada entidad y se
+    decide si el cliente debe actualizarla o eliminarla.
+
+    Attributes
+    ----------
+    id : int
+        Identificador autoincremental.
+    version : int
+        Versión del menú en la que se registró el cambio.
+    entidad : EntidadMenu
+        Tipo de entidad que cambió.
+    id_entidad : str
+        Identificador de la entidad que cambió.
+    fecha_creacion : datetime
+        Fecha y hora del cambio.
+    """
+
+    __tablename__ = "menu_cambio"
+
+    # SQLite solo autoincrementa columnas INTEGER PRIMARY KEY
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    entidad: Mapped[EntidadMenu] = mapped_column(Enum(EntidadMenu), nullable=False)
+    id_entidad: Mapped[str] = mapped_column(String(36), nullable=False)
+    fecha_creacion: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("idx_menu_cambio_entidad", "entidad", "id_entidad"),
+        Index("idx_menu_cambio_version", "version"),
+    )
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo MenuCambio."""
+        return (
+            f"<MenuCambioModel(id={self.id}, version={self.version}, entidad={self.entidad}, "
+            f"id_entidad='{self.id_entidad}')>"
+        )
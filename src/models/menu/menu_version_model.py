@@ -0,0 +1,36 @@
+"""
+Modelo de la versión vigente del menú.
+
+Es una tabla de una sola fila con un contador. Cada transacción que
+registra cambios del menú lo incrementa antes de confirmarse; el bloqueo
+de la fila se mantiene hasta el commit, así que las versiones se asignan
+en el mismo orden en que los cambios se hacen visibles.
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer
+from src.models.base_model import BaseModel
+
+# Identificador de la única fila de la tabla
+ID_VERSION_MENU = 1
+
+
+class MenuVersionModel(BaseModel):
+    """Modelo para representar el contador de versiones del menú público.
+
+    Attributes
+    ----------
+    id : int
+        Identificador de la fila; siempre ``ID_VERSION_MENU``.
+    version : int
+        Última versión asignada a un cambio del menú.
+    """
+
+    __tablename__ = "menu_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo MenuVersion."""
+        return f"<MenuVersionModel(version={self.version})>"
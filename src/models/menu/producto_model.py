@@ -8,7 +8,7 @@ adaptado para coincidir con el esquema de MySQL restaurant_dp2.producto.
 from typing import Any, Dict, Optional, Type, TypeVar, TYPE_CHECKING, List
 from decimal import Decimal
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, Text, DECIMAL, ForeignKey, Index
+from sqlalchemy import String, Boolean, Text, DECIMAL, BigInteger, ForeignKey, Index
 from uuid import UUID
 from src.models.base_model import BaseModel
 from src.models.mixins.audit_mixin import AuditMixin
@@ -46,6 +46,12 @@ class ProductoModel(BaseModel, AuditMixin):
         Indica si el producto está disponible actualmente.
     destacado : bool
         Indica si el producto es destacado en el menú.
+    mascara_alergenos_contiene : int
+        Máscara de bits (por ``AlergenoModel.bit_index``) de alérgenos que contiene.
+    mascara_alergenos_trazas : int
+        Máscara de bits de alérgenos presentes en trazas.
+    mascara_alergenos_puede_contener : int
+        Máscara de bits de alérgenos que puede contener.
     fecha_creacion : datetime
         Fecha y hora de creación del registro (heredado de AuditMixin).
     fecha_modificacion : datetime
@@ -82,6 +88,18 @@ class ProductoModel(BaseModel, AuditMixin):
         Boolean, nullable=False, default=False, server_default="0", index=True
     )
 
+    # Máscaras de alérgenos desnormalizadas (una por NivelPresencia).
+    # Se recalculan desde producto_alergeno en cada escritura de la relación.
+    mascara_alergenos_contiene: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    mascara_alergenos_trazas: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    mascara_alergenos_puede_contener: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+
     # Relación con Categoría
     categoria: Mapped["CategoriaModel"] = relationship(
         "CategoriaModel",
@@ -151,6 +169,28 @@ class ProductoModel(BaseModel, AuditMixin):
             if hasattr(self, key) and key != 'id':
                 setattr(self, key, value)
 
+    def contiene_alergenos(self, mascara: int, tolerar_trazas: bool = True) -> bool:
+        """Indica si el producto presenta alguno de los alérgenos de la máscara.
+
+        Parameters
+        ----------
+        mascara : int
+            Máscara de bits con los alérgenos a evaluar.
+        tolerar_trazas : bool, optional
+            Si es False, las trazas y el "puede contener" también cuentan
+            como presencia del alérgeno, por defecto True.
+
+        Returns
+        -------
+        bool
+            True si el producto debe excluirse para esa máscara.
+        """
+        presentes = self.mascara_alergenos_contiene or 0
+        if not tolerar_trazas:
+            presentes |= (self.mascara_alergenos_trazas or 0)
+            presentes |= (self.mascara_alergenos_puede_contener or 0)
+        return (presentes & mascara) != 0
+
     def __repr__(self) -> str:
         """Representación en string del modelo Producto."""
         return (
@@ -32,6 +32,8 @@ class MesaModel(BaseModel, AuditMixin):
         Indica si la mesa está activa en el sistema.
     estado : EstadoMesaEnum
         Estado actual de la mesa (libre, ocupada, reservada, fuera de servicio).
+    version : int
+        Contador de modificaciones para el control de concurrencia optimista.
     fecha_creacion : datetime
         Fecha y hora de creación del registro (heredado de AuditableModel).
     fecha_modificacion : datetime
@@ -49,6 +51,7 @@ class MesaModel(BaseModel, AuditMixin):
     nota: Mapped[str] = mapped_column(String(255), nullable=True)
     activo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     estado: Mapped[EstadoMesa] = mapped_column(SQLEnum(EstadoMesa), nullable=False, default=EstadoMesa.DISPONIBLE)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # Métodos comunes para todos los modelos
     def to_dict(self) -> Dict[str, Any]:
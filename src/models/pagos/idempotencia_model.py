@@ -0,0 +1,51 @@
+"""
+Modelo de claves de idempotencia.
+
+Guarda la respuesta de cada petición enviada con una cabecera
+``Idempotency-Key`` para devolverla tal cual si el cliente la reintenta.
+"""
+
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Text, TIMESTAMP, Index, UniqueConstraint
+from src.models.base_model import BaseModel
+from src.models.mixins.audit_mixin import AuditMixin
+
+
+class IdempotenciaModel(BaseModel, AuditMixin):
+    """Modelo para representar la respuesta guardada de una petición idempotente.
+
+    Attributes
+    ----------
+    ambito : str
+        Operación a la que pertenece la clave (por ejemplo ``pagos.crear``).
+    clave : str
+        Valor de la cabecera ``Idempotency-Key`` enviada por el cliente.
+    huella : str
+        SHA-256 del cuerpo de la petición; una clave reutilizada con otros
+        datos se rechaza.
+    codigo_estado : int
+        Código HTTP de la respuesta guardada.
+    respuesta : str
+        Cuerpo JSON de la respuesta guardada.
+    expira_en : datetime
+        Momento (UTC) a partir del cual la clave deja de ser válida.
+    """
+
+    __tablename__ = "idempotencia"
+
+    ambito: Mapped[str] = mapped_column(String(50), nullable=False)
+    clave: Mapped[str] = mapped_column(String(255), nullable=False)
+    huella: Mapped[str] = mapped_column(String(64), nullable=False)
+    codigo_estado: Mapped[int] = mapped_column(Integer, nullable=False)
+    respuesta: Mapped[str] = mapped_column(Text, nullable=False)
+    expira_en: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("ambito", "clave", name="uq_idempotencia_ambito_clave"),
+        Index("idx_idempotencia_expira_en", "expira_en"),
+    )
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo Idempotencia."""
+        return f"<IdempotenciaModel(ambito={self.ambito}, clave={self.clave})>"
@@ -0,0 +1,81 @@
+"""
+Modelo de pagos.
+"""
+
+from typing import Any, Dict, Optional
+from decimal import Decimal
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, DECIMAL, ForeignKey, Index, Enum as SQLEnum
+from src.models.base_model import BaseModel
+from src.models.mixins.audit_mixin import AuditMixin
+from src.core.enums.pago_enums import EstadoPago, MetodoPago
+
+
+class PagoModel(BaseModel, AuditMixin):
+    """Modelo para representar un pago de una mesa.
+
+    Attributes
+    ----------
+    id_mesa : str
+        Identificador de la mesa que paga.
+    id_pedido : str, optional
+        Pedido al que se aplica el pago, si se indica.
+    comensal : str, optional
+        Comensal que paga, según la división de la cuenta.
+    metodo : MetodoPago
+        Medio de pago.
+    estado : EstadoPago
+        Estado actual del pago.
+    monto : Decimal
+        Importe pagado.
+    referencia : str, optional
+        Número de operación de Yape, Plin o del terminal de tarjetas.
+    version : int
+        Contador de modificaciones para el control de concurrencia optimista.
+    fecha_creacion : datetime
+        Fecha y hora de creación del registro (heredado de AuditMixin).
+    fecha_modificacion : datetime
+        Fecha y hora de última modificación (heredado de AuditMixin).
+    """
+
+    __tablename__ = "pago"
+
+    id_mesa: Mapped[str] = mapped_column(
+        ForeignKey("mesas.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True
+    )
+    id_pedido: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("pedido.id", ondelete="RESTRICT"),
+        nullable=True,
+        index=True
+    )
+    comensal: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    metodo: Mapped[MetodoPago] = mapped_column(SQLEnum(MetodoPago), nullable=False)
+    estado: Mapped[EstadoPago] = mapped_column(
+        SQLEnum(EstadoPago), nullable=False, default=EstadoPago.PENDIENTE
+    )
+    monto: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
+    referencia: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+    __table_args__ = (
+        Index("idx_pago_estado", "estado"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte la instancia del modelo a un diccionario.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Diccionario con los nombres de columnas como claves y sus valores correspondientes.
+        """
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo Pago."""
+        return (
+            f"<PagoModel(id={self.id}, id_mesa={self.id_mesa}, "
+            f"metodo={self.metodo}, estado={self.estado}, monto={self.monto})>"
+        )
@@ -4,8 +4,12 @@ Modelos relacionados con pedidos y opciones de productos.
 
 from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
 from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
+from src.models.pedidos.pedido_model import PedidoModel
+from src.models.pedidos.pedido_item_model import PedidoItemModel
 
 __all__ = [
     "TipoOpcionModel",
     "ProductoOpcionModel",
+    "PedidoModel",
+    "PedidoItemModel",
 ]
@@ -0,0 +1,96 @@
+"""
+Modelo de ítems de pedido.
+
+Cada ítem guarda una copia del nombre del producto, de las opciones
+elegidas y de los precios vigentes al crear el pedido.
+"""
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from decimal import Decimal
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Integer, DECIMAL, JSON, ForeignKey, Index, Enum as SQLEnum
+from src.models.base_model import BaseModel
+from src.core.enums.pedido_enums import EstadoPedido
+
+if TYPE_CHECKING:
+    from src.models.pedidos.pedido_model import PedidoModel
+
+
+class PedidoItemModel(BaseModel):
+    """Modelo para representar un producto dentro de un pedido.
+
+    Attributes
+    ----------
+    id_pedido : str
+        Identificador del pedido al que pertenece.
+    id_producto : str
+        Identificador del producto solicitado.
+    orden : int
+        Posición del ítem dentro del pedido.
+    nombre_producto : str
+        Nombre del producto al crear el pedido.
+    cantidad : int
+        Unidades solicitadas.
+    precio_unitario : Decimal
+        Precio base más el precio adicional de las opciones.
+    subtotal : Decimal
+        Precio unitario por cantidad.
+    opciones : List[Dict[str, Any]]
+        Opciones elegidas con su nombre y precio adicional (``id``,
+        ``nombre``, ``precio_adicional`` como texto).
+    notas : str, optional
+        Indicaciones para cocina.
+    estacion : str
+        Estación de cocina que prepara el ítem.
+    estado : EstadoPedido
+        Estado de preparación del ítem en su estación.
+    """
+
+    __tablename__ = "pedido_item"
+
+    id_pedido: Mapped[str] = mapped_column(
+        ForeignKey("pedido.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    id_producto: Mapped[str] = mapped_column(
+        ForeignKey("producto.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True
+    )
+    orden: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    nombre_producto: Mapped[str] = mapped_column(String(255), nullable=False)
+    cantidad: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    precio_unitario: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
+    subtotal: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
+    opciones: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    notas: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    estacion: Mapped[str] = mapped_column(
+        String(50), nullable=False, default="cocina", server_default="cocina"
+    )
+    estado: Mapped[EstadoPedido] = mapped_column(
+        SQLEnum(EstadoPedido), nullable=False, default=EstadoPedido.PENDIENTE
+    )
+
+    pedido: Mapped["PedidoModel"] = relationship("PedidoModel", back_populates="items")
+
+    __table_args__ = (
+        Index("idx_pedido_item_estado", "estado"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte la instancia del modelo a un diccionario.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Diccionario con los nombres de columnas como claves y sus valores correspondientes.
+        """
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo PedidoItem."""
+        return (
+            f"<PedidoItemModel(id={self.id}, id_producto={self.id_producto}, "
+            f"cantidad={self.cantidad}, subtotal={self.subtotal})>"
+        )
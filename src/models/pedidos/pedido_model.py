@@ -0,0 +1,98 @@
+"""
+Modelo de pedidos.
+
+Un pedido agrupa los productos solicitados desde una mesa. Los precios y
+las opciones elegidas se copian en sus ítems al crearlo, de modo que los
+cambios posteriores del menú no alteran pedidos ya registrados.
+"""
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from decimal import Decimal
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Integer, DECIMAL, ForeignKey, Index, Enum as SQLEnum
+from src.models.base_model import BaseModel
+from src.models.mixins.audit_mixin import AuditMixin
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+if TYPE_CHECKING:
+    from src.models.pedidos.pedido_item_model import PedidoItemModel
+
+
+class PedidoModel(BaseModel, AuditMixin):
+    """Modelo para representar un pedido de una mesa.
+
+    Attributes
+    ----------
+    id_mesa : str
+        Identificador de la mesa que realizó el pedido.
+    estado : EstadoPedido
+        Estado actual del pedido.
+    prioridad : PrioridadPedido
+        Prioridad del pedido en cocina.
+    total : Decimal
+        Suma de los subtotales de los ítems.
+    notas : str, optional
+        Indicaciones generales del pedido.
+    version_menu : int
+        Versión del menú con la que se calcularon los precios.
+    version : int
+        Contador de modificaciones para el control de concurrencia optimista.
+    items : List[PedidoItemModel]
+        Productos solicitados.
+    fecha_creacion : datetime
+        Fecha y hora de creación del registro (heredado de AuditMixin).
+    fecha_modificacion : datetime
+        Fecha y hora de última modificación (heredado de AuditMixin).
+    """
+
+    __tablename__ = "pedido"
+
+    id_mesa: Mapped[str] = mapped_column(
+        ForeignKey("mesas.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True
+    )
+    estado: Mapped[EstadoPedido] = mapped_column(
+        SQLEnum(EstadoPedido), nullable=False, default=EstadoPedido.PENDIENTE
+    )
+    prioridad: Mapped[PrioridadPedido] = mapped_column(
+        SQLEnum(PrioridadPedido), nullable=False, default=PrioridadPedido.NORMAL
+    )
+    total: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2), nullable=False, default=Decimal("0.00")
+    )
+    notas: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    version_menu: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+    items: Mapped[List["PedidoItemModel"]] = relationship(
+        "PedidoItemModel",
+        back_populates="pedido",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="PedidoItemModel.orden",
+    )
+
+    __table_args__ = (
+        Index("idx_pedido_estado", "estado"),
+    )
+
+    # Las fechas por defecto del servidor se leen en el mismo INSERT (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte la instancia del modelo a un diccionario.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Diccionario con los nombres de columnas como claves y sus valores correspondientes.
+        """
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+
+    def __repr__(self) -> str:
+        """Representación en string del modelo Pedido."""
+        return (
+            f"<PedidoModel(id={self.id}, id_mesa={self.id_mesa}, "
+            f"estado={self.estado}, total={self.total})>"
+        )
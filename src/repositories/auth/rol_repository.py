@@ -200,3 +200,15 @@ class RolRepository:
             # En caso de error, no es necesario hacer rollback aquí
             # porque no estamos modificando datos
             raise
+
+    async def get_todos(self) -> List[RolModel]:
+        """
+        Obtiene todos los roles, activos e inactivos.
+
+        Returns
+        -------
+        List[RolModel]
+            Lista de roles.
+        """
+        result = await self.session.execute(select(RolModel))
+        return list(result.scalars().all())
@@ -0,0 +1,138 @@
+"""
+Repositorio para las revocaciones de tokens JWT.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+
+from src.models.auth.token_revocado_model import TokenRevocadoModel
+
+
+class TokenRevocadoRepository:
+    """Repositorio para gestionar las revocaciones de tokens.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    async def create(self, revocacion: TokenRevocadoModel) -> TokenRevocadoModel:
+        """
+        Registra una revocación.
+
+        Parameters
+        ----------
+        revocacion : TokenRevocadoModel
+            Revocación a guardar.
+
+        Returns
+        -------
+        TokenRevocadoModel
+            La misma revocación, ya persistida.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos,
+            incluido un ``jti`` ya revocado (IntegrityError).
+        """
+        try:
+            self.session.add(revocacion)
+            await self.session.flush()
+            await self.session.commit()
+            return revocacion
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def existe_jti(self, jti: str) -> bool:
+        """
+        Indica si un token está revocado.
+
+        Parameters
+        ----------
+        jti : str
+            Identificador del token.
+
+        Returns
+        -------
+        bool
+            True si existe una revocación para el token.
+        """
+        query = select(TokenRevocadoModel.id).where(TokenRevocadoModel.jti == jti)
+        result = await self.session.execute(query)
+        return result.first() is not None
+
+    async def get_vigentes(
+        self, ahora: datetime, desde: Optional[datetime] = None
+    ) -> List[TokenRevocadoModel]:
+        """
+        Obtiene las revocaciones cuyos tokens aún no expiraron.
+
+        Parameters
+        ----------
+        ahora : datetime
+            Momento actual (UTC).
+        desde : Optional[datetime], optional
+            Si se indica, solo las revocadas a partir de este momento.
+
+        Returns
+        -------
+        List[TokenRevocadoModel]
+            Revocaciones ordenadas por momento de revocación.
+        """
+        condiciones = [TokenRevocadoModel.expira_en > ahora]
+        if desde is not None:
+            condiciones.append(TokenRevocadoModel.revocado_en >= desde)
+        query = (
+            select(TokenRevocadoModel)
+            .where(*condiciones)
+            .order_by(TokenRevocadoModel.revocado_en)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def eliminar_expiradas(self, ahora: datetime) -> int:
+        """
+        Elimina las revocaciones de tokens que ya expiraron.
+
+        Parameters
+        ----------
+        ahora : datetime
+            Momento actual (UTC).
+
+        Returns
+        -------
+        int
+            Número de revocaciones eliminadas.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        try:
+            result = await self.session.execute(
+                delete(TokenRevocadoModel).where(TokenRevocadoModel.expira_en <= ahora)
+            )
+            await self.session.commit()
+            return result.rowcount or 0
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
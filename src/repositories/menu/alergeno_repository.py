@@ -2,13 +2,15 @@
 Repositorio para la gestión de alérgenos en el sistema.
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update, func
 
 from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.core.enums.alergeno_enums import NivelPresencia
 
 
 class AlergenoRepository:
@@ -231,3 +233,83 @@ class AlergenoRepository:
         query = select(AlergenoModel).where(AlergenoModel.activo == True)
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_mascara(self, alergeno_ids: List[str]) -> int:
+        """
+        Construye la máscara de bits correspondiente a un conjunto de alérgenos.
+
+        Parameters
+        ----------
+        alergeno_ids : List[str]
+            Identificadores de los alérgenos a incluir en la máscara.
+
+        Returns
+        -------
+        int
+            Máscara de bits. Los alérgenos sin bit asignado no aportan bits;
+            ``get_filtro_exclusion`` también resuelve esos alérgenos.
+        """
+        if not alergeno_ids:
+            return 0
+
+        query = select(AlergenoModel.bit_index).where(
+            AlergenoModel.id.in_(alergeno_ids),
+            AlergenoModel.bit_index.is_not(None),
+        )
+        result = await self.session.execute(query)
+
+        mascara = 0
+        for bit_index in result.scalars().all():
+            mascara |= 1 << bit_index
+        return mascara
+
+    async def get_filtro_exclusion(
+        self, alergeno_ids: List[str], tolerar_trazas: bool = True
+    ) -> Tuple[int, Set[str]]:
+        """
+        Resuelve el filtro que excluye los productos con alguno de los alérgenos.
+
+        Las máscaras solo tienen 63 bits: a partir del alérgeno 64 no queda
+        posición libre. Los productos con alérgenos sin bit se buscan en la
+        tabla de relaciones, que solo se consulta en ese caso.
+
+        Parameters
+        ----------
+        alergeno_ids : List[str]
+            Identificadores de los alérgenos a excluir.
+        tolerar_trazas : bool, optional
+            Si es False también cuentan las trazas y el "puede contener",
+            por defecto True.
+
+        Returns
+        -------
+        Tuple[int, Set[str]]
+            Máscara de bits de los alérgenos con bit y los IDs de los
+            productos que presentan alguno de los alérgenos sin bit.
+        """
+        if not alergeno_ids:
+            return 0, set()
+
+        result = await self.session.execute(
+            select(AlergenoModel.id, AlergenoModel.bit_index).where(
+                AlergenoModel.id.in_(alergeno_ids)
+            )
+        )
+        mascara = 0
+        sin_bit = []
+        for id_alergeno, bit_index in result.all():
+            if bit_index is None:
+                sin_bit.append(id_alergeno)
+            else:
+                mascara |= 1 << bit_index
+        if not sin_bit:
+            return mascara, set()
+
+        query = select(ProductoAlergenoModel.id_producto).distinct().where(
+            ProductoAlergenoModel.id_alergeno.in_(sin_bit),
+            ProductoAlergenoModel.activo == True,  # noqa: E712
+        )
+        if tolerar_trazas:
+            query = query.where(ProductoAlergenoModel.nivel_presencia == NivelPresencia.CONTIENE)
+        result = await self.session.execute(query)
+        return mascara, {str(id_producto) for id_producto in result.scalars().all()}
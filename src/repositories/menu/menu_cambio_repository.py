@@ -0,0 +1,141 @@
+"""
+Repositorio para el registro de cambios del menú.
+
+Los cambios no se escriben al registrarlos: quedan pendientes en la sesión
+y se insertan justo antes del siguiente commit, en la misma transacción
+que el cambio de la entidad. Si la transacción se deshace, los pendientes
+se descartan con ella.
+"""
+
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import event, select, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.models.menu.menu_cambio_model import MenuCambioModel
+from src.models.menu.menu_version_model import ID_VERSION_MENU, MenuVersionModel
+from src.core.enums.menu_enums import EntidadMenu
+
+# Clave de session.info con los cambios pendientes de escribir
+CLAVE_PENDIENTES = "menu_cambios_pendientes"
+
+
+@event.listens_for(Session, "before_commit")
+def _escribir_pendientes(session: Session) -> None:
+    """
+    Escribe los cambios del menú pendientes en la transacción que se confirma.
+
+    El contador se incrementa con un UPDATE, que bloquea su fila hasta el
+    commit: dos transacciones que cambian el menú a la vez reciben versiones
+    en el orden en que se confirman, y un cliente que lee la versión N ya
+    puede ver todos los cambios hasta N.
+    """
+    filas = session.info.pop(CLAVE_PENDIENTES, None)
+    if not filas:
+        return
+
+    version = session.execute(
+        update(MenuVersionModel)
+        .where(MenuVersionModel.id == ID_VERSION_MENU)
+        .values(version=MenuVersionModel.version + 1)
+        .returning(MenuVersionModel.version)
+    ).scalar()
+    if version is None:
+        # Base de datos creada sin migraciones: el contador aún no existe
+        version = 1
+        session.execute(insert(MenuVersionModel).values(id=ID_VERSION_MENU, version=version))
+
+    session.execute(
+        insert(MenuCambioModel), [{**fila, "version": version} for fila in filas]
+    )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _descartar_pendientes(session: Session, transaction: SessionTransaction) -> None:
+    """Descarta los cambios pendientes de una transacción que terminó sin escribirlos."""
+    if transaction.parent is None:
+        session.info.pop(CLAVE_PENDIENTES, None)
+
+
+class MenuCambioRepository:
+    """Repositorio para registrar y consultar cambios del menú.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    async def registrar(self, entidad: EntidadMenu, ids_entidad: Iterable[str]) -> None:
+        """
+        Registra que una o varias entidades del menú van a cambiar.
+
+        Debe llamarse antes de la escritura de la entidad: las filas se
+        insertan, con una nueva versión del menú, al confirmar esa escritura.
+        Todos los cambios de una transacción comparten versión.
+
+        Parameters
+        ----------
+        entidad : EntidadMenu
+            Tipo de entidad que cambia.
+        ids_entidad : Iterable[str]
+            Identificadores de las entidades; los duplicados se ignoran.
+        """
+        pendientes = self.session.info.setdefault(CLAVE_PENDIENTES, [])
+        registradas = {(fila["entidad"], fila["id_entidad"]) for fila in pendientes}
+        for id_entidad in dict.fromkeys(ids_entidad):
+            if (entidad, str(id_entidad)) not in registradas:
+                pendientes.append({"entidad": entidad, "id_entidad": str(id_entidad)})
+
+    async def get_version_actual(self) -> int:
+        """
+        Obtiene la versión vigente del menú.
+
+        Returns
+        -------
+        int
+            Valor del contador de versiones, o 0 si aún no hay cambios.
+        """
+        result = await self.session.execute(
+            select(MenuVersionModel.version).where(MenuVersionModel.id == ID_VERSION_MENU)
+        )
+        return int(result.scalar() or 0)
+
+    async def get_cambios_desde(
+        self, version: int, limite: int
+    ) -> List[Tuple[EntidadMenu, str]]:
+        """
+        Obtiene las entidades que cambiaron después de una versión.
+
+        Parameters
+        ----------
+        version : int
+            Versión a partir de la cual (excluida) buscar cambios.
+        limite : int
+            Número máximo de entidades distintas a retornar.
+
+        Returns
+        -------
+        List[Tuple[EntidadMenu, str]]
+            Pares (entidad, id_entidad) sin repetir.
+        """
+        query = (
+            select(MenuCambioModel.entidad, MenuCambioModel.id_entidad)
+            .where(MenuCambioModel.version > version)
+            .group_by(MenuCambioModel.entidad, MenuCambioModel.id_entidad)
+            .limit(limite)
+        )
+        result = await self.session.execute(query)
+        return [(EntidadMenu(entidad), id_entidad) for entidad, id_entidad in result.all()]
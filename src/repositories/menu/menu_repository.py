@@ -0,0 +1,213 @@
+"""
+Repositorio de solo lectura para construir el menú público completo.
+"""
+
+from typing import Collection, List, Optional, Set, Tuple
+
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
+from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
+
+
+class MenuRepository:
+    """Repositorio para las consultas del menú público.
+
+    Cada método ejecuta exactamente una consulta sobre el catálogo visible
+    (opcionalmente restringida a unos IDs), de modo que el número de
+    consultas para construir el menú no depende del número de categorías
+    ni de productos.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    @staticmethod
+    def _productos_visibles():
+        """Subconsulta con los IDs de productos disponibles en categorías activas."""
+        return (
+            select(ProductoModel.id)
+            .join(CategoriaModel, CategoriaModel.id == ProductoModel.id_categoria)
+            .where(
+                ProductoModel.disponible == True,  # noqa: E712
+                CategoriaModel.activo == True,  # noqa: E712
+            )
+        )
+
+    async def get_categorias(
+        self, ids_categoria: Optional[Collection[str]] = None
+    ) -> List[CategoriaModel]:
+        """
+        Obtiene las categorías activas ordenadas por nombre.
+
+        Parameters
+        ----------
+        ids_categoria : Optional[Collection[str]], optional
+            Restringe la consulta a estas categorías. Si es None, todas.
+
+        Returns
+        -------
+        List[CategoriaModel]
+            Categorías activas.
+        """
+        query = (
+            select(CategoriaModel)
+            .where(CategoriaModel.activo == True)  # noqa: E712
+            .order_by(CategoriaModel.nombre)
+        )
+        if ids_categoria is not None:
+            query = query.where(CategoriaModel.id.in_(ids_categoria))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_productos(
+        self, ids_producto: Optional[Collection[str]] = None
+    ) -> List[ProductoModel]:
+        """
+        Obtiene los productos disponibles de categorías activas ordenados por nombre.
+
+        Parameters
+        ----------
+        ids_producto : Optional[Collection[str]], optional
+            Restringe la consulta a estos productos. Si es None, todos.
+
+        Returns
+        -------
+        List[ProductoModel]
+            Productos visibles en el menú.
+        """
+        query = (
+            select(ProductoModel)
+            .where(ProductoModel.id.in_(self._productos_visibles()))
+            .order_by(ProductoModel.nombre)
+        )
+        if ids_producto is not None:
+            query = query.where(ProductoModel.id.in_(ids_producto))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_opciones(
+        self, ids_producto: Optional[Collection[str]] = None
+    ) -> List[Tuple[ProductoOpcionModel, TipoOpcionModel]]:
+        """
+        Obtiene las opciones activas de los productos visibles junto a su tipo.
+
+        Parameters
+        ----------
+        ids_producto : Optional[Collection[str]], optional
+            Restringe la consulta a estos productos. Si es None, todos.
+
+        Returns
+        -------
+        List[Tuple[ProductoOpcionModel, TipoOpcionModel]]
+            Pares (opción, tipo de opción) de tipos activos.
+        """
+        query = (
+            select(ProductoOpcionModel, TipoOpcionModel)
+            .join(TipoOpcionModel, TipoOpcionModel.id == ProductoOpcionModel.id_tipo_opcion)
+            .where(
+                ProductoOpcionModel.id_producto.in_(self._productos_visibles()),
+                ProductoOpcionModel.activo == True,  # noqa: E712
+                TipoOpcionModel.activo == True,  # noqa: E712
+            )
+        )
+        if ids_producto is not None:
+            query = query.where(ProductoOpcionModel.id_producto.in_(ids_producto))
+        result = await self.session.execute(query)
+        return [(opcion, tipo) for opcion, tipo in result.all()]
+
+    async def get_alergenos(
+        self, ids_producto: Optional[Collection[str]] = None
+    ) -> List[Tuple[ProductoAlergenoModel, AlergenoModel]]:
+        """
+        Obtiene las relaciones activas producto-alérgeno de los productos visibles.
+
+        Parameters
+        ----------
+        ids_producto : Optional[Collection[str]], optional
+            Restringe la consulta a estos productos. Si es None, todos.
+
+        Returns
+        -------
+        List[Tuple[ProductoAlergenoModel, AlergenoModel]]
+            Pares (relación, alérgeno) ordenados por nombre de alérgeno.
+        """
+        query = (
+            select(ProductoAlergenoModel, AlergenoModel)
+            .join(AlergenoModel, AlergenoModel.id == ProductoAlergenoModel.id_alergeno)
+            .where(
+                ProductoAlergenoModel.id_producto.in_(self._productos_visibles()),
+                ProductoAlergenoModel.activo == True,  # noqa: E712
+                AlergenoModel.activo == True,  # noqa: E712
+            )
+            .order_by(AlergenoModel.nombre)
+        )
+        if ids_producto is not None:
+            query = query.where(ProductoAlergenoModel.id_producto.in_(ids_producto))
+        result = await self.session.execute(query)
+        return [(relacion, alergeno) for relacion, alergeno in result.all()]
+
+    async def get_ids_productos_relacionados(
+        self,
+        ids_categoria: Collection[str] = (),
+        ids_tipo_opcion: Collection[str] = (),
+        ids_alergeno: Collection[str] = (),
+    ) -> Set[str]:
+        """
+        Obtiene los productos afectados por cambios en entidades que los agrupan.
+
+        Parameters
+        ----------
+        ids_categoria : Collection[str], optional
+            Categorías cuyos productos se buscan.
+        ids_tipo_opcion : Collection[str], optional
+            Tipos de opción usados por los productos buscados.
+        ids_alergeno : Collection[str], optional
+            Alérgenos vinculados a los productos buscados.
+
+        Returns
+        -------
+        Set[str]
+            IDs de los productos relacionados con cualquiera de las entidades.
+        """
+        consultas = []
+        if ids_categoria:
+            consultas.append(
+                select(ProductoModel.id).where(ProductoModel.id_categoria.in_(ids_categoria))
+            )
+        if ids_tipo_opcion:
+            consultas.append(
+                select(ProductoOpcionModel.id_producto).where(
+                    ProductoOpcionModel.id_tipo_opcion.in_(ids_tipo_opcion)
+                )
+            )
+        if ids_alergeno:
+            consultas.append(
+                select(ProductoAlergenoModel.id_producto).where(
+                    ProductoAlergenoModel.id_alergeno.in_(ids_alergeno)
+                )
+            )
+        if not consultas:
+            return set()
+
+        query = consultas[0] if len(consultas) == 1 else union(*consultas)
+        result = await self.session.execute(query)
+        return {str(id_producto) for id_producto in result.scalars().all()}
@@ -2,13 +2,29 @@
 Repositorio para la gestión de relaciones producto-alérgeno en el sistema.
 """
 
-from typing import Optional, List, Tuple
+import logging
+from typing import Optional, List, Tuple, Dict
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update, func
 
 from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_model import ProductoModel
+from src.core.enums.alergeno_enums import NivelPresencia
+
+logger = logging.getLogger(__name__)
+
+# Columna de ProductoModel que guarda la máscara de cada nivel de presencia
+COLUMNAS_MASCARA: Dict[NivelPresencia, str] = {
+    NivelPresencia.CONTIENE: "mascara_alergenos_contiene",
+    NivelPresencia.TRAZAS: "mascara_alergenos_trazas",
+    NivelPresencia.PUEDE_CONTENER: "mascara_alergenos_puede_contener",
+}
+
+# Las máscaras se guardan en BIGINT con signo: bits 0..62
+MAX_BITS_ALERGENO = 63
 
 
 class ProductoAlergenoRepository:
@@ -264,3 +280,144 @@ class ProductoAlergenoRepository:
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_alergenos_by_productos(
+        self, ids_producto: List[str]
+    ) -> List[Tuple[ProductoAlergenoModel, AlergenoModel]]:
+        """
+        Obtiene los alérgenos activos de varios productos en una sola consulta.
+
+        Parameters
+        ----------
+        ids_producto : List[str]
+            Identificadores de los productos a consultar.
+
+        Returns
+        -------
+        List[Tuple[ProductoAlergenoModel, AlergenoModel]]
+            Pares (relación, alérgeno) ordenados por producto y nombre de alérgeno.
+        """
+        if not ids_producto:
+            return []
+
+        query = (
+            select(ProductoAlergenoModel, AlergenoModel)
+            .join(AlergenoModel, AlergenoModel.id == ProductoAlergenoModel.id_alergeno)
+            .where(
+                ProductoAlergenoModel.id_producto.in_(ids_producto),
+                ProductoAlergenoModel.activo == True,  # noqa: E712
+                AlergenoModel.activo == True,  # noqa: E712
+            )
+            .order_by(ProductoAlergenoModel.id_producto, AlergenoModel.nombre)
+        )
+        result = await self.session.execute(query)
+        return [(relacion, alergeno) for relacion, alergeno in result.all()]
+
+    async def asignar_bits_faltantes(self) -> int:
+        """
+        Asigna una posición de bit a los alérgenos que todavía no la tienen.
+
+        Los alérgenos creados por scripts o por el seed no pasan por el servicio,
+        por lo que la asignación se hace de forma perezosa antes de recalcular
+        las máscaras. No hace commit; lo hace quien recalcula.
+
+        Returns
+        -------
+        int
+            Número de alérgenos a los que se asignó un bit.
+        """
+        query = (
+            select(AlergenoModel.id)
+            .where(AlergenoModel.bit_index.is_(None))
+            .order_by(AlergenoModel.id)
+        )
+        result = await self.session.execute(query)
+        sin_bit = list(result.scalars().all())
+        if not sin_bit:
+            return 0
+
+        max_result = await self.session.execute(select(func.max(AlergenoModel.bit_index)))
+        max_bit = max_result.scalar()
+        siguiente = 0 if max_bit is None else max_bit + 1
+
+        asignaciones = []
+        for id_alergeno in sin_bit:
+            if siguiente >= MAX_BITS_ALERGENO:
+                # Sin espacio en la máscara: los filtros de exclusión buscan
+                # este alérgeno en la tabla de relaciones
+                logger.warning(
+                    "Máscaras de alérgenos llenas: %d alérgenos sin bit", len(sin_bit) - len(asignaciones)
+                )
+                break
+            asignaciones.append({"id": id_alergeno, "bit_index": siguiente})
+            siguiente += 1
+
+        if asignaciones:
+            await self.session.execute(update(AlergenoModel), asignaciones)
+        return len(asignaciones)
+
+    async def recalcular_mascaras(self, ids_producto: Optional[List[str]] = None) -> int:
+        """
+        Recalcula las máscaras de alérgenos desnormalizadas en la tabla producto.
+
+        Parameters
+        ----------
+        ids_producto : Optional[List[str]], optional
+            Productos a recalcular. Si es None se recalcula todo el catálogo.
+
+        Returns
+        -------
+        int
+            Número de productos cuyas máscaras fueron escritas.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        try:
+            await self.asignar_bits_faltantes()
+
+            # Una sola consulta para todas las relaciones involucradas
+            query = (
+                select(
+                    ProductoAlergenoModel.id_producto,
+                    ProductoAlergenoModel.nivel_presencia,
+                    AlergenoModel.bit_index,
+                )
+                .join(AlergenoModel, AlergenoModel.id == ProductoAlergenoModel.id_alergeno)
+                .where(
+                    ProductoAlergenoModel.activo == True,  # noqa: E712
+                    AlergenoModel.bit_index.is_not(None),
+                )
+            )
+            if ids_producto is not None:
+                if not ids_producto:
+                    return 0
+                query = query.where(ProductoAlergenoModel.id_producto.in_(ids_producto))
+
+            result = await self.session.execute(query)
+
+            vacio = {columna: 0 for columna in COLUMNAS_MASCARA.values()}
+            mascaras: Dict[str, Dict[str, int]] = {
+                str(id_producto): dict(vacio) for id_producto in (ids_producto or [])
+            }
+            for id_producto, nivel, bit_index in result.all():
+                fila = mascaras.setdefault(str(id_producto), dict(vacio))
+                fila[COLUMNAS_MASCARA[NivelPresencia(nivel)]] |= 1 << bit_index
+
+            if ids_producto is None:
+                # Reiniciar el catálogo completo antes de escribir los productos con alérgenos
+                await self.session.execute(update(ProductoModel).values(**vacio))
+
+            if mascaras:
+                await self.session.execute(
+                    update(ProductoModel),
+                    [{"id": id_producto, **fila} for id_producto, fila in mascaras.items()],
+                )
+
+            await self.session.commit()
+            return len(mascaras)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
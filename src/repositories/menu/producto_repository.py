@@ -2,7 +2,7 @@
 Repositorio para la gestión de productos en el sistema.
 """
 
-from typing import Optional, List, Tuple
+from typing import Collection, Optional, List, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -83,6 +83,26 @@ class ProductoRepository:
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    async def get_by_ids(self, producto_ids: List[str]) -> List[ProductoModel]:
+        """
+        Obtiene varios productos por sus identificadores con una sola consulta.
+
+        Parameters
+        ----------
+        producto_ids : List[str]
+            Identificadores de los productos a buscar.
+
+        Returns
+        -------
+        List[ProductoModel]
+            Productos encontrados, en cualquier orden.
+        """
+        if not producto_ids:
+            return []
+        query = select(ProductoModel).where(ProductoModel.id.in_(producto_ids))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def get_by_id_with_opciones(self, producto_id: str) -> Optional[ProductoModel]:
         """
         Obtiene un producto por su ID con todas sus opciones Y tipos de opciones (eager loading).
@@ -199,7 +219,10 @@ class ProductoRepository:
             self, 
             skip: int = 0, 
             limit: int = 100,
-            id_categoria: str | None = None 
+            id_categoria: str | None = None,
+            mascara_excluida: int = 0,
+            tolerar_trazas: bool = True,
+            productos_excluidos: Collection[str] = (),
         ) -> Tuple[List[ProductoModel], int]:
         """
         Obtiene todos los productos con paginación y filtro opcional por categoría.
@@ -212,6 +235,14 @@ class ProductoRepository:
             Número máximo de registros a retornar, por defecto 100.
         id_categoria : UUID | None, optional
             ID de categoría para filtrar (opcional)
+        mascara_excluida : int, optional
+            Máscara de bits de alérgenos a excluir, por defecto 0 (sin filtro).
+        tolerar_trazas : bool, optional
+            Si es False también se excluyen productos con trazas o que
+            pueden contener los alérgenos, por defecto True.
+        productos_excluidos : Collection[str], optional
+            IDs de productos a excluir además de la máscara (los que tienen
+            alérgenos sin bit), por defecto ninguno.
 
         Returns
         -------
@@ -225,6 +256,19 @@ class ProductoRepository:
             # ✅ Aplicar filtro de categoría si se proporciona
             if id_categoria is not None:
                 query = query.where(ProductoModel.id_categoria == id_categoria)
+
+            # Filtro de alérgenos con operaciones bit a bit sobre columnas desnormalizadas
+            if mascara_excluida:
+                query = query.where(
+                    ProductoModel.mascara_alergenos_contiene.op("&")(mascara_excluida) == 0
+                )
+                if not tolerar_trazas:
+                    query = query.where(
+                        ProductoModel.mascara_alergenos_trazas.op("&")(mascara_excluida) == 0,
+                        ProductoModel.mascara_alergenos_puede_contener.op("&")(mascara_excluida) == 0,
+                    )
+            if productos_excluidos:
+                query = query.where(ProductoModel.id.not_in(list(productos_excluidos)))
             
             # Obtener total
             count_query = select(func.count()).select_from(query.subquery())
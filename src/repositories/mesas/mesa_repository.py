@@ -2,7 +2,7 @@
 Repositorio para la gestión de mesas en el sistema.
 """
 
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterable
 from uuid import UUID
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,6 +12,7 @@ from sqlalchemy.orm import selectinload
 
 from src.models.menu.alergeno_model import AlergenoModel
 from src.models.mesas.mesa_model import MesaModel
+from src.core.enums.mesa_enums import EstadoMesa
 
 
 class MesaRepository:
@@ -186,31 +187,87 @@ class MesaRepository:
         try:
             # Filtrar solo los campos que pertenecen al modelo
             valid_fields = {
-                k: v for k, v in kwargs.items() if hasattr(MesaModel, k) and k != "id"
+                k: v for k, v in kwargs.items() if hasattr(MesaModel, k) and k not in ("id", "version")
             }
 
             if not valid_fields:
                 # No hay campos válidos para actualizar
                 return await self.get_by_id(mesa_id)
 
-            # Construir y ejecutar la sentencia de actualización
+            # Actualizar y leer la mesa en la misma sentencia
             stmt = (
                 update(MesaModel)
                 .where(MesaModel.id == mesa_id)
-                .values(**valid_fields)
+                .values(**valid_fields, version=MesaModel.version + 1)
+                .returning(MesaModel)
+                .execution_options(populate_existing=True)
             )
 
             result = await self.session.execute(stmt)
+            updated_mesa = result.scalars().first()
             await self.session.commit()
 
-            # Consultar la mesa actualizada
-            updated_mesa = await self.get_by_id(mesa_id)
+            return updated_mesa
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
 
-            # Si no se encontró la mesa, retornar None
-            if not updated_mesa:
-                return None
+    async def cambiar_estado(
+        self,
+        mesa_id: str,
+        nuevo_estado: EstadoMesa,
+        estados_origen: Iterable[EstadoMesa],
+        version: Optional[int] = None,
+    ) -> Optional[MesaModel]:
+        """
+        Cambia el estado de una mesa si se cumplen las condiciones (compare-and-set).
 
-            return updated_mesa
+        La comprobación y la escritura se hacen en una sola sentencia
+        ``UPDATE ... WHERE ... RETURNING``, de modo que de dos peticiones
+        concurrentes sobre la misma mesa solo una puede aplicarse.
+
+        Parameters
+        ----------
+        mesa_id : str
+            Identificador único de la mesa.
+        nuevo_estado : EstadoMesa
+            Estado a asignar.
+        estados_origen : Iterable[EstadoMesa]
+            Estados actuales desde los que se permite el cambio.
+        version : Optional[int], optional
+            Si se indica, la mesa debe tener exactamente esta versión.
+
+        Returns
+        -------
+        Optional[MesaModel]
+            La mesa con su nuevo estado y versión, o None si no existe, está
+            inactiva o no cumple las condiciones.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        condiciones = [
+            MesaModel.id == mesa_id,
+            MesaModel.activo == True,
+            MesaModel.estado.in_(list(estados_origen)),
+        ]
+        if version is not None:
+            condiciones.append(MesaModel.version == version)
+
+        try:
+            stmt = (
+                update(MesaModel)
+                .where(*condiciones)
+                .values(estado=nuevo_estado, version=MesaModel.version + 1)
+                .returning(MesaModel)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            mesa = result.scalars().first()
+            await self.session.commit()
+            return mesa
         except SQLAlchemyError:
             await self.session.rollback()
             raise
@@ -310,4 +367,139 @@ class MesaRepository:
         """
         query = select(MesaModel).where(MesaModel.activo == True)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
\ No newline at end of file
+        return list(result.scalars().all())
+
+    async def get_activas_por_zona(self, zona: str) -> List[MesaModel]:
+        """
+        Obtiene las mesas activas de una zona ordenadas por número.
+
+        Parameters
+        ----------
+        zona : str
+            Zona de las mesas.
+
+        Returns
+        -------
+        List[MesaModel]
+            Mesas activas de la zona.
+        """
+        query = (
+            select(MesaModel)
+            .where(MesaModel.activo == True, MesaModel.zona == zona)
+            .order_by(MesaModel.numero)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_conteo_por_zona_estado(
+        self,
+    ) -> List[Tuple[Optional[str], EstadoMesa, int, int]]:
+        """
+        Cuenta las mesas activas agrupadas por zona y estado.
+
+        Returns
+        -------
+        List[Tuple[Optional[str], EstadoMesa, int, int]]
+            Tuplas (zona, estado, número de mesas, suma de capacidades).
+        """
+        query = (
+            select(
+                MesaModel.zona,
+                MesaModel.estado,
+                func.count(MesaModel.id),
+                func.coalesce(func.sum(MesaModel.capacidad), 0),
+            )
+            .where(MesaModel.activo == True)
+            .group_by(MesaModel.zona, MesaModel.estado)
+        )
+        result = await self.session.execute(query)
+        return [tuple(fila) for fila in result.all()]
+
+    async def get_todas(self) -> List[MesaModel]:
+        """
+        Obtiene todas las mesas, activas o no, sin paginación.
+
+        Returns
+        -------
+        List[MesaModel]
+            Lista completa de mesas.
+        """
+        result = await self.session.execute(select(MesaModel))
+        return list(result.scalars().all())
+
+    async def aplicar_sincronizacion(
+        self,
+        nuevas: List[MesaModel],
+        cambios: List[Dict[str, Any]],
+        ids_desactivar: List[str],
+    ) -> List[MesaModel]:
+        """
+        Aplica en una sola transacción el resultado de una sincronización.
+
+        Las inserciones se hacen en lote. Cada actualización es un
+        compare-and-set sobre la versión leída, igual que ``cambiar_estado``:
+        la mesa solo se escribe si nadie la modificó después de leerla, y
+        su versión se incrementa en la propia sentencia.
+
+        Parameters
+        ----------
+        nuevas : List[MesaModel]
+            Mesas a insertar.
+        cambios : List[Dict[str, Any]]
+            Valores a actualizar; cada diccionario incluye el ``id`` y la
+            ``version`` con la que se leyó la mesa.
+        ids_desactivar : List[str]
+            IDs de las mesas a marcar como inactivas.
+
+        Returns
+        -------
+        List[MesaModel]
+            Mesas insertadas, actualizadas y desactivadas con su estado final.
+            Las actualizaciones que no se aplicaron por conflicto de versión
+            no aparecen.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        if not (nuevas or cambios or ids_desactivar):
+            return []
+
+        try:
+            if nuevas:
+                self.session.add_all(nuevas)
+                await self.session.flush()
+            actualizadas: List[str] = []
+            for cambio in cambios:
+                valores = dict(cambio)
+                mesa_id = valores.pop("id")
+                version = valores.pop("version")
+                result = await self.session.execute(
+                    update(MesaModel)
+                    .where(MesaModel.id == mesa_id, MesaModel.version == version)
+                    .values(**valores, version=MesaModel.version + 1)
+                    .returning(MesaModel.id)
+                )
+                if result.scalar_one_or_none() is not None:
+                    actualizadas.append(mesa_id)
+            if ids_desactivar:
+                await self.session.execute(
+                    update(MesaModel)
+                    .where(MesaModel.id.in_(ids_desactivar))
+                    .values(activo=False, version=MesaModel.version + 1)
+                )
+            await self.session.commit()
+
+            ids = [mesa.id for mesa in nuevas] + actualizadas + ids_desactivar
+            if not ids:
+                return []
+            result = await self.session.execute(
+                select(MesaModel)
+                .where(MesaModel.id.in_(ids))
+                .execution_options(populate_existing=True)
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
@@ -0,0 +1,88 @@
+"""
+Repositorio para las respuestas guardadas de peticiones idempotentes.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+
+from src.models.pagos.idempotencia_model import IdempotenciaModel
+
+
+class IdempotenciaRepository:
+    """Repositorio para gestionar las claves de idempotencia.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    async def get(self, ambito: str, clave: str, ahora: datetime) -> Optional[IdempotenciaModel]:
+        """
+        Obtiene la respuesta guardada vigente de una clave.
+
+        Parameters
+        ----------
+        ambito : str
+            Operación a la que pertenece la clave.
+        clave : str
+            Clave de idempotencia enviada por el cliente.
+        ahora : datetime
+            Momento actual (UTC); las claves expiradas se ignoran.
+
+        Returns
+        -------
+        Optional[IdempotenciaModel]
+            La respuesta guardada o None si no existe o expiró.
+        """
+        query = select(IdempotenciaModel).where(
+            IdempotenciaModel.ambito == ambito,
+            IdempotenciaModel.clave == clave,
+            IdempotenciaModel.expira_en > ahora,
+        )
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def eliminar_expiradas(self, ahora: datetime) -> int:
+        """
+        Elimina las claves expiradas.
+
+        Parameters
+        ----------
+        ahora : datetime
+            Momento actual (UTC).
+
+        Returns
+        -------
+        int
+            Número de claves eliminadas.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        try:
+            result = await self.session.execute(
+                delete(IdempotenciaModel).where(IdempotenciaModel.expira_en <= ahora)
+            )
+            await self.session.commit()
+            return result.rowcount or 0
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
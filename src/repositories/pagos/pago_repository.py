@@ -0,0 +1,176 @@
+"""
+Repositorio para la gestión de pagos en el sistema.
+"""
+
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update
+
+from src.core.enums.pago_enums import EstadoPago
+from src.models.pagos.pago_model import PagoModel
+from src.models.pagos.idempotencia_model import IdempotenciaModel
+
+
+class PagoRepository:
+    """Repositorio para gestionar operaciones del modelo de pagos.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    async def create(
+        self, pago: PagoModel, idempotencia: Optional[IdempotenciaModel] = None
+    ) -> PagoModel:
+        """
+        Crea un pago y, si se indica, su respuesta idempotente en la misma transacción.
+
+        Si la clave de idempotencia ya existe, la restricción única hace
+        fallar la transacción completa y el pago no se registra.
+
+        Parameters
+        ----------
+        pago : PagoModel
+            Pago a registrar.
+        idempotencia : Optional[IdempotenciaModel], optional
+            Respuesta a guardar para la clave de idempotencia de la petición.
+
+        Returns
+        -------
+        PagoModel
+            El mismo pago, ya persistido.
+
+        Raises
+        ------
+        IntegrityError
+            Si la clave de idempotencia ya fue usada.
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        try:
+            self.session.add(pago)
+            if idempotencia is not None:
+                self.session.add(idempotencia)
+            await self.session.flush()
+            await self.session.commit()
+            return pago
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get_by_id(self, pago_id: str) -> Optional[PagoModel]:
+        """
+        Obtiene un pago por su identificador único.
+
+        Parameters
+        ----------
+        pago_id : str
+            Identificador único del pago.
+
+        Returns
+        -------
+        Optional[PagoModel]
+            El pago encontrado o None si no existe.
+        """
+        query = select(PagoModel).where(PagoModel.id == pago_id)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def cambiar_estado(
+        self,
+        pago_id: str,
+        nuevo_estado: EstadoPago,
+        estados_origen: Iterable[EstadoPago],
+        referencia: Optional[str] = None,
+    ) -> Optional[PagoModel]:
+        """
+        Cambia el estado de un pago si está en uno de los estados de origen (compare-and-set).
+
+        La comprobación y la escritura se hacen en una sola sentencia
+        ``UPDATE ... WHERE ... RETURNING``: de dos confirmaciones
+        concurrentes del mismo pago solo una se aplica.
+
+        Parameters
+        ----------
+        pago_id : str
+            Identificador único del pago.
+        nuevo_estado : EstadoPago
+            Estado a asignar.
+        estados_origen : Iterable[EstadoPago]
+            Estados actuales desde los que se permite el cambio.
+        referencia : Optional[str], optional
+            Número de operación a guardar; si es None se conserva el actual.
+
+        Returns
+        -------
+        Optional[PagoModel]
+            El pago con su nuevo estado y versión, o None si no existe o no
+            cumple las condiciones.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        valores = {"estado": nuevo_estado, "version": PagoModel.version + 1}
+        if referencia is not None:
+            valores["referencia"] = referencia
+
+        try:
+            stmt = (
+                update(PagoModel)
+                .where(
+                    PagoModel.id == pago_id,
+                    PagoModel.estado.in_(list(estados_origen)),
+                )
+                .values(**valores)
+                .returning(PagoModel)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            pago = result.scalars().first()
+            await self.session.commit()
+            return pago
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get_total_por_pedido(
+        self, pedido_id: str, estados: Iterable[EstadoPago]
+    ) -> Decimal:
+        """
+        Suma los importes de los pagos de un pedido en los estados indicados.
+
+        Parameters
+        ----------
+        pedido_id : str
+            Identificador único del pedido.
+        estados : Iterable[EstadoPago]
+            Estados de los pagos a sumar.
+
+        Returns
+        -------
+        Decimal
+            Importe total; cero si no hay pagos.
+        """
+        query = select(func.coalesce(func.sum(PagoModel.monto), 0)).where(
+            PagoModel.id_pedido == pedido_id,
+            PagoModel.estado.in_(list(estados)),
+        )
+        result = await self.session.execute(query)
+        return Decimal(str(result.scalar())).quantize(Decimal("0.01"))
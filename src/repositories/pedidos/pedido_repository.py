@@ -0,0 +1,324 @@
+"""
+Repositorio para la gestión de pedidos en el sistema.
+"""
+
+from typing import Iterable, Optional, List, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import noload
+
+from src.core.enums.pedido_enums import EstadoPedido
+from src.models.pedidos.pedido_model import PedidoModel
+from src.models.pedidos.pedido_item_model import PedidoItemModel
+
+
+class PedidoRepository:
+    """Repositorio para gestionar operaciones del modelo de pedidos.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Sesión asíncrona de SQLAlchemy para realizar operaciones en la base de datos.
+        """
+        self.session = session
+
+    async def create(self, pedido: PedidoModel) -> PedidoModel:
+        """
+        Crea un pedido con todos sus ítems en una sola transacción.
+
+        Los IDs se generan en la aplicación, así que el pedido se inserta
+        con una sentencia y todos sus ítems con un único INSERT de varias
+        filas; no se vuelve a leer nada después.
+
+        Parameters
+        ----------
+        pedido : PedidoModel
+            Pedido con sus ítems ya valorados.
+
+        Returns
+        -------
+        PedidoModel
+            El mismo pedido, ya persistido.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        try:
+            self.session.add(pedido)
+            await self.session.flush()
+            await self.session.commit()
+            return pedido
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get_by_id(self, pedido_id: str) -> Optional[PedidoModel]:
+        """
+        Obtiene un pedido con sus ítems por su identificador único.
+
+        Parameters
+        ----------
+        pedido_id : str
+            Identificador único del pedido.
+
+        Returns
+        -------
+        Optional[PedidoModel]
+            El pedido encontrado o None si no existe.
+        """
+        query = select(PedidoModel).where(PedidoModel.id == pedido_id)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        id_mesa: Optional[str] = None,
+        estado: Optional[EstadoPedido] = None,
+    ) -> Tuple[List[PedidoModel], int]:
+        """
+        Obtiene pedidos paginados, del más reciente al más antiguo.
+
+        Los ítems no se cargan: los listados solo muestran el resumen.
+
+        Parameters
+        ----------
+        skip : int, optional
+            Número de registros a omitir (offset), por defecto 0.
+        limit : int, optional
+            Número máximo de registros a retornar, por defecto 100.
+        id_mesa : Optional[str], optional
+            Filtra por mesa.
+        estado : Optional[EstadoPedido], optional
+            Filtra por estado.
+
+        Returns
+        -------
+        Tuple[List[PedidoModel], int]
+            Tupla con la lista de pedidos y el número total de registros.
+        """
+        condiciones = []
+        if id_mesa is not None:
+            condiciones.append(PedidoModel.id_mesa == id_mesa)
+        if estado is not None:
+            condiciones.append(PedidoModel.estado == estado)
+
+        query = (
+            select(PedidoModel)
+            .where(*condiciones)
+            .order_by(PedidoModel.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .options(noload(PedidoModel.items))
+        )
+        count_query = select(func.count(PedidoModel.id)).where(*condiciones)
+
+        result = await self.session.execute(query)
+        count_result = await self.session.execute(count_query)
+        return list(result.scalars().all()), count_result.scalar() or 0
+
+
+    async def get_item(self, item_id: str) -> Optional[PedidoItemModel]:
+        """
+        Obtiene un ítem de pedido por su identificador único.
+
+        Parameters
+        ----------
+        item_id : str
+            Identificador único del ítem.
+
+        Returns
+        -------
+        Optional[PedidoItemModel]
+            El ítem encontrado o None si no existe.
+        """
+        query = select(PedidoItemModel).where(PedidoItemModel.id == item_id)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def cambiar_estado_item(
+        self,
+        item_id: str,
+        nuevo_estado: EstadoPedido,
+        estados_origen: Iterable[EstadoPedido],
+        pedido_id: str,
+        version_pedido: int,
+        estado_pedido: Optional[EstadoPedido] = None,
+    ) -> Optional[PedidoItemModel]:
+        """
+        Cambia el estado de un ítem y el derivado de su pedido en una sola transacción.
+
+        Primero se incrementa la versión del pedido solo si sigue siendo la
+        leída (compare-and-set), asignando a la vez el estado derivado; así
+        dos cambios simultáneos de ítems del mismo pedido no se pisan y el
+        estado del pedido siempre se calcula sobre los ítems vigentes. Después
+        se cambia el ítem si está en uno de los estados de origen. Si
+        cualquiera de las dos condiciones falla se deshace todo.
+
+        Parameters
+        ----------
+        item_id : str
+            Identificador único del ítem.
+        nuevo_estado : EstadoPedido
+            Estado a asignar al ítem.
+        estados_origen : Iterable[EstadoPedido]
+            Estados actuales del ítem desde los que se permite el cambio.
+        pedido_id : str
+            Identificador único del pedido del ítem.
+        version_pedido : int
+            Versión del pedido sobre la que se calculó el estado derivado.
+        estado_pedido : Optional[EstadoPedido], optional
+            Nuevo estado del pedido, o None para conservar el actual.
+
+        Returns
+        -------
+        Optional[PedidoItemModel]
+            El ítem con su nuevo estado, o None si no existe, no cumple las
+            condiciones o el pedido cambió desde que se leyó.
+
+        Raises
+        ------
+        SQLAlchemyError
+            Si ocurre un error durante la operación en la base de datos.
+        """
+        valores = {"version": PedidoModel.version + 1}
+        if estado_pedido is not None:
+            valores["estado"] = estado_pedido
+        try:
+            # Cambia lo que se cobra (ítems cancelados): la cuenta se recalcula
+            pedido = await self.session.execute(
+                update(PedidoModel)
+                .where(PedidoModel.id == pedido_id, PedidoModel.version == version_pedido)
+                .values(**valores)
+                .returning(PedidoModel)
+                .execution_options(populate_existing=True)
+            )
+            if pedido.scalars().first() is None:
+                await self.session.rollback()
+                return None
+
+            stmt = (
+                update(PedidoItemModel)
+                .where(
+                    PedidoItemModel.id == item_id,
+                    PedidoItemModel.id_pedido == pedido_id,
+                    PedidoItemModel.estado.in_(list(estados_origen)),
+                )
+                .values(estado=nuevo_estado)
+                .returning(PedidoItemModel)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            item = result.scalars().first()
+            if item is None:
+                await self.session.rollback()
+                return None
+            await self.session.commit()
+            return item
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get_items_en_cocina(
+        self, estados: Iterable[EstadoPedido]
+    ) -> List[Tuple[PedidoItemModel, PedidoModel]]:
+        """
+        Obtiene los ítems en los estados indicados junto con su pedido.
+
+        Se usa al arrancar para reconstruir las colas de cocina en memoria;
+        los ítems de pedidos cancelados se excluyen.
+
+        Parameters
+        ----------
+        estados : Iterable[EstadoPedido]
+            Estados de los ítems a recuperar.
+
+        Returns
+        -------
+        List[Tuple[PedidoItemModel, PedidoModel]]
+            Pares (ítem, pedido) en una sola consulta.
+        """
+        query = (
+            select(PedidoItemModel, PedidoModel)
+            .join(PedidoModel, PedidoItemModel.id_pedido == PedidoModel.id)
+            .where(
+                PedidoItemModel.estado.in_(list(estados)),
+                PedidoModel.estado != EstadoPedido.CANCELADO,
+            )
+            .options(noload(PedidoModel.items))
+        )
+        result = await self.session.execute(query)
+        return [(item, pedido) for item, pedido in result.all()]
+
+    async def get_versiones_por_mesa(
+        self, id_mesa: str, pedido_ids: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Obtiene el ID y la versión de los pedidos no cancelados de una mesa.
+
+        Es una consulta ligera que no carga ítems; sirve para saber si un
+        cálculo guardado sobre esos pedidos sigue vigente.
+
+        Parameters
+        ----------
+        id_mesa : str
+            Identificador de la mesa.
+        pedido_ids : Optional[Iterable[str]], optional
+            Restringe la consulta a estos pedidos. Si es None, todos.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            Pares (id, versión) ordenados por ID.
+        """
+        condiciones = [
+            PedidoModel.id_mesa == id_mesa,
+            PedidoModel.estado != EstadoPedido.CANCELADO,
+        ]
+        if pedido_ids is not None:
+            condiciones.append(PedidoModel.id.in_(list(pedido_ids)))
+
+        query = (
+            select(PedidoModel.id, PedidoModel.version)
+            .where(*condiciones)
+            .order_by(PedidoModel.id)
+        )
+        result = await self.session.execute(query)
+        return [(pedido_id, version) for pedido_id, version in result.all()]
+
+    async def get_by_ids(self, pedido_ids: Iterable[str]) -> List[PedidoModel]:
+        """
+        Obtiene varios pedidos con sus ítems en dos consultas.
+
+        Parameters
+        ----------
+        pedido_ids : Iterable[str]
+            Identificadores de los pedidos.
+
+        Returns
+        -------
+        List[PedidoModel]
+            Pedidos encontrados ordenados por ID.
+        """
+        query = (
+            select(PedidoModel)
+            .where(PedidoModel.id.in_(list(pedido_ids)))
+            .order_by(PedidoModel.id)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,141 @@
+"""
+Pruebas de integración para las colas de cocina.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.menu_cambio_model import MenuCambioModel  # noqa: F401 - crea la tabla
+from src.models.mesas.mesa_model import MesaModel
+from src.models.pedidos.pedido_model import PedidoModel
+from src.models.pedidos.pedido_item_model import PedidoItemModel
+from src.business_logic.menu.menu_service import catalogo_cache
+from src.business_logic.notifications.websocket_hub import WebSocketHub
+from src.business_logic.pedidos.cocina_service import CocinaService
+from src.business_logic.pedidos.cola_cocina import ColaCocina
+from src.business_logic.pedidos.pedido_service import PedidoService
+from src.api.schemas.pedido_schema import ItemCocinaTransicion, PedidoCreate, PedidoItemCreate
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+
+@pytest.mark.asyncio
+async def test_integration_restaurar_colas_de_cocina(db_session):
+    """
+    Verifica que las colas se reconstruyen desde la base de datos.
+
+    PRECONDICIONES:
+        - Un pedido normal con un plato y una bebida, y después uno urgente.
+        - El plato del primer pedido está en preparación y la bebida ya está lista.
+
+    PROCESO:
+        - Restaurar unas colas nuevas desde la base de datos.
+
+    POSTCONDICIONES:
+        - La cocina tiene primero el plato urgente y después el que está en preparación.
+        - El bar no tiene ítems, porque la bebida ya está lista.
+        - El primer pedido quedó en preparación.
+    """
+    catalogo_cache.clear()
+    cocina = CategoriaModel(nombre="Ceviches")
+    bar = CategoriaModel(nombre="Bebidas", estacion="bar")
+    mesa = MesaModel(numero="M1", zona="Terraza")
+    db_session.add_all([cocina, bar, mesa])
+    await db_session.flush()
+    ceviche = ProductoModel(id_categoria=cocina.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    chicha = ProductoModel(id_categoria=bar.id, nombre="Chicha", precio_base=Decimal("6.00"))
+    db_session.add_all([ceviche, chicha])
+    await db_session.commit()
+
+    pedido_service = PedidoService(db_session)
+    pedido_service.event_bus = AsyncMock()
+    normal = await pedido_service.create_pedido(PedidoCreate(
+        id_mesa=mesa.id,
+        items=[PedidoItemCreate(id_producto=ceviche.id), PedidoItemCreate(id_producto=chicha.id)],
+    ))
+    urgente = await pedido_service.create_pedido(PedidoCreate(
+        id_mesa=mesa.id,
+        prioridad=PrioridadPedido.URGENTE,
+        items=[PedidoItemCreate(id_producto=ceviche.id, cantidad=2)],
+    ))
+    plato, bebida = normal.items
+    assert (plato.estacion, bebida.estacion) == ("cocina", "bar")
+
+    cocina_service = CocinaService(db_session)
+    cocina_service.event_bus = AsyncMock()
+    await cocina_service.transicionar_item(plato.id, ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION))
+    await cocina_service.transicionar_item(bebida.id, ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION))
+    await cocina_service.transicionar_item(bebida.id, ItemCocinaTransicion(estado=EstadoPedido.LISTO))
+
+    @asynccontextmanager
+    async def fabrica_sesion():
+        yield db_session
+
+    colas = ColaCocina(WebSocketHub(), fabrica_sesion=fabrica_sesion)
+    assert await colas.restaurar() == 2
+
+    assert [(item.id, item.estado) for item in colas.items("cocina")] == [
+        (urgente.items[0].id, EstadoPedido.PENDIENTE),
+        (plato.id, EstadoPedido.EN_PREPARACION),
+    ]
+    assert colas.items("bar") == []
+    assert (await db_session.get(PedidoModel, normal.id)).estado == EstadoPedido.EN_PREPARACION
+
+
+@pytest.mark.asyncio
+async def test_integration_transicion_con_pedido_desactualizado(db_session):
+    """
+    Verifica que el cambio de un ítem no se escribe sobre una versión antigua del pedido.
+
+    PRECONDICIONES:
+        - Un pedido con dos platos en preparación.
+
+    PROCESO:
+        - Marcar el primero como listo con la versión del pedido anterior a
+          otro cambio y después marcar ambos como listos desde el servicio.
+
+    POSTCONDICIONES:
+        - La escritura con la versión antigua no cambia ni el ítem ni el pedido.
+        - Tras los dos cambios del servicio el pedido queda listo.
+    """
+    catalogo_cache.clear()
+    cocina = CategoriaModel(nombre="Ceviches")
+    mesa = MesaModel(numero="M1", zona="Terraza")
+    db_session.add_all([cocina, mesa])
+    await db_session.flush()
+    ceviche = ProductoModel(id_categoria=cocina.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    db_session.add(ceviche)
+    await db_session.commit()
+
+    pedido_service = PedidoService(db_session)
+    pedido_service.event_bus = AsyncMock()
+    pedido = await pedido_service.create_pedido(PedidoCreate(
+        id_mesa=mesa.id,
+        items=[PedidoItemCreate(id_producto=ceviche.id), PedidoItemCreate(id_producto=ceviche.id)],
+    ))
+    primero, segundo = (item.id for item in pedido.items)
+
+    cocina_service = CocinaService(db_session)
+    cocina_service.event_bus = AsyncMock()
+    await cocina_service.transicionar_item(primero, ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION))
+    version_antigua = (await db_session.get(PedidoModel, pedido.id)).version
+    await cocina_service.transicionar_item(segundo, ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION))
+
+    escrito = await cocina_service.repository.cambiar_estado_item(
+        primero,
+        EstadoPedido.LISTO,
+        [EstadoPedido.EN_PREPARACION],
+        pedido.id,
+        version_antigua,
+        EstadoPedido.LISTO,
+    )
+    assert escrito is None
+    assert (await db_session.get(PedidoItemModel, primero)).estado == EstadoPedido.EN_PREPARACION
+    assert (await db_session.get(PedidoModel, pedido.id)).estado == EstadoPedido.EN_PREPARACION
+
+    await cocina_service.transicionar_item(primero, ItemCocinaTransicion(estado=EstadoPedido.LISTO))
+    await cocina_service.transicionar_item(segundo, ItemCocinaTransicion(estado=EstadoPedido.LISTO))
+    assert (await db_session.get(PedidoModel, pedido.id)).estado == EstadoPedido.LISTO
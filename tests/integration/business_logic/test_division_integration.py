@@ -0,0 +1,83 @@
+"""
+Pruebas de integración para la división de cuentas.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.menu_cambio_model import MenuCambioModel  # noqa: F401 - crea la tabla
+from src.models.mesas.mesa_model import MesaModel
+from src.models.pedidos.pedido_model import PedidoModel  # noqa: F401 - crea la tabla
+from src.models.pedidos.pedido_item_model import PedidoItemModel  # noqa: F401 - crea la tabla
+from src.business_logic.menu.menu_service import catalogo_cache
+from src.business_logic.pagos.division_service import DivisionCuentaService, division_cache
+from src.business_logic.pedidos.cocina_service import CocinaService
+from src.business_logic.exceptions.pago_exceptions import PagoValidationError
+from src.business_logic.pedidos.pedido_service import PedidoService
+from src.api.schemas.pago_schema import AsignacionItem, DivisionCuentaRequest
+from src.api.schemas.pedido_schema import ItemCocinaTransicion, PedidoCreate, PedidoItemCreate
+from src.core.enums.pedido_enums import EstadoPedido, TipoDivision
+
+
+@pytest.mark.asyncio
+async def test_integration_division_se_recalcula_al_cancelar_item(db_session):
+    """
+    Verifica que cancelar un ítem invalida la división guardada.
+
+    PRECONDICIONES:
+        - Una mesa con un pedido de dos ceviches y una chicha.
+
+    PROCESO:
+        - Dividir la cuenta por ítems: el ceviche entre tres y la chicha para uno.
+        - Cancelar la chicha desde cocina y volver a dividir.
+
+    POSTCONDICIONES:
+        - La primera división reparte los céntimos del ceviche y suma el total.
+        - Tras cancelar, la chicha ya no está en la cuenta y se rechaza su asignación.
+    """
+    catalogo_cache.clear()
+    division_cache.clear()
+    categoria = CategoriaModel(nombre="Ceviches")
+    mesa = MesaModel(numero="M1", zona="Terraza")
+    db_session.add_all([categoria, mesa])
+    await db_session.flush()
+    ceviche = ProductoModel(id_categoria=categoria.id, nombre="Ceviche", precio_base=Decimal("30.05"))
+    chicha = ProductoModel(id_categoria=categoria.id, nombre="Chicha", precio_base=Decimal("6.00"))
+    db_session.add_all([ceviche, chicha])
+    await db_session.commit()
+
+    pedido_service = PedidoService(db_session)
+    pedido_service.event_bus = AsyncMock()
+    pedido = await pedido_service.create_pedido(PedidoCreate(
+        id_mesa=mesa.id,
+        items=[PedidoItemCreate(id_producto=ceviche.id, cantidad=2), PedidoItemCreate(id_producto=chicha.id)],
+    ))
+    plato, bebida = pedido.items
+    solicitud = DivisionCuentaRequest(
+        id_mesa=mesa.id,
+        tipo=TipoDivision.POR_ITEMS,
+        asignaciones=[
+            AsignacionItem(id_item=plato.id, comensales=["1", "2", "3"]),
+            AsignacionItem(id_item=bebida.id, comensales=["1"]),
+        ],
+    )
+
+    division = await DivisionCuentaService(db_session).dividir(solicitud)
+
+    assert division.total == Decimal("66.10")
+    assert [parte.importe for parte in division.partes] == [
+        Decimal("26.04"), Decimal("20.03"), Decimal("20.03")
+    ]
+    assert division.pendiente == Decimal("0.00")
+
+    cocina_service = CocinaService(db_session)
+    cocina_service.event_bus = AsyncMock()
+    await cocina_service.transicionar_item(bebida.id, ItemCocinaTransicion(estado=EstadoPedido.CANCELADO))
+    db_session.expire_all()
+
+    with pytest.raises(PagoValidationError):
+        await DivisionCuentaService(db_session).dividir(solicitud)
+    division_cache.clear()
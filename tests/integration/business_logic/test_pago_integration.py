@@ -0,0 +1,71 @@
+"""
+Pruebas de integración para el registro idempotente de pagos.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import timedelta
+
+from sqlalchemy import func, select
+
+from src.models.mesas.mesa_model import MesaModel
+from src.models.pedidos.pedido_model import PedidoModel  # noqa: F401 - crea la tabla
+from src.models.pagos.pago_model import PagoModel
+from src.models.pagos.idempotencia_model import IdempotenciaModel
+from src.business_logic.pagos import idempotencia
+from src.business_logic.pagos.idempotencia import ahora_utc, respuestas_cache
+from src.business_logic.pagos.pago_service import PagoService
+from src.api.schemas.pago_schema import PagoCreate, PagoTransicion
+from src.core.enums.pago_enums import EstadoPago, MetodoPago
+
+
+@pytest.mark.asyncio
+async def test_integration_reintento_devuelve_respuesta_guardada(db_session, monkeypatch):
+    """
+    Verifica que un reintento tras perder la caché se sirve desde la tabla.
+
+    PRECONDICIONES:
+        - Una mesa activa.
+
+    PROCESO:
+        - Registrar un pago con una clave, vaciar la caché en memoria y reintentar.
+        - Completar el pago dos veces.
+        - Purgar una clave expirada.
+
+    POSTCONDICIONES:
+        - Solo hay un pago y el reintento devuelve el mismo.
+        - La segunda confirmación devuelve el pago sin incrementar su versión.
+        - La clave expirada se elimina y la vigente se conserva.
+    """
+    respuestas_cache.clear()
+    mesa = MesaModel(numero="M1", zona="Terraza")
+    db_session.add(mesa)
+    await db_session.commit()
+    datos = PagoCreate(id_mesa=mesa.id, metodo=MetodoPago.YAPE, monto=Decimal("42.00"))
+
+    pago, _ = await PagoService(db_session).registrar_pago(datos, "a1b2")
+    respuestas_cache.clear()
+    reintento, repetido = await PagoService(db_session).registrar_pago(datos, "a1b2")
+
+    assert repetido is True
+    assert reintento == pago
+    assert await db_session.scalar(select(func.count(PagoModel.id))) == 1
+
+    servicio = PagoService(db_session)
+    transicion = PagoTransicion(estado=EstadoPago.COMPLETADO, referencia="op-123")
+    completado = await servicio.transicionar_pago(pago.id, transicion)
+    repetida = await servicio.transicionar_pago(pago.id, transicion)
+    assert (completado.estado, completado.version, completado.referencia) == (
+        EstadoPago.COMPLETADO, 2, "op-123"
+    )
+    assert repetida.version == 2
+
+    db_session.add(IdempotenciaModel(
+        ambito="pagos.registrar", clave="vieja", huella="0" * 64, codigo_estado=201,
+        respuesta="{}", expira_en=ahora_utc() - timedelta(minutes=1),
+    ))
+    await db_session.commit()
+    monkeypatch.setattr(idempotencia, "_ultima_purga", 0.0)
+    assert await servicio.idempotencia.purgar_expiradas() == 1
+    assert await db_session.scalar(select(func.count(IdempotenciaModel.id))) == 1
+    respuestas_cache.clear()
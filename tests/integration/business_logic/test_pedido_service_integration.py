@@ -0,0 +1,86 @@
+"""
+Pruebas de integración para la creación de pedidos.
+"""
+
+import pytest
+from decimal import Decimal
+from sqlalchemy import event
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.menu_cambio_model import MenuCambioModel  # noqa: F401 - crea la tabla
+from src.models.mesas.mesa_model import MesaModel
+from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
+from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
+from src.models.pedidos.pedido_model import PedidoModel  # noqa: F401 - crea la tabla
+from src.models.pedidos.pedido_item_model import PedidoItemModel  # noqa: F401 - crea la tabla
+from src.business_logic.menu.menu_service import catalogo_cache
+from src.business_logic.pedidos.pedido_service import PedidoService
+from src.api.schemas.pedido_schema import PedidoCreate, PedidoItemCreate
+
+
+@pytest.mark.asyncio
+async def test_integration_create_pedido_inserta_items_en_lote(db_session):
+    """
+    Verifica que un pedido se guarda con un número fijo de sentencias.
+
+    PRECONDICIONES:
+        - Existen una mesa, dos productos y una opción.
+
+    PROCESO:
+        - Crear un pedido con tres ítems contando los INSERT ejecutados.
+        - Volver a leer el pedido.
+
+    POSTCONDICIONES:
+        - Se ejecuta un INSERT para el pedido y uno para todos sus ítems.
+        - El pedido leído conserva precios, opciones y el orden de los ítems.
+    """
+    catalogo_cache.clear()
+    categoria = CategoriaModel(nombre="Ceviches")
+    mesa = MesaModel(numero="M1", zona="Terraza")
+    tipo = TipoOpcionModel(codigo="tamano", nombre="Tamaño")
+    db_session.add_all([categoria, mesa, tipo])
+    await db_session.flush()
+    ceviche = ProductoModel(id_categoria=categoria.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    chicha = ProductoModel(id_categoria=categoria.id, nombre="Chicha", precio_base=Decimal("6.00"))
+    db_session.add_all([ceviche, chicha])
+    await db_session.flush()
+    grande = ProductoOpcionModel(
+        id_producto=ceviche.id, id_tipo_opcion=tipo.id, nombre="Grande", precio_adicional=Decimal("8.00")
+    )
+    db_session.add(grande)
+    await db_session.commit()
+
+    inserts = []
+
+    def contar_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(statement.split("(")[0].strip())
+
+    motor = db_session.bind.sync_engine
+    event.listen(motor, "before_cursor_execute", contar_inserts)
+    try:
+        service = PedidoService(db_session)
+        creado = await service.create_pedido(PedidoCreate(
+            id_mesa=mesa.id,
+            items=[
+                PedidoItemCreate(id_producto=ceviche.id, cantidad=2, opciones=[grande.id]),
+                PedidoItemCreate(id_producto=chicha.id, cantidad=3),
+                PedidoItemCreate(id_producto=ceviche.id),
+            ],
+        ))
+    finally:
+        event.remove(motor, "before_cursor_execute", contar_inserts)
+
+    assert inserts == ["INSERT INTO pedido", "INSERT INTO pedido_item"]
+    assert creado.total == Decimal("124.00")
+    assert creado.fecha_creacion is not None
+
+    db_session.expunge_all()
+    leido = await PedidoService(db_session).get_pedido_by_id(creado.id)
+    assert [(i.nombre_producto, i.cantidad, i.subtotal) for i in leido.items] == [
+        ("Ceviche", 2, Decimal("76.00")),
+        ("Chicha", 3, Decimal("18.00")),
+        ("Ceviche", 1, Decimal("30.00")),
+    ]
+    assert leido.items[0].opciones[0].nombre == "Grande"
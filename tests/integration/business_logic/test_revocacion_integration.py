@@ -0,0 +1,53 @@
+"""
+Pruebas de integración para la revocación de tokens.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from src.core.security import security
+from src.models.auth.token_revocado_model import TokenRevocadoModel
+from src.business_logic.auth.revocacion import ListaRevocacion
+from src.business_logic.auth.revocacion_service import RevocacionService
+
+
+@pytest.mark.asyncio
+async def test_integration_logout_y_baja_de_usuario(db_session, test_db_manager):
+    """
+    Verifica la revocación de un refresh token y de todas las sesiones de un usuario.
+
+    PRECONDICIONES:
+        - Tokens de dos usuarios.
+
+    PROCESO:
+        - Revocar el refresh token del primero dos veces y dar de baja al segundo.
+        - Cargar una lista nueva desde la base de datos, como un worker que arranca.
+
+    POSTCONDICIONES:
+        - Hay dos revocaciones y la repetida no es un error.
+        - La lista nueva rechaza el refresh revocado y los tokens del segundo usuario.
+        - Un token del primer usuario no revocado sigue aceptándose.
+    """
+    lista = ListaRevocacion(fabrica_sesion=test_db_manager.session, capacidad=100)
+    refresh = security.create_refresh_token({"sub": "u1"})
+    acceso = security.create_access_token({"sub": "u1"})
+    acceso_baja = security.create_access_token({"sub": "u2"})
+
+    with patch(
+        "src.business_logic.auth.revocacion_service.get_lista_revocacion", return_value=lista
+    ):
+        servicio = RevocacionService(db_session)
+        await servicio.revocar_token(refresh, id_usuario="u1")
+        await servicio.revocar_token(refresh, id_usuario="u1")
+        await servicio.revocar_usuario("u2")
+
+    assert await db_session.scalar(select(func.count(TokenRevocadoModel.id))) == 2
+    assert await lista.esta_revocado(security.verify_token(refresh)) is True
+
+    nueva = ListaRevocacion(fabrica_sesion=test_db_manager.session, capacidad=100)
+    assert await nueva.cargar() == 2
+    assert await nueva.esta_revocado(security.verify_token(refresh)) is True
+    assert await nueva.esta_revocado(security.verify_token(acceso_baja)) is True
+    assert await nueva.esta_revocado(security.verify_token(acceso)) is False
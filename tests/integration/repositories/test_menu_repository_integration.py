@@ -0,0 +1,228 @@
+"""
+Pruebas de integración para las consultas del menú público.
+"""
+
+import json
+import pytest
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from sqlalchemy import select
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
+from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
+from src.models.menu.menu_cambio_model import MenuCambioModel
+from src.business_logic.menu.menu_service import MenuService
+from src.business_logic.menu.categoria_service import CategoriaService
+from src.business_logic.menu.producto_service import ProductoService
+from src.business_logic.exceptions.categoria_exceptions import CategoriaConflictError
+from src.business_logic.notifications.menu_stream import MenuStreamBroadcaster
+from src.api.schemas.categoria_schema import CategoriaCreate
+from src.api.schemas.producto_schema import ProductoUpdate
+
+
+@pytest.mark.asyncio
+async def test_integration_menu_solo_incluye_catalogo_visible(db_session):
+    """
+    Verifica que el menú excluye categorías inactivas, productos no disponibles
+    y opciones inactivas.
+
+    PRECONDICIONES:
+        - La base de datos de pruebas debe estar vacía.
+
+    PROCESO:
+        - Crear un catálogo con elementos visibles y ocultos.
+        - Construir el menú con el servicio sobre la base de datos real.
+
+    POSTCONDICIONES:
+        - Solo aparecen la categoría activa, el producto disponible,
+          su opción activa y su alérgeno.
+    """
+    # Arrange
+    activa = CategoriaModel(nombre="Ceviches")
+    inactiva = CategoriaModel(nombre="Temporada", activo=False)
+    db_session.add_all([activa, inactiva])
+    await db_session.flush()
+
+    ceviche = ProductoModel(id_categoria=activa.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    agotado = ProductoModel(
+        id_categoria=activa.id, nombre="Tiradito", precio_base=Decimal("28.00"), disponible=False
+    )
+    oculto = ProductoModel(id_categoria=inactiva.id, nombre="Causa", precio_base=Decimal("20.00"))
+    tipo = TipoOpcionModel(codigo="tamano", nombre="Tamaño")
+    mariscos = AlergenoModel(nombre="Mariscos")
+    db_session.add_all([ceviche, agotado, oculto, tipo, mariscos])
+    await db_session.flush()
+
+    db_session.add_all([
+        ProductoOpcionModel(
+            id_producto=ceviche.id, id_tipo_opcion=tipo.id, nombre="Grande",
+            precio_adicional=Decimal("8.00"), orden=1,
+        ),
+        ProductoOpcionModel(
+            id_producto=ceviche.id, id_tipo_opcion=tipo.id, nombre="Familiar",
+            precio_adicional=Decimal("20.00"), activo=False,
+        ),
+        ProductoOpcionModel(
+            id_producto=oculto.id, id_tipo_opcion=tipo.id, nombre="Grande",
+            precio_adicional=Decimal("5.00"),
+        ),
+        ProductoAlergenoModel(id_producto=ceviche.id, id_alergeno=mariscos.id),
+        ProductoAlergenoModel(id_producto=agotado.id, id_alergeno=mariscos.id),
+    ])
+    await db_session.commit()
+
+    # Act
+    menu = await MenuService(db_session).get_menu()
+
+    # Assert
+    assert [c.nombre for c in menu.categorias] == ["Ceviches"]
+    productos = menu.categorias[0].productos
+    assert [p.nombre for p in productos] == ["Ceviche"]
+    assert [o.nombre for o in productos[0].tipos_opciones[0].opciones] == ["Grande"]
+    assert [a.nombre for a in productos[0].alergenos] == ["Mariscos"]
+
+
+@pytest.mark.asyncio
+async def test_integration_cambios_menu_desde_version(db_session):
+    """
+    Verifica que las escrituras registran cambios y que el feed de cambios
+    devuelve actualizaciones y eliminaciones desde una versión.
+
+    PRECONDICIONES:
+        - La base de datos de pruebas debe estar vacía.
+
+    PROCESO:
+        - Crear dos productos con el servicio y tomar la versión.
+        - Renombrar uno y marcar el otro como no disponible.
+        - Pedir los cambios desde la versión tomada.
+
+    POSTCONDICIONES:
+        - Cada escritura incrementa la versión.
+        - El producto renombrado se devuelve con su nuevo nombre.
+        - El producto no disponible aparece como eliminado.
+    """
+    # Arrange
+    categoria = CategoriaModel(nombre="Ceviches")
+    db_session.add(categoria)
+    await db_session.commit()
+
+    servicio_menu = MenuService(db_session)
+    assert (await servicio_menu.get_cambios(0)).version == 0
+
+    db_session.add_all([
+        ProductoModel(id_categoria=categoria.id, nombre="Ceviche", precio_base=Decimal("30.00")),
+        ProductoModel(id_categoria=categoria.id, nombre="Tiradito", precio_base=Decimal("28.00")),
+    ])
+    await db_session.commit()
+    ceviche, tiradito = sorted(
+        (await servicio_menu.repository.get_productos()), key=lambda p: p.nombre
+    )
+    productos = ProductoService(db_session)
+    await productos.update_producto(ceviche.id, ProductoUpdate(nombre="Ceviche clásico"))
+    version = (await servicio_menu.get_cambios(0)).version
+
+    # Act
+    await productos.update_producto(ceviche.id, ProductoUpdate(precio_base=Decimal("32.00")))
+    await productos.update_producto(tiradito.id, ProductoUpdate(disponible=False))
+    cambios = await servicio_menu.get_cambios(version)
+
+    # Assert
+    assert cambios.version == version + 2
+    assert cambios.requiere_menu_completo is False
+    assert [(p.nombre, p.precio_base) for p in cambios.productos] == [
+        ("Ceviche clásico", Decimal("32.00"))
+    ]
+    assert cambios.productos_eliminados == [tiradito.id]
+    assert (await servicio_menu.get_cambios(cambios.version)).productos == []
+
+
+@pytest.mark.asyncio
+async def test_integration_cambios_se_registran_con_la_escritura(db_session):
+    """
+    Verifica que el registro de cambios se escribe en la misma transacción que la entidad.
+
+    PRECONDICIONES:
+        - La base de datos de pruebas debe estar vacía.
+
+    PROCESO:
+        - Crear una categoría, intentar crear otra con el mismo nombre y
+          crear dos más en lote.
+
+    POSTCONDICIONES:
+        - La creación fallida no deja registro ni consume versión.
+        - Cada transacción recibe una versión y las filas del lote la comparten.
+        - La versión vigente es la de la última transacción.
+    """
+    # Arrange
+    servicio = CategoriaService(db_session)
+    cambios = MenuService(db_session).menu_cambio_repository
+
+    # Act
+    ceviches = await servicio.create_categoria(CategoriaCreate(nombre="Ceviches"))
+    with pytest.raises(CategoriaConflictError):
+        await servicio.create_categoria(CategoriaCreate(nombre="Ceviches"))
+    lote = await servicio.batch_create_categorias(
+        [CategoriaCreate(nombre="Bebidas"), CategoriaCreate(nombre="Postres")]
+    )
+
+    # Assert
+    filas = (await db_session.execute(
+        select(MenuCambioModel.version, MenuCambioModel.id_entidad).order_by(MenuCambioModel.id)
+    )).all()
+    assert [tuple(fila) for fila in filas] == [
+        (1, ceviches.id), (2, lote[0].id), (2, lote[1].id)
+    ]
+    assert await cambios.get_version_actual() == 2
+    assert await cambios.get_cambios_desde(1, 10) != []
+    assert await cambios.get_cambios_desde(2, 10) == []
+
+
+@pytest.mark.asyncio
+async def test_integration_stream_menu_difunde_agotado(db_session):
+    """
+    Verifica que el flujo SSE notifica cuando un producto deja de estar disponible.
+
+    PRECONDICIONES:
+        - La base de datos de pruebas debe estar vacía.
+
+    PROCESO:
+        - Conectar un cliente al difusor del menú.
+        - Marcar un producto como no disponible con el servicio.
+        - Difundir los cambios.
+
+    POSTCONDICIONES:
+        - El cliente recibe un evento disponibilidad con el producto agotado
+          y la nueva versión como id.
+    """
+    # Arrange
+    categoria = CategoriaModel(nombre="Ceviches")
+    db_session.add(categoria)
+    await db_session.flush()
+    ceviche = ProductoModel(id_categoria=categoria.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    db_session.add(ceviche)
+    await db_session.commit()
+
+    @asynccontextmanager
+    async def fabrica_sesion():
+        yield db_session
+
+    broadcaster = MenuStreamBroadcaster(fabrica_sesion=fabrica_sesion, ventana=60)
+    conexion = await broadcaster.conectar(None)
+    conexion.cola.get_nowait()
+
+    # Act
+    await ProductoService(db_session).update_producto(ceviche.id, ProductoUpdate(disponible=False))
+    await broadcaster.difundir()
+    broadcaster._vigilante.cancel()
+
+    # Assert
+    evento = dict(linea.split(": ", 1) for linea in conexion.cola.get_nowait().strip().split("\n"))
+    assert evento["event"] == "disponibilidad"
+    assert int(evento["id"]) == conexion.version > 0
+    assert json.loads(evento["data"])["productos"] == [
+        {"id": ceviche.id, "disponible": False, "precio_base": None}
+    ]
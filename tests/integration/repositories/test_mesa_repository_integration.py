@@ -0,0 +1,141 @@
+"""
+Pruebas de integración para la sincronización de mesas.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.api.schemas.mesa_schema import MesaSync, MesaSyncResultado
+from src.business_logic.mesas.mesa_service import MesaService
+from src.core.enums.mesa_enums import EstadoMesa
+from src.models.mesas.mesa_model import MesaModel
+from src.repositories.mesas.mesa_repository import MesaRepository
+
+
+@pytest.mark.asyncio
+async def test_integration_sync_mesas_repetida(db_session):
+    """
+    Prueba que sincronizar varias veces no choca con el número único de las mesas.
+
+    PRECONDICIONES:
+        - La base de datos está vacía.
+
+    PROCESO:
+        - Sincronizar dos mesas.
+        - Sincronizar de nuevo solo una, con otro estado.
+
+    POSTCONDICIONES:
+        - La segunda sincronización actualiza la mesa recibida y desactiva la ausente.
+    """
+    service = MesaService(db_session)
+    service.event_bus = AsyncMock()
+
+    primera = await service.sync_mesas([
+        MesaSync(numero="M1", zona="Terraza"),
+        MesaSync(numero="M2", zona="Salón"),
+    ])
+    segunda = await service.sync_mesas([
+        MesaSync(numero="M1", zona="Terraza", estado=EstadoMesa.OCUPADA),
+    ])
+
+    assert primera.model_dump() == MesaSyncResultado(creadas=2).model_dump()
+    assert sorted(mesa.numero for mesa in primera.mesas_creadas) == ["M1", "M2"]
+    assert segunda == MesaSyncResultado(actualizadas=1, desactivadas=1)
+
+    mesas = {mesa.numero: mesa for mesa in await MesaRepository(db_session).get_todas()}
+    assert isinstance(mesas["M1"], MesaModel)
+    assert (mesas["M1"].estado, mesas["M1"].activo) == (EstadoMesa.OCUPADA, True)
+    assert mesas["M2"].activo is False
+
+
+@pytest.mark.asyncio
+async def test_integration_cambiar_estado_compare_and_set(db_session):
+    """
+    Prueba que el cambio de estado condicional solo se aplica una vez por versión.
+
+    PRECONDICIONES:
+        - Existe una mesa libre con versión 1.
+
+    PROCESO:
+        - Ocupar la mesa dos veces con la misma versión.
+        - Actualizar la zona de la mesa.
+
+    POSTCONDICIONES:
+        - El primer cambio sube la versión a 2; el segundo no se aplica.
+        - La actualización genérica también incrementa la versión.
+    """
+    repository = MesaRepository(db_session)
+    mesa = await repository.create(MesaModel(numero="M1", zona="Terraza", estado=EstadoMesa.LIBRE))
+    assert mesa.version == 1
+
+    origenes = [EstadoMesa.LIBRE, EstadoMesa.DISPONIBLE, EstadoMesa.RESERVADA]
+    primera = await repository.cambiar_estado(mesa.id, EstadoMesa.OCUPADA, origenes, version=1)
+    segunda = await repository.cambiar_estado(mesa.id, EstadoMesa.OCUPADA, origenes, version=1)
+
+    assert (primera.estado, primera.version) == (EstadoMesa.OCUPADA, 2)
+    assert segunda is None
+
+    actualizada = await repository.update(mesa.id, zona="Salón")
+    assert (actualizada.zona, actualizada.version) == ("Salón", 3)
+
+
+@pytest.mark.asyncio
+async def test_integration_conteo_por_zona_estado(db_session):
+    """
+    Prueba la consulta agregada de ocupación.
+
+    PRECONDICIONES:
+        - Existen mesas activas en dos zonas y una mesa inactiva.
+
+    PROCESO:
+        - Obtener el conteo por zona y estado.
+
+    POSTCONDICIONES:
+        - Cada grupo trae el número de mesas y la suma de capacidades; la inactiva no cuenta.
+    """
+    repository = MesaRepository(db_session)
+    await repository.batch_insert([
+        MesaModel(numero="T1", zona="Terraza", capacidad=4, estado=EstadoMesa.OCUPADA),
+        MesaModel(numero="T2", zona="Terraza", capacidad=2, estado=EstadoMesa.OCUPADA),
+        MesaModel(numero="T3", zona="Terraza", capacidad=6, estado=EstadoMesa.LIBRE),
+        MesaModel(numero="B1", zona="Barra", capacidad=2, estado=EstadoMesa.LIBRE),
+        MesaModel(numero="B2", zona="Barra", capacidad=2, estado=EstadoMesa.LIBRE, activo=False),
+    ])
+
+    conteo = sorted(await repository.get_conteo_por_zona_estado())
+
+    assert conteo == [
+        ("Barra", EstadoMesa.LIBRE, 1, 2),
+        ("Terraza", EstadoMesa.LIBRE, 1, 6),
+        ("Terraza", EstadoMesa.OCUPADA, 2, 6),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_integration_sincronizacion_no_pisa_cambio_concurrente(db_session):
+    """
+    Prueba que la sincronización no sobrescribe una transición confirmada después de leer.
+
+    PRECONDICIONES:
+        - Existe una mesa libre con versión 1.
+
+    PROCESO:
+        - Ocupar la mesa con cambiar_estado (versión 2).
+        - Aplicar una sincronización calculada con la versión 1.
+
+    POSTCONDICIONES:
+        - La sincronización no se aplica y la mesa sigue ocupada con versión 2.
+        - Con la versión 2 sí se aplica y la versión pasa a 3.
+    """
+    repository = MesaRepository(db_session)
+    mesa = await repository.create(MesaModel(numero="M1", zona="Terraza", estado=EstadoMesa.LIBRE))
+    await repository.cambiar_estado(mesa.id, EstadoMesa.OCUPADA, [EstadoMesa.LIBRE])
+
+    cambio = {"id": mesa.id, "zona": "Salón", "estado": EstadoMesa.LIBRE, "activo": True}
+    assert await repository.aplicar_sincronizacion([], [{**cambio, "version": 1}], []) == []
+
+    actual = await repository.get_by_id(mesa.id)
+    assert (actual.estado, actual.zona, actual.version) == (EstadoMesa.OCUPADA, "Terraza", 2)
+
+    (aplicada,) = await repository.aplicar_sincronizacion([], [{**cambio, "version": 2}], [])
+    assert (aplicada.zona, aplicada.version) == ("Salón", 3)
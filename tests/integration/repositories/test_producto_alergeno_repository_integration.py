@@ -0,0 +1,218 @@
+"""
+Pruebas de integración para las máscaras de alérgenos del repositorio producto-alérgeno.
+"""
+
+import pytest
+from decimal import Decimal
+from sqlalchemy import select
+
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.models.pedidos.producto_opcion_model import ProductoOpcionModel  # noqa: F401
+from src.models.pedidos.tipo_opciones_model import TipoOpcionModel  # noqa: F401
+from src.repositories.menu.producto_alergeno_repository import (
+    MAX_BITS_ALERGENO,
+    ProductoAlergenoRepository,
+)
+from src.repositories.menu.alergeno_repository import AlergenoRepository
+from src.repositories.menu.producto_repository import ProductoRepository
+from src.core.enums.alergeno_enums import NivelPresencia
+
+
+@pytest.fixture(scope="function")
+async def catalogo(db_session):
+    """
+    Crea un catálogo mínimo con tres productos y dos alérgenos.
+
+    PRECONDICIONES:
+        - La sesión de base de datos debe estar inicializada en conftest.py.
+
+    PROCESO:
+        - Inserta una categoría, tres productos y dos alérgenos sin bit asignado.
+        - Vincula el ceviche (contiene mariscos) y el pan (trazas de gluten).
+
+    POSTCONDICIONES:
+        - Retorna un diccionario con los modelos creados.
+    """
+    categoria = CategoriaModel(nombre="Fondos")
+    db_session.add(categoria)
+    await db_session.flush()
+
+    ceviche = ProductoModel(id_categoria=categoria.id, nombre="Ceviche", precio_base=Decimal("30.00"))
+    pan = ProductoModel(id_categoria=categoria.id, nombre="Pan", precio_base=Decimal("5.00"))
+    chicha = ProductoModel(id_categoria=categoria.id, nombre="Chicha", precio_base=Decimal("8.00"))
+    mariscos = AlergenoModel(nombre="Mariscos")
+    gluten = AlergenoModel(nombre="Gluten")
+    db_session.add_all([ceviche, pan, chicha, mariscos, gluten])
+    await db_session.flush()
+
+    db_session.add_all([
+        ProductoAlergenoModel(
+            id_producto=ceviche.id, id_alergeno=mariscos.id, nivel_presencia=NivelPresencia.CONTIENE
+        ),
+        ProductoAlergenoModel(
+            id_producto=pan.id, id_alergeno=gluten.id, nivel_presencia=NivelPresencia.TRAZAS
+        ),
+    ])
+    await db_session.commit()
+
+    return {
+        "categoria": categoria,
+        "ceviche": ceviche,
+        "pan": pan,
+        "chicha": chicha,
+        "mariscos": mariscos,
+        "gluten": gluten,
+    }
+
+
+@pytest.mark.asyncio
+async def test_integration_recalcular_mascaras_y_filtrar(db_session, catalogo):
+    """
+    Verifica que las máscaras recalculadas permiten filtrar el listado de productos.
+
+    PRECONDICIONES:
+        - El catálogo de prueba debe estar creado.
+
+    PROCESO:
+        - Recalcular las máscaras de todo el catálogo.
+        - Resolver la máscara de ambos alérgenos y listar productos excluyéndolos.
+
+    POSTCONDICIONES:
+        - Cada alérgeno tiene un bit distinto.
+        - Con trazas toleradas solo se excluye el ceviche.
+        - Sin tolerar trazas también se excluye el pan.
+    """
+    # Arrange
+    repository = ProductoAlergenoRepository(db_session)
+
+    # Act
+    actualizados = await repository.recalcular_mascaras()
+    mascara = await AlergenoRepository(db_session).get_mascara(
+        [catalogo["mariscos"].id, catalogo["gluten"].id]
+    )
+    productos_repo = ProductoRepository(db_session)
+    tolerando, total_tolerando = await productos_repo.get_all(0, 100, mascara_excluida=mascara)
+    estrictos, total_estrictos = await productos_repo.get_all(
+        0, 100, mascara_excluida=mascara, tolerar_trazas=False
+    )
+
+    # Assert
+    assert actualizados == 2
+    bits = (
+        await db_session.execute(select(AlergenoModel.bit_index).order_by(AlergenoModel.bit_index))
+    ).scalars().all()
+    assert bits == [0, 1]
+    assert bin(mascara).count("1") == 2
+    assert {p.nombre for p in tolerando} == {"Pan", "Chicha"}
+    assert total_tolerando == 2
+    assert [p.nombre for p in estrictos] == ["Chicha"]
+    assert total_estrictos == 1
+
+
+@pytest.mark.asyncio
+async def test_integration_filtrar_alergenos_sin_bit(db_session, catalogo):
+    """
+    Verifica el filtro de exclusión cuando las máscaras ya no tienen bits libres.
+
+    PRECONDICIONES:
+        - El catálogo de prueba con el último bit ocupado por otro alérgeno,
+          de modo que mariscos y gluten se quedan sin bit.
+
+    PROCESO:
+        - Recalcular las máscaras y resolver el filtro de ambos alérgenos.
+        - Listar productos excluyéndolos, tolerando trazas y sin tolerarlas.
+
+    POSTCONDICIONES:
+        - Ninguno de los dos alérgenos recibe bit y la máscara queda vacía.
+        - Los productos se excluyen igual que con máscara.
+    """
+    # Arrange
+    db_session.add(AlergenoModel(nombre="Último", bit_index=MAX_BITS_ALERGENO - 1))
+    await db_session.commit()
+    await ProductoAlergenoRepository(db_session).recalcular_mascaras()
+    alergenos = AlergenoRepository(db_session)
+    ids = [catalogo["mariscos"].id, catalogo["gluten"].id]
+    productos_repo = ProductoRepository(db_session)
+
+    # Act
+    mascara, excluidos = await alergenos.get_filtro_exclusion(ids)
+    tolerando, _ = await productos_repo.get_all(0, 100, productos_excluidos=excluidos)
+    mascara_estricta, excluidos_estrictos = await alergenos.get_filtro_exclusion(
+        ids, tolerar_trazas=False
+    )
+    estrictos, total_estrictos = await productos_repo.get_all(
+        0, 100, productos_excluidos=excluidos_estrictos
+    )
+
+    # Assert
+    assert mascara == mascara_estricta == 0
+    assert excluidos == {catalogo["ceviche"].id}
+    assert {p.nombre for p in tolerando} == {"Pan", "Chicha"}
+    assert [p.nombre for p in estrictos] == ["Chicha"]
+    assert total_estrictos == 1
+
+
+@pytest.mark.asyncio
+async def test_integration_recalcular_mascaras_por_producto(db_session, catalogo):
+    """
+    Verifica que el recálculo parcial limpia la máscara al desactivar una relación.
+
+    PRECONDICIONES:
+        - El catálogo de prueba debe estar creado y con máscaras calculadas.
+
+    PROCESO:
+        - Desactivar la relación del ceviche y recalcular solo ese producto.
+
+    POSTCONDICIONES:
+        - La máscara del ceviche vuelve a cero y la del pan no cambia.
+    """
+    # Arrange
+    repository = ProductoAlergenoRepository(db_session)
+    await repository.recalcular_mascaras()
+    ceviche, pan = catalogo["ceviche"], catalogo["pan"]
+    await repository.update(ceviche.id, catalogo["mariscos"].id, activo=False)
+
+    # Act
+    actualizados = await repository.recalcular_mascaras([ceviche.id])
+
+    # Assert
+    assert actualizados == 1
+    await db_session.refresh(ceviche)
+    await db_session.refresh(pan)
+    assert ceviche.mascara_alergenos_contiene == 0
+    assert pan.mascara_alergenos_trazas != 0
+    assert not pan.contiene_alergenos(pan.mascara_alergenos_trazas)
+    assert pan.contiene_alergenos(pan.mascara_alergenos_trazas, tolerar_trazas=False)
+
+
+@pytest.mark.asyncio
+async def test_integration_get_alergenos_by_productos(db_session, catalogo):
+    """
+    Verifica la consulta en lote de alérgenos con sus detalles.
+
+    PRECONDICIONES:
+        - El catálogo de prueba debe estar creado.
+
+    PROCESO:
+        - Consultar los alérgenos de los tres productos en una sola llamada.
+
+    POSTCONDICIONES:
+        - Solo se devuelven las relaciones existentes, junto al modelo de alérgeno.
+    """
+    # Arrange
+    repository = ProductoAlergenoRepository(db_session)
+    ids = [catalogo["ceviche"].id, catalogo["pan"].id, catalogo["chicha"].id]
+
+    # Act
+    filas = await repository.get_alergenos_by_productos(ids)
+
+    # Assert
+    por_producto = {relacion.id_producto: alergeno.nombre for relacion, alergeno in filas}
+    assert por_producto == {
+        catalogo["ceviche"].id: "Mariscos",
+        catalogo["pan"].id: "Gluten",
+    }
+    assert await repository.get_alergenos_by_productos([]) == []
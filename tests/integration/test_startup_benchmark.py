@@ -0,0 +1,94 @@
+"""
+Pruebas del arranque en frío de la aplicación.
+
+El presupuesto por defecto deja margen para máquinas de CI lentas; se
+puede ajustar con la variable de entorno STARTUP_BUDGET_SECONDS.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[2]
+PRESUPUESTO = float(os.getenv("STARTUP_BUDGET_SECONDS", "5.0"))
+
+
+# Peticiones de la primera carga de cada controlador, en un intérprete nuevo
+PETICIONES = """
+import json, sys
+from fastapi.testclient import TestClient
+from src.main import app
+# Sin lifespan: las rutas no deben depender de lo que importe el arranque
+client = TestClient(app, raise_server_exceptions=False)
+estados = {ruta: client.get(ruta).status_code for ruta in sys.argv[1:]}
+print(json.dumps(estados))
+"""
+
+
+def _env(ruta_db) -> dict:
+    """Entorno con carga perezosa de routers sobre una base SQLite en fichero."""
+    return {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{ruta_db}",
+        "LAZY_ROUTERS": "true",
+        "OPENAPI_CACHE_PATH": "",
+    }
+
+
+def _ejecutar(args, env) -> str:
+    salida = subprocess.run(
+        [sys.executable, *args], cwd=RAIZ, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert salida.returncode == 0, salida.stderr
+    return salida.stdout
+
+
+def test_arranque_dentro_del_presupuesto(tmp_path):
+    """
+    Verifica que el arranque sobre una base ya migrada cabe en el presupuesto y atiende peticiones.
+
+    PRECONDICIONES:
+        - Una base de datos SQLite en fichero migrada con scripts/migrate.py,
+          como en un despliegue.
+
+    PROCESO:
+        - Ejecutar scripts/profile_startup.py en otro proceso.
+        - En otro proceso, importar la aplicación y, sin ejecutar el lifespan,
+          pedir una ruta de varios controladores que aún no se han cargado.
+
+    POSTCONDICIONES:
+        - Importación más inicio del lifespan por debajo del presupuesto.
+        - Ningún controlador se importa durante el arranque.
+        - Ninguna de las peticiones falla con un error del servidor.
+    """
+    env = _env(tmp_path / "benchmark.db")
+    _ejecutar(["-m", "scripts.migrate"], env)
+
+    perfil = json.loads(_ejecutar(["-m", "scripts.profile_startup"], env))
+    assert perfil["total"] < PRESUPUESTO, perfil
+    assert perfil["controladores_importados"] == []
+
+    rutas = ["/api/v1/mesas", "/api/v1/productos/cards", "/api/v1/roles", "/api/v1/menu"]
+    estados = json.loads(_ejecutar(["-c", PETICIONES, *rutas], env))
+    assert all(estado < 500 for estado in estados.values()), estados
+
+
+def test_arranque_repetido_sobre_base_migrada(tmp_path):
+    """
+    Verifica que la aplicación arranca sobre una base de datos que ya está al día.
+
+    PRECONDICIONES:
+        - Una base de datos SQLite en fichero, vacía.
+
+    PROCESO:
+        - Arrancar dos veces en intérpretes nuevos sobre el mismo fichero.
+
+    POSTCONDICIONES:
+        - Ambos arranques terminan bien; el segundo no aplica migraciones y
+          aun así encuentra todos los modelos al restaurar las colas de cocina.
+    """
+    env = _env(tmp_path / "arranque.db")
+    for _ in range(2):
+        _ejecutar(["-m", "scripts.profile_startup"], env)
@@ -0,0 +1,98 @@
+"""
+Pruebas unitarias para los endpoints de cierre de sesión y revocación.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.auth_controller import router
+from src.core.security import security
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de AuthController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_revocacion_service():
+    """Fixture que reemplaza el servicio de revocación del controlador."""
+    with patch("src.api.controllers.auth_controller.RevocacionService") as mock_service_class:
+        service = mock_service_class.return_value
+        service.revocar_payload = AsyncMock()
+        service.revocar_token = AsyncMock()
+        service.revocar_usuario = AsyncMock()
+        yield service
+
+
+def _cabecera(rol: str) -> dict:
+    """Cabecera Authorization con un token de acceso del rol indicado."""
+    token = security.create_access_token({"sub": "u1", "rol": rol})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_logout_revoca_acceso_y_refresh(test_client, mock_revocacion_service):
+    """
+    Prueba el cierre de sesión con refresh token.
+
+    PRECONDICIONES:
+        - El servicio de revocación debe estar mockeado.
+
+    PROCESO:
+        - Cerrar sesión enviando el refresh token.
+
+    POSTCONDICIONES:
+        - Responde 204 y revoca ambos tokens del usuario.
+    """
+    response = test_client.post(
+        "/api/v1/auth/logout", json={"refresh_token": "refresh"}, headers=_cabecera("mesero")
+    )
+
+    assert response.status_code == 204
+    mock_revocacion_service.revocar_token.assert_awaited_once_with("refresh", id_usuario="u1")
+    assert mock_revocacion_service.revocar_payload.await_args.args[0]["sub"] == "u1"
+
+
+def test_logout_sin_token(test_client, mock_revocacion_service):
+    """
+    Prueba que cerrar sesión requiere un token de acceso.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Cerrar sesión sin cabecera Authorization.
+
+    POSTCONDICIONES:
+        - Responde 401 y no se revoca nada.
+    """
+    response = test_client.post("/api/v1/auth/logout")
+
+    assert response.status_code == 401
+    mock_revocacion_service.revocar_payload.assert_not_awaited()
+
+
+def test_revocar_usuario_requiere_permiso(test_client, mock_revocacion_service):
+    """
+    Prueba que solo un rol con usuarios:gestionar puede revocar las sesiones de otro usuario.
+
+    PRECONDICIONES:
+        - El servicio de revocación debe estar mockeado.
+
+    PROCESO:
+        - Revocar un usuario como mesero y como admin.
+
+    POSTCONDICIONES:
+        - El mesero recibe 403 y el admin 204.
+    """
+    url = "/api/v1/auth/usuarios/u2/revocar"
+
+    assert test_client.post(url, headers=_cabecera("mesero")).status_code == 403
+    assert test_client.post(url, headers=_cabecera("admin")).status_code == 204
+    mock_revocacion_service.revocar_usuario.assert_awaited_once_with("u2")
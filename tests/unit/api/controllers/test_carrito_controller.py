@@ -0,0 +1,74 @@
+"""
+Pruebas unitarias para los endpoints del carrito.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.carrito_controller import router
+from src.api.schemas.carrito_schema import CarritoCotizacion
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de CarritoController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_carrito_service():
+    """Fixture que reemplaza el servicio del carrito del controlador."""
+    with patch("src.api.controllers.carrito_controller.CarritoService") as mock_service_class:
+        yield mock_service_class.return_value
+
+
+def test_cotizar_carrito_endpoint(test_client, mock_carrito_service):
+    """
+    Prueba la cotización del carrito.
+
+    PRECONDICIONES:
+        - El servicio del carrito debe estar mockeado.
+
+    PROCESO:
+        - Enviar un carrito con una línea.
+
+    POSTCONDICIONES:
+        - Responde 200 con la cotización y el servicio recibe las líneas.
+    """
+    mock_carrito_service.cotizar = AsyncMock(return_value=CarritoCotizacion(
+        version_menu=1, lineas=[], total=Decimal("6.00"), valido=True
+    ))
+
+    response = test_client.post(
+        "/api/v1/carrito/cotizar",
+        json={"lineas": [{"id_producto": "chicha", "cantidad": 1, "opciones": []}]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == "6.00"
+    carrito = mock_carrito_service.cotizar.await_args.args[0]
+    assert carrito.lineas[0].id_producto == "chicha"
+
+
+def test_cotizar_carrito_vacio(test_client, mock_carrito_service):
+    """
+    Prueba que un carrito sin líneas se rechaza.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Enviar un carrito vacío.
+
+    POSTCONDICIONES:
+        - Responde 422.
+    """
+    response = test_client.post("/api/v1/carrito/cotizar", json={"lineas": []})
+
+    assert response.status_code == 422
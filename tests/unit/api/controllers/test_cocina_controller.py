@@ -0,0 +1,89 @@
+"""
+Pruebas unitarias para los endpoints de cocina.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.cocina_controller import router
+from src.api.schemas.pedido_schema import ColaCocinaResponse, ItemCocina
+from src.business_logic.exceptions.pedido_exceptions import PedidoTransicionError
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de CocinaController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_cocina_service():
+    """Fixture que reemplaza el servicio de cocina del controlador."""
+    with patch("src.api.controllers.cocina_controller.CocinaService") as mock_service_class:
+        yield mock_service_class.return_value
+
+
+def _item_cocina(estado: EstadoPedido = EstadoPedido.PENDIENTE) -> ItemCocina:
+    return ItemCocina(
+        id="I1", id_pedido="P1", id_mesa="M1", orden=0, nombre_producto="Ceviche",
+        cantidad=2, estacion="cocina", estado=estado, prioridad=PrioridadPedido.NORMAL,
+    )
+
+
+def test_get_cola_estacion(test_client, mock_cocina_service):
+    """
+    Prueba la consulta de la cola de una estación.
+
+    PRECONDICIONES:
+        - El servicio de cocina debe estar mockeado.
+
+    PROCESO:
+        - Consultar la estación cocina.
+
+    POSTCONDICIONES:
+        - Responde 200 con los ítems de la estación.
+    """
+    mock_cocina_service.get_cola = MagicMock(
+        return_value=ColaCocinaResponse(estacion="cocina", items=[_item_cocina()], total=1)
+    )
+
+    response = test_client.get("/api/v1/cocina/cocina")
+
+    assert response.status_code == 200
+    assert response.json()["items"][0]["id"] == "I1"
+    mock_cocina_service.get_cola.assert_called_once_with("cocina")
+
+
+def test_transicionar_item_endpoint(test_client, mock_cocina_service):
+    """
+    Prueba el cambio de estado de un ítem.
+
+    PRECONDICIONES:
+        - El servicio de cocina debe estar mockeado.
+
+    PROCESO:
+        - Pasar el ítem a en preparación y después intentar una transición no permitida.
+
+    POSTCONDICIONES:
+        - Responde 200 con el ítem y después 409.
+    """
+    mock_cocina_service.transicionar_item = AsyncMock(
+        return_value=_item_cocina(EstadoPedido.EN_PREPARACION)
+    )
+    response = test_client.post(
+        "/api/v1/cocina/items/I1/transition", json={"estado": "en_preparacion"}
+    )
+    assert response.status_code == 200
+    assert response.json()["estado"] == "en_preparacion"
+
+    mock_cocina_service.transicionar_item = AsyncMock(
+        side_effect=PedidoTransicionError("No se puede pasar 'Ceviche' de 'pendiente' a 'listo'")
+    )
+    response = test_client.post("/api/v1/cocina/items/I1/transition", json={"estado": "listo"})
+    assert response.status_code == 409
@@ -0,0 +1,278 @@
+"""
+Pruebas unitarias para el endpoint del menú completo.
+"""
+
+import gzip
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.menu_controller import router, get_database_session
+from src.business_logic.menu.menu_service import MenuService, MenuSerializado
+from src.api.schemas.menu_schema import MenuCambiosResponse
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+MENU_JSON = b'{"version":7,"categorias":[]}'
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de MenuController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_db_session_dependency(async_mock_db_session, cleanup_app):
+    """
+    Fixture que reemplaza la dependencia de la sesión de base de datos por un mock.
+    """
+
+    async def override_get_db():
+        yield async_mock_db_session
+
+    app.dependency_overrides[get_database_session] = override_get_db
+
+
+@pytest.fixture
+def mock_menu_service():
+    """
+    Fixture que proporciona un mock del servicio del menú con un menú serializado.
+    """
+    with patch("src.api.controllers.menu_controller.MenuService") as mock:
+        service_instance = AsyncMock(spec=MenuService)
+        service_instance.get_menu_serializado.return_value = MenuSerializado(
+            version=7, json=MENU_JSON, gzip=gzip.compress(MENU_JSON)
+        )
+        mock.return_value = service_instance
+        yield service_instance
+
+
+def test_get_menu_gzip(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba que el menú se sirve comprimido cuando el cliente acepta gzip.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza una solicitud GET con Accept-Encoding: gzip.
+
+    POSTCONDICIONES:
+        - La respuesta es 200 con Content-Encoding gzip, el ETag de la versión
+          comprimida y Vary.
+    """
+    response = test_client.get("/api/v1/menu", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"menu-7-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == MENU_JSON  # el cliente descomprime
+
+
+def test_get_menu_sin_gzip(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba que el menú se sirve en claro cuando el cliente no acepta gzip.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza una solicitud GET con Accept-Encoding: identity.
+
+    POSTCONDICIONES:
+        - La respuesta es 200 sin Content-Encoding y con el JSON original.
+    """
+    response = test_client.get("/api/v1/menu", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"menu-7"'
+    assert response.content == MENU_JSON
+
+
+def test_get_menu_not_modified(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba que se responde 304 cuando el cliente ya tiene la versión vigente.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza solicitudes GET con If-None-Match con el ETag vigente de su
+          codificación, solo o en una lista con etiquetas débiles.
+
+    POSTCONDICIONES:
+        - La respuesta es 304 sin cuerpo y con el ETag de esa codificación.
+    """
+    response = test_client.get(
+        "/api/v1/menu", headers={"Accept-Encoding": "identity", "If-None-Match": '"menu-7"'}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = test_client.get(
+        "/api/v1/menu",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": '"menu-6-gzip", W/"menu-7-gzip"'},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"menu-7-gzip"'
+
+
+def test_get_menu_etag_de_otra_codificacion(
+    test_client, mock_db_session_dependency, mock_menu_service
+):
+    """
+    Prueba que el ETag de una codificación no valida la copia de otra.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza una solicitud GET con Accept-Encoding gzip e If-None-Match
+          con el ETag de la versión sin comprimir.
+
+    POSTCONDICIONES:
+        - La respuesta es 200 con el cuerpo comprimido.
+    """
+    response = test_client.get(
+        "/api/v1/menu", headers={"Accept-Encoding": "gzip", "If-None-Match": '"menu-7"'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_get_menu_error(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba el manejo de errores inesperados al construir el menú.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado para lanzar una excepción.
+
+    PROCESO:
+        - Realiza una solicitud GET al endpoint.
+
+    POSTCONDICIONES:
+        - La respuesta es 500 con el detalle del error.
+    """
+    mock_menu_service.get_menu_serializado.side_effect = Exception("fallo")
+
+    response = test_client.get("/api/v1/menu")
+
+    assert response.status_code == 500
+    assert "Error interno del servidor" in response.json()["detail"]
+
+
+def test_get_menu_changes(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba la obtención de los cambios del menú desde una versión.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza una solicitud GET a /menu/changes con since=5.
+
+    POSTCONDICIONES:
+        - La respuesta es 200 con la versión vigente y las eliminaciones.
+        - El servicio recibe la versión solicitada.
+    """
+    mock_menu_service.get_cambios.return_value = MenuCambiosResponse(
+        desde=5, version=7, productos_eliminados=["01J0000000000000000000000P"]
+    )
+
+    response = test_client.get("/api/v1/menu/changes?since=5")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["version"] == 7
+    assert data["requiere_menu_completo"] is False
+    assert data["productos_eliminados"] == ["01J0000000000000000000000P"]
+    mock_menu_service.get_cambios.assert_awaited_once_with(5)
+
+
+def test_get_menu_changes_since_invalido(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba que se rechaza una versión negativa o ausente.
+
+    PRECONDICIONES:
+        - El servicio del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza solicitudes GET sin since y con since=-1.
+
+    POSTCONDICIONES:
+        - Ambas respuestas son 422.
+    """
+    assert test_client.get("/api/v1/menu/changes").status_code == 422
+    assert test_client.get("/api/v1/menu/changes?since=-1").status_code == 422
+
+
+def test_get_menu_brotli_precomprimido(test_client, mock_db_session_dependency, mock_menu_service):
+    """
+    Prueba que se sirve la variante brotli cuando existe y el cliente la prefiere.
+
+    PRECONDICIONES:
+        - El servicio del menú devuelve un menú con variante brotli.
+
+    PROCESO:
+        - Realiza una solicitud GET con Accept-Encoding que prefiere br y otra que solo admite gzip.
+
+    POSTCONDICIONES:
+        - Cada respuesta usa los bytes precomprimidos de la codificación negociada.
+    """
+    mock_menu_service.get_menu_serializado.return_value = MenuSerializado(
+        version=7, json=MENU_JSON, gzip=gzip.compress(MENU_JSON), br=b"precomprimido-br"
+    )
+
+    # TestClient no descomprime brotli: se comprueban los bytes crudos
+    with test_client.stream(
+        "GET", "/api/v1/menu", headers={"Accept-Encoding": "gzip;q=0.5, br"}
+    ) as response:
+        assert response.headers["content-encoding"] == "br"
+        assert b"".join(response.iter_raw()) == b"precomprimido-br"
+
+    response = test_client.get("/api/v1/menu", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == MENU_JSON
+
+
+def test_stream_menu_reanuda_con_last_event_id(test_client):
+    """
+    Prueba que el flujo SSE reanuda desde la cabecera Last-Event-ID.
+
+    PRECONDICIONES:
+        - El difusor del menú debe estar mockeado.
+
+    PROCESO:
+        - Realiza una solicitud GET a /menu/stream con Last-Event-ID: 7.
+
+    POSTCONDICIONES:
+        - La respuesta es text/event-stream con los eventos del difusor.
+        - El difusor recibe la versión 7, que prevalece sobre since.
+    """
+
+    async def eventos(conexion):
+        yield "id: 8\nevent: disponibilidad\ndata: {}\n\n"
+
+    with patch("src.api.controllers.menu_controller.get_menu_broadcaster") as mock:
+        broadcaster = mock.return_value
+        broadcaster.conectar = AsyncMock(return_value="conexion")
+        broadcaster.eventos = eventos
+
+        response = test_client.get(
+            "/api/v1/menu/stream?since=3",
+            headers={"Last-Event-ID": "7", "Accept-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == "id: 8\nevent: disponibilidad\ndata: {}\n\n"
+    broadcaster.conectar.assert_awaited_once_with(7)
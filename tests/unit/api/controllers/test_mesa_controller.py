@@ -0,0 +1,170 @@
+"""
+Pruebas unitarias para los endpoints de mesas.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from ulid import ULID
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.mesa_controller import router
+from src.business_logic.notifications.websocket_hub import WebSocketHub
+from src.business_logic.exceptions.mesa_exceptions import MesaQRNoDisponibleError, MesaVersionConflictError
+from src.business_logic.mesas.mesa_qr_service import ArchivoQR
+from src.api.schemas.mesa_schema import MesaResponse, MesaResumen
+from src.core.enums.mesa_enums import EstadoMesa
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de MesaController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def hub():
+    """
+    Fixture que reemplaza el hub de mesas por uno con heartbeat corto.
+    """
+    hub = WebSocketHub(intervalo_heartbeat=0.05)
+    with patch("src.api.controllers.mesa_controller.get_mesa_hub", return_value=hub):
+        yield hub
+
+
+def test_mesas_websocket_suscribe_zonas_y_envia_ping(test_client, hub):
+    """
+    Prueba la conexión al canal en tiempo real de mesas.
+
+    PRECONDICIONES:
+        - El hub de mesas debe estar reemplazado.
+
+    PROCESO:
+        - Conectarse a /mesas/ws con dos zonas y esperar un mensaje.
+
+    POSTCONDICIONES:
+        - La conexión queda suscrita a ambas zonas y recibe pings.
+        - Al cerrar el cliente, el hub queda sin conexiones.
+    """
+    with test_client.websocket_connect("/api/v1/mesas/ws?zona=Terraza,Barra") as websocket:
+        assert websocket.receive_json()["evento"] == "ping"
+        (conexion,) = {c for canal in hub._canales.values() for c in canal}
+        assert conexion.canales == {"Terraza", "Barra"}
+        websocket.send_json({"evento": "pong", "payload": {}})
+
+    assert hub.total_conexiones == 0
+
+
+def test_transicionar_mesa_endpoint(test_client):
+    """
+    Prueba el endpoint de cambio de estado de una mesa.
+
+    PRECONDICIONES:
+        - El servicio de mesas debe estar mockeado.
+
+    PROCESO:
+        - Enviar un cambio de estado válido y otro con versión desactualizada.
+
+    POSTCONDICIONES:
+        - El primero responde 200 con la mesa; el segundo responde 409.
+    """
+    mesa = MesaResponse(
+        id=str(ULID()), numero="M1", zona="Terraza", estado=EstadoMesa.OCUPADA, activo=True, version=2
+    )
+    with patch("src.api.controllers.mesa_controller.MesaService") as mock_service_class:
+        mock_service = mock_service_class.return_value
+        mock_service.transicionar_mesa = AsyncMock(return_value=mesa)
+
+        response = test_client.post(
+            f"/api/v1/mesas/{mesa.id}/transition", json={"estado": "ocupada", "version": 1}
+        )
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+        transicion = mock_service.transicionar_mesa.await_args.args[1]
+        assert (transicion.estado, transicion.version) == (EstadoMesa.OCUPADA, 1)
+
+        mock_service.transicionar_mesa = AsyncMock(
+            side_effect=MesaVersionConflictError("La mesa fue modificada")
+        )
+        response = test_client.post(
+            f"/api/v1/mesas/{mesa.id}/transition", json={"estado": "ocupada", "version": 1}
+        )
+        assert response.status_code == 409
+
+
+def test_get_resumen_mesas_endpoint(test_client):
+    """
+    Prueba que /mesas/resumen no se confunde con la ruta de una mesa por ID.
+
+    PRECONDICIONES:
+        - El servicio de mesas debe estar mockeado.
+
+    PROCESO:
+        - Consultar /mesas/resumen.
+
+    POSTCONDICIONES:
+        - Responde 200 con el resumen del servicio.
+    """
+    resumen = MesaResumen(zonas=[], total_mesas=0, asientos_libres=0, asientos_ocupados=0)
+    with patch("src.api.controllers.mesa_controller.MesaService") as mock_service_class:
+        mock_service_class.return_value.get_resumen = AsyncMock(return_value=resumen)
+
+        response = test_client.get("/api/v1/mesas/resumen")
+
+    assert response.status_code == 200
+    assert response.json()["total_mesas"] == 0
+
+
+def test_get_qr_mesa_endpoint(test_client, tmp_path):
+    """
+    Prueba el endpoint del QR de una mesa y su revalidación con ETag.
+
+    PRECONDICIONES:
+        - El servicio de QR debe estar mockeado y devolver un archivo en disco.
+
+    PROCESO:
+        - Pedir el QR y volver a pedirlo con If-None-Match.
+
+    POSTCONDICIONES:
+        - La primera respuesta trae la imagen con caché pública; la segunda es 304.
+    """
+    ruta = tmp_path / "qr.svg"
+    ruta.write_bytes(b"<svg/>")
+    archivo = ArchivoQR(ruta=ruta, digest="abc", media_type="image/svg+xml")
+
+    with patch("src.api.controllers.mesa_controller.MesaQRService") as mock_service_class:
+        mock_service_class.return_value.get_qr_mesa = AsyncMock(return_value=archivo)
+
+        response = test_client.get("/api/v1/mesas/M1/qr?formato=svg")
+        assert response.status_code == 200
+        assert response.content == b"<svg/>"
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        assert mock_service_class.return_value.get_qr_mesa.await_args.args == ("M1", "svg")
+
+        response = test_client.get("/api/v1/mesas/M1/qr", headers={"If-None-Match": '"abc"'})
+        assert response.status_code == 304
+
+
+def test_get_qr_mesa_sin_segno_endpoint(test_client):
+    """
+    Prueba que sin generador de QR disponible se responde 503.
+
+    PRECONDICIONES:
+        - El servicio de QR lanza MesaQRNoDisponibleError.
+
+    PROCESO:
+        - Pedir el QR de una mesa.
+
+    POSTCONDICIONES:
+        - Responde 503.
+    """
+    with patch("src.api.controllers.mesa_controller.MesaQRService") as mock_service_class:
+        mock_service_class.return_value.get_qr_mesa = AsyncMock(side_effect=MesaQRNoDisponibleError())
+
+        response = test_client.get("/api/v1/mesas/M1/qr")
+
+    assert response.status_code == 503
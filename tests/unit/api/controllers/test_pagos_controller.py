@@ -0,0 +1,194 @@
+"""
+Pruebas unitarias para los endpoints de pagos.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.pagos_controller import router
+from src.api.schemas.pago_schema import DivisionCuentaResponse, ParteCuenta, PagoResponse
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoNotFoundError,
+    PagoTransicionError,
+    PagoIdempotenciaError,
+)
+from src.core.enums.pago_enums import EstadoPago, MetodoPago
+from src.core.enums.pedido_enums import TipoDivision
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de PagosController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_division_service():
+    """Fixture que reemplaza el servicio de división del controlador."""
+    with patch("src.api.controllers.pagos_controller.DivisionCuentaService") as mock_service_class:
+        yield mock_service_class.return_value
+
+
+def test_dividir_cuenta_endpoint(test_client, mock_division_service):
+    """
+    Prueba la división de la cuenta.
+
+    PRECONDICIONES:
+        - El servicio de división debe estar mockeado.
+
+    PROCESO:
+        - Pedir la división equitativa entre dos comensales.
+
+    POSTCONDICIONES:
+        - Responde 200 con las partes de cada comensal.
+    """
+    mock_division_service.dividir = AsyncMock(return_value=DivisionCuentaResponse(
+        id_mesa="m1",
+        tipo=TipoDivision.EQUITATIVA,
+        pedidos=["p1"],
+        total=Decimal("10.01"),
+        partes=[
+            ParteCuenta(comensal="1", importe=Decimal("5.01")),
+            ParteCuenta(comensal="2", importe=Decimal("5.00")),
+        ],
+        pendiente=Decimal("0.00"),
+    ))
+
+    response = test_client.post(
+        "/api/v1/pagos/division",
+        json={"id_mesa": "m1", "tipo": "equitativa", "comensales": 2},
+    )
+
+    assert response.status_code == 200
+    assert [parte["importe"] for parte in response.json()["partes"]] == ["5.01", "5.00"]
+    assert mock_division_service.dividir.await_args.args[0].comensales == 2
+
+
+@pytest.mark.parametrize(
+    "error, codigo",
+    [
+        (PagoValidationError("Los importes suman más que el total"), 400),
+        (PagoNotFoundError("La mesa no tiene pedidos"), 404),
+        (RuntimeError("fallo"), 500),
+    ],
+)
+def test_dividir_cuenta_errores(test_client, mock_division_service, error, codigo):
+    """
+    Prueba la traducción de errores del servicio a códigos HTTP.
+
+    PRECONDICIONES:
+        - El servicio de división lanza un error.
+
+    PROCESO:
+        - Pedir una división manual.
+
+    POSTCONDICIONES:
+        - Responde con el código correspondiente al error.
+    """
+    mock_division_service.dividir = AsyncMock(side_effect=error)
+
+    response = test_client.post(
+        "/api/v1/pagos/division",
+        json={"id_mesa": "m1", "tipo": "manual", "importes": {"1": "30.00"}},
+    )
+
+    assert response.status_code == codigo
+
+
+@pytest.fixture
+def mock_pago_service():
+    """Fixture que reemplaza el servicio de pagos del controlador."""
+    with patch("src.api.controllers.pagos_controller.PagoService") as mock_service_class:
+        yield mock_service_class.return_value
+
+
+def _pago_response():
+    """Crea la respuesta de un pago pendiente."""
+    return PagoResponse(
+        id="pg1", id_mesa="m1", metodo=MetodoPago.YAPE, estado=EstadoPago.PENDIENTE,
+        monto=Decimal("25.50"), version=1,
+    )
+
+
+def test_registrar_pago_con_clave_de_idempotencia(test_client, mock_pago_service):
+    """
+    Prueba que la clave de idempotencia llega al servicio y los reintentos se marcan.
+
+    PRECONDICIONES:
+        - El servicio de pagos debe estar mockeado.
+
+    PROCESO:
+        - Registrar un pago y reintentarlo con la misma clave.
+
+    POSTCONDICIONES:
+        - Ambas respuestas son 201 y solo el reintento trae Idempotent-Replayed.
+    """
+    mock_pago_service.registrar_pago = AsyncMock(
+        side_effect=[(_pago_response(), False), (_pago_response(), True)]
+    )
+    body = {"id_mesa": "m1", "metodo": "yape", "monto": "25.50"}
+
+    primera = test_client.post("/api/v1/pagos", json=body, headers={"Idempotency-Key": "k1"})
+    reintento = test_client.post("/api/v1/pagos", json=body, headers={"Idempotency-Key": "k1"})
+
+    assert (primera.status_code, reintento.status_code) == (201, 201)
+    assert "idempotent-replayed" not in primera.headers
+    assert reintento.headers["idempotent-replayed"] == "true"
+    assert mock_pago_service.registrar_pago.await_args.args[1] == "k1"
+
+
+def test_registrar_pago_clave_reutilizada(test_client, mock_pago_service):
+    """
+    Prueba que una clave reutilizada con otros datos responde 409.
+
+    PRECONDICIONES:
+        - El servicio lanza PagoIdempotenciaError.
+
+    PROCESO:
+        - Registrar un pago con la clave.
+
+    POSTCONDICIONES:
+        - Responde 409.
+    """
+    mock_pago_service.registrar_pago = AsyncMock(
+        side_effect=PagoIdempotenciaError("La clave ya se usó con datos distintos")
+    )
+
+    response = test_client.post(
+        "/api/v1/pagos",
+        json={"id_mesa": "m1", "metodo": "yape", "monto": "30.00"},
+        headers={"Idempotency-Key": "k1"},
+    )
+
+    assert response.status_code == 409
+
+
+def test_transicionar_pago_endpoint(test_client, mock_pago_service):
+    """
+    Prueba el cambio de estado de un pago.
+
+    PRECONDICIONES:
+        - El servicio de pagos debe estar mockeado.
+
+    PROCESO:
+        - Completar un pago y luego intentar una transición no permitida.
+
+    POSTCONDICIONES:
+        - Responde 200 y después 409.
+    """
+    mock_pago_service.transicionar_pago = AsyncMock(
+        side_effect=[_pago_response(), PagoTransicionError("No permitido")]
+    )
+
+    ok = test_client.post("/api/v1/pagos/pg1/transition", json={"estado": "completado"})
+    conflicto = test_client.post("/api/v1/pagos/pg1/transition", json={"estado": "pendiente"})
+
+    assert ok.status_code == 200
+    assert conflicto.status_code == 409
@@ -0,0 +1,101 @@
+"""
+Pruebas unitarias para los endpoints de pedidos.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.controllers.pedidos_controller import router
+from src.api.schemas.pedido_schema import PedidoResponse
+from src.business_logic.exceptions.pedido_exceptions import PedidoValidationError
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+@pytest.fixture
+def test_client():
+    """Fixture para TestClient local de PedidosController"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_pedido_service():
+    """Fixture que reemplaza el servicio de pedidos del controlador."""
+    with patch("src.api.controllers.pedidos_controller.PedidoService") as mock_service_class:
+        yield mock_service_class.return_value
+
+
+def test_create_pedido_endpoint(test_client, mock_pedido_service):
+    """
+    Prueba la creación de un pedido.
+
+    PRECONDICIONES:
+        - El servicio de pedidos debe estar mockeado.
+
+    PROCESO:
+        - Enviar un pedido con un producto.
+
+    POSTCONDICIONES:
+        - Responde 201 con el pedido y el servicio recibe los ítems.
+    """
+    mock_pedido_service.create_pedido = AsyncMock(return_value=PedidoResponse(
+        id="P1", id_mesa="M1", estado=EstadoPedido.PENDIENTE, prioridad=PrioridadPedido.NORMAL,
+        total=Decimal("6.00"), version_menu=1, items=[],
+    ))
+
+    response = test_client.post(
+        "/api/v1/pedidos", json={"id_mesa": "M1", "items": [{"id_producto": "chicha", "cantidad": 1}]}
+    )
+
+    assert response.status_code == 201
+    assert response.json()["total"] == "6.00"
+    pedido = mock_pedido_service.create_pedido.await_args.args[0]
+    assert [item.id_producto for item in pedido.items] == ["chicha"]
+
+
+def test_create_pedido_invalido(test_client, mock_pedido_service):
+    """
+    Prueba que un producto no disponible responde 400.
+
+    PRECONDICIONES:
+        - El servicio lanza PedidoValidationError.
+
+    PROCESO:
+        - Enviar el pedido.
+
+    POSTCONDICIONES:
+        - Responde 400 con el mensaje del servicio.
+    """
+    mock_pedido_service.create_pedido = AsyncMock(
+        side_effect=PedidoValidationError("El producto 'x' no está disponible")
+    )
+
+    response = test_client.post(
+        "/api/v1/pedidos", json={"id_mesa": "M1", "items": [{"id_producto": "x"}]}
+    )
+
+    assert response.status_code == 400
+    assert "no está disponible" in response.json()["detail"]
+
+
+def test_create_pedido_sin_items(test_client, mock_pedido_service):
+    """
+    Prueba que un pedido vacío se rechaza antes de llegar al servicio.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Enviar un pedido sin ítems.
+
+    POSTCONDICIONES:
+        - Responde 422.
+    """
+    response = test_client.post("/api/v1/pedidos", json={"id_mesa": "M1", "items": []})
+
+    assert response.status_code == 422
@@ -17,6 +17,11 @@ from src.business_logic.exceptions.producto_exceptions import (
     ProductoValidationError,
 )
 from src.api.schemas.producto_schema import ProductoResponse, ProductoList
+from src.business_logic.menu.producto_alergeno_service import ProductoAlergenoService
+from src.api.schemas.producto_alergeno_schema import (
+    ProductoAlergenosBatchRequest,
+    ProductoAlergenosBatchResponse,
+)
 
 app = FastAPI()
 app.include_router(router, prefix="/api/v1")
@@ -315,7 +320,9 @@ def test_list_productos_success(
     assert response.status_code == 200
     assert response.json()["total"] == 2
     assert len(response.json()["items"]) == 2
-    mock_producto_service.get_productos.assert_awaited_once_with(0, 10, None)
+    mock_producto_service.get_productos.assert_awaited_once_with(
+        0, 10, None, excluir_alergenos=[], tolerar_trazas=True
+    )
 
 
 def test_list_productos_validation_error(
@@ -395,7 +402,47 @@ def test_list_productos_with_categoria_filter(
     assert response.status_code == 200
     assert response.json()["total"] == 1
     assert len(response.json()["items"]) == 1
-    mock_producto_service.get_productos.assert_awaited_once_with(0, 10, id_categoria)
+    mock_producto_service.get_productos.assert_awaited_once_with(
+        0, 10, id_categoria, excluir_alergenos=[], tolerar_trazas=True
+    )
+
+
+def test_list_productos_with_alergenos_filter(
+    test_client, mock_db_session_dependency, mock_producto_service
+):
+    """
+    Prueba que el filtro de alérgenos acepta valores repetidos y separados por comas.
+
+    PRECONDICIONES:
+        - El cliente de prueba (test_client) debe estar configurado
+        - El servicio de productos debe estar mockeado (mock_producto_service)
+
+    PROCESO:
+        - Realiza una solicitud GET combinando ambos formatos y tolerar_trazas=false.
+
+    POSTCONDICIONES:
+        - La respuesta debe tener código HTTP 200 (OK)
+        - El servicio debe recibir la lista plana de IDs sin duplicados
+    """
+    # Arrange
+    gluten, mariscos, lacteos = str(ULID()), str(ULID()), str(ULID())
+    mock_producto_service.get_productos.return_value = ProductoList(items=[], total=0)
+
+    # Act
+    response = test_client.get(
+        f"/api/v1/productos?excluir_alergenos={gluten},{mariscos}"
+        f"&excluir_alergenos={lacteos}&excluir_alergenos={gluten}&tolerar_trazas=false"
+    )
+
+    # Assert
+    assert response.status_code == 200
+    mock_producto_service.get_productos.assert_awaited_once_with(
+        0,
+        100,
+        None,
+        excluir_alergenos=[gluten, mariscos, lacteos],
+        tolerar_trazas=False,
+    )
 
 
 def test_update_producto_success(
@@ -576,3 +623,61 @@ def test_delete_producto_not_found(
     assert response.status_code == 404
     assert f"No se encontró el producto con ID {sample_producto_id}" in response.json()["detail"]
     mock_producto_service.delete_producto.assert_awaited_once()
+
+
+def test_get_alergenos_batch_success(test_client, mock_db_session_dependency):
+    """
+    Prueba la consulta en lote de alérgenos de varios productos.
+
+    PRECONDICIONES:
+        - El cliente de prueba (test_client) debe estar configurado
+        - El servicio de producto-alérgeno debe estar mockeado
+
+    PROCESO:
+        - Realiza una solicitud POST con dos IDs de producto.
+
+    POSTCONDICIONES:
+        - La respuesta debe tener código HTTP 200 (OK)
+        - El servicio debe recibir los IDs solicitados
+    """
+    # Arrange
+    ids = [str(ULID()), str(ULID())]
+    with patch("src.api.controllers.producto_controller.ProductoAlergenoService") as mock:
+        service_instance = AsyncMock(spec=ProductoAlergenoService)
+        mock.return_value = service_instance
+        service_instance.get_alergenos_by_productos.return_value = ProductoAlergenosBatchResponse(
+            items=[{"id_producto": id_producto, "alergenos": []} for id_producto in ids]
+        )
+
+        # Act
+        response = test_client.post(
+            "/api/v1/productos/alergenos:batch", json={"ids_producto": ids}
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert [item["id_producto"] for item in response.json()["items"]] == ids
+    service_instance.get_alergenos_by_productos.assert_awaited_once_with(ids)
+
+
+def test_get_alergenos_batch_limits(test_client, mock_db_session_dependency):
+    """
+    Prueba que la consulta en lote valida el tamaño de la lista.
+
+    PRECONDICIONES:
+        - El cliente de prueba (test_client) debe estar configurado
+
+    PROCESO:
+        - Realiza solicitudes POST con una lista vacía y con demasiados IDs.
+
+    POSTCONDICIONES:
+        - Ambas respuestas deben tener código HTTP 422
+    """
+    demasiados = [str(ULID()) for _ in range(ProductoAlergenosBatchRequest.MAX_PRODUCTOS + 1)]
+
+    assert test_client.post(
+        "/api/v1/productos/alergenos:batch", json={"ids_producto": []}
+    ).status_code == 422
+    assert test_client.post(
+        "/api/v1/productos/alergenos:batch", json={"ids_producto": demasiados}
+    ).status_code == 422
@@ -0,0 +1,135 @@
+"""
+Pruebas unitarias para el mapa de permisos por rol.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.business_logic.auth.permisos import BIT_PERMISO, MapaPermisos, compilar
+from src.core.dependencies import requiere_permiso
+from src.core.enums.user_enums import Permiso
+from src.core.security import security
+
+
+def _rol(nombre, permisos=None, activo=True):
+    """Crea un rol mockeado."""
+    return MagicMock(nombre=nombre, permisos=permisos, activo=activo)
+
+
+def test_permisos_por_defecto():
+    """
+    Verifica los permisos de los roles predefinidos antes de la primera carga.
+
+    PRECONDICIONES:
+        - Un mapa recién creado.
+
+    PROCESO:
+        - Consultar permisos de mesero, cocina y admin.
+
+    POSTCONDICIONES:
+        - Cada rol tiene sus permisos por defecto y los roles desconocidos ninguno.
+    """
+    mapa = MapaPermisos(fabrica_sesion=MagicMock())
+
+    assert mapa.tiene("mesero", Permiso.MESAS_GESTIONAR, Permiso.PAGOS_REGISTRAR)
+    assert not mapa.tiene("Cocina", Permiso.PAGOS_REGISTRAR)
+    assert mapa.tiene("ADMIN", *Permiso)
+    assert not mapa.tiene("desconocido", Permiso.PEDIDOS_VER)
+    assert not mapa.tiene(None, Permiso.PEDIDOS_VER)
+
+
+@pytest.mark.asyncio
+async def test_recargar_desde_base_de_datos():
+    """
+    Verifica la carga de permisos propios, por defecto y de roles inactivos.
+
+    PRECONDICIONES:
+        - Un rol propio con permisos, un predefinido sin permisos y uno inactivo.
+
+    PROCESO:
+        - Recargar el mapa a partir de los roles del repositorio.
+
+    POSTCONDICIONES:
+        - El rol propio tiene solo sus permisos (los desconocidos se ignoran).
+        - El predefinido conserva sus permisos por defecto.
+        - El inactivo no tiene permisos.
+    """
+    @asynccontextmanager
+    async def fabrica_sesion():
+        yield AsyncMock()
+
+    roles = [
+        _rol("Cajero", ["pagos:registrar", "pagos:gestionar", "inventado"]),
+        _rol("mesero"),
+        _rol("cocina", activo=False),
+    ]
+    mapa = MapaPermisos(fabrica_sesion=fabrica_sesion)
+    with patch("src.business_logic.auth.permisos.RolRepository") as repository_class:
+        repository_class.return_value.get_todos = AsyncMock(return_value=roles)
+        # cajero y mesero, más cliente y admin, que no tienen fila
+        assert await mapa.recargar() == 4
+
+    assert mapa.mascara("cajero") == compilar(["pagos:registrar", "pagos:gestionar"])
+    assert mapa.mascara("cajero") == BIT_PERMISO[Permiso.PAGOS_REGISTRAR] | BIT_PERMISO[Permiso.PAGOS_GESTIONAR]
+    assert mapa.tiene("mesero", Permiso.PEDIDOS_CREAR)
+    assert not mapa.tiene("cocina", Permiso.COCINA_GESTIONAR)
+    assert mapa.version == 1
+
+
+def test_cargar_tabla_vacia_conserva_roles_predefinidos():
+    """
+    Verifica que una tabla de roles vacía no deja sin permisos a los predefinidos.
+
+    PRECONDICIONES:
+        - Un mapa y una lista de roles vacía.
+
+    PROCESO:
+        - Cargar el mapa sin roles.
+
+    POSTCONDICIONES:
+        - Admin, mesero y cocina conservan sus permisos por defecto.
+        - Los roles desconocidos siguen sin permisos.
+    """
+    mapa = MapaPermisos(fabrica_sesion=MagicMock())
+
+    mapa.cargar([])
+
+    assert mapa.tiene("admin", *Permiso)
+    assert mapa.tiene("mesero", Permiso.MESAS_GESTIONAR)
+    assert mapa.tiene("cocina", Permiso.COCINA_GESTIONAR)
+    assert not mapa.tiene("desconocido", Permiso.PEDIDOS_VER)
+
+
+def test_dependencia_requiere_permiso():
+    """
+    Verifica la dependencia de autorización sin consultar la base de datos.
+
+    PRECONDICIONES:
+        - Un endpoint que requiere el permiso de registrar pagos.
+
+    PROCESO:
+        - Llamarlo sin token, con un token de cocina y con uno de mesero.
+
+    POSTCONDICIONES:
+        - Responde 401, 403 y 200 respectivamente.
+    """
+    app = FastAPI()
+
+    @app.get("/protegido")
+    async def protegido(payload: dict = Depends(requiere_permiso(Permiso.PAGOS_REGISTRAR))):
+        return {"sub": payload["sub"]}
+
+    client = TestClient(app)
+    cocina = security.create_access_token({"sub": "u1", "rol": "cocina"})
+    mesero = security.create_access_token({"sub": "u2", "rol": "mesero"})
+    refresh = security.create_refresh_token({"sub": "u2", "rol": "mesero"})
+
+    assert client.get("/protegido").status_code == 401
+    assert client.get("/protegido", headers={"Authorization": f"Bearer {refresh}"}).status_code == 401
+    assert client.get("/protegido", headers={"Authorization": f"Bearer {cocina}"}).status_code == 403
+    respuesta = client.get("/protegido", headers={"Authorization": f"Bearer {mesero}"})
+    assert respuesta.status_code == 200
+    assert respuesta.json() == {"sub": "u2"}
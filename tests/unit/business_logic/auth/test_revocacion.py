@@ -0,0 +1,108 @@
+"""
+Pruebas unitarias para la lista de tokens revocados.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.business_logic.auth.revocacion import ListaRevocacion, a_timestamp
+
+
+@pytest.fixture
+def mock_repository():
+    """Fixture que reemplaza el repositorio de revocaciones de la lista."""
+    with patch("src.business_logic.auth.revocacion.TokenRevocadoRepository") as repository_class:
+        repository = repository_class.return_value
+        repository.get_vigentes = AsyncMock(return_value=[])
+        repository.existe_jti = AsyncMock(return_value=True)
+        yield repository
+
+
+@pytest.fixture
+def lista():
+    """Fixture con una lista de revocación que no usa la base de datos real."""
+
+    @asynccontextmanager
+    async def fabrica_sesion():
+        yield AsyncMock()
+
+    return ListaRevocacion(fabrica_sesion=fabrica_sesion, capacidad=100, tasa_error=0.01)
+
+
+@pytest.mark.asyncio
+async def test_token_no_revocado_no_consulta_la_base(lista, mock_repository):
+    """
+    Verifica que un token que no está en el filtro se acepta sin consultar la base de datos.
+
+    PRECONDICIONES:
+        - Una lista con un token revocado.
+
+    PROCESO:
+        - Comprobar otro token y el token revocado dos veces.
+
+    POSTCONDICIONES:
+        - El otro token no está revocado y no se consulta la base.
+        - El revocado se confirma en la base una sola vez.
+    """
+    lista.agregar(jti="revocado", id_usuario="u1", revocado_en=datetime.utcnow())
+
+    assert await lista.esta_revocado({"jti": "vigente", "sub": "u1", "iat": 1}) is False
+    mock_repository.existe_jti.assert_not_awaited()
+
+    assert await lista.esta_revocado({"jti": "revocado", "sub": "u1"}) is True
+    assert await lista.esta_revocado({"jti": "revocado", "sub": "u1"}) is True
+    mock_repository.existe_jti.assert_awaited_once_with("revocado")
+
+
+@pytest.mark.asyncio
+async def test_revocacion_de_usuario_usa_el_corte(lista, mock_repository):
+    """
+    Verifica que revocar un usuario rechaza solo los tokens emitidos hasta ese momento.
+
+    PRECONDICIONES:
+        - Un usuario revocado en un momento dado.
+
+    PROCESO:
+        - Comprobar tokens emitidos antes y después, y uno de otro usuario.
+
+    POSTCONDICIONES:
+        - Solo el emitido antes está revocado.
+    """
+    revocado_en = datetime(2026, 1, 1, 12, 0, 0)
+    corte = a_timestamp(revocado_en)
+    lista.agregar(id_usuario="u1", revocado_en=revocado_en)
+
+    assert await lista.esta_revocado({"jti": "a", "sub": "u1", "iat": int(corte) - 60}) is True
+    assert await lista.esta_revocado({"jti": "b", "sub": "u1", "iat": int(corte) + 60}) is False
+    assert await lista.esta_revocado({"jti": "c", "sub": "u2", "iat": int(corte) - 60}) is False
+
+
+@pytest.mark.asyncio
+async def test_sincronizar_lee_solo_las_nuevas(lista, mock_repository):
+    """
+    Verifica que tras la carga inicial solo se leen las revocaciones recientes.
+
+    PRECONDICIONES:
+        - Una revocación en la base de datos.
+
+    PROCESO:
+        - Cargar la lista y sincronizar con una revocación nueva.
+
+    POSTCONDICIONES:
+        - La sincronización filtra por momento de revocación y añade el token nuevo.
+    """
+    antigua = MagicMock(jti="j1", id_usuario="u1", revocado_en=datetime.utcnow() - timedelta(hours=1))
+    mock_repository.get_vigentes.return_value = [antigua]
+    assert await lista.cargar() == 1
+    assert "j1" in lista.filtro
+
+    nueva = MagicMock(jti="j2", id_usuario="u2", revocado_en=datetime.utcnow())
+    mock_repository.get_vigentes.return_value = [nueva]
+    assert await lista.sincronizar() == 1
+
+    desde = mock_repository.get_vigentes.await_args.kwargs["desde"]
+    assert desde is not None and desde < antigua.revocado_en
+    assert "j2" in lista.filtro
+    assert lista.version == 1
@@ -443,3 +443,30 @@ async def test_update_rol_no_changes(rol_service, mock_repository, sample_rol_da
     assert result.nombre == sample_rol_data["nombre"]
     mock_repository.get_by_id.assert_called_once_with(rol_id)
     mock_repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_rol_notifica_cambio(rol_service, mock_repository, sample_rol_data):
+    """
+    Prueba que actualizar los permisos de un rol lo anuncia en el bus.
+
+    PRECONDICIONES:
+        - El servicio y repositorio mock deben estar configurados.
+
+    PROCESO:
+        - Actualizar los permisos de un rol.
+
+    POSTCONDICIONES:
+        - Los permisos se guardan como códigos y se publica un evento en el canal roles.
+    """
+    rol_service.event_bus = AsyncMock()
+    mock_repository.update.return_value = RolModel(**sample_rol_data, permisos=["pedidos:ver"])
+
+    result = await rol_service.update_rol(
+        sample_rol_data["id"], RolUpdate(permisos=["pedidos:ver"])
+    )
+
+    assert [permiso.value for permiso in result.permisos] == ["pedidos:ver"]
+    mock_repository.update.assert_called_once_with(sample_rol_data["id"], permisos=["pedidos:ver"])
+    evento = rol_service.event_bus.publicar.await_args.args[0]
+    assert evento.canal == "roles"
@@ -35,6 +35,7 @@ def alergeno_service(mock_repository):
     """
     service = AlergenoService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
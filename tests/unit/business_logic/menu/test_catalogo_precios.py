@@ -0,0 +1,112 @@
+"""
+Pruebas unitarias para el catálogo de precios.
+"""
+
+import pytest
+from decimal import Decimal
+
+from src.business_logic.menu.catalogo_precios import (
+    CatalogoPrecios,
+    GrupoOpciones,
+    OpcionPrecio,
+    ProductoPrecio,
+)
+
+
+@pytest.fixture
+def catalogo():
+    """
+    Fixture con un ceviche de tamaño obligatorio y hasta dos extras.
+    """
+    return CatalogoPrecios(
+        version=3,
+        productos={
+            "ceviche": ProductoPrecio(
+                id="ceviche",
+                nombre="Ceviche",
+                precio_base=Decimal("30.00"),
+                opciones={
+                    "personal": OpcionPrecio("personal", "Personal", Decimal("0.00"), "tamano"),
+                    "grande": OpcionPrecio("grande", "Grande", Decimal("8.50"), "tamano"),
+                    "camote": OpcionPrecio("camote", "Camote", Decimal("1.10"), "extra"),
+                    "choclo": OpcionPrecio("choclo", "Choclo", Decimal("1.20"), "extra"),
+                    "cancha": OpcionPrecio("cancha", "Cancha", Decimal("0.70"), "extra"),
+                },
+                grupos={
+                    "tamano": GrupoOpciones("tamano", "Tamaño", seleccion_minima=1, seleccion_maxima=1),
+                    "extra": GrupoOpciones("extra", "Extras", seleccion_maxima=2),
+                },
+            ),
+        },
+    )
+
+
+def test_valorar_linea_valida(catalogo):
+    """
+    Prueba la valoración de una línea con opciones de dos grupos.
+
+    PRECONDICIONES:
+        - El producto tiene un tamaño obligatorio y extras opcionales.
+
+    PROCESO:
+        - Valorar tres unidades grandes con camote y choclo.
+
+    POSTCONDICIONES:
+        - El precio unitario suma las opciones con aritmética decimal exacta.
+    """
+    linea = catalogo.valorar("ceviche", 3, ["grande", "camote", "choclo"])
+
+    assert linea.valida
+    assert [o.id for o in linea.opciones] == ["grande", "camote", "choclo"]
+    assert linea.precio_unitario == Decimal("40.80")
+    assert linea.total == Decimal("122.40")
+
+
+@pytest.mark.parametrize(
+    "opciones, error",
+    [
+        ([], "al menos 1 en 'Tamaño'"),
+        (["personal", "grande"], "como máximo 1 en 'Tamaño'"),
+        (["personal", "camote", "choclo", "cancha"], "como máximo 2 en 'Extras'"),
+        (["personal", "personal"], "repetidas"),
+        (["personal", "queso"], "'queso' no está disponible"),
+    ],
+    ids=["minimo", "maximo_tamano", "maximo_extras", "repetida", "inexistente"],
+)
+def test_valorar_linea_seleccion_invalida(catalogo, opciones, error):
+    """
+    Prueba los límites de selección de cada grupo de opciones.
+
+    PRECONDICIONES:
+        - El producto tiene un tamaño obligatorio y hasta dos extras.
+
+    PROCESO:
+        - Valorar la línea con una selección no válida.
+
+    POSTCONDICIONES:
+        - La línea no es válida y el error explica el motivo.
+    """
+    linea = catalogo.valorar("ceviche", 1, opciones)
+
+    assert not linea.valida
+    assert any(error in mensaje for mensaje in linea.errores)
+
+
+def test_valorar_producto_no_disponible(catalogo):
+    """
+    Prueba la valoración de un producto que no está en el menú.
+
+    PRECONDICIONES:
+        - El catálogo no contiene el producto.
+
+    PROCESO:
+        - Valorar la línea.
+
+    POSTCONDICIONES:
+        - La línea no es válida y su importe es cero.
+    """
+    linea = catalogo.valorar("agotado", 2, [])
+
+    assert linea.producto is None
+    assert linea.total == Decimal("0.00")
+    assert linea.errores == ["El producto 'agotado' no está disponible"]
@@ -35,6 +35,7 @@ def categoria_service(mock_repository):
     """
     service = CategoriaService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
@@ -0,0 +1,299 @@
+"""
+Pruebas unitarias para el servicio del menú completo.
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from ulid import ULID
+from unittest.mock import AsyncMock
+
+from src.business_logic.menu.menu_service import (
+    LIMITE_CAMBIOS,
+    MenuService,
+    menu_cache,
+)
+from src.models.menu.categoria_model import CategoriaModel
+from src.models.menu.producto_model import ProductoModel
+from src.models.menu.alergeno_model import AlergenoModel
+from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
+from src.models.pedidos.producto_opcion_model import ProductoOpcionModel
+from src.models.pedidos.tipo_opciones_model import TipoOpcionModel
+from src.core.enums.alergeno_enums import NivelPresencia, NivelRiesgo
+from src.core.enums.menu_enums import EntidadMenu
+
+
+@pytest.fixture
+def mock_repository():
+    """
+    Fixture que proporciona un mock del repositorio del menú con un catálogo mínimo.
+    """
+    ahora = datetime.now()
+    categoria = CategoriaModel(id=str(ULID()), nombre="Ceviches", activo=True)
+    vacia = CategoriaModel(id=str(ULID()), nombre="Postres", activo=True)
+    producto = ProductoModel(
+        id=str(ULID()),
+        id_categoria=categoria.id,
+        nombre="Ceviche clásico",
+        precio_base=Decimal("30.00"),
+        destacado=True,
+    )
+    tamano = TipoOpcionModel(
+        id=str(ULID()), codigo="tamano", nombre="Tamaño", orden=2, seleccion_minima=1, seleccion_maxima=1
+    )
+    aji = TipoOpcionModel(id=str(ULID()), codigo="aji", nombre="Ají", orden=1, seleccion_minima=0)
+    opciones = [
+        (ProductoOpcionModel(
+            id=str(ULID()), id_producto=producto.id, id_tipo_opcion=tamano.id, nombre="Grande",
+            precio_adicional=Decimal("8.00"), activo=True, orden=2,
+            fecha_creacion=ahora, fecha_modificacion=ahora,
+        ), tamano),
+        (ProductoOpcionModel(
+            id=str(ULID()), id_producto=producto.id, id_tipo_opcion=tamano.id, nombre="Personal",
+            precio_adicional=Decimal("0.00"), activo=True, orden=1,
+            fecha_creacion=ahora, fecha_modificacion=ahora,
+        ), tamano),
+        (ProductoOpcionModel(
+            id=str(ULID()), id_producto=producto.id, id_tipo_opcion=aji.id, nombre="Sin ají",
+            precio_adicional=Decimal("0.00"), activo=True, orden=None,
+            fecha_creacion=ahora, fecha_modificacion=ahora,
+        ), aji),
+    ]
+    mariscos = AlergenoModel(id=str(ULID()), nombre="Mariscos", nivel_riesgo=NivelRiesgo.ALTO)
+    relacion = ProductoAlergenoModel(
+        id_producto=producto.id, id_alergeno=mariscos.id, nivel_presencia=NivelPresencia.CONTIENE
+    )
+
+    repository = AsyncMock()
+    repository.get_categorias.return_value = [categoria, vacia]
+    repository.get_productos.return_value = [producto]
+    repository.get_opciones.return_value = opciones
+    repository.get_alergenos.return_value = [(relacion, mariscos)]
+    return repository
+
+
+@pytest.fixture
+def mock_cambio_repository():
+    """
+    Fixture que proporciona un mock del registro de cambios en la versión 3.
+    """
+    repository = AsyncMock()
+    repository.get_version_actual.return_value = 3
+    return repository
+
+
+@pytest.fixture
+def menu_service(mock_repository, mock_cambio_repository):
+    """
+    Fixture que proporciona una instancia del servicio con repositorios mockeados.
+    """
+    menu_cache.clear()
+    service = MenuService(AsyncMock())
+    service.repository = mock_repository
+    service.menu_cambio_repository = mock_cambio_repository
+    yield service
+    menu_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_menu_agrupa_catalogo(menu_service, mock_repository):
+    """
+    Prueba la construcción del menú a partir de las cuatro consultas del repositorio.
+
+    PRECONDICIONES:
+        - El repositorio mock devuelve dos categorías, un producto, tres opciones y un alérgeno.
+
+    PROCESO:
+        - Llamar a get_menu.
+
+    POSTCONDICIONES:
+        - Cada consulta del repositorio se ejecuta una sola vez.
+        - Las opciones quedan agrupadas por tipo y ordenadas.
+        - Las categorías sin productos aparecen con lista vacía.
+    """
+    # Act
+    menu = await menu_service.get_menu()
+
+    # Assert
+    for consulta in ("get_categorias", "get_productos", "get_opciones", "get_alergenos"):
+        getattr(mock_repository, consulta).assert_awaited_once()
+
+    ceviches, postres = menu.categorias
+    assert postres.productos == []
+    producto = ceviches.productos[0]
+    assert producto.destacado is True
+    assert [t.nombre_tipo for t in producto.tipos_opciones] == ["Ají", "Tamaño"]
+    assert [o.nombre for o in producto.tipos_opciones[1].opciones] == ["Personal", "Grande"]
+    assert producto.alergenos[0].nombre == "Mariscos"
+    assert producto.alergenos[0].nivel_presencia == NivelPresencia.CONTIENE
+
+
+@pytest.mark.asyncio
+async def test_get_menu_serializado_cachea_por_version(
+    menu_service, mock_repository, mock_cambio_repository
+):
+    """
+    Prueba que el menú serializado se reutiliza hasta que cambia la versión.
+
+    PRECONDICIONES:
+        - La caché del menú debe estar vacía.
+
+    PROCESO:
+        - Obtener el menú serializado dos veces, registrar un cambio y volver a obtenerlo.
+
+    POSTCONDICIONES:
+        - La segunda llamada no consulta el repositorio del menú.
+        - Tras un cambio se reconstruye con la nueva versión.
+        - Los bytes gzip descomprimen al mismo JSON.
+    """
+    # Act
+    primero = await menu_service.get_menu_serializado()
+    segundo = await menu_service.get_menu_serializado()
+
+    # Assert
+    assert segundo is primero
+    assert mock_repository.get_productos.await_count == 1
+    assert gzip.decompress(primero.gzip) == primero.json
+    assert json.loads(primero.json)["version"] == primero.version == 3
+    assert primero.etag() == '"menu-3"'
+    assert primero.etag("gzip") == '"menu-3-gzip"'
+
+    # Act - una escritura registra una nueva versión
+    mock_cambio_repository.get_version_actual.return_value = 4
+    tercero = await menu_service.get_menu_serializado()
+
+    # Assert
+    assert tercero.version == 4
+    assert mock_repository.get_productos.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_cambios_sin_cambios(menu_service, mock_repository, mock_cambio_repository):
+    """
+    Prueba que un cliente al día no provoca consultas del catálogo.
+
+    PRECONDICIONES:
+        - El registro de cambios está en la versión 3.
+
+    PROCESO:
+        - Pedir los cambios desde la versión 3.
+
+    POSTCONDICIONES:
+        - La respuesta está vacía y no se consulta el registro ni el catálogo.
+    """
+    result = await menu_service.get_cambios(3)
+
+    assert result.version == 3
+    assert result.productos == [] and result.productos_eliminados == []
+    assert result.requiere_menu_completo is False
+    mock_cambio_repository.get_cambios_desde.assert_not_called()
+    mock_repository.get_productos.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_cambios_resuelve_upserts_y_eliminados(
+    menu_service, mock_repository, mock_cambio_repository
+):
+    """
+    Prueba la resolución de cambios en actualizaciones y eliminaciones.
+
+    PRECONDICIONES:
+        - El registro contiene un producto visible, un producto retirado,
+          un alérgeno y una categoría que ya no está activa.
+
+    PROCESO:
+        - Pedir los cambios desde la versión 1.
+
+    POSTCONDICIONES:
+        - Los productos visibles se devuelven completos.
+        - El producto retirado y la categoría inactiva se devuelven como eliminados.
+        - Los productos relacionados con el alérgeno se incluyen.
+    """
+    # Arrange
+    producto = mock_repository.get_productos.return_value[0]
+    retirado, relacionado = str(ULID()), str(ULID())
+    categoria_inactiva, alergeno = str(ULID()), str(ULID())
+    mock_cambio_repository.get_cambios_desde.return_value = [
+        (EntidadMenu.PRODUCTO, producto.id),
+        (EntidadMenu.PRODUCTO, retirado),
+        (EntidadMenu.ALERGENO, alergeno),
+        (EntidadMenu.CATEGORIA, categoria_inactiva),
+    ]
+    mock_repository.get_ids_productos_relacionados.return_value = {relacionado}
+    mock_repository.get_categorias.return_value = []
+
+    # Act
+    result = await menu_service.get_cambios(1)
+
+    # Assert
+    mock_cambio_repository.get_cambios_desde.assert_awaited_once_with(1, LIMITE_CAMBIOS + 1)
+    mock_repository.get_ids_productos_relacionados.assert_awaited_once_with(
+        ids_categoria={categoria_inactiva},
+        ids_tipo_opcion=set(),
+        ids_alergeno={alergeno},
+    )
+    mock_repository.get_productos.assert_awaited_once_with({producto.id, retirado, relacionado})
+    assert [p.id for p in result.productos] == [producto.id]
+    assert result.productos[0].id_categoria == producto.id_categoria
+    assert result.productos_eliminados == sorted([retirado, relacionado])
+    assert result.categorias_eliminadas == [categoria_inactiva]
+    assert result.requiere_menu_completo is False
+
+
+@pytest.mark.asyncio
+async def test_get_cambios_requiere_menu_completo(menu_service, mock_cambio_repository):
+    """
+    Prueba los casos en que el cliente debe recargar el menú completo.
+
+    PRECONDICIONES:
+        - El registro de cambios está en la versión 3.
+
+    PROCESO:
+        - Pedir cambios desde una versión futura, con un cambio masivo
+          y con más cambios que el límite.
+
+    POSTCONDICIONES:
+        - Las tres respuestas indican requiere_menu_completo.
+    """
+    assert (await menu_service.get_cambios(10)).requiere_menu_completo is True
+
+    mock_cambio_repository.get_cambios_desde.return_value = [(EntidadMenu.MENU, "*")]
+    assert (await menu_service.get_cambios(0)).requiere_menu_completo is True
+
+    mock_cambio_repository.get_cambios_desde.return_value = [
+        (EntidadMenu.PRODUCTO, str(ULID())) for _ in range(LIMITE_CAMBIOS + 1)
+    ]
+    assert (await menu_service.get_cambios(0)).requiere_menu_completo is True
+
+
+@pytest.mark.asyncio
+async def test_get_disponibilidad_compacta_los_cambios(menu_service, mock_repository, mock_cambio_repository):
+    """
+    Prueba que los cambios se reducen a disponibilidad y precio.
+
+    PRECONDICIONES:
+        - Un producto visible y otro retirado en el registro de cambios.
+
+    PROCESO:
+        - Pedir la disponibilidad desde la versión 1.
+
+    POSTCONDICIONES:
+        - El visible aparece disponible con su precio; el retirado, no disponible.
+    """
+    producto = mock_repository.get_productos.return_value[0]
+    retirado = str(ULID())
+    mock_cambio_repository.get_cambios_desde.return_value = [
+        (EntidadMenu.PRODUCTO, producto.id),
+        (EntidadMenu.PRODUCTO, retirado),
+    ]
+    mock_repository.get_ids_productos_relacionados.return_value = set()
+
+    result = await menu_service.get_disponibilidad(1)
+
+    assert result.version == 3
+    assert [(p.id, p.disponible, p.precio_base) for p in result.productos] == [
+        (producto.id, True, producto.precio_base),
+        (retirado, False, None),
+    ]
@@ -8,7 +8,10 @@ from unittest.mock import AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
-from src.business_logic.menu.producto_alergeno_service import ProductoAlergenoService
+from src.business_logic.menu.producto_alergeno_service import (
+    ProductoAlergenoService,
+    alergenos_por_producto_cache,
+)
 from src.models.menu.producto_alergeno_model import ProductoAlergenoModel
 from src.api.schemas.producto_alergeno_schema import (
     ProductoAlergenoCreate,
@@ -19,7 +22,7 @@ from src.business_logic.exceptions.producto_alergeno_exceptions import (
     ProductoAlergenoNotFoundError,
     ProductoAlergenoConflictError,
 )
-from src.core.enums.alergeno_enums import NivelPresencia
+from src.core.enums.alergeno_enums import NivelPresencia, NivelRiesgo
 from sqlalchemy.exc import IntegrityError
 
 # Importar modelos relacionados para resolver dependencias de SQLAlchemy
@@ -43,6 +46,7 @@ def producto_alergeno_service(mock_repository):
     """
     service = ProductoAlergenoService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
@@ -111,6 +115,9 @@ async def test_create_producto_alergeno_success(
     assert args[0].id_alergeno == sample_producto_alergeno_data["id_alergeno"]
     assert args[0].nivel_presencia == sample_producto_alergeno_data["nivel_presencia"]
     assert args[0].notas == sample_producto_alergeno_data["notas"]
+    mock_repository.recalcular_mascaras.assert_awaited_once_with(
+        [sample_producto_alergeno_data["id_producto"]]
+    )
 
 
 @pytest.mark.asyncio
@@ -244,6 +251,7 @@ async def test_delete_producto_alergeno_success(
     POSTCONDICIONES:
         - El servicio debe eliminar la relación correctamente.
         - El repositorio debe ser llamado con los IDs correctos.
+        - El cambio del menú se registra en la transacción de la eliminación.
     """
     # Arrange
     id_producto = sample_producto_alergeno_data["id_producto"]
@@ -251,7 +259,16 @@ async def test_delete_producto_alergeno_success(
     mock_repository.get_by_id.return_value = ProductoAlergenoModel(
         **sample_producto_alergeno_data
     )
-    mock_repository.delete.return_value = True
+    orden = []
+    producto_alergeno_service.menu_cambio_repository.registrar.side_effect = (
+        lambda *args: orden.append("registrar")
+    )
+
+    async def eliminar(*args):
+        orden.append("delete")
+        return True
+
+    mock_repository.delete.side_effect = eliminar
 
     # Act
     result = await producto_alergeno_service.delete_producto_alergeno(
@@ -262,6 +279,9 @@ async def test_delete_producto_alergeno_success(
     assert result is True
     mock_repository.get_by_id.assert_called_once_with(id_producto, id_alergeno)
     mock_repository.delete.assert_called_once_with(id_producto, id_alergeno)
+    mock_repository.recalcular_mascaras.assert_awaited_once_with([id_producto])
+    # El cambio del menú se anota antes del commit de la eliminación
+    assert orden == ["registrar", "delete"]
 
 
 @pytest.mark.asyncio
@@ -421,6 +441,7 @@ async def test_update_producto_alergeno_success(
         nivel_presencia=NivelPresencia.TRAZAS,
         notas="Actualizado: contiene trazas",
     )
+    mock_repository.recalcular_mascaras.assert_awaited_once_with([id_producto])
 
 
 @pytest.mark.asyncio
@@ -499,3 +520,90 @@ async def test_update_producto_alergeno_no_changes(
     assert result.nivel_presencia == sample_producto_alergeno_data["nivel_presencia"]
     mock_repository.get_by_id.assert_called_once_with(id_producto, id_alergeno)
     mock_repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_alergenos_by_productos_usa_cache(
+    producto_alergeno_service, mock_repository, sample_producto_alergeno_data
+):
+    """
+    Prueba la consulta en lote de alérgenos y su servicio desde caché.
+
+    PRECONDICIONES:
+        - El servicio y repositorio mock deben estar configurados.
+        - La caché de alérgenos por producto debe estar vacía.
+
+    PROCESO:
+        - Consultar dos productos (uno con alérgeno, otro sin relaciones) con un duplicado.
+        - Repetir la consulta añadiendo un tercer producto.
+        - Repetirla tras avanzar la versión del menú.
+
+    POSTCONDICIONES:
+        - La respuesta respeta el orden solicitado y omite duplicados.
+        - La segunda consulta solo pide al repositorio el producto nuevo.
+        - Con otra versión del menú (escrita por cualquier worker) no se usa la caché.
+    """
+    # Arrange
+    alergenos_por_producto_cache.clear()
+    version = producto_alergeno_service.menu_cambio_repository.get_version_actual
+    version.return_value = 1
+    id_producto = sample_producto_alergeno_data["id_producto"]
+    sin_alergenos, nuevo = str(ULID()), str(ULID())
+    alergeno = AlergenoModel(
+        id=sample_producto_alergeno_data["id_alergeno"],
+        nombre="Gluten",
+        nivel_riesgo=NivelRiesgo.ALTO,
+    )
+    relacion = ProductoAlergenoModel(**sample_producto_alergeno_data)
+    mock_repository.get_alergenos_by_productos.return_value = [(relacion, alergeno)]
+
+    # Act
+    result = await producto_alergeno_service.get_alergenos_by_productos(
+        [sin_alergenos, id_producto, sin_alergenos]
+    )
+
+    # Assert
+    assert [item.id_producto for item in result.items] == [sin_alergenos, id_producto]
+    assert result.items[0].alergenos == []
+    assert result.items[1].alergenos[0].nombre == "Gluten"
+    assert result.items[1].alergenos[0].nivel_presencia == NivelPresencia.CONTIENE
+    mock_repository.get_alergenos_by_productos.assert_awaited_once_with(
+        [sin_alergenos, id_producto]
+    )
+
+    # Act - segunda consulta con un producto nuevo
+    mock_repository.get_alergenos_by_productos.reset_mock()
+    mock_repository.get_alergenos_by_productos.return_value = []
+    result = await producto_alergeno_service.get_alergenos_by_productos([id_producto, nuevo])
+
+    # Assert
+    assert len(result.items[0].alergenos) == 1
+    mock_repository.get_alergenos_by_productos.assert_awaited_once_with([nuevo])
+
+    # Act - una escritura confirmada avanza la versión del menú
+    mock_repository.get_alergenos_by_productos.reset_mock()
+    version.return_value = 2
+    await producto_alergeno_service.get_alergenos_by_productos([id_producto, nuevo])
+
+    # Assert
+    mock_repository.get_alergenos_by_productos.assert_awaited_once_with([id_producto, nuevo])
+    assert (2, id_producto) in alergenos_por_producto_cache
+    alergenos_por_producto_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_alergenos_by_productos_validation_error(producto_alergeno_service):
+    """
+    Prueba que la consulta en lote rechaza una lista vacía.
+
+    PRECONDICIONES:
+        - El servicio debe estar configurado.
+
+    PROCESO:
+        - Llamar a get_alergenos_by_productos sin IDs.
+
+    POSTCONDICIONES:
+        - El servicio debe lanzar ProductoAlergenoValidationError.
+    """
+    with pytest.raises(ProductoAlergenoValidationError):
+        await producto_alergeno_service.get_alergenos_by_productos([])
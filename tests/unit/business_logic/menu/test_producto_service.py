@@ -2,6 +2,7 @@
 Pruebas unitarias para el servicio de productos.
 """
 from ulid import ULID
+import asyncio
 import pytest
 from unittest.mock import AsyncMock
 from decimal import Decimal
@@ -35,6 +36,7 @@ def producto_service(mock_repository):
     """
     service = ProductoService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
@@ -299,7 +301,10 @@ async def test_get_productos_success(producto_service, mock_repository, sample_p
     assert len(result.items) == 2
     assert result.items[0].nombre == sample_producto_data["nombre"]
     assert result.items[1].nombre == "Otro Producto"
-    mock_repository.get_all.assert_called_once_with(0, 10, None)
+    mock_repository.get_all.assert_called_once_with(
+        0, 10, None, mascara_excluida=0, tolerar_trazas=True,
+        productos_excluidos=set(),
+    )
 
 
 @pytest.mark.asyncio
@@ -359,7 +364,10 @@ async def test_get_productos_with_categoria_filter(producto_service, mock_reposi
     assert result.total == 1
     assert len(result.items) == 1
     assert result.items[0].nombre == sample_producto_data["nombre"]
-    mock_repository.get_all.assert_called_once_with(0, 10, id_categoria)
+    mock_repository.get_all.assert_called_once_with(
+        0, 10, id_categoria, mascara_excluida=0, tolerar_trazas=True,
+        productos_excluidos=set(),
+    )
 
 
 @pytest.mark.asyncio
@@ -496,3 +504,104 @@ async def test_update_producto_no_changes(producto_service, mock_repository, sam
     assert result.nombre == sample_producto_data["nombre"]
     mock_repository.get_by_id.assert_called_once_with(producto_id)
     mock_repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_productos_cards_concurrentes_consultan_una_vez():
+    """
+    Prueba que peticiones concurrentes idénticas de cards comparten una sola consulta.
+
+    PRECONDICIONES:
+        - Dos instancias del servicio (una por petición) con un repositorio lento.
+
+    PROCESO:
+        - Pedir las mismas cards desde ambas a la vez.
+
+    POSTCONDICIONES:
+        - El repositorio se consulta una vez y ambas reciben la misma lista.
+    """
+    repository = AsyncMock()
+
+    async def get_all_lento(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return [], 0
+
+    repository.get_all.side_effect = get_all_lento
+    servicios = [ProductoService(AsyncMock()) for _ in range(2)]
+    for servicio in servicios:
+        servicio.repository = repository
+        servicio.menu_cambio_repository = AsyncMock()
+
+    resultados = await asyncio.gather(
+        *(servicio.get_productos_cards_by_categoria("cat-1") for servicio in servicios)
+    )
+
+    assert resultados[0] is resultados[1]
+    repository.get_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_update_productos_solo_registra_cambios(
+    producto_service, mock_repository, sample_producto_data
+):
+    """
+    Prueba que una sincronización sin cambios no ensucia el registro de cambios del menú.
+
+    PRECONDICIONES:
+        - Dos productos guardados.
+
+    PROCESO:
+        - Actualizar en lote uno con su mismo precio y otro con un precio nuevo.
+
+    POSTCONDICIONES:
+        - Solo el producto con precio nuevo se escribe y se registra.
+        - La respuesta incluye ambos productos en el orden pedido.
+    """
+    # Arrange
+    igual = ProductoModel(**sample_producto_data)
+    distinto = ProductoModel(**{**sample_producto_data, "id": str(ULID()), "nombre": "Otro"})
+    actualizado = ProductoModel(
+        **{**sample_producto_data, "id": distinto.id, "nombre": "Otro", "precio_base": Decimal("20.00")}
+    )
+    mock_repository.get_by_ids.return_value = [distinto, igual]
+    mock_repository.batch_update.return_value = [actualizado]
+
+    # Act
+    result = await producto_service.batch_update_productos([
+        (igual.id, ProductoUpdate(precio_base=Decimal("15.99"))),
+        (distinto.id, ProductoUpdate(precio_base=Decimal("20.00"))),
+    ])
+
+    # Assert
+    assert [p.id for p in result] == [igual.id, distinto.id]
+    assert result[1].precio_base == Decimal("20.00")
+    mock_repository.batch_update.assert_awaited_once_with(
+        [(distinto.id, {"precio_base": Decimal("20.00")})]
+    )
+    producto_service.menu_cambio_repository.registrar.assert_awaited_once()
+    assert producto_service.menu_cambio_repository.registrar.await_args.args[1] == [distinto.id]
+
+
+@pytest.mark.asyncio
+async def test_batch_update_productos_not_found(producto_service, mock_repository):
+    """
+    Prueba que el lote falla antes de escribir si falta algún producto.
+
+    PRECONDICIONES:
+        - Ninguno de los productos existe.
+
+    PROCESO:
+        - Actualizar en lote un producto inexistente.
+
+    POSTCONDICIONES:
+        - Se lanza ProductoNotFoundError y no se escribe nada.
+    """
+    # Arrange
+    mock_repository.get_by_ids.return_value = []
+
+    # Act & Assert
+    with pytest.raises(ProductoNotFoundError):
+        await producto_service.batch_update_productos(
+            [(str(ULID()), ProductoUpdate(precio_base=Decimal("1.00")))]
+        )
+    mock_repository.batch_update.assert_not_called()
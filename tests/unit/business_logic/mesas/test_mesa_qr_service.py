@@ -0,0 +1,281 @@
+"""
+Pruebas unitarias para el servicio de códigos QR de mesas.
+"""
+
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import AsyncMock
+from ulid import ULID
+
+from src.business_logic.mesas import mesa_qr_service
+from src.business_logic.mesas.mesa_qr_service import MesaQRService
+from src.business_logic.exceptions.mesa_exceptions import (
+    MesaNotFoundError,
+    MesaQRNoDisponibleError,
+)
+from src.models.mesas.mesa_model import MesaModel
+
+
+class FakeQR:
+    """QR falso que escribe la URL codificada."""
+
+    def __init__(self, contenido: str, generados: list):
+        self.contenido = contenido
+        self.generados = generados
+
+    def save(self, destino, kind, scale, border):
+        self.generados.append((self.contenido, kind))
+        destino.write(f"{kind}:{self.contenido}".encode())
+
+
+class FakeSegno:
+    """Sustituto de segno que registra cada generación."""
+
+    def __init__(self):
+        self.generados = []
+
+    def make(self, contenido, error):
+        return FakeQR(contenido, self.generados)
+
+
+@pytest.fixture
+def fake_segno(monkeypatch):
+    """
+    Fixture que reemplaza segno por un generador falso.
+    """
+    fake = FakeSegno()
+    monkeypatch.setattr(mesa_qr_service, "segno", fake)
+    return fake
+
+
+@pytest.fixture
+def qr_service(tmp_path):
+    """
+    Fixture que proporciona el servicio con repositorio mockeado y caché en un directorio temporal.
+    """
+    service = MesaQRService(AsyncMock(), directorio=tmp_path / "qr")
+    service.repository = AsyncMock()
+    service.base_url = "https://resto.test/mesa"
+    return service
+
+
+def _crear_mesa(numero: str) -> MesaModel:
+    return MesaModel(id=str(ULID()), numero=numero, zona="Terraza", activo=True)
+
+
+@pytest.mark.asyncio
+async def test_get_qr_mesa_genera_una_sola_vez(qr_service, fake_segno):
+    """
+    Prueba que el QR se genera la primera vez y después se sirve desde disco.
+
+    PRECONDICIONES:
+        - La mesa existe y la caché está vacía.
+
+    PROCESO:
+        - Pedir el QR dos veces.
+
+    POSTCONDICIONES:
+        - Solo se genera una vez, con la URL pública de la mesa.
+        - Ambas llamadas devuelven el mismo archivo y ETag.
+    """
+    mesa = _crear_mesa("M1")
+    qr_service.repository.get_by_id.return_value = mesa
+
+    primero = await qr_service.get_qr_mesa(mesa.id, "svg")
+    segundo = await qr_service.get_qr_mesa(mesa.id, "svg")
+
+    assert fake_segno.generados == [(f"https://resto.test/mesa/{mesa.id}", "svg")]
+    assert primero == segundo
+    assert primero.media_type == "image/svg+xml"
+    assert primero.ruta.read_bytes() == f"svg:https://resto.test/mesa/{mesa.id}".encode()
+
+
+@pytest.mark.asyncio
+async def test_get_qr_mesa_regenera_si_cambia_la_url(qr_service, fake_segno):
+    """
+    Prueba que cambiar la URL base produce un archivo nuevo.
+
+    PRECONDICIONES:
+        - El QR de la mesa ya está en caché.
+
+    PROCESO:
+        - Cambiar la URL base y pedir el QR de nuevo.
+
+    POSTCONDICIONES:
+        - Se genera otro QR con distinto ETag.
+    """
+    mesa = _crear_mesa("M1")
+    qr_service.repository.get_by_id.return_value = mesa
+
+    anterior = await qr_service.get_qr_mesa(mesa.id)
+    qr_service.base_url = "https://otro.test/mesa"
+    nuevo = await qr_service.get_qr_mesa(mesa.id)
+
+    assert len(fake_segno.generados) == 2
+    assert anterior.etag != nuevo.etag
+
+
+@pytest.mark.asyncio
+async def test_get_qr_mesa_no_encontrada(qr_service, fake_segno):
+    """
+    Prueba el QR de una mesa inexistente.
+
+    PRECONDICIONES:
+        - El repositorio no encuentra la mesa.
+
+    PROCESO:
+        - Pedir el QR.
+
+    POSTCONDICIONES:
+        - Se lanza MesaNotFoundError sin generar nada.
+    """
+    qr_service.repository.get_by_id.return_value = None
+
+    with pytest.raises(MesaNotFoundError):
+        await qr_service.get_qr_mesa("inexistente")
+    assert fake_segno.generados == []
+
+
+@pytest.mark.asyncio
+async def test_get_qr_mesa_sin_segno(qr_service, monkeypatch):
+    """
+    Prueba que sin segno instalado se informa en lugar de fallar de forma genérica.
+
+    PRECONDICIONES:
+        - segno no está disponible y la caché está vacía.
+
+    PROCESO:
+        - Pedir el QR de una mesa.
+
+    POSTCONDICIONES:
+        - Se lanza MesaQRNoDisponibleError.
+    """
+    monkeypatch.setattr(mesa_qr_service, "segno", None)
+    mesa = _crear_mesa("M1")
+    qr_service.repository.get_by_id.return_value = mesa
+
+    with pytest.raises(MesaQRNoDisponibleError):
+        await qr_service.get_qr_mesa(mesa.id)
+
+
+@pytest.mark.asyncio
+async def test_get_qr_zona_empaqueta_por_numero(qr_service, fake_segno):
+    """
+    Prueba el ZIP con los QR de una zona.
+
+    PRECONDICIONES:
+        - La zona tiene dos mesas activas.
+
+    PROCESO:
+        - Pedir el ZIP dos veces.
+
+    POSTCONDICIONES:
+        - El ZIP contiene un archivo por número de mesa y se reutiliza en la segunda llamada.
+    """
+    qr_service.repository.get_activas_por_zona.return_value = [_crear_mesa("T1"), _crear_mesa("T2")]
+
+    primero = await qr_service.get_qr_zona("Terraza")
+    segundo = await qr_service.get_qr_zona("Terraza")
+
+    assert primero == segundo
+    assert primero.media_type == "application/zip"
+    assert len(fake_segno.generados) == 2
+    with zipfile.ZipFile(primero.ruta) as archivo:
+        assert archivo.namelist() == ["T1.png", "T2.png"]
+
+
+@pytest.mark.asyncio
+async def test_get_qr_zona_poda_zips_reemplazados(qr_service, fake_segno, monkeypatch):
+    """
+    Prueba que al regenerar el ZIP de una zona se borra el anterior.
+
+    PRECONDICIONES:
+        - Dos zonas con mesas activas y sin periodo de gracia.
+
+    PROCESO:
+        - Generar el ZIP de cada zona y, tras añadir una mesa a la terraza,
+          volver a generar el de la terraza.
+
+    POSTCONDICIONES:
+        - Solo queda el ZIP nuevo de la terraza; el de la otra zona se conserva.
+    """
+    monkeypatch.setattr(mesa_qr_service, "GRACIA_ZIP_OBSOLETO", -1)
+    terraza = [_crear_mesa("T1")]
+    qr_service.repository.get_activas_por_zona.return_value = terraza
+    anterior = await qr_service.get_qr_zona("Terraza")
+    qr_service.repository.get_activas_por_zona.return_value = [_crear_mesa("S1")]
+    salon = await qr_service.get_qr_zona("Salón")
+
+    qr_service.repository.get_activas_por_zona.return_value = terraza + [_crear_mesa("T2")]
+    nuevo = await qr_service.get_qr_zona("Terraza")
+
+    assert nuevo.ruta != anterior.ruta
+    assert sorted(qr_service.directorio.glob("*.zip")) == sorted([nuevo.ruta, salon.ruta])
+
+
+def test_escribir_atomico_concurrente(tmp_path):
+    """
+    Prueba escrituras simultáneas del mismo archivo desde varios hilos.
+
+    PRECONDICIONES:
+        - Un directorio vacío.
+
+    PROCESO:
+        - Escribir el mismo archivo desde ocho hilos a la vez.
+
+    POSTCONDICIONES:
+        - El archivo queda completo con uno de los contenidos y no quedan temporales.
+    """
+    ruta = tmp_path / "qr.png"
+    contenidos = [bytes([i]) * 100_000 for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda contenido: mesa_qr_service._escribir_atomico(ruta, contenido), contenidos))
+
+    assert ruta.read_bytes() in contenidos
+    assert [p.name for p in tmp_path.iterdir()] == ["qr.png"]
+
+
+@pytest.mark.asyncio
+async def test_get_qr_zona_vacia(qr_service, fake_segno):
+    """
+    Prueba el ZIP de una zona sin mesas.
+
+    PRECONDICIONES:
+        - La zona no tiene mesas activas.
+
+    PROCESO:
+        - Pedir el ZIP.
+
+    POSTCONDICIONES:
+        - Se lanza MesaNotFoundError.
+    """
+    qr_service.repository.get_activas_por_zona.return_value = []
+
+    with pytest.raises(MesaNotFoundError):
+        await qr_service.get_qr_zona("Vacía")
+
+
+@pytest.mark.asyncio
+async def test_get_qr_mesa_con_segno_real(qr_service):
+    """
+    Prueba la generación con el paquete segno instalado, sin sustitutos.
+
+    PRECONDICIONES:
+        - La mesa existe y la caché está vacía.
+
+    PROCESO:
+        - Pedir el QR en PNG y en SVG.
+
+    POSTCONDICIONES:
+        - Se escriben una imagen PNG y un documento SVG válidos.
+    """
+    mesa = _crear_mesa("M1")
+    qr_service.repository.get_by_id.return_value = mesa
+
+    png = await qr_service.get_qr_mesa(mesa.id, "png")
+    svg = await qr_service.get_qr_mesa(mesa.id, "svg")
+
+    assert png.ruta.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+    assert b"<svg" in svg.ruta.read_bytes()
@@ -0,0 +1,513 @@
+"""
+Pruebas unitarias para el servicio de mesas.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from ulid import ULID
+
+from src.business_logic.mesas.mesa_service import MesaService
+from src.business_logic.exceptions.mesa_exceptions import (
+    MesaNotFoundError,
+    MesaTransicionError,
+    MesaValidationError,
+    MesaVersionConflictError,
+)
+from src.models.mesas.mesa_model import MesaModel
+from src.api.schemas.mesa_schema import MesaCreate, MesaUpdate, MesaSync, MesaSyncResultado, MesaTransicion
+from src.core.enums.mesa_enums import EstadoMesa
+from src.business_logic.notifications.websocket_hub import CANAL_MESAS
+
+
+@pytest.fixture
+def mock_repository():
+    """
+    Fixture que proporciona un mock del repositorio de mesas.
+    """
+    return AsyncMock()
+
+
+@pytest.fixture
+def mesa_service(mock_repository):
+    """
+    Fixture que proporciona una instancia del servicio con repositorio y bus de eventos mockeados.
+    """
+    service = MesaService(AsyncMock())
+    service.repository = mock_repository
+    service.event_bus = AsyncMock()
+    return service
+
+
+def _crear_mesa(numero: str = "M1", zona: str = "Terraza", estado=EstadoMesa.OCUPADA) -> MesaModel:
+    return MesaModel(
+        id=str(ULID()), numero=numero, capacidad=4, zona=zona, activo=True, estado=estado, version=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_mesa_publica_cambio(mesa_service, mock_repository):
+    """
+    Prueba que actualizar una mesa publica su nuevo estado en el bus de eventos.
+
+    PRECONDICIONES:
+        - El repositorio devuelve la mesa actualizada.
+
+    PROCESO:
+        - Actualizar la zona de la mesa.
+
+    POSTCONDICIONES:
+        - Se publica un evento actualizacion_mesa con la zona y el ID de la mesa como clave.
+    """
+    mesa = _crear_mesa(zona="Salón")
+    mock_repository.update.return_value = mesa
+
+    await mesa_service.update_mesa(mesa.id, MesaUpdate(zona="Salón"))
+
+    mesa_service.event_bus.publicar.assert_awaited_once()
+    (evento,) = mesa_service.event_bus.publicar.await_args.args
+    assert (evento.canal, evento.zona, evento.clave) == (CANAL_MESAS, "Salón", mesa.id)
+    assert evento.mensaje.evento == "actualizacion_mesa"
+    assert evento.mensaje.payload["id"] == mesa.id
+    assert evento.mensaje.payload["estado"] == "ocupada"
+
+
+@pytest.mark.asyncio
+async def test_update_mesa_estado_pasa_por_la_maquina_de_estados(mesa_service, mock_repository):
+    """
+    Prueba que el estado enviado por PATCH se cambia con la transición condicional.
+
+    PRECONDICIONES:
+        - Una mesa ocupada.
+
+    PROCESO:
+        - Actualizar su estado a libre junto con la zona.
+
+    POSTCONDICIONES:
+        - El estado se cambia con cambiar_estado y el resto de campos con update,
+          sin incluir el estado.
+    """
+    actual = _crear_mesa(estado=EstadoMesa.OCUPADA)
+    mock_repository.get_by_id.return_value = actual
+    mock_repository.cambiar_estado.return_value = _crear_mesa(estado=EstadoMesa.LIBRE)
+    mock_repository.update.return_value = _crear_mesa(zona="Salón", estado=EstadoMesa.LIBRE)
+
+    respuesta = await mesa_service.update_mesa(
+        actual.id, MesaUpdate(estado=EstadoMesa.LIBRE, zona="Salón")
+    )
+
+    assert mock_repository.cambiar_estado.await_args.args[:2] == (actual.id, EstadoMesa.LIBRE)
+    mock_repository.update.assert_awaited_once_with(actual.id, zona="Salón")
+    assert (respuesta.estado, respuesta.zona) == (EstadoMesa.LIBRE, "Salón")
+
+
+@pytest.mark.asyncio
+async def test_update_mesa_transicion_invalida_no_escribe(mesa_service, mock_repository):
+    """
+    Prueba que PATCH rechaza un estado no permitido desde el estado actual.
+
+    PRECONDICIONES:
+        - Una mesa ocupada; la transición condicional no se aplica.
+
+    PROCESO:
+        - Actualizar su estado a reservada junto con la zona.
+
+    POSTCONDICIONES:
+        - Se lanza MesaTransicionError y no se actualiza ni publica nada.
+    """
+    actual = _crear_mesa(estado=EstadoMesa.OCUPADA)
+    mock_repository.get_by_id.return_value = actual
+    mock_repository.cambiar_estado.return_value = None
+
+    with pytest.raises(MesaTransicionError):
+        await mesa_service.update_mesa(
+            actual.id, MesaUpdate(estado=EstadoMesa.RESERVADA, zona="Salón")
+        )
+
+    mock_repository.update.assert_not_called()
+    mesa_service.event_bus.publicar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_mesa_no_encontrada_no_publica(mesa_service, mock_repository):
+    """
+    Prueba que no se publica nada si la mesa no existe.
+
+    PRECONDICIONES:
+        - El repositorio no encuentra la mesa.
+
+    PROCESO:
+        - Actualizar el estado y la zona de una mesa inexistente.
+
+    POSTCONDICIONES:
+        - Se lanza MesaNotFoundError y no se publica ningún mensaje.
+    """
+    mock_repository.get_by_id.return_value = None
+    mock_repository.update.return_value = None
+
+    with pytest.raises(MesaNotFoundError):
+        await mesa_service.update_mesa(str(ULID()), MesaUpdate(estado=EstadoMesa.LIBRE))
+    with pytest.raises(MesaNotFoundError):
+        await mesa_service.update_mesa(str(ULID()), MesaUpdate(zona="Salón"))
+
+    mesa_service.event_bus.publicar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_create_mesas_publica_cada_mesa(mesa_service, mock_repository):
+    """
+    Prueba que la creación en lote publica cada mesa en su zona.
+
+    PRECONDICIONES:
+        - El repositorio devuelve dos mesas de zonas distintas.
+
+    PROCESO:
+        - Crear las mesas en lote.
+
+    POSTCONDICIONES:
+        - Se publica un evento por mesa con su zona.
+    """
+    mock_repository.batch_insert.return_value = [
+        _crear_mesa("M1", "Terraza"),
+        _crear_mesa("M2", "Salón"),
+    ]
+
+    await mesa_service.batch_create_mesas([
+        MesaCreate(numero="M1", zona="Terraza"),
+        MesaCreate(numero="M2", zona="Salón"),
+    ])
+
+    zonas = [llamada.args[0].zona for llamada in mesa_service.event_bus.publicar.await_args_list]
+    assert zonas == ["Terraza", "Salón"]
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_crea_nuevas_con_valores_por_defecto(mesa_service, mock_repository):
+    """
+    Prueba que la sincronización inserta las mesas desconocidas.
+
+    PRECONDICIONES:
+        - No hay mesas en la base de datos.
+
+    PROCESO:
+        - Sincronizar una mesa sin capacidad ni estado.
+
+    POSTCONDICIONES:
+        - Se inserta con capacidad 4 y estado disponible, y se publica su evento.
+    """
+    mock_repository.get_todas.return_value = []
+    mock_repository.aplicar_sincronizacion.return_value = [_crear_mesa("M1", estado=EstadoMesa.DISPONIBLE)]
+
+    resultado = await mesa_service.sync_mesas([MesaSync(numero="M1", zona="Terraza")])
+
+    nuevas, cambios, ids_desactivar = mock_repository.aplicar_sincronizacion.await_args.args
+    assert [(m.numero, m.capacidad, m.estado) for m in nuevas] == [("M1", 4, EstadoMesa.DISPONIBLE)]
+    assert cambios == [] and ids_desactivar == []
+    assert resultado.model_dump() == MesaSyncResultado(creadas=1).model_dump()
+    assert [mesa.numero for mesa in resultado.mesas_creadas] == ["M1"]
+    mesa_service.event_bus.publicar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_solo_actualiza_cambios(mesa_service, mock_repository):
+    """
+    Prueba que solo se escriben las mesas con algún campo distinto.
+
+    PRECONDICIONES:
+        - Existen dos mesas; solo una cambia de estado.
+
+    PROCESO:
+        - Sincronizar ambas mesas.
+
+    POSTCONDICIONES:
+        - Solo la mesa modificada se envía al repositorio y se publica.
+        - Los campos no recibidos conservan su valor actual.
+    """
+    igual = _crear_mesa("M1", estado=EstadoMesa.OCUPADA)
+    cambia = _crear_mesa("M2", estado=EstadoMesa.OCUPADA)
+    mock_repository.get_todas.return_value = [igual, cambia]
+    mock_repository.aplicar_sincronizacion.return_value = [cambia]
+
+    resultado = await mesa_service.sync_mesas([
+        MesaSync(numero="M1", zona="Terraza", estado=EstadoMesa.OCUPADA),
+        MesaSync(numero="M2", zona="Terraza", estado=EstadoMesa.LIBRE),
+    ])
+
+    _, cambios, _ = mock_repository.aplicar_sincronizacion.await_args.args
+    assert cambios == [{
+        "id": cambia.id,
+        "zona": "Terraza",
+        "nota": None,
+        "capacidad": 4,
+        "estado": EstadoMesa.LIBRE,
+        "activo": True,
+        "version": 1,
+    }]
+    assert resultado == MesaSyncResultado(actualizadas=1, sin_cambios=1)
+    mesa_service.event_bus.publicar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_sin_cambios_no_escribe_ni_publica(mesa_service, mock_repository):
+    """
+    Prueba que una sincronización repetida no genera escrituras ni eventos.
+
+    PRECONDICIONES:
+        - La mesa existente coincide con la recibida.
+
+    PROCESO:
+        - Sincronizar la misma mesa.
+
+    POSTCONDICIONES:
+        - El repositorio recibe listas vacías y no se publica nada.
+    """
+    mock_repository.get_todas.return_value = [_crear_mesa("M1")]
+    mock_repository.aplicar_sincronizacion.return_value = []
+
+    resultado = await mesa_service.sync_mesas([
+        MesaSync(numero="M1", zona="Terraza", estado=EstadoMesa.OCUPADA),
+    ])
+
+    mock_repository.aplicar_sincronizacion.assert_awaited_once_with([], [], [])
+    assert resultado == MesaSyncResultado(sin_cambios=1)
+    mesa_service.event_bus.publicar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_desactiva_ausentes_y_reactiva(mesa_service, mock_repository):
+    """
+    Prueba que se desactivan las mesas no recibidas y se reactivan las que vuelven.
+
+    PRECONDICIONES:
+        - Existe una mesa activa que no se recibe y una inactiva que sí.
+
+    PROCESO:
+        - Sincronizar solo la mesa inactiva.
+
+    POSTCONDICIONES:
+        - La mesa ausente se desactiva y se publica mesa_desactivada.
+        - La mesa recibida se reactiva.
+    """
+    ausente = _crear_mesa("M1")
+    inactiva = _crear_mesa("M2")
+    inactiva.activo = False
+    mock_repository.get_todas.return_value = [ausente, inactiva]
+    ausente_final = _crear_mesa("M1")
+    ausente_final.id, ausente_final.activo = ausente.id, False
+    mock_repository.aplicar_sincronizacion.return_value = [inactiva, ausente_final]
+
+    resultado = await mesa_service.sync_mesas([
+        MesaSync(numero="M2", zona="Terraza", estado=EstadoMesa.OCUPADA),
+    ])
+
+    _, cambios, ids_desactivar = mock_repository.aplicar_sincronizacion.await_args.args
+    assert [(c["id"], c["activo"]) for c in cambios] == [(inactiva.id, True)]
+    assert ids_desactivar == [ausente.id]
+    assert resultado == MesaSyncResultado(actualizadas=1, desactivadas=1)
+
+    eventos = {
+        llamada.args[0].clave: llamada.args[0].mensaje.evento
+        for llamada in mesa_service.event_bus.publicar.await_args_list
+    }
+    assert eventos == {inactiva.id: "actualizacion_mesa", ausente.id: "mesa_desactivada"}
+
+
+@pytest.mark.asyncio
+async def test_transicionar_mesa_aplica_y_publica(mesa_service, mock_repository):
+    """
+    Prueba un cambio de estado permitido.
+
+    PRECONDICIONES:
+        - El repositorio aplica el cambio condicional.
+
+    PROCESO:
+        - Ocupar una mesa libre indicando su versión.
+
+    POSTCONDICIONES:
+        - Se pasan al repositorio los estados de origen permitidos y la versión.
+        - Se publica el nuevo estado y no se relee la mesa.
+    """
+    mesa = _crear_mesa(estado=EstadoMesa.OCUPADA)
+    mesa.version = 2
+    mock_repository.cambiar_estado.return_value = mesa
+
+    resultado = await mesa_service.transicionar_mesa(
+        mesa.id, MesaTransicion(estado=EstadoMesa.OCUPADA, version=1)
+    )
+
+    mesa_id, estado, origenes, version = mock_repository.cambiar_estado.await_args.args
+    assert (mesa_id, estado, version) == (mesa.id, EstadoMesa.OCUPADA, 1)
+    assert EstadoMesa.LIBRE in origenes and EstadoMesa.OCUPADA not in origenes
+    assert resultado.version == 2
+    mock_repository.get_by_id.assert_not_called()
+    mesa_service.event_bus.publicar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_transicionar_mesa_version_desactualizada(mesa_service, mock_repository):
+    """
+    Prueba que una versión antigua produce un conflicto de versión.
+
+    PRECONDICIONES:
+        - El cambio condicional no se aplica y la mesa tiene versión 3.
+
+    PROCESO:
+        - Solicitar el cambio con versión 2.
+
+    POSTCONDICIONES:
+        - Se lanza MesaVersionConflictError y no se publica nada.
+    """
+    mesa = _crear_mesa(estado=EstadoMesa.LIBRE)
+    mesa.version = 3
+    mock_repository.cambiar_estado.return_value = None
+    mock_repository.get_by_id.return_value = mesa
+
+    with pytest.raises(MesaVersionConflictError):
+        await mesa_service.transicionar_mesa(
+            mesa.id, MesaTransicion(estado=EstadoMesa.OCUPADA, version=2)
+        )
+    mesa_service.event_bus.publicar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transicionar_mesa_transicion_invalida(mesa_service, mock_repository):
+    """
+    Prueba que ocupar una mesa ya ocupada no está permitido.
+
+    PRECONDICIONES:
+        - La mesa está ocupada.
+
+    PROCESO:
+        - Solicitar el paso a ocupada sin versión.
+
+    POSTCONDICIONES:
+        - Se lanza MesaTransicionError.
+    """
+    mesa = _crear_mesa(estado=EstadoMesa.OCUPADA)
+    mock_repository.cambiar_estado.return_value = None
+    mock_repository.get_by_id.return_value = mesa
+
+    with pytest.raises(MesaTransicionError):
+        await mesa_service.transicionar_mesa(mesa.id, MesaTransicion(estado=EstadoMesa.OCUPADA))
+
+
+@pytest.mark.asyncio
+async def test_transicionar_mesa_no_encontrada(mesa_service, mock_repository):
+    """
+    Prueba el cambio de estado de una mesa inexistente.
+
+    PRECONDICIONES:
+        - El repositorio no encuentra la mesa.
+
+    PROCESO:
+        - Solicitar un cambio de estado.
+
+    POSTCONDICIONES:
+        - Se lanza MesaNotFoundError.
+    """
+    mock_repository.cambiar_estado.return_value = None
+    mock_repository.get_by_id.return_value = None
+
+    with pytest.raises(MesaNotFoundError):
+        await mesa_service.transicionar_mesa("inexistente", MesaTransicion(estado=EstadoMesa.LIBRE))
+
+
+@pytest.mark.asyncio
+async def test_get_resumen_agrega_por_zona(mesa_service, mock_repository):
+    """
+    Prueba el resumen de ocupación a partir de los conteos agregados.
+
+    PRECONDICIONES:
+        - El repositorio devuelve conteos de dos zonas, una de ellas sin nombre.
+
+    PROCESO:
+        - Obtener el resumen.
+
+    POSTCONDICIONES:
+        - Libre y disponible suman asientos libres; ocupada suma asientos ocupados.
+        - Las zonas se ordenan por nombre y la zona None va al final.
+    """
+    mock_repository.get_conteo_por_zona_estado.return_value = [
+        ("Terraza", EstadoMesa.LIBRE, 2, 8),
+        ("Terraza", EstadoMesa.DISPONIBLE, 1, 2),
+        ("Terraza", EstadoMesa.OCUPADA, 3, 10),
+        (None, EstadoMesa.RESERVADA, 1, 4),
+        ("Barra", EstadoMesa.OCUPADA, 1, 2),
+    ]
+
+    resumen = await mesa_service.get_resumen()
+
+    assert [zona.zona for zona in resumen.zonas] == ["Barra", "Terraza", None]
+    terraza = resumen.zonas[1]
+    assert terraza.por_estado[EstadoMesa.OCUPADA] == 3
+    assert terraza.por_estado[EstadoMesa.RESERVADA] == 0
+    assert (terraza.total_mesas, terraza.asientos_libres, terraza.asientos_ocupados) == (6, 10, 10)
+    assert (resumen.total_mesas, resumen.asientos_libres, resumen.asientos_ocupados) == (8, 10, 12)
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_reintenta_mesa_modificada(mesa_service, mock_repository):
+    """
+    Prueba que una mesa modificada durante la sincronización se relee y se recalcula.
+
+    PRECONDICIONES:
+        - Una mesa libre con versión 1; otra petición la ocupa (versión 2)
+          antes de que se escriba la sincronización.
+
+    PROCESO:
+        - Sincronizar la mesa con otra zona.
+
+    POSTCONDICIONES:
+        - El reintento usa la versión 2 y conserva el estado ocupado.
+        - Si la mesa sigue en conflicto tras los reintentos, se cuenta en conflictos.
+    """
+    leida = _crear_mesa("M1", estado=EstadoMesa.LIBRE)
+    modificada = _crear_mesa("M1", estado=EstadoMesa.OCUPADA)
+    modificada.id, modificada.version = leida.id, 2
+    mock_repository.get_todas.return_value = [leida]
+    mock_repository.get_by_id.return_value = modificada
+    mock_repository.aplicar_sincronizacion.side_effect = [[], [modificada]]
+
+    resultado = await mesa_service.sync_mesas([MesaSync(numero="M1", zona="Salón")])
+
+    _, reintento, _ = mock_repository.aplicar_sincronizacion.await_args_list[1].args
+    assert reintento[0]["version"] == 2
+    assert reintento[0]["estado"] == EstadoMesa.OCUPADA
+    assert resultado == MesaSyncResultado(actualizadas=1)
+
+    mock_repository.aplicar_sincronizacion.side_effect = None
+    mock_repository.aplicar_sincronizacion.return_value = []
+    resultado = await mesa_service.sync_mesas([MesaSync(numero="M1", zona="Salón")])
+    assert resultado == MesaSyncResultado(conflictos=1)
+
+
+@pytest.mark.asyncio
+async def test_sync_mesas_rechaza_estado_vacio_o_truncado(mesa_service, mock_repository):
+    """
+    Prueba que un scraping vacío o truncado no desactiva las mesas.
+
+    PRECONDICIONES:
+        - Existen cuatro mesas activas.
+
+    PROCESO:
+        - Sincronizar una lista vacía y otra con una sola mesa.
+        - Repetir la lista vacía forzando la desactivación.
+
+    POSTCONDICIONES:
+        - Las dos primeras se rechazan sin escribir nada.
+        - La forzada desactiva las cuatro mesas.
+    """
+    mesas = [_crear_mesa(f"M{i}") for i in range(4)]
+    mock_repository.get_todas.return_value = mesas
+    mock_repository.aplicar_sincronizacion.return_value = []
+
+    with pytest.raises(MesaValidationError):
+        await mesa_service.sync_mesas([])
+    with pytest.raises(MesaValidationError):
+        await mesa_service.sync_mesas([MesaSync(numero="M0", zona="Terraza")])
+    mock_repository.aplicar_sincronizacion.assert_not_called()
+
+    resultado = await mesa_service.sync_mesas([], forzar_desactivacion=True)
+
+    _, _, ids_desactivar = mock_repository.aplicar_sincronizacion.await_args.args
+    assert ids_desactivar == [mesa.id for mesa in mesas]
+    assert resultado.desactivadas == 4
@@ -0,0 +1,68 @@
+"""
+Pruebas unitarias para la máquina de estados de las mesas.
+"""
+
+from src.business_logic.mesas.transiciones_mesa import (
+    TRANSICIONES_MESA,
+    es_transicion_valida,
+    estados_origen,
+)
+from src.core.enums.mesa_enums import EstadoMesa
+
+
+def test_todos_los_estados_tienen_transiciones():
+    """
+    Prueba que la máquina de estados cubre todos los valores de EstadoMesa.
+
+    PRECONDICIONES:
+        - TRANSICIONES_MESA está definido.
+
+    PROCESO:
+        - Comparar sus claves con EstadoMesa.
+
+    POSTCONDICIONES:
+        - Ningún estado queda sin salida ni transiciona a sí mismo.
+    """
+    assert set(TRANSICIONES_MESA) == set(EstadoMesa)
+    for origen, destinos in TRANSICIONES_MESA.items():
+        assert destinos
+        assert origen not in destinos
+
+
+def test_es_transicion_valida():
+    """
+    Prueba transiciones permitidas y prohibidas.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Evaluar varias transiciones.
+
+    POSTCONDICIONES:
+        - Una mesa libre se puede ocupar; una ocupada no se puede volver a ocupar ni reservar.
+    """
+    assert es_transicion_valida(EstadoMesa.LIBRE, EstadoMesa.OCUPADA)
+    assert es_transicion_valida(EstadoMesa.RESERVADA, EstadoMesa.OCUPADA)
+    assert not es_transicion_valida(EstadoMesa.OCUPADA, EstadoMesa.OCUPADA)
+    assert not es_transicion_valida(EstadoMesa.OCUPADA, EstadoMesa.RESERVADA)
+
+
+def test_estados_origen():
+    """
+    Prueba el cálculo inverso de la máquina de estados.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Obtener los orígenes permitidos para ocupar una mesa.
+
+    POSTCONDICIONES:
+        - Son los estados libres y reservada.
+    """
+    assert estados_origen(EstadoMesa.OCUPADA) == {
+        EstadoMesa.LIBRE,
+        EstadoMesa.DISPONIBLE,
+        EstadoMesa.RESERVADA,
+    }
@@ -0,0 +1,293 @@
+"""
+Pruebas unitarias para el bus de eventos.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.notifications.event_bus import (
+    ColaCoalescente,
+    EventBus,
+    Evento,
+    MemoryEventBus,
+    RedisEventBus,
+)
+from src.business_logic.notifications.websocket_hub import WebSocketHub
+
+
+def _evento(clave=None, estado="libre", canal="mesas", zona="Terraza") -> Evento:
+    return Evento(
+        canal=canal,
+        zona=zona,
+        clave=clave,
+        mensaje=WebSocketMessage(evento="actualizacion_mesa", payload={"id": clave, "estado": estado}),
+    )
+
+
+class FakePubSub:
+    """Suscripción simulada de Redis que lee de la cola compartida del servidor."""
+
+    def __init__(self, servidor: "FakeRedis"):
+        self.servidor = servidor
+        self.cola: asyncio.Queue = asyncio.Queue()
+        self.patron = None
+
+    async def psubscribe(self, patron: str):
+        self.patron = patron
+        self.servidor.suscripciones.append(self)
+
+    async def listen(self):
+        while True:
+            mensaje = await self.cola.get()
+            if isinstance(mensaje, Exception):
+                raise mensaje
+            yield mensaje
+
+    async def aclose(self):
+        self.servidor.suscripciones.remove(self)
+
+
+class FakeRedis:
+    """Servidor de Redis simulado: reparte cada publish a todas las suscripciones."""
+
+    def __init__(self):
+        self.suscripciones = []
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def publish(self, canal: str, data: str) -> int:
+        for pubsub in self.suscripciones:
+            if canal.startswith(pubsub.patron.rstrip("*")):
+                pubsub.cola.put_nowait({"type": "pmessage", "channel": canal, "data": data})
+        return len(self.suscripciones)
+
+
+@pytest.mark.asyncio
+async def test_cola_coalescente_fusiona_y_conserva_orden():
+    """
+    Prueba que la cola fusiona eventos pendientes con la misma clave.
+
+    PRECONDICIONES:
+        - Una cola vacía.
+
+    PROCESO:
+        - Encolar A, B, A actualizado y un evento sin clave.
+
+    POSTCONDICIONES:
+        - Se entregan B, A actualizado y el evento sin clave, en ese orden.
+    """
+    cola = ColaCoalescente()
+    for evento in (_evento("A"), _evento("B"), _evento("A", "ocupada"), _evento()):
+        cola.poner(evento)
+
+    entregados = [await cola.sacar() for _ in range(len(cola))]
+
+    assert [(e.clave, e.mensaje.payload["estado"]) for e in entregados] == [
+        ("B", "libre"), ("A", "ocupada"), (None, "libre"),
+    ]
+    assert cola.fusionados == 1
+
+
+@pytest.mark.asyncio
+async def test_cola_coalescente_descarta_los_mas_antiguos():
+    """
+    Prueba el límite de eventos pendientes.
+
+    PRECONDICIONES:
+        - Una cola con límite de dos eventos.
+
+    PROCESO:
+        - Encolar tres eventos distintos.
+
+    POSTCONDICIONES:
+        - Se descarta el más antiguo.
+    """
+    cola = ColaCoalescente(max_pendientes=2)
+    for clave in ("A", "B", "C"):
+        cola.poner(_evento(clave))
+
+    assert [(await cola.sacar()).clave for _ in range(2)] == ["B", "C"]
+    assert cola.descartados == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_event_bus_entrega_por_canal():
+    """
+    Prueba la entrega del bus en memoria a los suscriptores de cada canal.
+
+    PRECONDICIONES:
+        - Un bus con un manejador síncrono en "mesas" y uno asíncrono en "menu".
+
+    PROCESO:
+        - Publicar eventos en ambos canales.
+
+    POSTCONDICIONES:
+        - Cada manejador recibe solo los eventos de su canal, en orden.
+        - Un manejador que falla no impide la entrega a los demás.
+    """
+    bus = MemoryEventBus()
+    mesas, menu = [], []
+
+    async def manejador_menu(evento):
+        menu.append(evento.clave)
+
+    def manejador_roto(evento):
+        raise RuntimeError("fallo")
+
+    bus.suscribir("mesas", manejador_roto)
+    bus.suscribir("mesas", lambda evento: mesas.append(evento.clave))
+    bus.suscribir("menu", manejador_menu)
+
+    await bus.publicar(_evento("M1"))
+    await bus.publicar(_evento("P1", canal="menu"))
+    await bus.publicar(_evento("M2"))
+    await bus.esperar_entregas()
+
+    assert mesas == ["M1", "M2"]
+    assert menu == ["P1"]
+    await bus.detener()
+
+
+@pytest.mark.asyncio
+async def test_redis_event_bus_reparte_entre_workers():
+    """
+    Prueba que un evento publicado en un worker llega a los hubs de todos.
+
+    PRECONDICIONES:
+        - Dos buses Redis (dos workers) sobre el mismo servidor simulado,
+          cada uno con su hub y una conexión en la zona Terraza.
+
+    PROCESO:
+        - Publicar un evento desde el primer worker.
+
+    POSTCONDICIONES:
+        - Ambas conexiones reciben el mensaje.
+    """
+    servidor = FakeRedis()
+    workers = []
+    for _ in range(2):
+        bus = RedisEventBus(servidor)
+        hub = WebSocketHub()
+        bus.suscribir("mesas", hub.entregar)
+        conexion = hub.conectar(object(), ["Terraza"])
+        await bus.iniciar()
+        workers.append((bus, conexion))
+
+    await workers[0][0].publicar(_evento("M1", "ocupada"))
+    for bus, _ in workers:
+        await asyncio.sleep(0)
+        await bus.esperar_entregas()
+
+    for bus, conexion in workers:
+        assert conexion.cola.qsize() == 1
+        await bus.detener()
+    assert servidor.suscripciones == []
+
+
+@pytest.mark.asyncio
+async def test_redis_event_bus_caido_no_lanza():
+    """
+    Prueba que publicar con Redis caído no lanza y entrega el evento en el propio worker.
+
+    PRECONDICIONES:
+        - Un bus Redis sin iniciar cuyo cliente falla al publicar.
+
+    PROCESO:
+        - Publicar un evento.
+
+    POSTCONDICIONES:
+        - No se lanza ninguna excepción y el suscriptor local lo recibe.
+    """
+    cliente = FakeRedis()
+    cliente.publish = AsyncMock(side_effect=ConnectionError("sin conexión"))
+    bus = RedisEventBus(cliente)
+    recibidos = []
+    bus.suscribir("mesas", recibidos.append)
+
+    await bus.publicar(_evento("M1", "ocupada"))
+    await bus.esperar_entregas()
+
+    assert [evento.clave for evento in recibidos] == ["M1"]
+    await bus.detener()
+
+
+@pytest.mark.asyncio
+async def test_redis_event_bus_resincroniza_al_reconectar():
+    """
+    Prueba que el bus relee el estado cuando recupera la conexión con Redis.
+
+    PRECONDICIONES:
+        - Un bus Redis con un resincronizador registrado.
+
+    PROCESO:
+        - Iniciarlo, cortar su suscripción y esperar a que reconecte.
+
+    POSTCONDICIONES:
+        - El resincronizador no se llama al conectar la primera vez y sí
+          una vez tras la reconexión; los eventos siguen llegando.
+    """
+    servidor = FakeRedis()
+    bus = RedisEventBus(servidor, espera_reconexion=0.001)
+    resincronizaciones = []
+    recibidos = []
+    bus.al_reconectar(lambda: resincronizaciones.append(1))
+    bus.suscribir("mesas", recibidos.append)
+    await bus.iniciar()
+    assert resincronizaciones == []
+
+    # La suscripción se corta como si Redis se hubiera reiniciado
+    servidor.suscripciones[0].cola.put_nowait(ConnectionError("conexión cerrada"))
+    for _ in range(100):
+        await asyncio.sleep(0.005)
+        if resincronizaciones:
+            break
+    assert resincronizaciones == [1]
+
+    await bus.publicar(_evento("M1", "ocupada"))
+    await asyncio.sleep(0)
+    await bus.esperar_entregas()
+    assert [evento.clave for evento in recibidos] == ["M1"]
+    await bus.detener()
+
+
+def test_evento_serializacion_ida_y_vuelta():
+    """
+    Prueba que un evento se reconstruye igual tras serializarlo.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Serializar y deserializar un evento.
+
+    POSTCONDICIONES:
+        - El evento reconstruido es igual al original.
+    """
+    evento = _evento("M1", "ocupada")
+
+    assert Evento.from_json(evento.to_json()) == evento
+
+
+def test_event_bus_exige_publicar():
+    """
+    Verifica que un backend sin ``publicar`` no se puede instanciar.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Instanciar la base y un backend que no implementa ``publicar``.
+
+    POSTCONDICIONES:
+        - Ambos lanzan TypeError al crearse.
+    """
+    class BackendIncompleto(EventBus):
+        pass
+
+    with pytest.raises(TypeError):
+        EventBus()
+    with pytest.raises(TypeError):
+        BackendIncompleto()
@@ -0,0 +1,195 @@
+"""
+Pruebas unitarias para el flujo SSE de cambios del menú.
+"""
+
+import asyncio
+import json
+import pytest
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+from src.api.schemas.menu_schema import MenuDisponibilidadEvento, ProductoDisponibilidad
+from src.business_logic.notifications.menu_stream import (
+    KEEPALIVE,
+    MenuStreamBroadcaster,
+    formatear_evento,
+)
+
+
+@asynccontextmanager
+async def _sesion_falsa():
+    yield AsyncMock()
+
+
+@pytest.fixture
+def mock_menu_service():
+    """
+    Fixture que reemplaza el servicio del menú usado por el difusor.
+    """
+    with patch("src.business_logic.notifications.menu_stream.MenuService") as mock:
+        servicio = AsyncMock()
+        servicio.menu_cambio_repository.get_version_actual.return_value = 5
+        mock.return_value = servicio
+        yield servicio
+
+
+@pytest.fixture
+def broadcaster():
+    """
+    Fixture que proporciona un difusor con sesiones falsas y una ventana larga.
+    """
+    broadcaster = MenuStreamBroadcaster(fabrica_sesion=_sesion_falsa, ventana=60, max_cola=2)
+    yield broadcaster
+    if broadcaster._vigilante is not None:
+        broadcaster._vigilante.cancel()
+
+
+def _parsear(texto: str) -> dict:
+    """Convierte un evento SSE en un diccionario campo -> valor."""
+    return dict(linea.split(": ", 1) for linea in texto.strip().split("\n"))
+
+
+def test_formatear_evento():
+    """
+    Verifica el formato de un evento SSE.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Formatear un evento con y sin id.
+
+    POSTCONDICIONES:
+        - Los campos aparecen en orden y el evento termina en línea en blanco.
+    """
+    assert formatear_evento("version", "{}", id_evento=3) == "id: 3\nevent: version\ndata: {}\n\n"
+    assert formatear_evento("ping", "{}") == "event: ping\ndata: {}\n\n"
+
+
+@pytest.mark.asyncio
+async def test_conectar_sin_y_con_version(broadcaster, mock_menu_service):
+    """
+    Prueba el evento inicial al conectar.
+
+    PRECONDICIONES:
+        - El menú está en la versión 5.
+
+    PROCESO:
+        - Conectar sin versión y reanudando desde la versión 2.
+
+    POSTCONDICIONES:
+        - Sin versión se envía el evento version con id 5.
+        - Al reanudar se envían los cambios perdidos.
+    """
+    nueva = await broadcaster.conectar(None)
+    assert _parsear(nueva.cola.get_nowait()) == {
+        "id": "5", "event": "version", "data": '{"version":5}'
+    }
+
+    mock_menu_service.get_disponibilidad.return_value = MenuDisponibilidadEvento(
+        version=5, productos=[ProductoDisponibilidad(id="P1", disponible=False)]
+    )
+    reanudada = await broadcaster.conectar(2)
+
+    evento = _parsear(reanudada.cola.get_nowait())
+    assert evento["event"] == "disponibilidad"
+    assert json.loads(evento["data"])["productos"][0] == {
+        "id": "P1", "disponible": False, "precio_base": None
+    }
+    mock_menu_service.get_disponibilidad.assert_awaited_once_with(2)
+    assert broadcaster.total_conexiones == 2
+
+
+@pytest.mark.asyncio
+async def test_difundir_calcula_un_evento_por_version(broadcaster, mock_menu_service):
+    """
+    Prueba que la difusión calcula un evento por versión de partida.
+
+    PRECONDICIONES:
+        - Dos conexiones en la versión 5 y una al día en la 7.
+
+    PROCESO:
+        - El menú pasa a la versión 7 y se difunden los cambios.
+
+    POSTCONDICIONES:
+        - Se consulta una sola vez desde la versión 5.
+        - Las dos conexiones atrasadas reciben el evento y quedan en la versión 7.
+    """
+    atrasadas = [await broadcaster.conectar(None) for _ in range(2)]
+    mock_menu_service.menu_cambio_repository.get_version_actual.return_value = 7
+    al_dia = await broadcaster.conectar(None)
+    for conexion in atrasadas + [al_dia]:
+        conexion.cola.get_nowait()
+
+    mock_menu_service.get_disponibilidad.return_value = MenuDisponibilidadEvento(
+        version=7,
+        productos=[ProductoDisponibilidad(id="P1", disponible=True, precio_base=Decimal("30.00"))],
+    )
+    await broadcaster.difundir()
+
+    mock_menu_service.get_disponibilidad.assert_awaited_once_with(5)
+    for conexion in atrasadas:
+        assert conexion.version == 7
+        assert _parsear(conexion.cola.get_nowait())["id"] == "7"
+    assert al_dia.cola.empty()
+
+
+@pytest.mark.asyncio
+async def test_difundir_sin_productos_solo_avanza_version(broadcaster, mock_menu_service):
+    """
+    Prueba que los cambios sin productos afectados no generan eventos.
+
+    PRECONDICIONES:
+        - Una conexión en la versión 5.
+
+    PROCESO:
+        - El menú pasa a la versión 6 sin cambios de disponibilidad.
+
+    POSTCONDICIONES:
+        - No se encola ningún evento y la versión de la conexión avanza.
+    """
+    conexion = await broadcaster.conectar(None)
+    conexion.cola.get_nowait()
+    mock_menu_service.menu_cambio_repository.get_version_actual.return_value = 6
+    mock_menu_service.get_disponibilidad.return_value = MenuDisponibilidadEvento(version=6)
+
+    await broadcaster.difundir()
+
+    assert conexion.cola.empty()
+    assert conexion.version == 6
+
+
+@pytest.mark.asyncio
+async def test_eventos_keepalive_y_cierre_por_saturacion(mock_menu_service):
+    """
+    Prueba el generador de eventos de una conexión.
+
+    PRECONDICIONES:
+        - Un difusor con keepalive corto y colas de dos eventos.
+
+    PROCESO:
+        - Consumir el evento inicial y un keepalive.
+        - Saturar la cola de la conexión.
+
+    POSTCONDICIONES:
+        - El generador termina y la conexión se elimina del difusor.
+    """
+    broadcaster = MenuStreamBroadcaster(
+        fabrica_sesion=_sesion_falsa, ventana=60, max_cola=2, intervalo_keepalive=0.01
+    )
+    conexion = await broadcaster.conectar(None)
+    generador = broadcaster.eventos(conexion)
+
+    assert _parsear(await generador.__anext__())["event"] == "version"
+    assert await generador.__anext__() == KEEPALIVE
+
+    for _ in range(3):
+        conexion.encolar("evento")
+    assert conexion.saturada is True
+
+    restantes = [texto async for texto in generador]
+    assert restantes == []
+    assert broadcaster.total_conexiones == 0
+    await asyncio.sleep(0)
+    broadcaster._vigilante.cancel()
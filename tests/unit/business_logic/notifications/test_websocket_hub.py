@@ -0,0 +1,240 @@
+"""
+Pruebas unitarias para el hub de conexiones WebSocket.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import WebSocketDisconnect
+
+from src.api.schemas.scrapper_schemas import WebSocketMessage
+from src.business_logic.notifications.websocket_hub import (
+    CANAL_TODOS,
+    CIERRE_CLIENTE_LENTO,
+    CIERRE_SIN_HEARTBEAT,
+    WebSocketHub,
+)
+
+
+def _crear_websocket() -> MagicMock:
+    """Crea un WebSocket simulado con envío y cierre asíncronos."""
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.receive_text = AsyncMock()
+    return websocket
+
+
+def _mensaje(numero: str = "M1") -> WebSocketMessage:
+    return WebSocketMessage(evento="actualizacion_mesa", payload={"numero": numero})
+
+
+def test_publicar_por_zona():
+    """
+    Prueba que cada mensaje llega solo a la zona indicada y a los suscritos a todas.
+
+    PRECONDICIONES:
+        - Tres conexiones: Terraza, Salón y todas las zonas.
+
+    PROCESO:
+        - Publicar un mensaje en Terraza y otro sin zona.
+
+    POSTCONDICIONES:
+        - Terraza y la conexión global reciben el primero; solo la global el segundo.
+        - El mensaje se encola ya serializado.
+    """
+    hub = WebSocketHub()
+    terraza = hub.conectar(_crear_websocket(), ["Terraza"])
+    salon = hub.conectar(_crear_websocket(), ["Salón"])
+    todas = hub.conectar(_crear_websocket(), [])
+
+    assert hub.publicar("Terraza", _mensaje()) == 2
+    assert hub.publicar(None, _mensaje()) == 1
+
+    assert todas.canales == {CANAL_TODOS}
+    assert terraza.cola.qsize() == 1 and salon.cola.qsize() == 0 and todas.cola.qsize() == 2
+    assert json.loads(terraza.cola.get_nowait())["payload"] == {"numero": "M1"}
+
+
+def test_suscripcion_y_desconexion():
+    """
+    Prueba los mensajes de control de suscripción y la desconexión.
+
+    PRECONDICIONES:
+        - Una conexión suscrita a Terraza.
+
+    PROCESO:
+        - Suscribirla a Barra, desuscribirla de Terraza y desconectarla.
+
+    POSTCONDICIONES:
+        - Los canales se actualizan y tras desconectar no queda registrada.
+        - Los mensajes mal formados se ignoran.
+    """
+    hub = WebSocketHub()
+    conexion = hub.conectar(_crear_websocket(), ["Terraza"])
+
+    hub._procesar_mensaje(conexion, '{"evento": "suscribir", "payload": {"zonas": ["Barra"]}}')
+    hub._procesar_mensaje(conexion, '{"evento": "desuscribir", "payload": {"zonas": "Terraza"}}')
+    hub._procesar_mensaje(conexion, "no es json")
+    hub._procesar_mensaje(conexion, "[1, 2]")
+
+    assert conexion.canales == {"Barra"}
+    assert hub.publicar("Terraza", _mensaje()) == 0
+    assert hub.publicar("Barra", _mensaje()) == 1
+
+    hub.desconectar(conexion)
+    assert hub.total_conexiones == 0
+
+
+@pytest.mark.asyncio
+async def test_cliente_lento_se_desconecta():
+    """
+    Prueba que una cola de envío llena cierra la conexión sin afectar a otras.
+
+    PRECONDICIONES:
+        - Hub con colas de dos mensajes y dos conexiones en la misma zona.
+
+    PROCESO:
+        - Vaciar la cola de una conexión y publicar tres mensajes.
+        - Ejecutar el emisor de la conexión saturada.
+
+    POSTCONDICIONES:
+        - La conexión saturada se cierra con el código 1013.
+        - La otra conexión recibe todos los mensajes.
+    """
+    hub = WebSocketHub(max_cola=2)
+    lenta = hub.conectar(_crear_websocket(), ["Terraza"])
+    rapida = hub.conectar(_crear_websocket(), ["Terraza"])
+
+    for numero in ("M1", "M2"):
+        hub.publicar("Terraza", _mensaje(numero))
+        rapida.cola.get_nowait()
+    assert hub.publicar("Terraza", _mensaje("M3")) == 1
+
+    assert lenta.saturada is True
+    assert rapida.saturada is False
+
+    await asyncio.wait_for(lenta.emitir(intervalo_heartbeat=1), timeout=1)
+    lenta.websocket.close.assert_awaited_once_with(code=CIERRE_CLIENTE_LENTO)
+    lenta.websocket.send_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_emisor_envia_ping_sin_trafico():
+    """
+    Prueba que el emisor envía un ping cuando no hay mensajes.
+
+    PRECONDICIONES:
+        - Una conexión sin mensajes pendientes.
+
+    PROCESO:
+        - Ejecutar el emisor con un intervalo corto.
+
+    POSTCONDICIONES:
+        - Se envía al menos un ping.
+    """
+    hub = WebSocketHub()
+    conexion = hub.conectar(_crear_websocket(), [])
+
+    tarea = asyncio.create_task(conexion.emitir(intervalo_heartbeat=0.01))
+    await asyncio.sleep(0.05)
+    tarea.cancel()
+
+    enviado = conexion.websocket.send_text.await_args_list[0].args[0]
+    assert json.loads(enviado)["evento"] == "ping"
+
+
+@pytest.mark.asyncio
+async def test_atender_cierra_cliente_sin_heartbeat():
+    """
+    Prueba que un cliente que no envía nada se desconecta.
+
+    PRECONDICIONES:
+        - Un WebSocket que nunca recibe mensajes.
+
+    PROCESO:
+        - Atender la conexión con un intervalo de heartbeat corto.
+
+    POSTCONDICIONES:
+        - La conexión se cierra con el código 1001 y se elimina del hub.
+    """
+    hub = WebSocketHub(intervalo_heartbeat=0.01)
+    websocket = _crear_websocket()
+
+    async def sin_mensajes():
+        await asyncio.sleep(10)
+
+    websocket.receive_text.side_effect = sin_mensajes
+
+    await asyncio.wait_for(hub.atender(websocket, ["Terraza"]), timeout=1)
+
+    websocket.close.assert_awaited_once_with(code=CIERRE_SIN_HEARTBEAT)
+    assert hub.total_conexiones == 0
+
+
+@pytest.mark.asyncio
+async def test_atender_termina_al_desconectar_cliente():
+    """
+    Prueba que la conexión se libera cuando el cliente se desconecta.
+
+    PRECONDICIONES:
+        - Un WebSocket que envía una suscripción y luego se desconecta.
+
+    PROCESO:
+        - Atender la conexión.
+
+    POSTCONDICIONES:
+        - El hub queda sin conexiones y no se cierra desde el servidor.
+    """
+    hub = WebSocketHub()
+    websocket = _crear_websocket()
+    websocket.receive_text.side_effect = [
+        '{"evento": "suscribir", "payload": {"zonas": ["Barra"]}}',
+        WebSocketDisconnect(),
+    ]
+
+    await asyncio.wait_for(hub.atender(websocket, []), timeout=1)
+
+    assert hub.total_conexiones == 0
+    websocket.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_atender_envia_mensajes_iniciales_primero():
+    """
+    Prueba que los mensajes iniciales se envían antes que los cambios posteriores.
+
+    PRECONDICIONES:
+        - Un WebSocket que se desconecta tras recibir dos mensajes.
+
+    PROCESO:
+        - Atender la conexión con un mensaje inicial y publicar un cambio en su canal.
+
+    POSTCONDICIONES:
+        - El cliente recibe primero el estado completo y después el cambio.
+    """
+    hub = WebSocketHub()
+    websocket = _crear_websocket()
+    enviados = asyncio.Event()
+
+    async def enviar(texto):
+        if websocket.send_text.await_count >= 2:
+            enviados.set()
+
+    async def recibir():
+        await enviados.wait()
+        raise WebSocketDisconnect()
+
+    websocket.send_text.side_effect = enviar
+    websocket.receive_text.side_effect = recibir
+    inicial = WebSocketMessage(evento="cola_cocina", payload={"items": []})
+
+    tarea = asyncio.create_task(hub.atender(websocket, ["cocina"], iniciales=[inicial]))
+    await asyncio.sleep(0)
+    hub.publicar("cocina", _mensaje())
+    await asyncio.wait_for(tarea, timeout=1)
+
+    eventos = [json.loads(c.args[0])["evento"] for c in websocket.send_text.await_args_list]
+    assert eventos == ["cola_cocina", "actualizacion_mesa"]
@@ -0,0 +1,3 @@
+"""
+Pruebas unitarias para la lógica de negocio de pagos.
+"""
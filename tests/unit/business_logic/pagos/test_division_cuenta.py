@@ -0,0 +1,137 @@
+"""
+Pruebas unitarias para el cálculo de la división de cuentas.
+"""
+
+import pytest
+from decimal import Decimal
+
+from src.business_logic.pagos.division_cuenta import (
+    dividir_equitativa,
+    dividir_manual,
+    dividir_por_items,
+    orden_comensales,
+)
+
+
+def test_dividir_equitativa_reparte_centimos():
+    """
+    Prueba la división equitativa de un total no divisible.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Dividir 100.00 entre tres comensales.
+
+    POSTCONDICIONES:
+        - El primer comensal paga el céntimo sobrante y las partes suman el total.
+    """
+    division = dividir_equitativa(Decimal("100.00"), 3)
+
+    assert [parte.importe for parte in division.partes] == [
+        Decimal("33.34"), Decimal("33.33"), Decimal("33.33")
+    ]
+    assert sum(parte.importe for parte in division.partes) == Decimal("100.00")
+    assert division.pendiente == Decimal("0.00")
+
+
+def test_dividir_por_items_con_item_compartido():
+    """
+    Prueba la división por ítems con un ítem compartido y otro sin asignar.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Repartir un ítem de 10.00 entre tres comensales, uno de 5.00 para
+          un comensal y dejar otro de 2.50 sin asignar.
+
+    POSTCONDICIONES:
+        - Cada comensal se redondea una sola vez y lo asignado suma 15.00.
+        - El ítem sin asignar queda pendiente.
+        - El resultado no depende del orden de las asignaciones.
+    """
+    importes = {"a": Decimal("10.00"), "b": Decimal("5.00"), "c": Decimal("2.50")}
+
+    division = dividir_por_items(
+        Decimal("17.50"), importes, {"a": ["ana", "2", "10"], "b": ["ana"]}
+    )
+    invertida = dividir_por_items(
+        Decimal("17.50"), importes, {"b": ["ana"], "a": ["10", "ana", "2"]}
+    )
+
+    assert [(p.comensal, p.importe, p.items) for p in division.partes] == [
+        ("2", Decimal("3.34"), ("a",)),
+        ("10", Decimal("3.33"), ("a",)),
+        ("ana", Decimal("8.33"), ("a", "b")),
+    ]
+    assert division.pendiente == Decimal("2.50")
+    assert division.items_sin_asignar == ["c"]
+    assert invertida == division
+
+
+def test_dividir_manual_supera_el_total():
+    """
+    Prueba que los importes manuales no pueden superar el total.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Indicar importes que suman más que la cuenta.
+
+    POSTCONDICIONES:
+        - Se lanza ValueError.
+    """
+    with pytest.raises(ValueError):
+        dividir_manual(Decimal("20.00"), {"1": Decimal("15.00"), "2": Decimal("5.01")})
+
+
+def test_dividir_manual_con_pendiente():
+    """
+    Prueba una división manual que no cubre toda la cuenta.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Indicar importes que suman menos que la cuenta.
+
+    POSTCONDICIONES:
+        - Se devuelve lo que falta por cubrir.
+    """
+    division = dividir_manual(Decimal("20.00"), {"1": Decimal("15.00")})
+
+    assert division.pendiente == Decimal("5.00")
+
+
+def test_orden_comensales_numerico():
+    """
+    Prueba que los comensales numéricos se ordenan por su valor.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Ordenar comensales numéricos, con nombre y repetidos.
+
+    POSTCONDICIONES:
+        - Primero los numéricos por valor, después el resto, sin repetir.
+    """
+    assert orden_comensales(["10", "luis", "2", "ana", "2"]) == ["2", "10", "ana", "luis"]
+
+
+def test_orden_comensales_digitos_no_ascii():
+    """
+    Prueba que los dígitos Unicode que no son ASCII se ordenan como texto.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Ordenar comensales con superíndices y dígitos de otros alfabetos.
+
+    POSTCONDICIONES:
+        - No se lanza ningún error y solo "3" se ordena como número.
+    """
+    assert orden_comensales(["²", "3", "٣", "ana"]) == ["3", "ana", "²", "٣"]
@@ -0,0 +1,172 @@
+"""
+Pruebas unitarias para el servicio de división de cuentas.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.business_logic.pagos.division_service import DivisionCuentaService, division_cache
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoNotFoundError,
+)
+from src.api.schemas.pago_schema import AsignacionItem, DivisionCuentaRequest
+from src.core.enums.pedido_enums import EstadoPedido, TipoDivision
+
+
+def _pedido(pedido_id, version, items):
+    """Crea un pedido mockeado con sus ítems."""
+    pedido = MagicMock()
+    pedido.id = pedido_id
+    pedido.version = version
+    pedido.items = [
+        MagicMock(id=item_id, subtotal=Decimal(subtotal), estado=estado)
+        for item_id, subtotal, estado in items
+    ]
+    return pedido
+
+
+@pytest.fixture
+def division_service():
+    """
+    Fixture que proporciona el servicio con el repositorio mockeado y la caché vacía.
+    """
+    division_cache.clear()
+    service = DivisionCuentaService(AsyncMock())
+    service.pedido_repository = AsyncMock()
+    service.pedido_repository.get_versiones_por_mesa.return_value = [("p1", 3)]
+    service.pedido_repository.get_by_ids.return_value = [
+        _pedido("p1", 3, [
+            ("i1", "60.00", EstadoPedido.ENTREGADO),
+            ("i2", "40.00", EstadoPedido.PENDIENTE),
+            ("i3", "25.00", EstadoPedido.CANCELADO),
+        ])
+    ]
+    yield service
+    division_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_dividir_equitativa_usa_cache(division_service):
+    """
+    Prueba que una división repetida se sirve desde la caché.
+
+    PRECONDICIONES:
+        - La mesa tiene un pedido con un ítem cancelado.
+
+    PROCESO:
+        - Pedir dos veces la división equitativa entre tres comensales.
+
+    POSTCONDICIONES:
+        - El ítem cancelado no suma al total.
+        - Los pedidos se cargan una sola vez; la segunda vez solo se leen versiones.
+    """
+    solicitud = DivisionCuentaRequest(id_mesa="m1", tipo=TipoDivision.EQUITATIVA, comensales=3)
+
+    primera = await division_service.dividir(solicitud)
+    segunda = await division_service.dividir(solicitud)
+
+    assert primera.total == Decimal("100.00")
+    assert [parte.importe for parte in primera.partes] == [
+        Decimal("33.34"), Decimal("33.33"), Decimal("33.33")
+    ]
+    assert segunda == primera
+    division_service.pedido_repository.get_by_ids.assert_awaited_once()
+    assert division_service.pedido_repository.get_versiones_por_mesa.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_dividir_recalcula_si_cambia_la_version(division_service):
+    """
+    Prueba que un cambio en los pedidos invalida la división guardada.
+
+    PRECONDICIONES:
+        - Hay una división guardada para la versión 3 del pedido.
+
+    PROCESO:
+        - Pedir la misma división con el pedido en la versión 4.
+
+    POSTCONDICIONES:
+        - Los pedidos se vuelven a cargar.
+    """
+    solicitud = DivisionCuentaRequest(id_mesa="m1", tipo=TipoDivision.EQUITATIVA, comensales=2)
+    await division_service.dividir(solicitud)
+
+    division_service.pedido_repository.get_versiones_por_mesa.return_value = [("p1", 4)]
+    await division_service.dividir(solicitud)
+
+    assert division_service.pedido_repository.get_by_ids.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_dividir_por_items_desconocidos(division_service):
+    """
+    Prueba que no se pueden asignar ítems que no están en la cuenta.
+
+    PRECONDICIONES:
+        - El ítem i3 está cancelado.
+
+    PROCESO:
+        - Asignar el ítem cancelado a un comensal.
+
+    POSTCONDICIONES:
+        - Se lanza PagoValidationError.
+    """
+    solicitud = DivisionCuentaRequest(
+        id_mesa="m1",
+        tipo=TipoDivision.POR_ITEMS,
+        asignaciones=[AsignacionItem(id_item="i3", comensales=["1"])],
+    )
+
+    with pytest.raises(PagoValidationError):
+        await division_service.dividir(solicitud)
+
+
+@pytest.mark.asyncio
+async def test_dividir_sin_datos_del_modo(division_service):
+    """
+    Prueba que cada modo exige sus datos antes de consultar la base de datos.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Pedir una división manual sin importes.
+
+    POSTCONDICIONES:
+        - Se lanza PagoValidationError sin consultar el repositorio.
+    """
+    with pytest.raises(PagoValidationError):
+        await division_service.dividir(
+            DivisionCuentaRequest(id_mesa="m1", tipo=TipoDivision.MANUAL)
+        )
+
+    division_service.pedido_repository.get_versiones_por_mesa.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dividir_pedidos_ajenos_y_mesa_vacia(division_service):
+    """
+    Prueba los pedidos que no son de la mesa y la mesa sin pedidos.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Pedir un pedido que no está en la mesa.
+        - Pedir la división de una mesa sin pedidos.
+
+    POSTCONDICIONES:
+        - Se lanzan PagoValidationError y PagoNotFoundError respectivamente.
+    """
+    with pytest.raises(PagoValidationError):
+        await division_service.dividir(DivisionCuentaRequest(
+            id_mesa="m1", tipo=TipoDivision.EQUITATIVA, comensales=2, pedidos=["p1", "otro"]
+        ))
+
+    division_service.pedido_repository.get_versiones_por_mesa.return_value = []
+    with pytest.raises(PagoNotFoundError):
+        await division_service.dividir(
+            DivisionCuentaRequest(id_mesa="m2", tipo=TipoDivision.EQUITATIVA, comensales=2)
+        )
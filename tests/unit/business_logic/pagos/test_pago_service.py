@@ -0,0 +1,167 @@
+"""
+Pruebas unitarias para el servicio de pagos.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.business_logic.pagos.pago_service import PagoService
+from src.business_logic.pagos.idempotencia import respuestas_cache
+from src.business_logic.exceptions.pago_exceptions import (
+    PagoValidationError,
+    PagoTransicionError,
+    PagoIdempotenciaError,
+)
+from src.api.schemas.pago_schema import PagoCreate, PagoTransicion
+from src.core.enums.pago_enums import EstadoPago, MetodoPago
+from src.core.enums.pedido_enums import EstadoPedido
+
+
+@pytest.fixture
+def pago_service():
+    """
+    Fixture que proporciona el servicio con los repositorios mockeados y la caché vacía.
+    """
+    respuestas_cache.clear()
+    service = PagoService(AsyncMock())
+    service.repository = AsyncMock()
+    service.pedido_repository = AsyncMock()
+    service.mesa_repository = AsyncMock()
+    service.mesa_repository.get_by_id.return_value = MagicMock(activo=True)
+    service.idempotencia.repository = AsyncMock()
+    service.idempotencia.repository.get.return_value = None
+    yield service
+    respuestas_cache.clear()
+
+
+@pytest.fixture
+def pago_data():
+    """Fixture con los datos de un pago con Yape."""
+    return PagoCreate(id_mesa="m1", metodo=MetodoPago.YAPE, monto=Decimal("25.50"))
+
+
+@pytest.mark.asyncio
+async def test_registrar_pago_reintento_no_repite(pago_service, pago_data):
+    """
+    Prueba que un reintento con la misma clave devuelve el pago original.
+
+    PRECONDICIONES:
+        - La mesa existe y la clave es nueva.
+
+    PROCESO:
+        - Registrar el pago dos veces con la misma clave de idempotencia.
+
+    POSTCONDICIONES:
+        - El pago se registra una sola vez, junto con la respuesta guardada.
+        - El reintento devuelve el mismo pago sin volver a validar la mesa.
+    """
+    pago, repetido = await pago_service.registrar_pago(pago_data, "clave-1")
+    reintento, repetido_2 = await pago_service.registrar_pago(pago_data, "clave-1")
+
+    assert (repetido, repetido_2) == (False, True)
+    assert reintento == pago
+    assert pago.estado == EstadoPago.PENDIENTE
+    pago_service.repository.create.assert_awaited_once()
+    registro = pago_service.repository.create.await_args.args[1]
+    assert (registro.clave, registro.codigo_estado) == ("clave-1", 201)
+    pago_service.mesa_repository.get_by_id.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_registrar_pago_clave_con_otros_datos(pago_service, pago_data):
+    """
+    Prueba que una clave no se puede reutilizar con otro cuerpo.
+
+    PRECONDICIONES:
+        - Hay un pago registrado con la clave.
+
+    PROCESO:
+        - Reintentar la clave con otro monto.
+
+    POSTCONDICIONES:
+        - Se lanza PagoIdempotenciaError.
+    """
+    await pago_service.registrar_pago(pago_data, "clave-1")
+
+    with pytest.raises(PagoIdempotenciaError):
+        await pago_service.registrar_pago(
+            pago_data.model_copy(update={"monto": Decimal("30.00")}), "clave-1"
+        )
+
+
+@pytest.mark.asyncio
+async def test_registrar_pago_supera_saldo(pago_service):
+    """
+    Prueba que el monto no puede superar el saldo pendiente del pedido.
+
+    PRECONDICIONES:
+        - El pedido suma 40.00 sin el ítem cancelado y ya tiene 20.00 pagados.
+
+    PROCESO:
+        - Registrar un pago de 25.00 para el pedido.
+
+    POSTCONDICIONES:
+        - Se lanza PagoValidationError y no se registra el pago.
+    """
+    pedido = MagicMock(id="p1", id_mesa="m1", estado=EstadoPedido.ENTREGADO)
+    pedido.items = [
+        MagicMock(subtotal=Decimal("40.00"), estado=EstadoPedido.ENTREGADO),
+        MagicMock(subtotal=Decimal("15.00"), estado=EstadoPedido.CANCELADO),
+    ]
+    pago_service.pedido_repository.get_by_id.return_value = pedido
+    pago_service.repository.get_total_por_pedido.return_value = Decimal("20.00")
+
+    with pytest.raises(PagoValidationError):
+        await pago_service.registrar_pago(PagoCreate(
+            id_mesa="m1", id_pedido="p1", metodo=MetodoPago.PLIN, monto=Decimal("25.00")
+        ))
+
+    pago_service.repository.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transicionar_pago_repetida(pago_service):
+    """
+    Prueba que repetir una confirmación ya aplicada no es un error.
+
+    PRECONDICIONES:
+        - El pago ya está completado.
+
+    PROCESO:
+        - Confirmar el pago de nuevo.
+
+    POSTCONDICIONES:
+        - Se devuelve el pago sin cambios.
+    """
+    pago_service.repository.cambiar_estado.return_value = None
+    pago_service.repository.get_by_id.return_value = MagicMock(
+        id="pg1", id_mesa="m1", id_pedido=None, comensal=None, metodo=MetodoPago.YAPE,
+        estado=EstadoPago.COMPLETADO, monto=Decimal("10.00"), referencia="op-1",
+        version=2, fecha_creacion=None,
+    )
+
+    pago = await pago_service.transicionar_pago("pg1", PagoTransicion(estado=EstadoPago.COMPLETADO))
+
+    assert pago.estado == EstadoPago.COMPLETADO
+
+
+@pytest.mark.asyncio
+async def test_transicionar_pago_no_permitida(pago_service):
+    """
+    Prueba que un pago fallido no se puede completar.
+
+    PRECONDICIONES:
+        - El pago está fallido.
+
+    PROCESO:
+        - Intentar completarlo.
+
+    POSTCONDICIONES:
+        - Se lanza PagoTransicionError.
+    """
+    pago_service.repository.cambiar_estado.return_value = None
+    pago_service.repository.get_by_id.return_value = MagicMock(estado=EstadoPago.FALLIDO)
+
+    with pytest.raises(PagoTransicionError):
+        await pago_service.transicionar_pago("pg1", PagoTransicion(estado=EstadoPago.COMPLETADO))
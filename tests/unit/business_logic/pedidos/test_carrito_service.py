@@ -0,0 +1,72 @@
+"""
+Pruebas unitarias para el servicio de cotización del carrito.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.business_logic.pedidos.carrito_service import CarritoService
+from src.business_logic.menu.catalogo_precios import (
+    CatalogoPrecios,
+    GrupoOpciones,
+    OpcionPrecio,
+    ProductoPrecio,
+)
+from src.api.schemas.carrito_schema import CarritoCotizar, CarritoLinea
+
+
+@pytest.fixture
+def carrito_service():
+    """
+    Fixture que proporciona el servicio con el catálogo mockeado.
+    """
+    service = CarritoService(AsyncMock())
+    service.menu_service = AsyncMock()
+    service.menu_service.get_catalogo_precios.return_value = CatalogoPrecios(
+        version=5,
+        productos={
+            "ceviche": ProductoPrecio(
+                id="ceviche",
+                nombre="Ceviche",
+                precio_base=Decimal("30.00"),
+                opciones={"grande": OpcionPrecio("grande", "Grande", Decimal("8.50"), "tamano")},
+                grupos={"tamano": GrupoOpciones("tamano", "Tamaño", seleccion_maxima=1)},
+            ),
+            "chicha": ProductoPrecio(id="chicha", nombre="Chicha", precio_base=Decimal("6.10")),
+        },
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_cotizar_carrito(carrito_service):
+    """
+    Prueba la cotización de un carrito con una línea no válida.
+
+    PRECONDICIONES:
+        - El catálogo tiene ceviche y chicha.
+
+    PROCESO:
+        - Cotizar dos ceviches grandes, tres chichas y un producto agotado.
+
+    POSTCONDICIONES:
+        - Las líneas válidas tienen su precio y suman al total.
+        - La línea no válida trae su error y el carrito no es válido.
+        - El catálogo se obtiene una sola vez para todo el carrito.
+    """
+    cotizacion = await carrito_service.cotizar(CarritoCotizar(lineas=[
+        CarritoLinea(id_producto="ceviche", cantidad=2, opciones=["grande"]),
+        CarritoLinea(id_producto="chicha", cantidad=3),
+        CarritoLinea(id_producto="agotado"),
+    ]))
+
+    ceviche, chicha, agotado = cotizacion.lineas
+    assert (ceviche.precio_unitario, ceviche.total) == (Decimal("38.50"), Decimal("77.00"))
+    assert ceviche.opciones[0].nombre == "Grande"
+    assert chicha.total == Decimal("18.30")
+    assert not agotado.valida and agotado.nombre_producto is None
+    assert cotizacion.total == Decimal("95.30")
+    assert cotizacion.valido is False
+    assert cotizacion.version_menu == 5
+    carrito_service.menu_service.get_catalogo_precios.assert_awaited_once()
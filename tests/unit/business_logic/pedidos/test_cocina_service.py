@@ -0,0 +1,202 @@
+"""
+Pruebas unitarias para el servicio de cocina.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.business_logic.pedidos.cocina_service import REINTENTOS_ITEM, CocinaService
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoNotFoundError,
+    PedidoTransicionError,
+)
+from src.api.schemas.pedido_schema import ItemCocinaTransicion
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+from src.models.pedidos.pedido_model import PedidoModel
+from src.models.pedidos.pedido_item_model import PedidoItemModel
+
+
+def _item(item_id: str, estado: EstadoPedido) -> PedidoItemModel:
+    return PedidoItemModel(
+        id=item_id,
+        id_pedido="P1",
+        id_producto="prod",
+        orden=0,
+        nombre_producto="Ceviche",
+        cantidad=1,
+        precio_unitario=Decimal("30.00"),
+        subtotal=Decimal("30.00"),
+        opciones=[],
+        estacion="cocina",
+        estado=estado,
+    )
+
+
+@pytest.fixture
+def cocina_service():
+    """
+    Fixture que proporciona el servicio con repositorio y bus mockeados.
+    """
+    service = CocinaService(AsyncMock())
+    service.repository = AsyncMock()
+    service.event_bus = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_transicionar_item_actualiza_pedido(cocina_service):
+    """
+    Prueba que empezar a preparar un ítem pasa el pedido a en preparación.
+
+    PRECONDICIONES:
+        - Pedido pendiente en su versión 4 con dos ítems; el cambio del primero se aplica.
+
+    PROCESO:
+        - Pasar el primer ítem a en preparación.
+
+    POSTCONDICIONES:
+        - El ítem y el pedido, que pasa a en preparación, se escriben juntos
+          sobre la versión leída.
+        - El ítem se publica en el canal de cocina.
+    """
+    actual = _item("I1", EstadoPedido.PENDIENTE)
+    pedido = PedidoModel(
+        id="P1", id_mesa="M1", estado=EstadoPedido.PENDIENTE, prioridad=PrioridadPedido.ALTA,
+        version=4, items=[actual, _item("I2", EstadoPedido.PENDIENTE)],
+    )
+    item = _item("I1", EstadoPedido.EN_PREPARACION)
+    cocina_service.repository.get_item.return_value = actual
+    cocina_service.repository.get_by_id.return_value = pedido
+    cocina_service.repository.cambiar_estado_item.return_value = item
+
+    result = await cocina_service.transicionar_item(
+        "I1", ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION)
+    )
+
+    assert result.estado == EstadoPedido.EN_PREPARACION
+    assert result.prioridad == PrioridadPedido.ALTA
+    cocina_service.repository.cambiar_estado_item.assert_awaited_once_with(
+        "I1",
+        EstadoPedido.EN_PREPARACION,
+        frozenset({EstadoPedido.PENDIENTE}),
+        "P1",
+        4,
+        EstadoPedido.EN_PREPARACION,
+    )
+    evento = cocina_service.event_bus.publicar.await_args.args[0]
+    assert (evento.canal, evento.zona, evento.clave) == ("cocina", "cocina", "I1")
+
+
+@pytest.mark.asyncio
+async def test_transicionar_item_no_permitida(cocina_service):
+    """
+    Prueba que no se puede marcar como listo un ítem que no se empezó a preparar.
+
+    PRECONDICIONES:
+        - El ítem está pendiente.
+
+    PROCESO:
+        - Pasar el ítem a listo.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoTransicionError sin escribir ni publicar nada.
+    """
+    cocina_service.repository.get_item.return_value = _item("I1", EstadoPedido.PENDIENTE)
+
+    with pytest.raises(PedidoTransicionError):
+        await cocina_service.transicionar_item("I1", ItemCocinaTransicion(estado=EstadoPedido.LISTO))
+    cocina_service.repository.cambiar_estado_item.assert_not_awaited()
+    cocina_service.event_bus.publicar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transicionar_item_no_encontrado(cocina_service):
+    """
+    Prueba el cambio de estado de un ítem inexistente.
+
+    PRECONDICIONES:
+        - El ítem no existe.
+
+    PROCESO:
+        - Pasar el ítem a en preparación.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoNotFoundError.
+    """
+    cocina_service.repository.get_item.return_value = None
+
+    with pytest.raises(PedidoNotFoundError):
+        await cocina_service.transicionar_item(
+            "X", ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION)
+        )
+
+
+@pytest.mark.asyncio
+async def test_transicionar_item_reintenta_pedido_modificado(cocina_service):
+    """
+    Prueba que el estado del pedido se recalcula si otro ítem cambió entretanto.
+
+    PRECONDICIONES:
+        - Pedido en preparación con dos ítems; el primero en preparación y el
+          segundo listo.
+        - La primera escritura no se aplica porque el pedido cambió de versión.
+
+    PROCESO:
+        - Pasar el primer ítem a listo.
+
+    POSTCONDICIONES:
+        - Se vuelve a leer el pedido y se escribe con la nueva versión.
+        - El pedido pasa a listo.
+    """
+    def pedido(version):
+        return PedidoModel(
+            id="P1", id_mesa="M1", estado=EstadoPedido.EN_PREPARACION,
+            prioridad=PrioridadPedido.NORMAL, version=version,
+            items=[_item("I1", EstadoPedido.EN_PREPARACION), _item("I2", EstadoPedido.LISTO)],
+        )
+
+    cocina_service.repository.get_item.return_value = _item("I1", EstadoPedido.EN_PREPARACION)
+    cocina_service.repository.get_by_id.side_effect = [pedido(2), pedido(3)]
+    cocina_service.repository.cambiar_estado_item.side_effect = [
+        None, _item("I1", EstadoPedido.LISTO)
+    ]
+
+    result = await cocina_service.transicionar_item(
+        "I1", ItemCocinaTransicion(estado=EstadoPedido.LISTO)
+    )
+
+    assert result.estado == EstadoPedido.LISTO
+    llamadas = cocina_service.repository.cambiar_estado_item.await_args_list
+    assert [llamada.args[4:] for llamada in llamadas] == [
+        (2, EstadoPedido.LISTO), (3, EstadoPedido.LISTO)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transicionar_item_conflicto_persistente(cocina_service):
+    """
+    Prueba que se abandona el cambio si el pedido sigue cambiando tras los reintentos.
+
+    PRECONDICIONES:
+        - Ninguna escritura se aplica.
+
+    PROCESO:
+        - Pasar un ítem pendiente a en preparación.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoTransicionError tras REINTENTOS_ITEM intentos y no se publica nada.
+    """
+    cocina_service.repository.get_item.return_value = _item("I1", EstadoPedido.PENDIENTE)
+    cocina_service.repository.get_by_id.return_value = PedidoModel(
+        id="P1", id_mesa="M1", estado=EstadoPedido.PENDIENTE, version=1,
+        items=[_item("I1", EstadoPedido.PENDIENTE)],
+    )
+    cocina_service.repository.cambiar_estado_item.return_value = None
+
+    with pytest.raises(PedidoTransicionError):
+        await cocina_service.transicionar_item(
+            "I1", ItemCocinaTransicion(estado=EstadoPedido.EN_PREPARACION)
+        )
+    assert cocina_service.repository.cambiar_estado_item.await_count == REINTENTOS_ITEM
+    cocina_service.event_bus.publicar.assert_not_called()
@@ -0,0 +1,210 @@
+"""
+Pruebas unitarias para las colas de cocina en memoria.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from src.api.schemas.pedido_schema import ItemCocina
+from src.business_logic.notifications.event_bus import Evento
+from src.business_logic.notifications.websocket_hub import WebSocketHub
+from src.business_logic.pedidos.cola_cocina import (
+    CANAL_COCINA,
+    ColaCocina,
+    ColaEstacion,
+    mensaje_item,
+)
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+
+
+def _item(
+    item_id: str,
+    id_pedido: str,
+    prioridad: PrioridadPedido = PrioridadPedido.NORMAL,
+    estado: EstadoPedido = EstadoPedido.PENDIENTE,
+    estacion: str = "cocina",
+    orden: int = 0,
+) -> ItemCocina:
+    return ItemCocina(
+        id=item_id,
+        id_pedido=id_pedido,
+        id_mesa="M1",
+        orden=orden,
+        nombre_producto=f"Producto {item_id}",
+        cantidad=1,
+        estacion=estacion,
+        estado=estado,
+        prioridad=prioridad,
+    )
+
+
+def test_cola_ordena_por_prioridad_y_antiguedad():
+    """
+    Prueba el orden de preparación de una estación.
+
+    PRECONDICIONES:
+        - Ítems de pedidos con distinta prioridad y antigüedad (IDs ULID crecientes).
+
+    PROCESO:
+        - Añadirlos en desorden.
+
+    POSTCONDICIONES:
+        - Primero los urgentes, después los de prioridad alta y luego los normales;
+          a igual prioridad, el pedido más antiguo y el orden dentro del pedido.
+    """
+    cola = ColaEstacion()
+    cola.poner(_item("n2", "P3"))
+    cola.poner(_item("u1", "P4", PrioridadPedido.URGENTE))
+    cola.poner(_item("n1b", "P1", orden=1))
+    cola.poner(_item("a1", "P2", PrioridadPedido.ALTA))
+    cola.poner(_item("n1a", "P1", orden=0))
+
+    assert [item.id for item in cola.ordenados()] == ["u1", "a1", "n1a", "n1b", "n2"]
+    assert cola.siguiente().id == "u1"
+
+
+def test_cola_cambio_estado_conserva_posicion_y_quitar():
+    """
+    Prueba los cambios de estado y la salida de ítems de la cola.
+
+    PRECONDICIONES:
+        - Cola con tres ítems.
+
+    PROCESO:
+        - Pasar el primero a en preparación, quitarlo y subir la prioridad del último.
+
+    POSTCONDICIONES:
+        - El cambio de estado no añade entradas al montículo.
+        - Tras quitarlo, el siguiente es el ítem con mayor prioridad.
+    """
+    cola = ColaEstacion()
+    for item in (_item("i1", "P1"), _item("i2", "P2"), _item("i3", "P3")):
+        cola.poner(item)
+
+    cola.poner(_item("i1", "P1", estado=EstadoPedido.EN_PREPARACION))
+    assert len(cola._monticulo) == 3
+    assert cola.ordenados()[0].estado == EstadoPedido.EN_PREPARACION
+
+    assert cola.quitar("i1") is True
+    assert cola.quitar("i1") is False
+    cola.poner(_item("i3", "P3", PrioridadPedido.URGENTE))
+
+    assert cola.siguiente().id == "i3"
+    assert [item.id for item in cola.ordenados()] == ["i3", "i2"]
+    assert "i1" not in cola and len(cola) == 2
+
+
+def test_cola_compacta_entradas_obsoletas():
+    """
+    Prueba que el montículo no crece sin límite con los ítems que salen.
+
+    PRECONDICIONES:
+        - Cola con un límite bajo de entradas obsoletas.
+
+    PROCESO:
+        - Añadir y quitar muchos ítems.
+
+    POSTCONDICIONES:
+        - El montículo se mantiene acotado y la cola sigue siendo correcta.
+    """
+    cola = ColaEstacion(max_obsoletas=4)
+    cola.poner(_item("fijo", "P0"))
+    for numero in range(100):
+        cola.poner(_item(f"i{numero}", f"P{numero + 1:03d}"))
+        cola.quitar(f"i{numero}")
+
+    assert len(cola._monticulo) <= 2 * len(cola) + 4
+    assert [item.id for item in cola.ordenados()] == ["fijo"]
+    assert cola.siguiente().id == "fijo"
+
+
+def test_entregar_aplica_y_reenvia_a_la_estacion():
+    """
+    Prueba la llegada de eventos del bus a las colas y a las pantallas.
+
+    PRECONDICIONES:
+        - Una pantalla de la estación bar y otra de cocina.
+
+    PROCESO:
+        - Entregar un ítem nuevo del bar y después el mismo ítem listo.
+
+    POSTCONDICIONES:
+        - El ítem entra en la cola del bar y sale al estar listo.
+        - Solo la pantalla del bar recibe los mensajes incrementales.
+    """
+    hub = WebSocketHub()
+    cola = ColaCocina(hub, fabrica_sesion=MagicMock())
+    bar = hub.conectar(MagicMock(), ["bar"])
+    cocina = hub.conectar(MagicMock(), ["cocina"])
+
+    nuevo = _item("i1", "P1", estacion="bar")
+    cola.entregar(Evento(canal=CANAL_COCINA, zona="bar", clave="i1", mensaje=mensaje_item(nuevo)))
+    assert [item.id for item in cola.items("bar")] == ["i1"]
+    assert cola.estaciones == ["bar"]
+
+    listo = _item("i1", "P1", estado=EstadoPedido.LISTO, estacion="bar")
+    cola.entregar(Evento(canal=CANAL_COCINA, zona="bar", clave="i1", mensaje=mensaje_item(listo)))
+    assert cola.items("bar") == []
+
+    assert bar.cola.qsize() == 2 and cocina.cola.qsize() == 0
+    bar.cola.get_nowait()
+    assert json.loads(bar.cola.get_nowait())["payload"]["estado"] == "listo"
+
+
+def test_instantanea_de_estacion():
+    """
+    Prueba el mensaje inicial que recibe una pantalla al conectarse.
+
+    PRECONDICIONES:
+        - La estación tiene dos ítems.
+
+    PROCESO:
+        - Construir la instantánea de la estación.
+
+    POSTCONDICIONES:
+        - Contiene los ítems en orden de preparación.
+    """
+    cola = ColaCocina(WebSocketHub(), fabrica_sesion=MagicMock())
+    cola.aplicar(_item("i1", "P1"))
+    cola.aplicar(_item("i2", "P2", PrioridadPedido.ALTA))
+
+    mensaje = cola.instantanea("cocina")
+
+    assert mensaje.evento == "cola_cocina"
+    assert [item["id"] for item in mensaje.payload["items"]] == ["i2", "i1"]
+    assert cola.instantanea("bar").payload["items"] == []
+
+
+async def test_resincronizar_envia_colas_completas():
+    """
+    Prueba la reconstrucción de las colas cuando el bus recupera la conexión.
+
+    PRECONDICIONES:
+        - El bar tiene un ítem que en la base de datos ya salió de cocina y
+          hay un ítem de cocina cuyo evento se perdió.
+        - Una pantalla del bar y otra de cocina.
+
+    PROCESO:
+        - Resincronizar con una restauración que lee solo el ítem de cocina.
+
+    POSTCONDICIONES:
+        - Ambas pantallas reciben su cola completa, vacía la del bar.
+    """
+    hub = WebSocketHub()
+    cola = ColaCocina(hub, fabrica_sesion=MagicMock())
+    bar = hub.conectar(MagicMock(), ["bar"])
+    cocina = hub.conectar(MagicMock(), ["cocina"])
+    cola.aplicar(_item("i1", "P1", estacion="bar"))
+
+    async def restaurar():
+        cola._estaciones = {}
+        cola.aplicar(_item("i2", "P2"))
+        return 1
+
+    cola.restaurar = restaurar
+    assert await cola.resincronizar() == 1
+
+    mensaje_bar = json.loads(bar.cola.get_nowait())
+    mensaje_cocina = json.loads(cocina.cola.get_nowait())
+    assert mensaje_bar["evento"] == "cola_cocina" and mensaje_bar["payload"]["items"] == []
+    assert [item["id"] for item in mensaje_cocina["payload"]["items"]] == ["i2"]
@@ -0,0 +1,184 @@
+"""
+Pruebas unitarias para el servicio de pedidos.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from ulid import ULID
+
+from src.business_logic.pedidos.pedido_service import PedidoService
+from src.business_logic.menu.catalogo_precios import CatalogoPrecios, OpcionPrecio, ProductoPrecio
+from src.business_logic.exceptions.pedido_exceptions import (
+    PedidoNotFoundError,
+    PedidoValidationError,
+)
+from src.api.schemas.pedido_schema import PedidoCreate, PedidoItemCreate
+from src.core.enums.pedido_enums import EstadoPedido, PrioridadPedido
+from src.models.mesas.mesa_model import MesaModel
+
+
+@pytest.fixture
+def catalogo():
+    """
+    Fixture con un catálogo de dos productos, uno con opciones.
+    """
+    return CatalogoPrecios(
+        version=7,
+        productos={
+            "ceviche": ProductoPrecio(
+                id="ceviche",
+                nombre="Ceviche",
+                precio_base=Decimal("30.00"),
+                opciones={
+                    "grande": OpcionPrecio("grande", "Grande", Decimal("8.50"), "tamano"),
+                    "picante": OpcionPrecio("picante", "Picante", Decimal("0.00"), "aji"),
+                },
+            ),
+            "chicha": ProductoPrecio(
+                id="chicha", nombre="Chicha", precio_base=Decimal("6.00"), estacion="bar"
+            ),
+        },
+    )
+
+
+@pytest.fixture
+def pedido_service(catalogo):
+    """
+    Fixture que proporciona el servicio con repositorios y menú mockeados.
+    """
+    service = PedidoService(AsyncMock())
+    service.repository = AsyncMock()
+    service.repository.create.side_effect = lambda pedido: pedido
+    service.mesa_repository = AsyncMock()
+    service.mesa_repository.get_by_id.return_value = MesaModel(
+        id=str(ULID()), numero="M1", activo=True
+    )
+    service.menu_service = AsyncMock()
+    service.menu_service.get_catalogo_precios.return_value = catalogo
+    service.event_bus = AsyncMock()
+    return service
+
+
+def _asignar_ids(pedido):
+    """Simula los IDs que asigna la base de datos al insertar."""
+    pedido.id = str(ULID())
+    for item in pedido.items:
+        item.id = str(ULID())
+    return pedido
+
+
+@pytest.mark.asyncio
+async def test_create_pedido_valora_con_catalogo(pedido_service):
+    """
+    Prueba que el pedido se valora con el catálogo y se copian las opciones.
+
+    PRECONDICIONES:
+        - La mesa existe y el catálogo tiene los productos.
+
+    PROCESO:
+        - Crear un pedido con dos ceviches grandes y picantes y una chicha.
+
+    POSTCONDICIONES:
+        - Los precios incluyen el adicional de las opciones y el total suma los subtotales.
+        - El pedido queda pendiente, con la versión del menú usada y un solo guardado.
+        - Cada ítem se publica en el canal de cocina de su estación.
+    """
+    pedido_service.repository.create.side_effect = _asignar_ids
+    mesa = pedido_service.mesa_repository.get_by_id.return_value
+
+    pedido = await pedido_service.create_pedido(PedidoCreate(
+        id_mesa=mesa.id,
+        prioridad=PrioridadPedido.ALTA,
+        items=[
+            PedidoItemCreate(id_producto="ceviche", cantidad=2, opciones=["grande", "picante"]),
+            PedidoItemCreate(id_producto="chicha"),
+        ],
+    ))
+
+    ceviche, chicha = pedido.items
+    assert (ceviche.precio_unitario, ceviche.subtotal) == (Decimal("38.50"), Decimal("77.00"))
+    assert [o.nombre for o in ceviche.opciones] == ["Grande", "Picante"]
+    assert ceviche.opciones[0].precio_adicional == Decimal("8.50")
+    assert chicha.subtotal == Decimal("6.00")
+    assert pedido.total == Decimal("83.00")
+    assert (pedido.estado, pedido.prioridad, pedido.version_menu) == (
+        EstadoPedido.PENDIENTE, PrioridadPedido.ALTA, 7
+    )
+    pedido_service.repository.create.assert_awaited_once()
+    eventos = [call.args[0] for call in pedido_service.event_bus.publicar.await_args_list]
+    assert [(e.canal, e.zona, e.clave) for e in eventos] == [
+        ("cocina", "cocina", ceviche.id),
+        ("cocina", "bar", chicha.id),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "item",
+    [
+        PedidoItemCreate(id_producto="agotado"),
+        PedidoItemCreate(id_producto="chicha", opciones=["grande"]),
+        PedidoItemCreate(id_producto="ceviche", opciones=["grande", "grande"]),
+    ],
+    ids=["producto_no_disponible", "opcion_de_otro_producto", "opcion_repetida"],
+)
+async def test_create_pedido_rechaza_items_invalidos(pedido_service, item):
+    """
+    Prueba que no se guarda un pedido con productos u opciones no válidos.
+
+    PRECONDICIONES:
+        - El catálogo no contiene el producto o la opción indicados.
+
+    PROCESO:
+        - Crear el pedido.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoValidationError sin guardar nada.
+    """
+    with pytest.raises(PedidoValidationError):
+        await pedido_service.create_pedido(PedidoCreate(id_mesa="M1", items=[item]))
+    pedido_service.repository.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_pedido_mesa_inactiva(pedido_service):
+    """
+    Prueba que no se aceptan pedidos de mesas inactivas.
+
+    PRECONDICIONES:
+        - La mesa existe pero está inactiva.
+
+    PROCESO:
+        - Crear un pedido para la mesa.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoValidationError sin consultar el catálogo.
+    """
+    pedido_service.mesa_repository.get_by_id.return_value.activo = False
+
+    with pytest.raises(PedidoValidationError):
+        await pedido_service.create_pedido(
+            PedidoCreate(id_mesa="M1", items=[PedidoItemCreate(id_producto="chicha")])
+        )
+    pedido_service.menu_service.get_catalogo_precios.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_pedido_no_encontrado(pedido_service):
+    """
+    Prueba la consulta de un pedido inexistente.
+
+    PRECONDICIONES:
+        - El repositorio no encuentra el pedido.
+
+    PROCESO:
+        - Consultar el pedido.
+
+    POSTCONDICIONES:
+        - Se lanza PedidoNotFoundError.
+    """
+    pedido_service.repository.get_by_id.return_value = None
+
+    with pytest.raises(PedidoNotFoundError):
+        await pedido_service.get_pedido_by_id("inexistente")
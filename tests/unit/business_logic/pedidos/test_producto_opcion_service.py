@@ -35,6 +35,7 @@ def producto_opcion_service(mock_repository):
     """
     service = ProductoOpcionService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
@@ -34,6 +34,7 @@ def tipo_opcion_service(mock_repository):
     """
     service = TipoOpcionService(AsyncMock())
     service.repository = mock_repository
+    service.menu_cambio_repository = AsyncMock()
     return service
 
 
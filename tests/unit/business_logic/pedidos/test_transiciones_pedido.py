@@ -0,0 +1,61 @@
+"""
+Pruebas unitarias para la máquina de estados de los ítems de pedido.
+"""
+
+import pytest
+
+from src.business_logic.pedidos.transiciones_pedido import (
+    es_transicion_valida,
+    estado_pedido,
+    estados_origen,
+)
+from src.core.enums.pedido_enums import EstadoPedido as E
+
+
+def test_transiciones_item():
+    """
+    Prueba las transiciones permitidas de un ítem.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Consultar transiciones válidas e inválidas y los estados de origen.
+
+    POSTCONDICIONES:
+        - Un ítem avanza pendiente → en_preparacion → listo y no puede saltarse pasos.
+    """
+    assert es_transicion_valida(E.PENDIENTE, E.EN_PREPARACION)
+    assert es_transicion_valida(E.EN_PREPARACION, E.LISTO)
+    assert not es_transicion_valida(E.PENDIENTE, E.LISTO)
+    assert not es_transicion_valida(E.LISTO, E.EN_PREPARACION)
+    assert estados_origen(E.LISTO) == {E.EN_PREPARACION}
+    assert estados_origen(E.CANCELADO) == {E.PENDIENTE, E.EN_PREPARACION}
+
+
+@pytest.mark.parametrize(
+    "estados, esperado",
+    [
+        ([E.PENDIENTE, E.PENDIENTE], None),
+        ([E.EN_PREPARACION, E.PENDIENTE], E.EN_PREPARACION),
+        ([E.LISTO, E.PENDIENTE], E.EN_PREPARACION),
+        ([E.LISTO, E.CANCELADO], E.LISTO),
+        ([E.ENTREGADO, E.LISTO], E.LISTO),
+        ([E.ENTREGADO, E.CANCELADO], E.ENTREGADO),
+        ([E.CANCELADO, E.CANCELADO], E.CANCELADO),
+    ],
+)
+def test_estado_pedido_desde_items(estados, esperado):
+    """
+    Prueba el estado del pedido derivado del de sus ítems.
+
+    PRECONDICIONES:
+        - Combinación de estados de ítems.
+
+    PROCESO:
+        - Derivar el estado del pedido.
+
+    POSTCONDICIONES:
+        - Los ítems cancelados no cuentan salvo que lo estén todos.
+    """
+    assert estado_pedido(estados) == esperado
@@ -0,0 +1,56 @@
+"""
+Pruebas unitarias para el filtro de Bloom.
+"""
+
+import pytest
+
+from src.core.bloom import FiltroBloom
+
+
+def test_sin_falsos_negativos_y_tasa_acotada():
+    """
+    Verifica que los elementos añadidos siempre se encuentran y los falsos positivos son escasos.
+
+    PRECONDICIONES:
+        - Un filtro para 1000 elementos con tasa de error 0.01.
+
+    PROCESO:
+        - Añadir 1000 elementos y consultar otros 10000 distintos.
+
+    POSTCONDICIONES:
+        - Todos los añadidos están en el filtro.
+        - Menos del 2% de los no añadidos dan positivo.
+    """
+    filtro = FiltroBloom(capacidad=1000, tasa_error=0.01)
+    for i in range(1000):
+        filtro.add(f"jti-{i}")
+
+    assert all(f"jti-{i}" in filtro for i in range(1000))
+    falsos_positivos = sum(f"otro-{i}" in filtro for i in range(10000))
+    assert falsos_positivos < 200
+    assert len(filtro) == 1000
+    assert not filtro.saturado
+
+    filtro.add("uno-mas")
+    assert filtro.saturado
+
+
+def test_parametros_invalidos():
+    """
+    Verifica que se rechazan capacidades y tasas de error no válidas.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Crear filtros con capacidad cero y tasas fuera de (0, 1).
+
+    POSTCONDICIONES:
+        - Se lanza ValueError.
+    """
+    with pytest.raises(ValueError):
+        FiltroBloom(capacidad=0)
+    with pytest.raises(ValueError):
+        FiltroBloom(capacidad=10, tasa_error=1)
+    with pytest.raises(ValueError):
+        FiltroBloom(capacidad=10, tasa_error=0)
@@ -0,0 +1,111 @@
+"""
+Pruebas unitarias para la caché en memoria con TTL.
+"""
+
+import pytest
+
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    """Reloj controlable para simular el paso del tiempo."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expira_entradas():
+    """
+    Verifica que las entradas dejan de servirse al superar su TTL.
+
+    PRECONDICIONES:
+        - Una caché con TTL de 10 segundos y un reloj controlable.
+
+    PROCESO:
+        - Escribir una clave y avanzar el reloj antes y después del TTL.
+
+    POSTCONDICIONES:
+        - La clave se sirve antes del TTL y desaparece después.
+        - Los contadores de aciertos y fallos se actualizan.
+    """
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_desaloja_lru():
+    """
+    Verifica que al superar maxsize se desaloja la entrada menos usada.
+
+    PRECONDICIONES:
+        - Una caché con capacidad para dos entradas.
+
+    PROCESO:
+        - Escribir "a" y "b", leer "a" y escribir "c".
+
+    POSTCONDICIONES:
+        - "b" es desalojada; "a" y "c" permanecen.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_cache_invalidate_y_clear():
+    """
+    Verifica la invalidación selectiva y el vaciado completo.
+
+    PRECONDICIONES:
+        - Una caché con varias entradas, una de ellas con valor None.
+
+    PROCESO:
+        - Invalidar una clave inexistente y otra existente, y luego vaciar.
+
+    POSTCONDICIONES:
+        - Los valores None se distinguen de claves ausentes en get_many.
+        - Invalidar claves inexistentes no falla.
+    """
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set_many({"a": 1, "b": None, "c": 3})
+
+    assert cache.get_many(["a", "b", "x"]) == {"a": 1, "b": None}
+
+    cache.invalidate("a", "x")
+    assert "a" not in cache
+    assert "c" in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_maxsize_invalido():
+    """
+    Verifica que no se permite crear una caché sin capacidad.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Crear una caché con maxsize=0.
+
+    POSTCONDICIONES:
+        - Se lanza ValueError.
+    """
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
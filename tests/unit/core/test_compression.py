@@ -0,0 +1,241 @@
+"""
+Pruebas unitarias para la compresión de respuestas.
+"""
+
+import gzip
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.compression import (
+    CompressionMiddleware,
+    comprimir,
+    elegir_codificacion,
+    etag_coincide,
+)
+
+CUERPO_GRANDE = b'{"nombre":"Ceviche clasico"}' * 100
+
+
+def _crear_app() -> FastAPI:
+    """Crea una aplicación mínima con el middleware de compresión."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/grande")
+    async def grande():
+        return Response(content=CUERPO_GRANDE, media_type="application/json",
+                        headers={"ETag": '"v1"'})
+
+    @app.get("/pequeno")
+    async def pequeno():
+        return {"ok": True}
+
+    @app.get("/precomprimido")
+    async def precomprimido():
+        return Response(content=gzip.compress(CUERPO_GRANDE), media_type="application/json",
+                        headers={"Content-Encoding": "gzip"})
+
+    @app.get("/imagen")
+    async def imagen():
+        return Response(content=b"\x89PNG" * 500, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def partes():
+            for _ in range(10):
+                yield CUERPO_GRANDE[:100]
+        return StreamingResponse(partes(), media_type="application/json")
+
+    @app.get("/eventos")
+    async def eventos():
+        async def partes():
+            yield b"data: " + CUERPO_GRANDE + b"\n\n"
+        return StreamingResponse(partes(), media_type="text/event-stream")
+
+    return app
+
+
+@pytest.fixture
+def client():
+    """Fixture que proporciona un TestClient sobre la aplicación mínima."""
+    return TestClient(_crear_app())
+
+
+@pytest.mark.parametrize(
+    "cabecera, esperado",
+    [
+        ("gzip, deflate, br", "gzip"),
+        ("br;q=1.0, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=abc", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_elegir_codificacion_solo_gzip(cabecera, esperado):
+    """
+    Verifica la negociación cuando el servidor solo dispone de gzip.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Evaluar distintas cabeceras Accept-Encoding.
+
+    POSTCONDICIONES:
+        - gzip se elige solo si aparece (o "*") con q mayor que cero.
+    """
+    assert elegir_codificacion(cabecera, disponibles=("gzip",)) == esperado
+
+
+@pytest.mark.parametrize(
+    "cabecera, esperado",
+    [
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.8", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+    ],
+)
+def test_elegir_codificacion_con_brotli(cabecera, esperado):
+    """
+    Verifica la negociación cuando el servidor dispone de brotli y gzip.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Evaluar distintas cabeceras Accept-Encoding.
+
+    POSTCONDICIONES:
+        - Gana el mayor q y, a igual q, brotli.
+    """
+    assert elegir_codificacion(cabecera, disponibles=("br", "gzip")) == esperado
+
+
+@pytest.mark.parametrize(
+    "cabecera, esperado",
+    [
+        (None, False),
+        ('"v1"', True),
+        ('W/"v1"', True),
+        ('"v0", W/"v1"', True),
+        ('"v0","v2"', False),
+        ('"v1-gzip"', False),
+        ("*", True),
+    ],
+)
+def test_etag_coincide(cabecera, esperado):
+    """
+    Verifica la comparación de If-None-Match con el ETag vigente.
+
+    PRECONDICIONES:
+        - El ETag vigente es "v1".
+
+    PROCESO:
+        - Evaluar cabeceras vacías, débiles, en lista y con comodín.
+
+    POSTCONDICIONES:
+        - Coinciden la misma etiqueta, fuerte o débil, en cualquier posición
+          de la lista, y el comodín.
+    """
+    assert etag_coincide(cabecera, '"v1"') is esperado
+
+
+def test_comprimir_gzip_y_codificacion_no_disponible():
+    """
+    Verifica la compresión de un cuerpo completo.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Comprimir con gzip y con una codificación desconocida.
+
+    POSTCONDICIONES:
+        - gzip es reversible y determinista; la codificación desconocida falla.
+    """
+    comprimido = comprimir(CUERPO_GRANDE, "gzip")
+
+    assert gzip.decompress(comprimido) == CUERPO_GRANDE
+    assert comprimir(CUERPO_GRANDE, "gzip") == comprimido
+    with pytest.raises(ValueError):
+        comprimir(CUERPO_GRANDE, "deflate")
+
+
+def test_middleware_comprime_respuestas_grandes(client):
+    """
+    Verifica que se comprimen las respuestas por encima del umbral.
+
+    PRECONDICIONES:
+        - La aplicación usa el middleware con umbral de 500 bytes.
+
+    PROCESO:
+        - Solicitar una respuesta grande aceptando gzip.
+
+    POSTCONDICIONES:
+        - La respuesta es gzip, con Vary, Content-Length ajustado y ETag débil.
+    """
+    with client.stream("GET", "/grande", headers={"Accept-Encoding": "gzip"}) as response:
+        crudo = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) == len(crudo) < len(CUERPO_GRANDE)
+    assert gzip.decompress(crudo) == CUERPO_GRANDE
+
+
+def test_middleware_respeta_umbral_y_negociacion(client):
+    """
+    Verifica los casos en que la respuesta se envía sin comprimir.
+
+    PRECONDICIONES:
+        - La aplicación usa el middleware con umbral de 500 bytes.
+
+    PROCESO:
+        - Solicitar una respuesta pequeña, una grande sin aceptar gzip,
+          una precomprimida y una imagen.
+
+    POSTCONDICIONES:
+        - Ninguna se recomprime.
+    """
+    pequeno = client.get("/pequeno", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in pequeno.headers
+    assert pequeno.json() == {"ok": True}
+
+    sin_gzip = client.get("/grande", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in sin_gzip.headers
+    assert sin_gzip.content == CUERPO_GRANDE
+
+    precomprimido = client.get("/precomprimido", headers={"Accept-Encoding": "gzip"})
+    assert precomprimido.content == CUERPO_GRANDE  # descomprimido una sola vez
+
+    imagen = client.get("/imagen", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in imagen.headers
+
+
+def test_middleware_comprime_streaming_y_excluye_sse(client):
+    """
+    Verifica el tratamiento de respuestas en streaming.
+
+    PRECONDICIONES:
+        - La aplicación usa el middleware con umbral de 500 bytes.
+
+    PROCESO:
+        - Solicitar un JSON en streaming y un flujo de eventos SSE.
+
+    POSTCONDICIONES:
+        - El JSON se comprime sin Content-Length; el SSE se envía sin comprimir.
+    """
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert stream.headers["content-encoding"] == "gzip"
+    assert "content-length" not in stream.headers
+    assert stream.content == CUERPO_GRANDE[:100] * 10
+
+    eventos = client.get("/eventos", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in eventos.headers
@@ -0,0 +1,123 @@
+"""
+Pruebas unitarias para la carga de routers bajo demanda.
+"""
+
+import json
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.lazy_routers import CargadorRouters, LazyRouterMiddleware, leer_openapi_cache
+
+
+def _modulo_controlador(monkeypatch, nombre: str, prefijo: str) -> None:
+    """Registra en sys.modules un controlador falso con un endpoint GET en su prefijo."""
+    router = APIRouter(prefix=prefijo)
+
+    @router.get("/{id}")
+    async def obtener(id: str):
+        return {"modulo": nombre, "id": id}
+
+    modulo = types.ModuleType(nombre)
+    modulo.router = router
+    monkeypatch.setitem(sys.modules, nombre, modulo)
+
+
+@pytest.fixture
+def app_perezosa(monkeypatch):
+    """Aplicación con dos controladores falsos cargados bajo demanda y root_path /api."""
+    _modulo_controlador(monkeypatch, "ctrl_productos", "/productos")
+    _modulo_controlador(monkeypatch, "ctrl_producto_opciones", "/producto-opciones")
+    app = FastAPI(root_path="/api")
+    cargador = CargadorRouters(
+        app,
+        [
+            ("ctrl_productos", "Productos", "/productos"),
+            ("ctrl_producto_opciones", "Producto Opciones", "/producto-opciones"),
+            ("ctrl_inexistente", "Inexistente", "/inexistente"),
+        ],
+        "/v1",
+    )
+    app.add_middleware(LazyRouterMiddleware, cargador=cargador)
+    return app, cargador
+
+
+def test_carga_solo_el_router_de_la_peticion(app_perezosa):
+    """
+    Verifica que cada router se registra con la primera petición a su prefijo.
+
+    PRECONDICIONES:
+        - Una aplicación con /productos y /producto-opciones pendientes de cargar.
+
+    PROCESO:
+        - Pedir /api/v1/producto-opciones/1 y después /api/v1/productos/2.
+
+    POSTCONDICIONES:
+        - La primera petición responde y solo carga su controlador
+          (/productos no captura /producto-opciones).
+        - La segunda carga el otro controlador y también responde.
+    """
+    app, cargador = app_perezosa
+    client = TestClient(app)
+
+    response = client.get("/api/v1/producto-opciones/1")
+    assert response.status_code == 200
+    assert response.json() == {"modulo": "ctrl_producto_opciones", "id": "1"}
+    assert cargador.cargados == {"ctrl_producto_opciones"}
+
+    response = client.get("/api/v1/productos/2")
+    assert response.status_code == 200
+    assert cargador.cargados == {"ctrl_producto_opciones", "ctrl_productos"}
+
+
+def test_controlador_que_falla_no_se_reintenta(app_perezosa):
+    """
+    Verifica que un controlador que no se puede importar responde 404 y no se reintenta.
+
+    PRECONDICIONES:
+        - Un controlador registrado cuyo módulo no existe.
+
+    PROCESO:
+        - Pedir dos veces una ruta de su prefijo.
+
+    POSTCONDICIONES:
+        - Ambas peticiones responden 404 y el controlador queda como procesado.
+        - Cargar todos registra los que faltan sin duplicar rutas.
+    """
+    app, cargador = app_perezosa
+    client = TestClient(app)
+
+    assert client.get("/api/v1/inexistente/1").status_code == 404
+    assert client.get("/api/v1/inexistente/1").status_code == 404
+    assert cargador.cargados == {"ctrl_inexistente"}
+
+    client.get("/api/v1/productos/1")
+    cargador.cargar_todos()
+    rutas = [r.path for r in app.routes if r.path.startswith("/v1")]
+    assert sorted(rutas) == ["/v1/producto-opciones/{id}", "/v1/productos/{id}"]
+
+
+def test_leer_openapi_cache(tmp_path):
+    """
+    Verifica que el esquema en caché solo se usa si existe y es de la misma versión.
+
+    PRECONDICIONES:
+        - Un esquema guardado con versión 1.0.0.
+
+    PROCESO:
+        - Leerlo sin ruta, con una ruta inexistente, con otra versión y con la suya.
+
+    POSTCONDICIONES:
+        - Solo la última lectura devuelve el esquema.
+    """
+    ruta = tmp_path / "openapi.json"
+    esquema = {"openapi": "3.1.0", "info": {"title": "API", "version": "1.0.0"}, "paths": {}}
+    ruta.write_text(json.dumps(esquema), encoding="utf-8")
+
+    assert leer_openapi_cache(None, "1.0.0") is None
+    assert leer_openapi_cache(str(tmp_path / "otro.json"), "1.0.0") is None
+    assert leer_openapi_cache(str(ruta), "2.0.0") is None
+    assert leer_openapi_cache(str(ruta), "1.0.0") == esquema
@@ -0,0 +1,91 @@
+"""
+Pruebas unitarias para el monitor de carga.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.load_monitor import MonitorCarga
+
+
+def test_probabilidad_descarte_crece_con_el_exceso():
+    """
+    Verifica la fracción de peticiones a descartar según las señales de carga.
+
+    PRECONDICIONES:
+        - Un monitor con umbrales de 0.1 s (bucle) y 0.5 s (pool) sin suavizado.
+
+    PROCESO:
+        - Registrar retrasos y esperas por debajo, sobre y por encima del umbral.
+
+    POSTCONDICIONES:
+        - Por debajo no se descarta nada; al 150% del umbral, la mitad; al doble o más, todo.
+    """
+    monitor = MonitorCarga(umbral_retraso=0.1, umbral_espera_pool=0.5, suavizado=1.0)
+    monitor.registrar_retraso(0.05)
+    assert monitor.probabilidad_descarte() == 0
+
+    monitor.registrar_retraso(0.15)
+    assert monitor.probabilidad_descarte() == pytest.approx(0.5)
+
+    monitor.registrar_retraso(0.0)
+    monitor.registrar_espera_pool(3.0)
+    assert monitor.probabilidad_descarte() == 1
+
+
+@pytest.mark.asyncio
+async def test_mide_retraso_del_bucle():
+    """
+    Verifica que la tarea de medición detecta un bucle de eventos bloqueado.
+
+    PRECONDICIONES:
+        - Un monitor con intervalo de 10 ms sin suavizado.
+
+    PROCESO:
+        - Iniciarlo, bloquear el bucle 100 ms y detenerlo.
+
+    POSTCONDICIONES:
+        - El retraso medido refleja el bloqueo y la tarea se detiene.
+    """
+    monitor = MonitorCarga(intervalo=0.01, suavizado=1.0)
+    await monitor.iniciar()
+    await asyncio.sleep(0)
+    time.sleep(0.1)
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if monitor.retraso_bucle > 0.05:
+            break
+    await monitor.detener()
+
+    assert monitor.retraso_bucle > 0.05
+    assert monitor._tarea is None
+
+
+def test_espera_pool_decae_sin_checkouts():
+    """
+    Verifica que la espera del pool no se queda fija cuando nadie obtiene conexiones.
+
+    PRECONDICIONES:
+        - Un monitor con la espera del pool al doble del umbral (descarte total).
+
+    PROCESO:
+        - Cerrar un intervalo con un checkout y después varios sin ninguno.
+
+    POSTCONDICIONES:
+        - Con checkouts la media no cambia al cerrar el intervalo.
+        - Sin checkouts decae hasta dejar de descartar.
+    """
+    monitor = MonitorCarga(umbral_espera_pool=0.5, suavizado=0.5)
+    monitor.registrar_espera_pool(2.0)
+    monitor.registrar_espera_pool(2.0)
+    assert monitor.probabilidad_descarte() == 1
+
+    monitor.cerrar_intervalo()
+    assert monitor.espera_pool == pytest.approx(1.5)
+
+    for _ in range(5):
+        monitor.cerrar_intervalo()
+    assert monitor.espera_pool < 0.5
+    assert monitor.probabilidad_descarte() == 0
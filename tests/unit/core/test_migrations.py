@@ -0,0 +1,241 @@
+"""
+Pruebas unitarias para las migraciones versionadas del esquema.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.migrations.runner import (
+    BloqueoMigraciones,
+    Migracion,
+    MigracionError,
+    aplicar_migraciones,
+    version_actual,
+)
+from src.core.migrations.versions import MIGRACIONES
+
+
+@pytest.fixture
+async def ruta_db(tmp_path):
+    """Ruta de una base de datos SQLite en fichero, vacía."""
+    return tmp_path / "migraciones.db"
+
+
+def _engine(ruta):
+    return create_async_engine(f"sqlite+aiosqlite:///{ruta}")
+
+
+async def _columnas(engine, tabla):
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda c: {col["name"] for col in inspect(c).get_columns(tabla)}
+        )
+
+
+async def test_base_nueva_y_camino_rapido(ruta_db, monkeypatch):
+    """
+    Verifica que una base nueva queda en la última versión y que después no se toma el bloqueo.
+
+    PRECONDICIONES:
+        - Una base de datos SQLite vacía.
+
+    PROCESO:
+        - Aplicar las migraciones dos veces; la segunda con el bloqueo inutilizado.
+
+    POSTCONDICIONES:
+        - La primera aplica todas y crea las tablas con sus columnas actuales.
+        - La segunda no aplica ninguna ni intenta tomar el bloqueo.
+    """
+    engine = _engine(ruta_db)
+    try:
+        assert await version_actual(engine) == 0
+        assert await aplicar_migraciones(engine) == len(MIGRACIONES)
+        assert await version_actual(engine) == MIGRACIONES[-1].version
+        assert "version" in await _columnas(engine, "mesas")
+
+        async def sin_bloqueo(self):
+            raise AssertionError("el camino rápido no debe tomar el bloqueo")
+
+        monkeypatch.setattr(BloqueoMigraciones, "adquirir", sin_bloqueo)
+        assert await aplicar_migraciones(engine) == 0
+    finally:
+        await engine.dispose()
+
+
+async def test_base_anterior_recibe_columnas(ruta_db):
+    """
+    Verifica que una base creada antes de un cambio recibe la columna sin perder datos.
+
+    PRECONDICIONES:
+        - Una tabla mesas sin la columna version, con una fila.
+        - Una tabla rol sin la columna permisos.
+
+    PROCESO:
+        - Aplicar las migraciones.
+
+    POSTCONDICIONES:
+        - mesas.version existe y la fila existente vale 1.
+        - rol.permisos existe.
+    """
+    engine = _engine(ruta_db)
+    try:
+        await aplicar_migraciones(engine, MIGRACIONES[:1])
+        async with engine.begin() as conn:
+            await conn.execute(text("ALTER TABLE mesas DROP COLUMN version"))
+            await conn.execute(text("ALTER TABLE rol DROP COLUMN permisos"))
+            await conn.execute(text(
+                "INSERT INTO mesas (id, numero, capacidad, estado, activo, fecha_creacion, "
+                "fecha_modificacion) VALUES ('01MESA', '1', 4, 'libre', 1, "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ))
+        assert "version" not in await _columnas(engine, "mesas")
+
+        assert await aplicar_migraciones(engine) == len(MIGRACIONES) - 1
+
+        assert "permisos" in await _columnas(engine, "rol")
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("SELECT version FROM mesas WHERE id = '01MESA'")) == 1
+    finally:
+        await engine.dispose()
+
+
+async def test_registro_de_cambios_recibe_version(ruta_db):
+    """
+    Verifica que los cambios del menú anteriores al contador conservan su versión.
+
+    PRECONDICIONES:
+        - Una tabla menu_cambio sin la columna version, con dos filas, y sin
+          la tabla menu_version.
+
+    PROCESO:
+        - Aplicar las migraciones.
+
+    POSTCONDICIONES:
+        - Cada cambio tiene como versión su identificador.
+        - El contador parte de la versión más alta.
+    """
+    engine = _engine(ruta_db)
+    try:
+        await aplicar_migraciones(engine, MIGRACIONES[:1])
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE menu_version"))
+            await conn.execute(text("DROP INDEX idx_menu_cambio_version"))
+            await conn.execute(text("ALTER TABLE menu_cambio DROP COLUMN version"))
+            await conn.execute(text(
+                "INSERT INTO menu_cambio (entidad, id_entidad, fecha_creacion) VALUES "
+                "('PRODUCTO', '01A', CURRENT_TIMESTAMP), ('CATEGORIA', '01B', CURRENT_TIMESTAMP)"
+            ))
+
+        await aplicar_migraciones(engine)
+
+        async with engine.connect() as conn:
+            versiones = await conn.execute(text("SELECT id, version FROM menu_cambio ORDER BY id"))
+            assert [tuple(fila) for fila in versiones] == [(1, 1), (2, 2)]
+            assert await conn.scalar(text("SELECT version FROM menu_version")) == 2
+    finally:
+        await engine.dispose()
+
+
+async def test_workers_concurrentes_migran_una_vez(ruta_db):
+    """
+    Verifica que, con varios workers arrancando a la vez, cada migración se aplica una sola vez.
+
+    PRECONDICIONES:
+        - Tres motores sobre el mismo fichero y una migración lenta que cuenta sus ejecuciones.
+
+    PROCESO:
+        - Aplicar las migraciones desde los tres motores a la vez.
+
+    POSTCONDICIONES:
+        - La migración se ejecutó una vez y solo un worker informa de ella.
+        - El fichero de bloqueo se eliminó al terminar.
+    """
+    ejecuciones = []
+
+    async def lenta(conn):
+        ejecuciones.append(1)
+        await asyncio.sleep(0.2)
+        await conn.execute(text("CREATE TABLE prueba (id INTEGER PRIMARY KEY)"))
+
+    migraciones = [Migracion(1, "Tabla de prueba", lenta)]
+    engines = [_engine(ruta_db) for _ in range(3)]
+    try:
+        resultados = await asyncio.gather(
+            *(aplicar_migraciones(e, migraciones, espera=5) for e in engines)
+        )
+        assert ejecuciones == [1]
+        assert sorted(resultados) == [0, 0, 1]
+        assert not os.path.exists(f"{ruta_db}.migraciones.lock")
+    finally:
+        for engine in engines:
+            await engine.dispose()
+
+
+async def test_migracion_fallida_no_avanza_la_version(ruta_db):
+    """
+    Verifica que una migración que falla no registra su versión ni deja el bloqueo tomado.
+
+    PRECONDICIONES:
+        - Dos migraciones: la primera correcta y la segunda con un error.
+
+    PROCESO:
+        - Aplicarlas.
+
+    POSTCONDICIONES:
+        - Se lanza MigracionError y la versión queda en 1.
+        - El fichero de bloqueo se eliminó.
+    """
+    async def correcta(conn):
+        await conn.execute(text("CREATE TABLE prueba (id INTEGER PRIMARY KEY)"))
+
+    async def erronea(conn):
+        await conn.execute(text("ALTER TABLE inexistente ADD COLUMN x INTEGER"))
+
+    engine = _engine(ruta_db)
+    try:
+        with pytest.raises(MigracionError):
+            await aplicar_migraciones(
+                engine, [Migracion(1, "Correcta", correcta), Migracion(2, "Errónea", erronea)]
+            )
+        assert await version_actual(engine) == 1
+        assert not os.path.exists(f"{ruta_db}.migraciones.lock")
+    finally:
+        await engine.dispose()
+
+
+async def test_bloqueo_abandonado_y_espera_agotada(ruta_db):
+    """
+    Verifica el fichero de bloqueo de SQLite cuando otro proceso no lo suelta.
+
+    PRECONDICIONES:
+        - Un fichero de bloqueo ya existente.
+
+    PROCESO:
+        - Intentar tomar el bloqueo con el fichero reciente y después con el fichero antiguo.
+
+    POSTCONDICIONES:
+        - Con el fichero reciente se agota la espera con MigracionError y el
+          fichero del otro proceso se conserva.
+        - Con el fichero antiguo se considera abandonado y se toma el bloqueo.
+    """
+    engine = _engine(ruta_db)
+    fichero = f"{ruta_db}.migraciones.lock"
+    open(fichero, "w").close()
+    try:
+        bloqueo = BloqueoMigraciones(engine, espera=0.3, intervalo=0.05, abandono=5)
+        with pytest.raises(MigracionError):
+            await bloqueo.adquirir()
+        assert os.path.exists(fichero)
+
+        antiguo = time.time() - 10
+        os.utime(fichero, (antiguo, antiguo))
+        await bloqueo.adquirir()
+        await bloqueo.liberar()
+        assert not os.path.exists(fichero)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,216 @@
+"""
+Pruebas unitarias para la limitación de peticiones y el descarte por sobrecarga.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.load_monitor import MonitorCarga
+from src.core.rate_limit import (
+    LimitadorMemoria,
+    LimitadorRedis,
+    RateLimitMiddleware,
+    ReglaLimite,
+)
+
+
+class RelojFalso:
+    """Reloj manual para controlar el paso del tiempo."""
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+def _crear_app(monitor: MonitorCarga, limitador=None) -> FastAPI:
+    """Crea una aplicación con una ruta limitada y otra libre."""
+    app = FastAPI(root_path="/api")
+
+    @app.get("/v1/productos/cards")
+    async def cards():
+        return {"ok": True}
+
+    @app.post("/v1/pedidos")
+    async def pedidos():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        reglas=[ReglaLimite("productos", "/v1/productos", capacidad=2, tasa=0.1)],
+        limitador=limitador or LimitadorMemoria(),
+        monitor=monitor,
+    )
+    return app
+
+
+@pytest.mark.asyncio
+async def test_cubeta_admite_rafaga_y_repone():
+    """
+    Verifica el comportamiento de la cubeta de tokens en memoria.
+
+    PRECONDICIONES:
+        - Una cubeta de capacidad 2 que repone 1 token por segundo.
+
+    PROCESO:
+        - Consumir tres tokens seguidos, esperar un segundo y volver a consumir.
+
+    POSTCONDICIONES:
+        - Se admiten los dos primeros; el tercero indica la espera.
+        - Tras un segundo se admite otro, y otra clave tiene su propia cubeta.
+    """
+    reloj = RelojFalso()
+    limitador = LimitadorMemoria(clock=reloj)
+
+    assert await limitador.consumir("a", 2, 1.0) == 0
+    assert await limitador.consumir("a", 2, 1.0) == 0
+    assert await limitador.consumir("a", 2, 1.0) == pytest.approx(1.0)
+    assert await limitador.consumir("b", 2, 1.0) == 0
+
+    reloj.ahora = 1.0
+    assert await limitador.consumir("a", 2, 1.0) == 0
+    assert await limitador.consumir("a", 2, 1.0) > 0
+
+
+def test_middleware_limita_por_ip():
+    """
+    Verifica que el middleware responde 429 al agotar la cubeta de un cliente.
+
+    PRECONDICIONES:
+        - Una regla de capacidad 2 para /v1/productos.
+
+    PROCESO:
+        - Pedir la carta tres veces y crear pedidos.
+
+    POSTCONDICIONES:
+        - La tercera petición recibe 429 con Retry-After.
+        - Las rutas sin regla no se limitan.
+    """
+    client = TestClient(_crear_app(MonitorCarga()))
+
+    assert client.get("/api/v1/productos/cards").status_code == 200
+    assert client.get("/api/v1/productos/cards").status_code == 200
+    limitada = client.get("/api/v1/productos/cards")
+    assert limitada.status_code == 429
+    assert limitada.headers["retry-after"] == "10"
+
+    assert all(client.post("/api/v1/pedidos").status_code == 200 for _ in range(5))
+
+
+def test_mesa_rotativa_no_amplia_el_limite():
+    """
+    Verifica que cambiar de mesa en cada petición no da una cubeta nueva.
+
+    PRECONDICIONES:
+        - Una regla de capacidad 2 y tasa 0.1 por segundo.
+
+    PROCESO:
+        - Pedir la carta 20 veces con un X-Mesa-Id y un id_mesa distintos cada vez.
+
+    POSTCONDICIONES:
+        - Solo las dos primeras peticiones responden 200.
+    """
+    client = TestClient(_crear_app(MonitorCarga()))
+
+    estados = [
+        client.get(
+            f"/api/v1/productos/cards?id_mesa=q{i}", headers={"X-Mesa-Id": f"m{i}"}
+        ).status_code
+        for i in range(20)
+    ]
+    assert estados.count(200) == 2
+    assert estados.count(429) == 18
+
+
+@pytest.mark.parametrize(
+    "proxies, cabecera, ip_esperada",
+    [
+        (1, "1.1.1.1", "1.1.1.1"),
+        (1, "6.6.6.6, 1.1.1.1", "1.1.1.1"),
+        (2, "6.6.6.6, 1.1.1.1, 10.0.0.2", "1.1.1.1"),
+        (2, "1.1.1.1", "testclient"),
+    ],
+)
+def test_ip_de_x_forwarded_for(proxies, cabecera, ip_esperada):
+    """
+    Verifica que la IP del cliente se toma contando los proxies desde la derecha.
+
+    PRECONDICIONES:
+        - El middleware confía en X-Forwarded-For con un número de proxies propios.
+
+    PROCESO:
+        - Calcular la IP de una petición con entradas falsas a la izquierda.
+
+    POSTCONDICIONES:
+        - Se usa la entrada añadida por el primer proxy propio; las de la
+          izquierda, que escribe el cliente, se ignoran.
+        - Con menos entradas que proxies se usa la dirección de la conexión.
+    """
+    middleware = RateLimitMiddleware(
+        app=None,
+        reglas=[],
+        limitador=LimitadorMemoria(),
+        monitor=MonitorCarga(),
+        confiar_forwarded=True,
+        proxies_confiables=proxies,
+    )
+    scope = {
+        "type": "http",
+        "client": ("testclient", 50000),
+        "headers": [(b"x-forwarded-for", cabecera.encode())],
+    }
+    assert middleware._ip(scope) == ip_esperada
+
+
+def test_middleware_descarta_con_sobrecarga():
+    """
+    Verifica el descarte de peticiones públicas cuando el bucle de eventos se retrasa.
+
+    PRECONDICIONES:
+        - Un monitor con el retraso del bucle al doble de su umbral.
+
+    PROCESO:
+        - Pedir la carta y crear un pedido.
+
+    POSTCONDICIONES:
+        - La carta responde 503 sin consumir la cubeta y el pedido se atiende.
+    """
+    monitor = MonitorCarga(umbral_retraso=0.1)
+    monitor.retraso_bucle = 0.2
+    limitador = MagicMock()
+    limitador.consumir = AsyncMock(return_value=0.0)
+    client = TestClient(_crear_app(monitor, limitador))
+
+    respuesta = client.get("/api/v1/productos/cards")
+    assert respuesta.status_code == 503
+    assert respuesta.headers["retry-after"] == "1"
+    limitador.consumir.assert_not_awaited()
+    assert client.post("/api/v1/pedidos").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_limitador_redis():
+    """
+    Verifica el limitador sobre Redis y que deja pasar las peticiones si Redis falla.
+
+    PRECONDICIONES:
+        - Un cliente de Redis mockeado.
+
+    PROCESO:
+        - Consumir con Redis respondiendo una espera y con Redis caído.
+
+    POSTCONDICIONES:
+        - Se devuelve la espera calculada por el script y 0 si Redis falla.
+    """
+    cliente = MagicMock()
+    cliente.eval = AsyncMock(return_value=b"2.5")
+    limitador = LimitadorRedis(cliente)
+
+    assert await limitador.consumir("productos:1.2.3.4:m1", 2, 0.4) == 2.5
+    assert cliente.eval.await_args.args[2] == "restaurant:limite:productos:1.2.3.4:m1"
+
+    cliente.eval = AsyncMock(side_effect=ConnectionError("sin conexión"))
+    assert await limitador.consumir("productos:1.2.3.4:m1", 2, 0.4) == 0.0
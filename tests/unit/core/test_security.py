@@ -0,0 +1,223 @@
+"""
+Pruebas unitarias para la emisión y verificación de tokens JWT.
+"""
+
+import threading
+import time
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.core.config import get_settings
+from src.core import security as security_module
+from src.core.security import SecurityConfig
+
+
+def _claves_rsa():
+    """Genera un par de claves RSA en PEM."""
+    privada = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    privada_pem = privada.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    publica_pem = privada.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return privada_pem, publica_pem
+
+
+def _security(**cambios) -> SecurityConfig:
+    """Crea una configuración de seguridad con los ajustes indicados."""
+    settings = get_settings().model_copy(update=cambios)
+    with patch("src.core.security.get_settings", return_value=settings):
+        return SecurityConfig()
+
+
+def test_verify_token_usa_cache_hasta_exp():
+    """
+    Verifica que un token ya verificado no vuelve a decodificarse hasta su expiración.
+
+    PRECONDICIONES:
+        - Configuración HS256.
+
+    PROCESO:
+        - Verificar el mismo token dos veces.
+        - Simular que pasó su expiración y verificarlo de nuevo.
+
+    POSTCONDICIONES:
+        - La firma se comprueba una sola vez.
+        - Tras la expiración el token se rechaza aunque esté en caché.
+    """
+    config = _security(algorithm="HS256")
+    token = config.create_access_token({"sub": "u1"}, expires_delta=timedelta(minutes=5))
+
+    with patch.object(security_module.jwt, "decode", wraps=security_module.jwt.decode) as decode:
+        assert config.verify_token(token)["sub"] == "u1"
+        assert config.verify_token(token)["sub"] == "u1"
+        assert decode.call_count == 1
+
+        with patch.object(security_module.time, "time", return_value=time.time() + 600):
+            assert config.verify_token(token) is None
+
+
+def test_verify_token_invalido():
+    """
+    Verifica que un token manipulado se rechaza y no se guarda.
+
+    PRECONDICIONES:
+        - Configuración HS256.
+
+    PROCESO:
+        - Verificar un token con la firma alterada.
+
+    POSTCONDICIONES:
+        - Se devuelve None.
+    """
+    config = _security(algorithm="HS256")
+    token = config.create_access_token({"sub": "u1"})
+
+    assert config.verify_token(token[:-2] + "xx") is None
+
+
+def test_rs256_con_rotacion_de_claves():
+    """
+    Verifica la firma RS256 con kid y la rotación de claves.
+
+    PRECONDICIONES:
+        - Dos pares de claves RSA; la clave "k1" es la activa.
+
+    PROCESO:
+        - Emitir un token con "k1" y verificarlo desde un servicio que solo
+          tiene las claves públicas.
+        - Rotar a "k2" conservando "k1", y después retirar "k1".
+
+    POSTCONDICIONES:
+        - El verificador sin clave privada acepta el token.
+        - Tras rotar, los tokens nuevos usan "k2" y los de "k1" siguen
+          siendo válidos hasta que se retira su clave.
+    """
+    privada_1, publica_1 = _claves_rsa()
+    privada_2, publica_2 = _claves_rsa()
+    emisor = _security(
+        algorithm="RS256",
+        jwt_private_key=privada_1,
+        jwt_active_kid="k1",
+        jwt_public_keys={"k1": publica_1},
+    )
+    verificador = _security(algorithm="RS256", jwt_public_keys={"k1": publica_1, "k2": publica_2})
+
+    antiguo = emisor.create_access_token({"sub": "u1"})
+    assert verificador.verify_token(antiguo)["sub"] == "u1"
+
+    emisor.configure_keys({"k1": publica_1, "k2": publica_2}, active_kid="k2", private_key=privada_2)
+    nuevo = emisor.create_access_token({"sub": "u2"})
+    assert security_module.jwt.get_unverified_header(nuevo)["kid"] == "k2"
+    assert verificador.verify_token(nuevo)["sub"] == "u2"
+
+    verificador.configure_keys({"k2": publica_2})
+    assert verificador.verify_token(antiguo) is None
+    assert verificador.verify_token(nuevo)["sub"] == "u2"
+
+
+def test_rs256_sin_clave_privada():
+    """
+    Verifica que un servicio solo verificador no puede emitir tokens.
+
+    PRECONDICIONES:
+        - Configuración RS256 sin clave privada.
+
+    PROCESO:
+        - Emitir un token.
+
+    POSTCONDICIONES:
+        - Se lanza ValueError.
+    """
+    _, publica = _claves_rsa()
+    config = _security(algorithm="RS256", jwt_public_keys={"k1": publica})
+
+    with pytest.raises(ValueError):
+        config.create_access_token({"sub": "u1"})
+
+
+def test_algoritmo_no_soportado():
+    """
+    Verifica que un algoritmo no soportado se rechaza al configurar.
+
+    PRECONDICIONES:
+        - Ninguna.
+
+    PROCESO:
+        - Configurar EdDSA.
+
+    POSTCONDICIONES:
+        - Se lanza ValueError.
+    """
+    with pytest.raises(ValueError):
+        _security(algorithm="EdDSA")
+
+
+@pytest.mark.asyncio
+async def test_hash_de_contrasena_en_hilos_dedicados():
+    """
+    Verifica que bcrypt se ejecuta fuera del event loop, en el pool acotado.
+
+    PRECONDICIONES:
+        - Configuración con bcrypt de coste 4 y un solo hilo.
+
+    PROCESO:
+        - Calcular y verificar un hash con las variantes asíncronas.
+
+    POSTCONDICIONES:
+        - El hash se verifica y se calculó en un hilo del pool.
+    """
+    config = _security(bcrypt_rounds=4, password_hash_workers=1)
+    hilos = []
+    original = config.pwd_context.hash
+
+    def hash_registrando(password):
+        hilos.append(threading.current_thread().name)
+        return original(password)
+
+    config.pwd_context.hash = hash_registrando
+    try:
+        hashed = await config.get_password_hash_async("ceviche")
+        assert await config.verify_password_async("ceviche", hashed)
+        assert not await config.verify_password_async("otro", hashed)
+        assert hilos[0].startswith("password-hash")
+        assert config._password_executor._max_workers == 1
+    finally:
+        config.close()
+
+
+@pytest.mark.asyncio
+async def test_rehash_al_cambiar_el_coste():
+    """
+    Verifica que un hash con coste antiguo se actualiza al iniciar sesión.
+
+    PRECONDICIONES:
+        - Un hash calculado con coste 4.
+
+    PROCESO:
+        - Verificar la contraseña con una configuración de coste 5.
+
+    POSTCONDICIONES:
+        - Se devuelve un hash nuevo con coste 5; con la configuración
+          antigua no hace falta actualizar.
+    """
+    antigua = _security(bcrypt_rounds=4)
+    nueva = _security(bcrypt_rounds=5)
+    hashed = antigua.get_password_hash("ceviche")
+
+    try:
+        assert await antigua.verify_and_update_password("ceviche", hashed) == (True, None)
+        valida, nuevo_hash = await nueva.verify_and_update_password("ceviche", hashed)
+        assert valida and nuevo_hash.startswith("$2b$05$")
+        assert await nueva.verify_and_update_password("otro", hashed) == (False, None)
+    finally:
+        antigua.close()
+        nueva.close()
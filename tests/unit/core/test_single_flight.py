@@ -0,0 +1,152 @@
+"""
+Pruebas unitarias para la fusión de llamadas concurrentes.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.single_flight import SingleFlight, coalescer
+
+
+@pytest.mark.asyncio
+async def test_llamadas_concurrentes_comparten_resultado():
+    """
+    Verifica que las llamadas concurrentes con la misma clave se ejecutan una vez.
+
+    PRECONDICIONES:
+        - Un grupo sin llamadas en curso.
+
+    PROCESO:
+        - Lanzar cinco llamadas iguales a la vez y una con otra clave.
+
+    POSTCONDICIONES:
+        - El trabajo de la clave repetida se ejecuta una sola vez y todas reciben su resultado.
+        - Al terminar no queda ninguna llamada en curso.
+    """
+    vuelos = SingleFlight()
+    ejecuciones = []
+
+    async def trabajo(valor):
+        ejecuciones.append(valor)
+        await asyncio.sleep(0.01)
+        return valor * 2
+
+    resultados = await asyncio.gather(
+        *(vuelos.ejecutar("a", lambda: trabajo(1)) for _ in range(5)),
+        vuelos.ejecutar("b", lambda: trabajo(2)),
+    )
+
+    assert resultados == [2, 2, 2, 2, 2, 4]
+    assert ejecuciones == [1, 2]
+    assert vuelos.fusionadas == 4
+    assert len(vuelos) == 0
+
+
+@pytest.mark.asyncio
+async def test_error_se_propaga_a_todas():
+    """
+    Verifica que el error de la llamada líder llega a todas las seguidoras.
+
+    PRECONDICIONES:
+        - Un trabajo que falla.
+
+    PROCESO:
+        - Lanzar tres llamadas iguales y después otra cuando ya terminaron.
+
+    POSTCONDICIONES:
+        - Las tres reciben el error; la posterior vuelve a ejecutar el trabajo.
+    """
+    vuelos = SingleFlight()
+    intentos = 0
+
+    async def trabajo():
+        nonlocal intentos
+        intentos += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("fallo")
+
+    resultados = await asyncio.gather(
+        *(vuelos.ejecutar("a", trabajo) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in resultados)
+    assert intentos == 1
+
+    with pytest.raises(ValueError):
+        await vuelos.ejecutar("a", trabajo)
+    assert intentos == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelaciones():
+    """
+    Verifica que cancelar la líder o una seguidora no cancela a las demás.
+
+    PRECONDICIONES:
+        - Un trabajo lento.
+
+    PROCESO:
+        - Lanzar una líder y dos seguidoras; cancelar una seguidora y después la líder.
+
+    POSTCONDICIONES:
+        - La seguidora restante repite el trabajo como nueva líder y obtiene el resultado.
+    """
+    vuelos = SingleFlight()
+    inicios = 0
+
+    async def trabajo():
+        nonlocal inicios
+        inicios += 1
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    lider = asyncio.create_task(vuelos.ejecutar("a", trabajo))
+    await asyncio.sleep(0)
+    cancelada = asyncio.create_task(vuelos.ejecutar("a", trabajo))
+    seguidora = asyncio.create_task(vuelos.ejecutar("a", trabajo))
+    await asyncio.sleep(0)
+
+    cancelada.cancel()
+    await asyncio.sleep(0)
+    assert not lider.done()
+
+    lider.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lider
+    assert await seguidora == "ok"
+    assert inicios == 2
+    assert cancelada.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_decorador_fusiona_entre_instancias():
+    """
+    Verifica que el decorador fusiona por método y argumentos, sin tener en cuenta la instancia.
+
+    PRECONDICIONES:
+        - Un servicio con un método decorado.
+
+    PROCESO:
+        - Llamarlo a la vez desde dos instancias con los mismos argumentos (listas incluidas)
+          y desde una tercera con otros.
+
+    POSTCONDICIONES:
+        - Los argumentos iguales se ejecutan una vez; los distintos, aparte.
+    """
+    llamadas = []
+
+    class Servicio:
+        @coalescer
+        async def leer(self, categoria, excluir=None):
+            llamadas.append((categoria, excluir))
+            await asyncio.sleep(0.01)
+            return categoria
+
+    resultados = await asyncio.gather(
+        Servicio().leer("c1", excluir=["gluten"]),
+        Servicio().leer("c1", excluir=["gluten"]),
+        Servicio().leer("c2"),
+    )
+
+    assert resultados == ["c1", "c1", "c2"]
+    assert llamadas == [("c1", ["gluten"]), ("c2", None)]
@@ -0,0 +1,62 @@
+"""
+Pruebas unitarias para las tareas periódicas.
+"""
+
+import asyncio
+
+from src.core.tarea_periodica import TareaPeriodica
+
+
+async def test_tarea_periodica_repite_y_sobrevive_a_fallos():
+    """
+    Verifica que la tarea repite la función aunque falle.
+
+    PRECONDICIONES:
+        - Una función asíncrona que falla en su primera llamada.
+
+    PROCESO:
+        - Iniciar la tarea con un intervalo de 1 ms, esperar tres llamadas y detenerla.
+
+    POSTCONDICIONES:
+        - La función se sigue llamando tras el fallo y la tarea se detiene.
+    """
+    llamadas = []
+
+    async def funcion():
+        llamadas.append(1)
+        if len(llamadas) == 1:
+            raise RuntimeError("fallo")
+
+    tarea = TareaPeriodica("prueba", funcion, 0.001)
+    await tarea.iniciar()
+    for _ in range(1000):
+        if len(llamadas) >= 3:
+            break
+        await asyncio.sleep(0.001)
+    await tarea.detener()
+
+    total = len(llamadas)
+    assert total >= 3
+    await asyncio.sleep(0.01)
+    assert len(llamadas) == total
+
+
+async def test_tarea_periodica_sin_intervalo_no_se_inicia():
+    """
+    Verifica que un intervalo de 0 desactiva la tarea.
+
+    PRECONDICIONES:
+        - Una tarea con intervalo 0.
+
+    PROCESO:
+        - Iniciarla y ceder el bucle de eventos.
+
+    POSTCONDICIONES:
+        - La función no se llama.
+    """
+    llamadas = []
+    tarea = TareaPeriodica("prueba", lambda: llamadas.append(1), 0)
+    await tarea.iniciar()
+    await asyncio.sleep(0.01)
+    await tarea.detener()
+    assert llamadas == []
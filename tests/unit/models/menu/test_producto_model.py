@@ -159,3 +159,32 @@ def test_producto_decimal_precision():
 
     assert producto.precio_base == Decimal("99.99")
     assert isinstance(producto.precio_base, Decimal)
+
+
+def test_producto_contiene_alergenos():
+    """
+    Verifica la comprobación bit a bit de las máscaras de alérgenos.
+
+    PRECONDICIONES:
+        - El modelo debe tener las columnas de máscara por nivel de presencia.
+
+    PROCESO:
+        - Crear un producto que contiene el bit 0 y tiene trazas del bit 1.
+        - Consultar distintas máscaras con y sin tolerancia a trazas.
+
+    POSTCONDICIONES:
+        - Las trazas solo cuentan cuando no se toleran.
+    """
+    producto = ProductoModel(
+        nombre="Ceviche",
+        id_categoria=str(ULID()),
+        precio_base=Decimal("30.00"),
+        mascara_alergenos_contiene=0b01,
+        mascara_alergenos_trazas=0b10,
+        mascara_alergenos_puede_contener=0,
+    )
+
+    assert producto.contiene_alergenos(0b01) is True
+    assert producto.contiene_alergenos(0b10) is False
+    assert producto.contiene_alergenos(0b10, tolerar_trazas=False) is True
+    assert producto.contiene_alergenos(0b100, tolerar_trazas=False) is False